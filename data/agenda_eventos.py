@@ -0,0 +1,290 @@
+"""Agenda da paróquia gerada a partir de eventos.json, missas.json e missas-festivas.json.
+
+O site não precisa mais percorrer a árvore inteira de eventos (anos -> mês ->
+[eventos]) para descobrir o que vem a seguir. A cada salvamento o gerenciador
+grava em data/agenda/:
+
+  - proximos.json: os próximos eventos e missas festivas, já em ordem de data
+    (é o que a página inicial lê, dentro do pacote-inicio);
+  - eventos/manifesto.json e eventos/<AAAA-MM>.json: os eventos divididos por
+    mês, com o número de eventos de cada mês no manifesto;
+  - paroquia.ics: feed iCalendar com os eventos, as missas festivas e as missas
+    dos horários regulares, repetidas semana a semana dentro de uma janela móvel.
+
+    python agenda_eventos.py
+"""
+import datetime
+import json
+import os
+import re
+
+from arquivos import escrever_atomico, escrever_se_mudou
+
+PASTA_DADOS = os.path.dirname(os.path.abspath(__file__))
+PASTA_AGENDA = os.path.join(PASTA_DADOS, "agenda")
+
+MESES = ["janeiro", "fevereiro", "março", "abril", "maio", "junho",
+         "julho", "agosto", "setembro", "outubro", "novembro", "dezembro"]
+
+# Chaves de horarios_regulares do missas.json -> date.weekday()
+DIAS_SEMANA = {"segunda": 0, "terca": 1, "quarta": 2, "quinta": 3, "sexta": 4, "sabado": 5, "domingo": 6}
+
+# Quantos itens vão para o proximos.json
+PROXIMOS_EVENTOS = 5
+PROXIMAS_MISSAS_FESTIVAS = 3
+
+# Janela das missas regulares no feed: uma semana para trás (quem sincroniza
+# pouco não perde a semana corrente) e oito semanas à frente, contadas da
+# segunda-feira da semana atual para a janela só andar uma vez por semana
+DIAS_ANTES = 7
+DIAS_DEPOIS = 56
+
+DURACAO_EVENTO = datetime.timedelta(hours=2)
+DURACAO_MISSA = datetime.timedelta(hours=1)
+
+FUSO = "America/Sao_Paulo"
+DOMINIO_UID = "paroquia-sao-francisco"
+NOME_CALENDARIO = "Paróquia São Francisco"
+
+
+def datas_do_evento(evento):
+    """Datas do evento em ordem ('data' pode ser uma data ou a lista dos dias); datas inválidas são ignoradas."""
+    valores = evento.get("data") or []
+    if isinstance(valores, str):
+        valores = [valores]
+    datas = set()
+    for valor in valores:
+        try:
+            datas.add(datetime.date.fromisoformat(str(valor).strip()))
+        except ValueError:
+            continue
+    return sorted(datas)
+
+
+def hora_inicio(horario):
+    """Primeiro horário do texto ("19:00", "19h", "8h30 e 10h"...) ou None se o evento for o dia todo."""
+    encontrado = re.search(r"(\d{1,2})\s*[:h]\s*(\d{2})?", horario or "")
+    if not encontrado:
+        return None
+    hora, minuto = int(encontrado.group(1)), int(encontrado.group(2) or 0)
+    if hora > 23 or minuto > 59:
+        return None
+    return datetime.time(hora, minuto)
+
+
+def arquivo_do_mes(ano, mes):
+    """Nome do fragmento do mês: AAAA-MM.json, ou o nome do mês saneado se não for um mês conhecido."""
+    chave = mes.strip().lower()
+    if chave in MESES:
+        return f"eventos/{ano}-{MESES.index(chave) + 1:02d}.json"
+    return f"eventos/{ano}-" + re.sub(r"[^A-Za-z0-9_-]", "_", mes) + ".json"
+
+
+def _proximos_eventos(eventos, hoje):
+    proximos = []
+    for evento in eventos:
+        datas = [data for data in datas_do_evento(evento) if data >= hoje]
+        if not datas:
+            continue
+        inicio = hora_inicio(evento.get("horario"))
+        proximos.append(((datas[0], inicio or datetime.time(0)), {
+            "id": evento.get("id", ""),
+            "titulo": evento.get("titulo", ""),
+            "datas": [data.isoformat() for data in datas],
+            "horario": evento.get("horario", ""),
+            "local": evento.get("local", ""),
+            "descricao": evento.get("descricao", ""),
+        }))
+    proximos.sort(key=lambda item: item[0])
+    return [item for _, item in proximos[:PROXIMOS_EVENTOS]]
+
+
+def _proximas_missas_festivas(missas, hoje):
+    proximas = []
+    for missa in missas:
+        datas = [data for data in datas_do_evento(missa) if data >= hoje]
+        if datas:
+            proximas.append(((datas[0], hora_inicio(missa.get("horario")) or datetime.time(0)), {
+                "titulo": missa.get("titulo", ""),
+                "data": datas[0].isoformat(),
+                "horario": missa.get("horario", ""),
+                "descricao": missa.get("descricao", ""),
+            }))
+    proximas.sort(key=lambda item: item[0])
+    return [item for _, item in proximas[:PROXIMAS_MISSAS_FESTIVAS]]
+
+
+def missas_regulares(horarios_regulares, inicio, fim):
+    """Repete os horários semanais do missas.json de 'inicio' a 'fim' (inclusive). Retorna [(data, hora, observação)]."""
+    missas = []
+    dia = inicio
+    while dia <= fim:
+        for chave, configuracao in horarios_regulares.items():
+            if DIAS_SEMANA.get(chave) != dia.weekday():
+                continue
+            for horario in configuracao.get("horarios", []):
+                hora = hora_inicio(horario)
+                if hora is not None:
+                    missas.append((dia, hora, configuracao.get("observacao", "")))
+        dia += datetime.timedelta(days=1)
+    return sorted(missas, key=lambda missa: missa[:2])
+
+
+def _escapar_ical(texto):
+    return (str(texto).replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+
+def _dobrar_linha(linha):
+    """Quebra a linha em pedaços de até 75 bytes (RFC 5545), sem cortar caracteres UTF-8 ao meio."""
+    partes = []
+    atual = ""
+    for caractere in linha:
+        limite = 75 if not partes else 74  # as continuações começam com um espaço
+        if len((atual + caractere).encode("utf-8")) > limite:
+            partes.append(atual)
+            atual = ""
+        atual += caractere
+    partes.append(atual)
+    return "\r\n ".join(partes)
+
+
+def _vevento(uid, titulo, dia, hora, duracao, carimbo, descricao="", local=""):
+    linhas = ["BEGIN:VEVENT", f"UID:{uid}@{DOMINIO_UID}", f"DTSTAMP:{carimbo}"]
+    if hora is None:
+        linhas.append(f"DTSTART;VALUE=DATE:{dia:%Y%m%d}")
+        linhas.append(f"DTEND;VALUE=DATE:{dia + datetime.timedelta(days=1):%Y%m%d}")
+    else:
+        inicio = datetime.datetime.combine(dia, hora)
+        linhas.append(f"DTSTART;TZID={FUSO}:{inicio:%Y%m%dT%H%M%S}")
+        linhas.append(f"DTEND;TZID={FUSO}:{inicio + duracao:%Y%m%dT%H%M%S}")
+    linhas.append(f"SUMMARY:{_escapar_ical(titulo)}")
+    if descricao:
+        linhas.append(f"DESCRIPTION:{_escapar_ical(descricao)}")
+    if local:
+        linhas.append(f"LOCATION:{_escapar_ical(local)}")
+    linhas.append("END:VEVENT")
+    return linhas
+
+
+def montar_ical(eventos, missas_festivas, horarios_regulares, hoje):
+    """Feed iCalendar da paróquia.
+
+    Nada depende do dia exato da geração: a janela das missas regulares começa
+    numa segunda-feira e o DTSTAMP é o início dela, então salvar em outro dia da
+    mesma semana gera o mesmo arquivo.
+    """
+    segunda = hoje - datetime.timedelta(days=hoje.weekday())
+    inicio, fim = segunda - datetime.timedelta(days=DIAS_ANTES), segunda + datetime.timedelta(days=DIAS_DEPOIS)
+    carimbo = f"{inicio:%Y%m%d}T000000Z"
+    linhas = [
+        "BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Paroquia Sao Francisco//Agenda//PT",
+        "CALSCALE:GREGORIAN", "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{_escapar_ical(NOME_CALENDARIO)}", f"X-WR-TIMEZONE:{FUSO}",
+        # Sem horário de verão desde 2019
+        "BEGIN:VTIMEZONE", f"TZID:{FUSO}", "BEGIN:STANDARD", "DTSTART:19700101T000000",
+        "TZOFFSETFROM:-0300", "TZOFFSETTO:-0300", "TZNAME:-03", "END:STANDARD", "END:VTIMEZONE",
+    ]
+
+    for evento in eventos:
+        hora = hora_inicio(evento.get("horario"))
+        datas = datas_do_evento(evento)
+        for dia in datas:
+            # Um VEVENT por dia: nos eventos de vários dias o horário vale para cada um deles
+            uid = evento.get("id") or evento.get("titulo", "evento")
+            if len(datas) > 1:
+                uid = f"{uid}-{dia:%Y%m%d}"
+            linhas += _vevento(uid, evento.get("titulo", ""), dia, hora, DURACAO_EVENTO, carimbo,
+                               evento.get("descricao", ""), evento.get("local", ""))
+
+    for missa in missas_festivas:
+        for dia in datas_do_evento(missa):
+            uid = f"{missa.get('id') or 'missa-festiva'}-{dia:%Y%m%d}"
+            linhas += _vevento(uid, missa.get("titulo", ""), dia, hora_inicio(missa.get("horario")),
+                               DURACAO_MISSA, carimbo, missa.get("descricao", ""))
+
+    for dia, hora, observacao in missas_regulares(horarios_regulares, inicio, fim):
+        linhas += _vevento(f"missa-{dia:%Y%m%d}-{hora:%H%M}", "Missa", dia, hora, DURACAO_MISSA, carimbo, observacao)
+
+    linhas.append("END:VCALENDAR")
+    return "".join(_dobrar_linha(linha) + "\r\n" for linha in linhas)
+
+
+def montar_agenda_eventos(pasta_dados=PASTA_DADOS, hoje=None):
+    """Monta os arquivos da agenda. Retorna {caminho relativo: conteúdo} (dict para JSON, str para o .ics)."""
+    hoje = hoje or datetime.date.today()
+
+    def carregar(nome):
+        with open(os.path.join(pasta_dados, nome), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    anos = carregar("eventos.json").get("anos", {})
+    missas_festivas = carregar("missas-festivas.json").get("missas_festivas", [])
+    horarios_regulares = carregar("missas.json").get("horarios_regulares", {})
+
+    arquivos = {}
+    manifesto = {"anos": {}}
+    todos = []
+    for ano, meses in anos.items():
+        for mes, eventos in meses.items():
+            relativo = arquivo_do_mes(ano, mes)
+            arquivos[relativo] = {"eventos": eventos}
+            manifesto["anos"].setdefault(ano, {})[mes] = {"eventos": len(eventos), "arquivo": relativo}
+            todos.extend(eventos)
+    arquivos["eventos/manifesto.json"] = manifesto
+
+    # Sem a data da geração: o arquivo só muda quando a lista muda (o site descarta os dias que já passaram)
+    arquivos["proximos.json"] = {
+        "eventos": _proximos_eventos(todos, hoje),
+        "missas_festivas": _proximas_missas_festivas(missas_festivas, hoje),
+    }
+    arquivos["paroquia.ics"] = montar_ical(todos, missas_festivas, horarios_regulares, hoje)
+    return arquivos
+
+
+def _gravar_se_mudou(caminho, conteudo):
+    if isinstance(conteudo, str):
+        # O .ics usa CRLF, então a comparação é feita em bytes
+        dados = conteudo.encode("utf-8")
+        try:
+            with open(caminho, "rb") as f:
+                if f.read() == dados:
+                    return False
+        except FileNotFoundError:
+            pass
+        escrever_atomico(caminho, dados, modo="wb")
+        return True
+    return escrever_se_mudou(caminho, json.dumps(conteudo, ensure_ascii=False, separators=(",", ":")))
+
+
+def gerar_agenda_eventos(dados=None, pasta_saida=PASTA_AGENDA, pasta_dados=PASTA_DADOS, hoje=None):
+    """Grava os arquivos de montar_agenda_eventos, tocando só nos que mudaram.
+
+    Recebe 'dados' só para servir de gerador da SessaoEdicao: rodando a cada
+    salvamento, os próximos eventos e a janela das missas acompanham a data.
+    Meses que deixaram de existir são apagados. Retorna a lista de caminhos alterados.
+    """
+    alterados = []
+    desejados = set()
+
+    for relativo, conteudo in montar_agenda_eventos(pasta_dados, hoje).items():
+        caminho = os.path.join(pasta_saida, *relativo.split("/"))
+        desejados.add(os.path.abspath(caminho))
+        if _gravar_se_mudou(caminho, conteudo):
+            alterados.append(caminho)
+
+    for raiz, pastas, nomes in os.walk(pasta_saida, topdown=False):
+        for nome in nomes:
+            caminho = os.path.join(raiz, nome)
+            if os.path.abspath(caminho) not in desejados:
+                os.remove(caminho)
+                alterados.append(caminho)
+        if raiz != pasta_saida and not os.listdir(raiz):
+            os.rmdir(raiz)
+
+    return alterados
+
+
+if __name__ == "__main__":
+    arquivos = gerar_agenda_eventos()
+    print(f"{len(arquivos)} arquivo(s) da agenda atualizado(s).")
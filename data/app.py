@@ -1,9 +1,21 @@
 import customtkinter as ctk
-import json
+import functools
 import uuid # Para gerar IDs únicos
 import os
-import shutil # Para copiar arquivos
-import git
+import queue
+import re
+import threading
+import time
+import desempenho
+from concurrent.futures import Future
+from repositorio_noticias import RepositorioNoticias
+from fila_git import FilaGit, importar_git
+from sessao_edicao import GERADORES_PADRAO, SessaoEdicao, carregar_jornal, retrato, validar_noticia
+from observador_arquivos import ObservadorArquivos
+from validacao_dados import formatar_problema, so_erros, validar_dados
+from diario_alteracoes import DiarioAlteracoes
+from imagens import pipeline_padrao
+from construcao_site import construir_site
 from tkinter import filedialog, messagebox # Para a janela de seleção de arquivo
 
 class JanelaFormularioNoticia(ctk.CTkToplevel):
@@ -36,6 +48,11 @@ class JanelaFormularioNoticia(ctk.CTkToplevel):
         self.foto_secundaria_var = ctk.StringVar()
         self.destaque_var = ctk.BooleanVar()
 
+        # Registros das imagens processadas (versões para srcset) e processamentos em andamento
+        self.imagens = {}
+        self.imagens_pendentes = {}
+        self.inicio_imagens = {}
+
         # ID (não editável)
         ctk.CTkLabel(self.frame_formulario, text="ID (gerado automaticamente):").pack(anchor="w", padx=20, pady=(10, 0))
         ctk.CTkEntry(self.frame_formulario, textvariable=self.id_var, state="readonly").pack(pady=5, padx=20, fill="x")
@@ -59,7 +76,7 @@ class JanelaFormularioNoticia(ctk.CTkToplevel):
         frame_foto1.pack(fill="x", padx=20, pady=5)
         self.entry_foto_principal = ctk.CTkEntry(frame_foto1, textvariable=self.foto_principal_var, state="readonly")
         self.entry_foto_principal.pack(side="left", fill="x", expand=True, padx=(0, 5))
-        ctk.CTkButton(frame_foto1, text="Selecionar...", command=lambda: self.selecionar_imagem(self.foto_principal_var)).pack(side="left")
+        ctk.CTkButton(frame_foto1, text="Selecionar...", command=lambda: self.selecionar_imagem(self.foto_principal_var, "foto_principal")).pack(side="left")
 
         # Foto Secundária
         ctk.CTkLabel(self.frame_formulario, text="Foto Secundária (opcional):").pack(anchor="w", padx=20, pady=(10, 0))
@@ -67,7 +84,7 @@ class JanelaFormularioNoticia(ctk.CTkToplevel):
         frame_foto2.pack(fill="x", padx=20, pady=5)
         self.entry_foto_secundaria = ctk.CTkEntry(frame_foto2, textvariable=self.foto_secundaria_var, state="readonly")
         self.entry_foto_secundaria.pack(side="left", fill="x", expand=True, padx=(0, 5))
-        ctk.CTkButton(frame_foto2, text="Selecionar...", command=lambda: self.selecionar_imagem(self.foto_secundaria_var)).pack(side="left")
+        ctk.CTkButton(frame_foto2, text="Selecionar...", command=lambda: self.selecionar_imagem(self.foto_secundaria_var, "foto_secundaria")).pack(side="left")
 
         # Conteúdo
         ctk.CTkLabel(self.frame_formulario, text="Conteúdo Principal:").pack(anchor="w", padx=20, pady=(10, 0))
@@ -120,13 +137,13 @@ class JanelaFormularioNoticia(ctk.CTkToplevel):
         self.subtitulo_var.set(noticia.get("subtitulo", ""))
         self.foto_principal_var.set(noticia.get("foto_principal", ""))
         self.foto_secundaria_var.set(noticia.get("foto_secundaria", "") or "")
+        for campo in ("foto_principal", "foto_secundaria"):
+            if noticia.get(f"{campo}_srcset"):
+                self.imagens[campo] = noticia[f"{campo}_srcset"]
         
         # Verifica se a notícia é um destaque
-        # (Acessa a lista de destaques da janela principal)
-        if noticia.get("id") in self.master.dados.get("destaques", []):
-            self.destaque_var.set(True)
-        else:
-            self.destaque_var.set(False)
+        # (Consulta o repositório de notícias da janela principal)
+        self.destaque_var.set(self.master.repositorio.eh_destaque(noticia.get("id")))
 
         # Preenche os campos de texto grandes
         self.textbox_conteudo.insert("1.0", noticia.get("conteudo", ""))
@@ -154,8 +171,12 @@ class JanelaFormularioNoticia(ctk.CTkToplevel):
         modelo_lista = "<ul>\n  <li>Item 1</li>\n  <li>Item 2</li>\n</ul>"
         self.textbox_conteudo_adicional.insert("insert", modelo_lista)
 
-    def selecionar_imagem(self, var_alvo):
-        """Abre a janela para selecionar um arquivo de imagem e copia para a pasta do projeto."""
+    def selecionar_imagem(self, var_alvo, campo):
+        """Abre a janela para selecionar um arquivo de imagem e a envia para o pipeline de imagens.
+
+        O pipeline (em outro processo) gera versões redimensionadas em WebP e JPEG
+        dentro de ../images/noticias; o resultado é acompanhado por acompanhar_imagem.
+        """
         caminho_imagem = filedialog.askopenfilename(
             title="Selecione uma imagem",
             filetypes=[("Arquivos de Imagem", "*.jpg *.jpeg *.png *.gif *.webp")]
@@ -163,25 +184,33 @@ class JanelaFormularioNoticia(ctk.CTkToplevel):
         if not caminho_imagem:
             return # Usuário cancelou
 
-        # Define a pasta de destino
-        pasta_destino = "../images/noticias"
-        if not os.path.exists(pasta_destino):
-            os.makedirs(pasta_destino) # Cria a pasta se não existir
+        var_alvo.set("Processando imagem...")
+        self.inicio_imagens[campo] = time.perf_counter()
+        self.imagens_pendentes[campo] = pipeline_padrao().enviar(caminho_imagem)
+        self.acompanhar_imagem(var_alvo, campo)
 
-        # Copia o arquivo para a pasta de destino
-        nome_arquivo = os.path.basename(caminho_imagem)
-        caminho_destino = os.path.join(pasta_destino, nome_arquivo)
-
-        origem_abs = os.path.abspath(caminho_imagem)
-        destino_abs = os.path.abspath(caminho_destino)
+    def acompanhar_imagem(self, var_alvo, campo):
+        """Verifica periodicamente se o processamento da imagem terminou."""
+        futuro = self.imagens_pendentes.get(campo)
+        if futuro is None:
+            return
+        if not futuro.done():
+            self.after(100, lambda: self.acompanhar_imagem(var_alvo, campo))
+            return
 
-        if origem_abs != destino_abs:
-            shutil.copy(origem_abs, destino_abs)
+        del self.imagens_pendentes[campo]
+        # Tempo total até a imagem ficar pronta (inclui a fila do pool de processos)
+        desempenho.registrar("processar_imagem", (time.perf_counter() - self.inicio_imagens.pop(campo)) * 1000)
+        try:
+            registro = futuro.result()
+        except Exception as e:
+            var_alvo.set("")
+            messagebox.showerror("Erro", f"Não foi possível processar a imagem:\n\n{e}")
+            return
 
-        # Atualiza o campo de texto com o caminho relativo
-        # Usamos barras normais (/) para compatibilidade web
-        caminho_relativo_web = f"../images/noticias/{nome_arquivo}"
-        var_alvo.set(caminho_relativo_web)
+        # O campo de texto recebe a versão de reserva (JPEG); o registro completo vai para o JSON
+        self.imagens[campo] = registro
+        var_alvo.set(registro["src"])
 
     def salvar(self):
         """Coleta os dados, envia para o callback e fecha a janela."""
@@ -196,31 +225,218 @@ class JanelaFormularioNoticia(ctk.CTkToplevel):
             "conteudo_adicional": self.textbox_conteudo_adicional.get("1.0", "end-1c")
         }
         
-        if not noticia_modificada["titulo"] or not noticia_modificada["data"]:
-            messagebox.showerror("Erro", "Os campos 'Título' e 'Data' são obrigatórios.")
+        erros = validar_noticia(noticia_modificada)
+        if erros:
+            messagebox.showerror("Erro", "\n".join(erros))
             return
 
+        if self.imagens_pendentes:
+            messagebox.showerror("Erro", "Aguarde o processamento das imagens terminar.")
+            return
+
+        # Versões redimensionadas, para o site montar o srcset
+        for campo in ("foto_principal", "foto_secundaria"):
+            registro = self.imagens.get(campo)
+            if registro and registro["src"] == noticia_modificada[campo] and registro["webp"]:
+                noticia_modificada[f"{campo}_srcset"] = registro
+
         eh_destaque = self.destaque_var.get()
         # AQUI ESTÁ A MUDANÇA PRINCIPAL: Passa 3 argumentos
         self.callback_salvar(self.noticia_original_id, noticia_modificada, eh_destaque)
         self.destroy()
 
+# --- Lista Virtualizada de Notícias ---
+# Em vez de criar um botão por notícia, mantém um conjunto fixo de linhas
+# (do tamanho da área visível) e apenas troca o texto delas ao rolar.
+class ListaVirtualNoticias(ctk.CTkFrame):
+    ALTURA_LINHA = 32
+
+    def __init__(self, master, ao_selecionar, **kwargs):
+        super().__init__(master, **kwargs)
+
+        self.ao_selecionar = ao_selecionar
+        self.itens = []
+        self.primeiro = 0 # Índice do item exibido na primeira linha
+        self.indice_selecionado = None
+
+        self.linhas = []
+        # Último conteúdo aplicado em cada linha, para pular reconfigurações iguais
+        self.assinaturas = []
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self.area_linhas = ctk.CTkFrame(self, fg_color="transparent")
+        self.area_linhas.grid(row=0, column=0, sticky="nsew")
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._ao_mover_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self.area_linhas.bind("<Configure>", self._ao_redimensionar)
+        self._vincular_rolagem(self.area_linhas)
+
+    def definir_itens(self, itens):
+        """Troca a lista exibida (sem recriar widgets) e redesenha as linhas visíveis."""
+        self.itens = itens
+        self._limitar_primeiro()
+        self.atualizar()
+
+    def selecionar(self, indice):
+        """Marca visualmente a linha do índice informado (ou nenhuma, se None)."""
+        self.indice_selecionado = indice
+        self.atualizar()
+
+    def mostrar_indice(self, indice):
+        """Rola a lista, se necessário, para que o índice fique visível."""
+        if indice < self.primeiro:
+            self.primeiro = indice
+        elif indice >= self.primeiro + len(self.linhas):
+            self.primeiro = indice - len(self.linhas) + 1
+        self._limitar_primeiro()
+        self.atualizar()
+
+    def atualizar(self):
+        """Reaplica os dados nas linhas visíveis, tocando só nas que mudaram."""
+        for posicao, botao in enumerate(self.linhas):
+            indice = self.primeiro + posicao
+            if indice < len(self.itens):
+                noticia = self.itens[indice]
+                assinatura = (noticia.get("id"), noticia.get("titulo", "Sem título"), indice == self.indice_selecionado)
+            else:
+                assinatura = None
+
+            if assinatura == self.assinaturas[posicao]:
+                continue
+            self.assinaturas[posicao] = assinatura
+
+            if assinatura is None:
+                botao.configure(text="", state="disabled", fg_color="transparent")
+            else:
+                botao.configure(
+                    text=assinatura[1],
+                    state="normal",
+                    fg_color=("gray75", "gray30") if assinatura[2] else "transparent"
+                )
+
+        self._atualizar_scrollbar()
+
+    def _ao_redimensionar(self, event):
+        """Ajusta o tamanho do conjunto de linhas à altura disponível."""
+        quantidade = max(1, event.height // self.ALTURA_LINHA)
+
+        while len(self.linhas) < quantidade:
+            posicao = len(self.linhas)
+            botao = ctk.CTkButton(
+                self.area_linhas,
+                text="",
+                height=self.ALTURA_LINHA - 4,
+                fg_color="transparent",
+                text_color=("black", "white"),
+                anchor="w",
+                command=lambda p=posicao: self._ao_clicar(p)
+            )
+            botao.pack(fill="x", padx=5, pady=2)
+            self._vincular_rolagem(botao)
+            self.linhas.append(botao)
+            self.assinaturas.append(False) # Força o primeiro desenho
+
+        while len(self.linhas) > quantidade:
+            self.linhas.pop().destroy()
+            self.assinaturas.pop()
+
+        self._limitar_primeiro()
+        self.atualizar()
+
+    def _ao_clicar(self, posicao):
+        indice = self.primeiro + posicao
+        if indice < len(self.itens):
+            self.ao_selecionar(indice)
+
+    def _vincular_rolagem(self, widget):
+        widget.bind("<MouseWheel>", self._ao_rolar_mouse, add="+") # Windows / macOS
+        widget.bind("<Button-4>", lambda e: self._rolar(-3), add="+") # Linux
+        widget.bind("<Button-5>", lambda e: self._rolar(3), add="+")
+
+    def _ao_rolar_mouse(self, event):
+        passos = -event.delta // 120 if abs(event.delta) >= 120 else -event.delta
+        self._rolar(passos * 3)
+
+    def _rolar(self, linhas):
+        anterior = self.primeiro
+        self.primeiro += linhas
+        self._limitar_primeiro()
+        if self.primeiro != anterior:
+            self.atualizar()
+
+    def _ao_mover_scrollbar(self, *args):
+        """Recebe os comandos da scrollbar ('moveto' ou 'scroll')."""
+        if args[0] == "moveto":
+            self.primeiro = int(float(args[1]) * len(self.itens))
+            self._limitar_primeiro()
+            self.atualizar()
+        elif args[0] == "scroll":
+            passo = int(args[1])
+            if args[2] == "pages":
+                passo *= max(1, len(self.linhas) - 1)
+            self._rolar(passo)
+
+    def _limitar_primeiro(self):
+        maximo = max(0, len(self.itens) - len(self.linhas))
+        self.primeiro = min(max(0, self.primeiro), maximo)
+
+    def _atualizar_scrollbar(self):
+        total = len(self.itens)
+        if total == 0:
+            self.scrollbar.set(0, 1)
+            return
+        inicio = self.primeiro / total
+        fim = min(1.0, (self.primeiro + len(self.linhas)) / total)
+        self.scrollbar.set(inicio, fim)
+
 # --- Janela de Gerenciamento de Notícias ---
 # Esta é a janela que criamos antes, agora encapsulada em uma classe.
+
+# Erros de validação listados na pergunta antes do commit (o resto vai resumido)
+LIMITE_ERROS_VALIDACAO = 10
+# Espera depois da última tecla antes de filtrar a lista (ms)
+ATRASO_FILTRO = 150
+# Datas do filtro: AAAA, AAAA-MM ou AAAA-MM-DD
+PADRAO_DATA_FILTRO = re.compile(r"\d{4}(-\d{2}(-\d{2})?)?")
 class JanelaNoticias(ctk.CTkToplevel):
     def __init__(self, master=None):
         super().__init__(master)
         self.title("Gerenciador de Notícias")
         self.geometry("1100x700") # Aumentei um pouco o tamanho da janela
         self.resizable(True, True) # Permitir redimensionar
+        self.protocol("WM_DELETE_WINDOW", self.fechar) # Avisa sobre alterações não salvas
 
+        # Os dados são lidos em segundo plano (carregar_dados); até lá a lista fica vazia
         self.dados = None
-        self.noticias = []
-        self.carregar_dados()
+        self.repositorio = RepositorioNoticias()
+        # O que a lista exibe: o repositório inteiro ou o resultado do filtro (mesma interface)
+        self.visao = self.repositorio
+        self._after_filtro = None
+        self.diario = None
+        self.sessao = None
+        self.carregamento = None
+        self._after_carregamento = None
+        # Mudanças nos JSON feitas fora do gerenciador (git pull, edição à mão...)
+        self.observador = None
+        self._after_observador = None
+        # Retrato do jornal.json como estava no disco da última vez que foi lido ou gravado aqui
+        self.base_jornal = None
 
         # Guarda o índice da notícia atualmente selecionada
         self.indice_selecionado = None
 
+        # Operações do Git rodam em uma thread própria, com um único repositório aberto
+        self.fila_git = FilaGit(os.path.dirname(os.path.abspath(__file__)))
+        self._after_eventos_git = None
+        # Salvamento em andamento na thread do Git (retrato da sessão e o trabalho da fila)
+        self.salvamento = None
+        self.trabalho_salvamento = None
+        self._fechar_apos_salvar = False
+
         # Configura o grid da janela (2 colunas)
         self.grid_columnconfigure(0, weight=1, minsize=300) # Coluna da lista
         self.grid_columnconfigure(1, weight=3)              # Coluna dos detalhes
@@ -229,28 +445,52 @@ class JanelaNoticias(ctk.CTkToplevel):
         # --- Frame da Esquerda (Lista de Notícias e Botões) ---
         self.frame_esquerda = ctk.CTkFrame(self)
         self.frame_esquerda.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
-        self.frame_esquerda.grid_rowconfigure(1, weight=1)
+        self.frame_esquerda.grid_rowconfigure(2, weight=1)
 
         label_lista = ctk.CTkLabel(self.frame_esquerda, text="Notícias Cadastradas", font=ctk.CTkFont(size=16, weight="bold"))
         label_lista.grid(row=0, column=0, columnspan=2, padx=10, pady=10)
 
-        self.lista_noticias = ctk.CTkScrollableFrame(self.frame_esquerda, label_text="")
-        self.lista_noticias.grid(row=1, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
+        # --- Filtros da lista (busca, período e destaques) ---
+        self.frame_filtros = ctk.CTkFrame(self.frame_esquerda, fg_color="transparent")
+        self.frame_filtros.grid(row=1, column=0, columnspan=2, padx=10, pady=(0, 5), sticky="ew")
+        self.frame_filtros.grid_columnconfigure((0, 1), weight=1)
+
+        self.busca_var = ctk.StringVar()
+        self.data_inicio_var = ctk.StringVar()
+        self.data_fim_var = ctk.StringVar()
+        self.so_destaques_var = ctk.BooleanVar()
+
+        self.entry_busca = ctk.CTkEntry(self.frame_filtros, textvariable=self.busca_var, placeholder_text="Buscar (título, subtítulo, conteúdo)...")
+        self.entry_busca.grid(row=0, column=0, columnspan=2, pady=(0, 5), sticky="ew")
+
+        ctk.CTkEntry(self.frame_filtros, textvariable=self.data_inicio_var, placeholder_text="De (AAAA-MM-DD)").grid(row=1, column=0, padx=(0, 5), sticky="ew")
+        ctk.CTkEntry(self.frame_filtros, textvariable=self.data_fim_var, placeholder_text="Até (AAAA-MM-DD)").grid(row=1, column=1, sticky="ew")
+
+        ctk.CTkCheckBox(self.frame_filtros, text="Só destaques", variable=self.so_destaques_var, onvalue=True, offvalue=False, command=self.aplicar_filtro).grid(row=2, column=0, pady=(5, 0), sticky="w")
+        self.label_contagem = ctk.CTkLabel(self.frame_filtros, text="", anchor="e")
+        self.label_contagem.grid(row=2, column=1, pady=(5, 0), sticky="e")
+
+        # Cada tecla só reagenda o filtro; ele roda quando a digitação para por ATRASO_FILTRO
+        for variavel in (self.busca_var, self.data_inicio_var, self.data_fim_var):
+            variavel.trace_add("write", lambda *_: self.agendar_filtro())
+
+        self.lista_noticias = ListaVirtualNoticias(self.frame_esquerda, ao_selecionar=self.mostrar_detalhes)
+        self.lista_noticias.grid(row=2, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
         
         self.frame_botoes = ctk.CTkFrame(self.frame_esquerda)
-        self.frame_botoes.grid(row=2, column=0, columnspan=2, padx=10, pady=10, sticky="ew")
+        self.frame_botoes.grid(row=3, column=0, columnspan=2, padx=10, pady=10, sticky="ew")
         self.frame_botoes.grid_columnconfigure((0, 1, 2, 3, 4), weight=1)
 
-        self.botao_adicionar = ctk.CTkButton(self.frame_botoes, text="Adicionar", command=self.abrir_janela_adicionar)
+        self.botao_adicionar = ctk.CTkButton(self.frame_botoes, text="Adicionar", command=self.abrir_janela_adicionar, state="disabled")
         self.botao_adicionar.grid(row=0, column=0, padx=5, pady=5, sticky="ew")
 
         self.botao_editar = ctk.CTkButton(self.frame_botoes, text="Editar", command=self.abrir_janela_editar, state="disabled")
         self.botao_editar.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
 
-        self.botao_excluir = ctk.CTkButton(self.frame_botoes, text="Excluir")
+        self.botao_excluir = ctk.CTkButton(self.frame_botoes, text="Excluir", command=self.excluir_noticia, state="disabled")
         self.botao_excluir.grid(row=0, column=2, padx=5, pady=5, sticky="ew")
         
-        self.botao_salvar = ctk.CTkButton(self.frame_botoes, text="Salvar", fg_color="green")
+        self.botao_salvar = ctk.CTkButton(self.frame_botoes, text="Salvar", fg_color="green", command=self.salvar_alteracoes_no_arquivo, state="disabled")
         self.botao_salvar.grid(row=0, column=3, padx=5, pady=5, sticky="ew")
 
         self.botao_publicar = ctk.CTkButton(self.frame_botoes, text="Publicar", fg_color="#34568B", command=self.git_push)
@@ -314,152 +554,467 @@ class JanelaNoticias(ctk.CTkToplevel):
         self.check_destaque = ctk.CTkCheckBox(self.frame_direita, text="Marcar como Destaque", variable=self.destaque_var, onvalue=True, offvalue=False, state="disabled")
         self.check_destaque.pack(pady=10, padx=20, anchor="w")
 
-        self.atualizar_lista_noticias()
+        # --- Barra de Status (operações do Git) ---
+        self.frame_status = ctk.CTkFrame(self)
+        self.frame_status.grid(row=1, column=0, columnspan=2, padx=10, pady=(0, 10), sticky="ew")
+        self.frame_status.grid_columnconfigure(0, weight=1)
+
+        self.label_status = ctk.CTkLabel(self.frame_status, text="", anchor="w")
+        self.label_status.grid(row=0, column=0, padx=10, pady=5, sticky="ew")
+
+        self.barra_progresso = ctk.CTkProgressBar(self.frame_status, width=200)
+        self.barra_progresso.grid(row=0, column=1, padx=10, pady=5)
+        self.barra_progresso.set(0)
+
+        self.botao_cancelar = ctk.CTkButton(self.frame_status, text="Cancelar", width=90, state="disabled", command=self.fila_git.cancelar_todos)
+        self.botao_cancelar.grid(row=0, column=2, padx=10, pady=5)
+
+        # Começa a acompanhar a fila do Git; a janela já aparece enquanto o jornal.json é lido
+        self.processar_eventos_git()
+        self.carregar_dados()
 
     def git_push(self):
-        """Executa 'git push' para enviar os commits locais para o repositório remoto."""
+        """Agenda um 'git push' na fila do Git para enviar os commits locais para o repositório remoto."""
         # Pergunta ao usuário se ele realmente quer publicar
         if not messagebox.askyesno("Confirmar Publicação", "Você tem certeza que deseja enviar todas as alterações salvas para o servidor?\n\nIsso pode atualizar o site ao vivo."):
             return
+        if not self.confirmar_validacao():
+            return
+
+        # Antes de enviar, gera as cópias com hash dos CSS/JS/JSON e as commita junto. Roda na thread
+        # do Git, a mesma dos salvamentos, para nunca reescrever as páginas ao mesmo tempo que eles;
+        # cliques repetidos enquanto a construção aguarda na fila reaproveitam o mesmo trabalho
+        self.fila_git.commit([], "Atualiza os arquivos do site", preparar=construir_site, chave="construir_site")
 
+        # Se já houver um push aguardando, a fila devolve o mesmo trabalho (cliques repetidos não geram vários pushes)
+        self.fila_git.push()
+
+    def processar_eventos_git(self):
+        """Lê os eventos produzidos pela thread do Git e atualiza a barra de status."""
         try:
-            self.configure(cursor="watch") # Muda o cursor para "espera"
-            self.update_idletasks() # Força a atualização da UI
+            while True:
+                trabalho, evento, dados = self.fila_git.eventos.get_nowait()
+                self.tratar_evento_git(trabalho, evento, dados)
+        except queue.Empty:
+            pass
+        self._after_eventos_git = self.after(100, self.processar_eventos_git)
 
-            repo = git.Repo('.')
-            
-            # Verifica se existe um remoto chamado 'origin'
-            if 'origin' not in [remote.name for remote in repo.remotes]:
-                messagebox.showerror("Erro de Push", "Nenhum repositório remoto 'origin' configurado.\n\nConfigure-o via linha de comando com 'git remote add origin <URL>'.")
-                return
+    def tratar_evento_git(self, trabalho, evento, dados):
+        if evento == "inicio":
+            self.label_status.configure(text=f"{trabalho.descricao}...")
+            self.barra_progresso.set(0)
+            self.botao_cancelar.configure(state="normal")
+            return
 
-            origin = repo.remote(name='origin')
-            
-            # Executa o push
-            push_info = origin.push()
+        if evento == "progresso":
+            mensagem, percentual = dados
+            self.label_status.configure(text=f"{trabalho.descricao}: {mensagem}")
+            if percentual is not None:
+                self.barra_progresso.set(percentual)
+            return
 
-            # Verifica se houve algum erro no push
-            if any(info.flags & git.PushInfo.ERROR for info in push_info):
-                # Tenta extrair uma mensagem de erro, se houver
-                error_summary = push_info[0].summary if push_info else "Erro desconhecido."
-                raise RuntimeError(f"Falha no push: {error_summary}")
+        # Fim do trabalho (concluído, com erro ou cancelado)
+        self.botao_cancelar.configure(state="disabled")
+        self.barra_progresso.set(1 if evento == "concluido" else 0)
 
+        if trabalho is self.trabalho_salvamento and not self.concluir_salvamento(evento, dados):
+            return
+
+        if evento == "cancelado":
+            self.label_status.configure(text=f"Cancelado: {trabalho.descricao}")
+
+        elif evento == "erro":
+            self.label_status.configure(text=f"Erro: {trabalho.descricao}")
+            if isinstance(dados, ImportError):
+                messagebox.showerror("Git", f"O GitPython não está instalado (pip install gitpython):\n\n{dados}")
+            elif isinstance(dados, importar_git().InvalidGitRepositoryError):
+                erro_msg = "Erro: A pasta do projeto não é um repositório Git. Execute 'git init'."
+                print(erro_msg)
+                messagebox.showwarning("Git não encontrado", erro_msg)
+            elif trabalho.tipo == "push":
+                messagebox.showerror("Erro de Push", f"Falha ao enviar as alterações para o servidor:\n\n{dados}")
+            else:
+                erro_msg = f"Ocorreu um erro durante o commit no Git: {dados}"
+                print(erro_msg)
+                messagebox.showerror("Erro de Git", erro_msg)
+
+        elif trabalho.tipo == "commit":
+            if dados is None:
+                self.label_status.configure(text="Nenhuma alteração detectada no arquivo para commitar.")
+            else:
+                print(f"Commit realizado com sucesso: '{trabalho.parametros['mensagem']}'")
+                self.label_status.configure(text=f"Alterações salvas e commitadas ({dados[:7]}).")
+
+        elif trabalho.tipo == "push":
+            self.label_status.configure(text="Alterações publicadas.")
             messagebox.showinfo("Publicado com Sucesso", "As alterações foram enviadas para o servidor com sucesso!")
 
-        except Exception as e:
-            messagebox.showerror("Erro de Push", f"Falha ao enviar as alterações para o servidor:\n\n{e}")
-        finally:
-            self.configure(cursor="") # Restaura o cursor ao normal
-            self.update_idletasks()
+        elif trabalho.tipo == "status":
+            if dados["a_enviar"]:
+                self.label_status.configure(text=f"{dados['a_enviar']} commit(s) aguardando publicação.")
+            else:
+                self.label_status.configure(text="Tudo publicado.")
+
+    def destroy(self):
+        # Para a leitura de eventos e libera a thread do Git
+        if self._after_eventos_git is not None:
+            self.after_cancel(self._after_eventos_git)
+            self._after_eventos_git = None
+        if self._after_carregamento is not None:
+            self.after_cancel(self._after_carregamento)
+            self._after_carregamento = None
+        if self._after_filtro is not None:
+            self.after_cancel(self._after_filtro)
+            self._after_filtro = None
+        if self._after_observador is not None:
+            self.after_cancel(self._after_observador)
+            self._after_observador = None
+        if self.observador is not None:
+            self.observador.encerrar()
+        self.fila_git.encerrar()
+        # Resume o diário (o que não foi salvo continua nele, fora do jornal.json)
+        if self.diario is not None:
+            try:
+                self.diario.compactar()
+            except Exception as e:
+                print(f"Erro ao compactar o diário: {e}")
+        super().destroy()
 
     def abrir_janela_adicionar(self):
         """Abre a janela de formulário para adicionar uma nova notícia."""
-        JanelaFormularioNoticia(self, callback_salvar=self.adicionar_nova_noticia)
+        with desempenho.medir("abrir_formulario", modo="adicionar"):
+            JanelaFormularioNoticia(self, callback_salvar=self.adicionar_nova_noticia)
 
-    def adicionar_nova_noticia(self, noticia, eh_destaque):
-        """Recebe a nova notícia do formulário, adiciona aos dados e salva."""
-        # Adiciona a nova notícia à lista de notícias em memória
-        self.noticias.insert(0, noticia) # Insere no início
+    def adicionar_nova_noticia(self, _id_original, noticia, eh_destaque):
+        """Recebe a nova notícia do formulário e a adiciona à sessão (só vai para o arquivo ao Salvar)."""
+        id_selecionado = self.id_selecionado()
 
-        # Se for destaque, adiciona o ID à lista de destaques
-        if eh_destaque:
-            if noticia["id"] not in self.dados["destaques"]:
-                self.dados["destaques"].append(noticia["id"])
-        
-        # Atualiza a lista na interface
+        # Adiciona a nova notícia ao repositório (já na posição certa pela data)
+        try:
+            self.sessao.adicionar(noticia, eh_destaque)
+        except ValueError as e:
+            messagebox.showerror("Erro", str(e))
+            return
+
+        # Atualiza a lista na interface; a seleção atual pode ter mudado de posição
         self.atualizar_lista_noticias()
-        
-        # Salva os dados no arquivo JSON
-        self.salvar_alteracoes_no_arquivo(commit_message=f"Adiciona notícia: {noticia['titulo'][:30]}...")
-        print(f"Notícia '{noticia['titulo']}' adicionada com sucesso!")
-    
-    def salvar_alteracoes_no_arquivo(self):
-        """Salva o estado atual dos dados (self.dados) no arquivo JSON."""
-        # Atualiza a lista de notícias no dicionário principal
-        self.dados['noticias'] = self.noticias
+        self.reposicionar_selecao(id_selecionado)
 
-        caminho_arquivo_json = "noticias.json"
-        
-        try:
-            with open("jornal.json", "w", encoding="utf-8") as f:
-                json.dump(self.dados, f, indent=2, ensure_ascii=False)
-            print(f"Arquivo '{caminho_arquivo_json}' salvo com sucesso.")
+        # Mostra a notícia nova (se ela passar pelo filtro atual)
+        if noticia["id"] in self.visao:
+            self.lista_noticias.mostrar_indice(self.visao.posicao_de(noticia["id"]))
+        self.atualizar_estado_sessao()
+        print(f"Notícia '{noticia['titulo']}' adicionada (não salva).")
 
-            if not commit_message:
-                commit_message = f"Atualiza conteúdo: {os.path.basename(caminho_arquivo_json)}"
+    def excluir_noticia(self):
+        """Remove a notícia selecionada da sessão (só sai do arquivo ao Salvar)."""
+        if self.indice_selecionado is None:
+            return
 
-            self.commitar_alteracoes(caminho_arquivo_json, mensagem=commit_message)
+        noticia = self.visao[self.indice_selecionado]
+        if not messagebox.askyesno("Confirmar Exclusão", f"Deseja excluir a notícia '{noticia['titulo']}'?"):
+            return
 
-        except Exception as e:
-            print(f"Erro ao salvar o arquivo: {e}")
-            messagebox.showerror("Erro", f"Ocorreu um erro ao salvar as alterações: {e}")
-            # (Aqui poderíamos mostrar uma mensagem de erro para o usuário)
+        self.sessao.remover(noticia["id"])
 
-    def commitar_alteracoes(self, arquivo_modificado, mensagem):
-        """Adiciona o arquivo modificado e faz um commit no repositório Git."""
-        try:
-            # Abre o repositório Git na pasta atual
-            repo = git.Repo('.')
-
-            # Verifica se o arquivo foi realmente modificado pelo Git
-            if not repo.is_dirty(path=arquivo_modificado):
-                print("Nenhuma alteração detectada no arquivo para commitar.")
-                # Podemos opcionalmente mostrar uma mensagem de que nada mudou
-                # messagebox.showinfo("Informação", "Nenhuma alteração para salvar.")
+        self.limpar_campos_detalhes()
+        self.botao_editar.configure(state="disabled")
+        self.botao_excluir.configure(state="disabled")
+        self.indice_selecionado = None
+        self.lista_noticias.indice_selecionado = None
+        self.atualizar_lista_noticias()
+        self.atualizar_estado_sessao()
+        print(f"Notícia '{noticia['titulo']}' excluída (não salva).")
+
+    def atualizar_estado_sessao(self):
+        """Mostra no título da janela e na barra de status se há alterações não salvas."""
+        quantidade = len(self.sessao.alteracoes)
+        if quantidade:
+            self.title("Gerenciador de Notícias *")
+            self.botao_salvar.configure(state="disabled" if self.salvamento is not None else "normal")
+            self.label_status.configure(text=f"{quantidade} notícia(s) alterada(s) aguardando 'Salvar'.")
+        else:
+            self.title("Gerenciador de Notícias")
+            self.botao_salvar.configure(state="disabled")
+
+    def salvar_alteracoes_no_arquivo(self):
+        """Grava todas as alterações da sessão no jornal.json (uma única escrita atômica), gera os arquivos do site e faz um único commit.
+
+        A gravação e os geradores rodam na thread do Git, como preparação do
+        commit, para não travar a janela; concluir_salvamento termina o trabalho
+        quando a fila avisar. Retorna True se o salvamento foi agendado.
+        """
+        if not self.sessao.tem_alteracoes or self.salvamento is not None:
+            return False
+
+        # Traz antes o que tiver mudado no disco e o observador ainda não viu, para não gravar por cima
+        if self.observador is not None:
+            self.observador.verificar_agora()
+            self.ler_eventos_arquivos()
+
+        # Confere os dados antes de gravar: o jornal como está em memória, os demais JSON como estão no disco
+        jornal = {**self.sessao.dados, **self.repositorio.para_dict()}
+        if not self.confirmar_validacao({os.path.basename(self.sessao.caminho_arquivo): jornal}):
+            return False
+
+        self.salvamento = self.sessao.preparar_salvamento()
+        self.trabalho_salvamento = self.fila_git.commit([], self.salvamento["mensagem"], preparar=functools.partial(self.gravar_salvamento, self.salvamento))
+        self.botao_salvar.configure(state="disabled")
+        self.label_status.configure(text="Salvando as alterações...")
+        return True
+
+    def gravar_salvamento(self, salvamento):
+        """Grava o retrato da sessão e roda os geradores (na thread do Git); retorna os arquivos para o commit."""
+        arquivos = self.sessao.gravar(salvamento)
+        if self.observador is not None:
+            self.observador.conhecer(self.sessao.caminho_arquivo) # A gravação é nossa: não é uma mudança externa
+        salvamento["gravado"] = True
+        return arquivos
+
+    def concluir_salvamento(self, evento, dados):
+        """Fecha o salvamento quando o trabalho da fila termina; retorna False se o evento já foi tratado aqui."""
+        salvamento = self.salvamento
+        self.salvamento = None
+        self.trabalho_salvamento = None
+
+        if not salvamento.get("gravado"):
+            # Nada foi gravado (erro ao gravar ou cancelado na fila): as alterações continuam pendentes
+            self._fechar_apos_salvar = False
+            self.atualizar_estado_sessao()
+            if evento == "erro":
+                print(f"Erro ao salvar o arquivo: {dados}")
+                self.label_status.configure(text="Erro ao salvar as alterações.")
+                messagebox.showerror("Erro", f"Ocorreu um erro ao salvar as alterações: {dados}")
+            else:
+                self.label_status.configure(text="Salvamento cancelado.")
+            return False
+
+        # O arquivo foi gravado: o que estava no retrato deixa de ser pendente, mesmo que o commit falhe
+        print(f"Arquivo '{self.sessao.caminho_arquivo}' salvo com sucesso.")
+        self.sessao.concluir_salvamento(salvamento)
+        self.base_jornal = retrato(salvamento["dados"])
+        self.atualizar_estado_sessao()
+        if self._fechar_apos_salvar and not self.sessao.tem_alteracoes:
+            self.after_idle(self.destroy)
+        return True
+
+    def confirmar_validacao(self, substitutos=None):
+        """Valida os JSON de dados antes de um commit; se houver erros, pergunta se deve seguir assim mesmo."""
+        problemas = validar_dados(substitutos=substitutos)
+        erros = so_erros(problemas)
+        if len(problemas) > len(erros):
+            print(f"{len(problemas) - len(erros)} aviso(s) na validação dos dados (veja com 'python validacao_dados.py').")
+        if not erros:
+            return True
+
+        linhas = [formatar_problema(problema) for problema in erros[:LIMITE_ERROS_VALIDACAO]]
+        if len(erros) > LIMITE_ERROS_VALIDACAO:
+            linhas.append(f"... e mais {len(erros) - LIMITE_ERROS_VALIDACAO}")
+        return messagebox.askyesno("Problemas nos Dados", f"A validação encontrou {len(erros)} erro(s) nos dados:\n\n" + "\n".join(linhas) + "\n\nDeseja continuar mesmo assim?")
+
+    def fechar(self):
+        """Fecha a janela, avisando se há alterações não salvas."""
+        if self.salvamento is not None:
+            # Fecha quando o salvamento em andamento terminar
+            self._fechar_apos_salvar = True
+            self.label_status.configure(text="A janela fecha assim que o salvamento terminar...")
+            return
+        if self.sessao is not None and self.sessao.tem_alteracoes:
+            resposta = messagebox.askyesnocancel("Alterações não salvas", "Existem alterações que ainda não foram salvas no Git.\n\nDeseja salvá-las antes de fechar?\n(Se não, elas continuam gravadas no disco e entram no próximo salvamento.)")
+            if resposta is None:
+                return
+            if resposta:
+                # A janela fecha em concluir_salvamento; se falhar ao salvar, ela fica aberta
+                self._fechar_apos_salvar = self.salvar_alteracoes_no_arquivo()
                 return
+        self.destroy()
 
-            # Adiciona o arquivo ao stage
-            repo.index.add([arquivo_modificado])
-            
-            # Faz o commit
-            repo.index.commit(mensagem)
-            
-            print(f"Commit realizado com sucesso: '{mensagem}'")
-            messagebox.showinfo("Sucesso", "Alterações salvas e commitadas no Git com sucesso!")
+    def carregar_dados(self):
+        """Começa a ler o jornal.json em uma thread; acompanhar_carregamento conclui na thread do Tk."""
+        self.label_status.configure(text="Carregando notícias...")
+        self.carregamento = Future()
+
+        def ler():
+            try:
+                self.carregamento.set_result(self.ler_dados())
+            except Exception as e:
+                self.carregamento.set_exception(e)
+
+        threading.Thread(target=ler, name="carregar-jornal", daemon=True).start()
+        self.acompanhar_carregamento()
+
+    def ler_dados(self):
+        """Lê o jornal.json e o diário e monta o repositório e a sessão (roda fora da thread do Tk)."""
+        with desempenho.medir("carregar_dados"):
+            # Se o arquivo não existir ou for inválido, começa com uma estrutura vazia
+            dados = carregar_jornal("jornal.json")
+
+            with desempenho.medir("indexar_noticias", noticias=len(dados.get("noticias", []))):
+                repositorio = RepositorioNoticias(dados)
+
+            # Índice de termos do filtro da lista; daqui em diante o repositório o mantém a cada alteração
+            with desempenho.medir("indexar_texto", noticias=len(repositorio)):
+                repositorio.indexar_texto()
+
+            # Reaplica alterações que ficaram no diário (o programa fechou antes de incorporá-las)
+            diario = DiarioAlteracoes("jornal.json")
+            sessao = SessaoEdicao(repositorio, "jornal.json", dados, diario=diario, geradores=GERADORES_PADRAO)
+            recuperadas = sessao.reproduzir(diario.pendentes())
+        return dados, repositorio, diario, sessao, recuperadas
 
-        except git.InvalidGitRepositoryError:
-            erro_msg = "Erro: A pasta do projeto não é um repositório Git. Execute 'git init'."
-            print(erro_msg)
-            messagebox.showwarning("Git não encontrado", erro_msg)
+    def acompanhar_carregamento(self):
+        """Verifica periodicamente se a leitura terminou e, então, preenche a janela."""
+        if not self.carregamento.done():
+            self._after_carregamento = self.after(50, self.acompanhar_carregamento)
+            return
+        self._after_carregamento = None
+
+        try:
+            self.dados, self.repositorio, self.diario, self.sessao, self.alteracoes_recuperadas = self.carregamento.result()
         except Exception as e:
-            erro_msg = f"Ocorreu um erro durante o commit no Git: {e}"
-            print(erro_msg)
-            messagebox.showerror("Erro de Git", erro_msg)
+            self.label_status.configure(text="Não foi possível carregar as notícias.")
+            messagebox.showerror("Erro", f"Não foi possível carregar o jornal.json:\n\n{e}")
+            return
 
-    def carregar_dados(self):
-        """Carrega os dados do arquivo jornal.json"""
+        self.atualizar_lista_noticias()
+        self.botao_adicionar.configure(state="normal")
+        self.label_status.configure(text=f"{len(self.repositorio)} notícia(s) carregada(s).")
+
+        # A partir daqui, mudanças no jornal.json feitas por fora são mescladas por ID
+        self.base_jornal = retrato(self.dados)
+        self.observador = ObservadorArquivos(os.path.dirname(os.path.abspath(self.sessao.caminho_arquivo)))
+        self.processar_eventos_arquivos()
+
+        # Verifica se há commits a publicar
+        self.fila_git.status()
+
+        if self.repositorio.ids_repetidos:
+            repetidos = sorted(set(self.repositorio.ids_repetidos))
+            lista = ", ".join(repetidos[:LIMITE_ERROS_VALIDACAO]) + (" ..." if len(repetidos) > LIMITE_ERROS_VALIDACAO else "")
+            messagebox.showwarning("IDs Repetidos", f"O jornal.json tem {len(self.repositorio.ids_repetidos)} notícia(s) com ID repetido: {lista}\n\nSó a primeira ocorrência de cada ID foi carregada; as demais saem do arquivo no próximo 'Salvar'.")
+
+        if self.alteracoes_recuperadas:
+            print(f"{self.alteracoes_recuperadas} alteração(ões) recuperada(s) do diário.")
+            self.diario.agendar_compactacao()
+            self.atualizar_estado_sessao()
+            messagebox.showinfo("Alterações Recuperadas", f"{self.alteracoes_recuperadas} alteração(ões) que não tinham sido salvas foram recuperadas.\n\nClique em 'Salvar' para registrá-las no Git.")
+
+    def processar_eventos_arquivos(self):
+        """Lê periodicamente as mudanças vistas pelo observador de arquivos."""
+        self.ler_eventos_arquivos()
+        self._after_observador = self.after(250, self.processar_eventos_arquivos)
+
+    def ler_eventos_arquivos(self):
+        if self.salvamento is not None:
+            return # Espera o salvamento terminar: base_jornal ainda não é o arquivo que está sendo gravado
         try:
-            with open("jornal.json", "r", encoding="utf-8") as f:
-                self.dados = json.load(f)
-                self.noticias = self.dados['noticias']
-        except (FileNotFoundError, json.JSONDecodeError):
-            # Se o arquivo não existir ou for inválido, começa com uma estrutura vazia
-            self.dados = {"destaques": [], "noticias": []}
-            self.noticias = []
+            while True:
+                caminho, dados, erro = self.observador.eventos.get_nowait()
+                self.tratar_arquivo_externo(caminho, dados, erro)
+        except queue.Empty:
+            pass
+
+    def tratar_arquivo_externo(self, caminho, dados, erro):
+        """Incorpora uma mudança feita fora do gerenciador.
+
+        No jornal.json, só as notícias que mudaram são trazidas para a memória; as
+        que também foram alteradas aqui (e ainda não salvas) são perguntadas uma a
+        uma. Os demais JSON não ficam em memória: os arquivos do site derivados deles
+        são regenerados no próximo 'Salvar'.
+        """
+        nome = os.path.basename(caminho)
+        if erro is not None:
+            self.label_status.configure(text=f"{nome} foi alterado fora do gerenciador, mas não é um JSON válido: {erro}")
+            return
+        if caminho != os.path.abspath(self.sessao.caminho_arquivo):
+            if dados is not None:
+                self.label_status.configure(text=f"{nome} foi alterado fora do gerenciador; os arquivos do site serão atualizados no próximo 'Salvar'.")
+            return
+        if dados is None:
+            self.label_status.configure(text=f"{nome} foi apagado fora do gerenciador; o próximo 'Salvar' o recria.")
+            return
+
+        with desempenho.medir("comparar_jornal_externo", noticias=len(dados.get("noticias", []))):
+            externas, conflitos = self.sessao.comparar_externo(self.base_jornal, dados)
+        noticias_externo = retrato(dados)[0]
+        for id_noticia in conflitos:
+            titulo = (self.repositorio.obter(id_noticia) or noticias_externo.get(id_noticia) or {}).get("titulo", id_noticia)
+            if not messagebox.askyesno("Conflito de Edição", f"A notícia '{titulo}' foi alterada no jornal.json fora do gerenciador e também aqui (ainda não salva).\n\nManter a sua versão?\n(Se não, a versão do arquivo substitui a sua.)"):
+                externas.append(id_noticia)
+        self.base_jornal = retrato(dados)
+        if not externas:
+            return
+
+        id_selecionado = self.id_selecionado()
+        self.sessao.aplicar_externas(dados, externas)
+        self.atualizar_lista_noticias()
+        self.reposicionar_selecao(id_selecionado)
+        # A notícia aberta nos detalhes pode ter sido a alterada
+        if id_selecionado in externas and self.indice_selecionado is not None:
+            self.mostrar_detalhes(self.indice_selecionado)
+        self.atualizar_estado_sessao()
+        self.label_status.configure(text=f"{len(externas)} notícia(s) atualizada(s) a partir do {nome}.")
+        print(f"{len(externas)} notícia(s) alterada(s) fora do gerenciador incorporada(s).")
 
     def atualizar_lista_noticias(self):
-        """Limpa e recarrega a lista de notícias na interface."""
-        # Limpa a lista antiga
-        for widget in self.lista_noticias.winfo_children():
-            widget.destroy()
-
-        # Adiciona um botão para cada notícia
-        for i, noticia in enumerate(self.noticias):
-            titulo = noticia.get("titulo", "Sem título")
-            # Usamos uma função lambda para passar o índice da notícia para o comando
-            btn = ctk.CTkButton(
-                self.lista_noticias,
-                text=titulo,
-                fg_color="transparent",
-                text_color=("black", "white"),
-                anchor="w",
-                command=lambda index=i: self.mostrar_detalhes(index)
-            )
-            btn.pack(fill="x", padx=5, pady=2)
+        """Reaplica o filtro, reaponta a lista da interface para o resultado e redesenha só as linhas visíveis que mudaram."""
+        with desempenho.medir("filtrar_noticias", noticias=len(self.repositorio)):
+            self.visao = self.repositorio.filtrar(**self.filtro_atual(), anterior=self.visao)
+        with desempenho.medir("reconstruir_lista", noticias=len(self.visao)):
+            self.lista_noticias.definir_itens(self.visao)
+
+        if self.visao is self.repositorio:
+            self.label_contagem.configure(text=f"{len(self.repositorio)} notícia(s)")
+        else:
+            self.label_contagem.configure(text=f"{len(self.visao)} de {len(self.repositorio)}")
+
+    def filtro_atual(self):
+        """Lê os campos de filtro; datas incompletas (ainda sendo digitadas) são ignoradas."""
+        datas = []
+        for variavel in (self.data_inicio_var, self.data_fim_var):
+            texto = variavel.get().strip()
+            datas.append(texto if PADRAO_DATA_FILTRO.fullmatch(texto) else "")
+        return {"texto": self.busca_var.get(), "inicio": datas[0], "fim": datas[1], "so_destaques": self.so_destaques_var.get()}
+
+    def agendar_filtro(self):
+        """Adia o filtro até a digitação parar, para não filtrar a cada tecla de uma palavra."""
+        if self._after_filtro is not None:
+            self.after_cancel(self._after_filtro)
+        self._after_filtro = self.after(ATRASO_FILTRO, self.aplicar_filtro)
+
+    def aplicar_filtro(self):
+        """Filtra a lista mantendo a notícia selecionada, se ela continuar visível."""
+        if self._after_filtro is not None:
+            self.after_cancel(self._after_filtro)
+            self._after_filtro = None
+        id_selecionado = self.id_selecionado()
+        self.atualizar_lista_noticias()
+        self.reposicionar_selecao(id_selecionado)
+
+    def reposicionar_selecao(self, id_noticia):
+        """Depois de a lista mudar, procura a notícia selecionada nela; se ela saiu da lista, limpa os detalhes."""
+        if id_noticia is not None and id_noticia in self.visao:
+            self.indice_selecionado = self.visao.posicao_de(id_noticia)
+            self.lista_noticias.selecionar(self.indice_selecionado)
+            return
+
+        if self.indice_selecionado is not None:
+            self.limpar_campos_detalhes()
+            self.botao_editar.configure(state="disabled")
+            self.botao_excluir.configure(state="disabled")
+        self.indice_selecionado = None
+        self.lista_noticias.selecionar(None)
+
+    def id_selecionado(self):
+        """Retorna o ID da notícia selecionada na lista, ou None."""
+        if self.indice_selecionado is None:
+            return None
+        return self.visao[self.indice_selecionado]["id"]
 
     def mostrar_detalhes(self, index):
         self.indice_selecionado = index
-        noticia = self.noticias[index]
+        self.lista_noticias.selecionar(index)
+        noticia = self.visao[index]
         
         # Limpa os campos antes de preencher
         self.limpar_campos_detalhes()
@@ -485,12 +1040,10 @@ class JanelaNoticias(ctk.CTkToplevel):
         self.textbox_conteudo_adicional.configure(state="disabled")
         
         # Verifica se a notícia é um destaque
-        if noticia.get("id") in self.dados.get("destaques", []):
-            self.destaque_var.set(True)
-        else:
-            self.destaque_var.set(False)
+        self.destaque_var.set(self.repositorio.eh_destaque(noticia.get("id")))
 
         self.botao_editar.configure(state="normal")
+        self.botao_excluir.configure(state="normal")
 
     def limpar_campos_detalhes(self):
         """Limpa todos os campos da tela de detalhes."""
@@ -513,44 +1066,93 @@ class JanelaNoticias(ctk.CTkToplevel):
         if self.indice_selecionado is None:
             return
 
-        noticia_selecionada = self.noticias[self.indice_selecionado]
+        noticia_selecionada = self.visao[self.indice_selecionado]
         
         # Abre a mesma janela de formulário, mas passando a notícia existente
-        JanelaFormularioNoticia(self, 
-                                callback_salvar=self.editar_noticia, 
-                                noticia_existente=noticia_selecionada)
+        with desempenho.medir("abrir_formulario", modo="editar"):
+            JanelaFormularioNoticia(self, 
+                                    callback_salvar=self.editar_noticia, 
+                                    noticia_existente=noticia_selecionada)
 
     def editar_noticia(self, id_original, noticia_modificada, eh_destaque):
-        """Substitui os dados da notícia antiga pelos novos e salva."""
-        # Encontra a notícia original pelo ID e a substitui
-        for i, noticia in enumerate(self.noticias):
-            if noticia['id'] == id_original:
-                self.noticias[i] = noticia_modificada
-                break
-        
-        # Atualiza a lista de destaques
-        id_modificado = noticia_modificada['id']
-        # Remove o ID antigo da lista de destaques (caso o ID tenha mudado)
-        if id_original in self.dados['destaques']:
-            self.dados['destaques'].remove(id_original)
-        
-        # Adiciona o novo ID se for um destaque
-        if eh_destaque and id_modificado not in self.dados['destaques']:
-            self.dados['destaques'].append(id_modificado)
-
-        # Reordena as notícias por data, caso a data tenha sido alterada
-        self.noticias = sorted(self.dados['noticias'], key=lambda x: x['data'], reverse=True)
+        """Substitui os dados da notícia antiga pelos novos na sessão (só vai para o arquivo ao Salvar)."""
+        # Substitui a notícia pelo ID; o repositório a reposiciona se a data mudou
+        # e atualiza os destaques (inclusive se o ID tiver mudado)
+        try:
+            self.sessao.editar(id_original, noticia_modificada, eh_destaque)
+        except (KeyError, ValueError) as e:
+            messagebox.showerror("Erro", f"Não foi possível editar a notícia: {e}")
+            return
 
         # Atualiza a interface gráfica
         self.atualizar_lista_noticias()
         # Limpa os campos de detalhes, pois os dados podem ter mudado
         self.limpar_campos_detalhes()
         self.botao_editar.configure(state="disabled")
+        self.botao_excluir.configure(state="disabled")
         self.indice_selecionado = None
+        self.lista_noticias.selecionar(None)
+        self.atualizar_estado_sessao()
+        print(f"Notícia '{noticia_modificada['titulo']}' editada (não salva).")
+
+# --- Painel de Desempenho ---
+class JanelaDesempenho(ctk.CTkToplevel):
+    """Mostra o p50/p95 recente de cada operação medida (ver desempenho.py)."""
+
+    INTERVALO_ATUALIZACAO = 2000 # ms
+
+    def __init__(self, master):
+        super().__init__(master)
+        self.title("Desempenho")
+        self.geometry("620x420")
+        self.transient(master)
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
 
-        # Salva no arquivo e commita
-        self.salvar_alteracoes_no_arquivo(commit_message=f"Edita notícia: {noticia_modificada['titulo'][:30]}...")
-        print(f"Notícia '{noticia_modificada['titulo']}' editada com sucesso!")
+        self.texto = ctk.CTkTextbox(self, font=ctk.CTkFont(family="Courier", size=13), wrap="none")
+        self.texto.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+
+        frame_rodape = ctk.CTkFrame(self, fg_color="transparent")
+        frame_rodape.grid(row=1, column=0, padx=10, pady=(0, 10), sticky="ew")
+        frame_rodape.grid_columnconfigure(0, weight=1)
+        registro = desempenho.registro_ativo()
+        caminho_log = registro.caminho if registro else "desativado"
+        ctk.CTkLabel(frame_rodape, text=f"Log: {caminho_log}", anchor="w").grid(row=0, column=0, sticky="ew")
+        ctk.CTkButton(frame_rodape, text="Atualizar", width=100, command=self.atualizar).grid(row=0, column=1)
+
+        self._after_atualizar = None
+        self.atualizar()
+
+    def atualizar(self):
+        """Redesenha a tabela e agenda a próxima atualização."""
+        if self._after_atualizar is not None:
+            self.after_cancel(self._after_atualizar)
+
+        registro = desempenho.registro_ativo()
+        resumo = registro.resumo() if registro else {}
+
+        linhas = [f"{'Operação':<24}{'Qtd':>6}{'p50 (ms)':>12}{'p95 (ms)':>12}{'Última':>12}", "-" * 66]
+        for operacao, valores in resumo.items():
+            linhas.append(
+                f"{operacao:<24}{valores['quantidade']:>6}{valores['p50_ms']:>12.1f}"
+                f"{valores['p95_ms']:>12.1f}{valores['ultimo_ms']:>12.1f}"
+            )
+        if not resumo:
+            linhas.append("Nenhuma medição ainda.")
+
+        self.texto.configure(state="normal")
+        self.texto.delete("1.0", "end")
+        self.texto.insert("1.0", "\n".join(linhas))
+        self.texto.configure(state="disabled")
+
+        self._after_atualizar = self.after(self.INTERVALO_ATUALIZACAO, self.atualizar)
+
+    def destroy(self):
+        if self._after_atualizar is not None:
+            self.after_cancel(self._after_atualizar)
+            self._after_atualizar = None
+        super().destroy()
 
 # --- Tela Principal (Menu) ---
 class App(ctk.CTk):
@@ -579,7 +1181,11 @@ class App(ctk.CTk):
         # botao_eventos = ctk.CTkButton(main_frame, text="Gerenciar Eventos", state="disabled")
         # botao_eventos.pack(pady=10, padx=20, fill="x")
 
+        botao_desempenho = ctk.CTkButton(main_frame, text="Desempenho", command=self.abrir_janela_desempenho, fg_color="gray40")
+        botao_desempenho.pack(pady=10, padx=20, fill="x")
+
         self.janela_noticias = None # Para garantir que apenas uma janela de notícias seja aberta
+        self.janela_desempenho = None
 
     def abrir_janela_noticias(self):
         # Verifica se a janela já não está aberta ou foi minimizada
@@ -589,9 +1195,19 @@ class App(ctk.CTk):
         else:
             self.janela_noticias.focus()  # Se já estiver aberta, apenas foca nela
 
+    def abrir_janela_desempenho(self):
+        if self.janela_desempenho is None or not self.janela_desempenho.winfo_exists():
+            self.janela_desempenho = JanelaDesempenho(self)
+        else:
+            self.janela_desempenho.focus()
+
 if __name__ == "__main__":
     ctk.set_appearance_mode("System") # Pode ser "Light", "Dark"
     ctk.set_default_color_theme("blue")
     
-    app = App()
-    app.mainloop()
+    # Tempos das operações vão para data/desempenho.jsonl (e para o painel "Desempenho")
+    desempenho.ativar()
+
+    with desempenho.perfil_da_sessao():
+        app = App()
+        app.mainloop()
@@ -0,0 +1,72 @@
+import json
+import os
+import stat
+import tempfile
+
+from desempenho import medir
+
+
+def _ler_umask():
+    # os.umask só lê trocando o valor; feito uma vez, na importação, antes das threads
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+UMASK = _ler_umask()
+
+
+def escrever_atomico(caminho, conteudo, modo="w", encoding="utf-8"):
+    """Grava o arquivo de forma atômica: escreve em um temporário na mesma pasta,
+    faz fsync e só então o renomeia por cima do original.
+
+    Se algo falhar no meio do caminho, o arquivo antigo continua intacto. O
+    arquivo mantém as permissões do original (ou as de um arquivo novo, pela
+    umask), e não as 0600 do temporário.
+    """
+    pasta = os.path.dirname(os.path.abspath(caminho))
+    os.makedirs(pasta, exist_ok=True)
+    try:
+        permissoes = stat.S_IMODE(os.stat(caminho).st_mode)
+    except FileNotFoundError:
+        permissoes = 0o666 & ~UMASK
+
+    descritor, caminho_temporario = tempfile.mkstemp(dir=pasta, prefix=".tmp-", suffix=os.path.basename(caminho))
+    try:
+        with os.fdopen(descritor, modo, encoding=None if "b" in modo else encoding) as f:
+            f.write(conteudo)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(caminho_temporario, permissoes)
+        os.replace(caminho_temporario, caminho)
+    except BaseException:
+        if os.path.exists(caminho_temporario):
+            os.remove(caminho_temporario)
+        raise
+
+    # Garante que a renomeação também foi gravada em disco (não suportado no Windows)
+    if hasattr(os, "O_DIRECTORY"):
+        descritor_pasta = os.open(pasta, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(descritor_pasta)
+        finally:
+            os.close(descritor_pasta)
+
+
+def escrever_json_atomico(caminho, dados, indent=2):
+    """Serializa os dados e os grava com escrever_atomico."""
+    with medir("json_dump", arquivo=os.path.basename(caminho)):
+        escrever_atomico(caminho, json.dumps(dados, indent=indent, ensure_ascii=False))
+
+
+def escrever_se_mudou(caminho, texto):
+    """Grava o texto (de forma atômica) só se ele for diferente do conteúdo atual. Retorna True se gravou."""
+    try:
+        with open(caminho, "r", encoding="utf-8") as f:
+            if f.read() == texto:
+                return False
+    except FileNotFoundError:
+        pass
+
+    escrever_atomico(caminho, texto)
+    return True
@@ -0,0 +1,421 @@
+"""Medições de desempenho do gerenciador com jornais sintéticos.
+
+Gera arquivos jornal.json realistas (texto em português, corpo em HTML,
+destaques) com uma semente fixa e mede os caminhos usados pelo app.py:
+carregar, salvar (com os geradores), reconstruir a lista, editar e reordenar,
+commit e push (para um repositório "bare" local no papel do servidor).
+Também mede a inicialização: o tempo de importar o app.py em um processo novo
+e se algum módulo pesado (GitPython, Pillow...) foi importado antes da hora.
+
+    python benchmark.py executar                      # 100, 10 mil e 100 mil notícias
+    python benchmark.py executar --tamanhos 100 1000 --comparar anterior.json
+    python benchmark.py gerar 10000 /tmp/jornal.json  # só gera o arquivo
+
+Os resultados (em milissegundos) vão para um arquivo JSON; com --comparar, o
+comando termina com erro se alguma medição piorou além da tolerância.
+"""
+import argparse
+import datetime
+import functools
+import importlib.util
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from arquivos import escrever_json_atomico
+from indice_busca import gerar_indice_busca
+from publicacao_jornal import gerar_publicacao
+from renderizacao_jornal import gerar_paginas_estaticas
+from repositorio_noticias import RepositorioNoticias
+from sessao_edicao import SessaoEdicao, carregar_jornal
+
+PASTA_DADOS = os.path.dirname(os.path.abspath(__file__))
+ARQUIVO_RESULTADOS = os.path.join(PASTA_DADOS, "benchmark_resultados.json")
+
+TAMANHOS_PADRAO = (100, 10_000, 100_000)
+SEMENTE_PADRAO = 2025
+REPETICOES_PADRAO = 5
+EDICOES_POR_RODADA = 200
+LINHAS_VISIVEIS = 20 # Linhas que a ListaVirtualNoticias mostra em uma janela típica
+
+# Módulos que o app só deve importar quando precisar deles (não na abertura)
+MODULOS_PESADOS = ("git", "PIL", "cProfile")
+# Sem o customtkinter, mede os módulos que o app.py importa
+MODULOS_APP_SEM_INTERFACE = "repositorio_noticias, fila_git, sessao_edicao, diario_alteracoes, imagens, desempenho"
+
+PALAVRAS = (
+    "paróquia comunidade missa celebração catequese crisma batismo festa padroeiro novena "
+    "oração família jovens pastoral caridade campanha doação alimentos inscrições encontro "
+    "retiro liturgia advento quaresma páscoa natal procissão terço rosário santo santa "
+    "igreja capela fiéis voluntários coral música leitura evangelho homilia bênção "
+    "sacramento confissão reconciliação esperança fé alegria partilha solidariedade "
+    "domingo sábado semana mês horário salão reunião conselho dízimo obras reforma"
+).split()
+LIGACOES = ("de", "da", "do", "para", "com", "em", "na", "no", "e", "a", "o", "nossa", "todos")
+CATEGORIAS_TITULO = ("Aviso", "Festa", "Campanha", "Catequese", "Inscrições", "Celebração", "Encontro")
+
+
+# --- Geração dos dados ---
+
+def _frase(aleatorio, minimo, maximo):
+    palavras = []
+    for _ in range(aleatorio.randint(minimo, maximo)):
+        palavras.append(aleatorio.choice(LIGACOES if aleatorio.random() < 0.3 else PALAVRAS))
+    frase = " ".join(palavras)
+    return frase[0].upper() + frase[1:]
+
+
+def _corpo_html(aleatorio):
+    paragrafos = [f"<p>{_frase(aleatorio, 25, 60)}.</p>" for _ in range(aleatorio.randint(1, 4))]
+    if aleatorio.random() < 0.4:
+        itens = "".join(f"<li>{_frase(aleatorio, 3, 8)}</li>" for _ in range(aleatorio.randint(2, 5)))
+        paragrafos.append(f"<b><h3>{_frase(aleatorio, 1, 3)}</h3></b><ul>{itens}</ul>")
+    return "\n".join(paragrafos)
+
+
+def gerar_jornal(quantidade, semente=SEMENTE_PADRAO):
+    """Gera um jornal sintético com a quantidade de notícias pedida (o mesmo para a mesma semente)."""
+    aleatorio = random.Random(semente)
+    inicio = datetime.date(2010, 1, 1)
+    dias = (datetime.date(2026, 12, 31) - inicio).days
+
+    noticias = []
+    for numero in range(quantidade):
+        data = inicio + datetime.timedelta(days=aleatorio.randint(0, dias))
+        foto = f"../images/noticias/sintetica-{aleatorio.randint(1, 50):02d}.jpg"
+        noticias.append({
+            "id": f"noticia-{numero:06d}",
+            "data": data.isoformat(),
+            "titulo": f"{aleatorio.choice(CATEGORIAS_TITULO)}: {_frase(aleatorio, 3, 8)}",
+            "subtitulo": _frase(aleatorio, 6, 14) + ".",
+            "foto_principal": foto,
+            "foto_secundaria": foto if aleatorio.random() < 0.3 else None,
+            "conteudo": _frase(aleatorio, 30, 80) + ".",
+            "conteudo_adicional": _corpo_html(aleatorio) if aleatorio.random() < 0.6 else "",
+        })
+
+    destaques = [noticia["id"] for noticia in aleatorio.sample(noticias, min(3, quantidade))]
+    return {"destaques": destaques, "noticias": noticias}
+
+
+# --- Medição ---
+
+def medir(funcao, repeticoes=REPETICOES_PADRAO, preparar=None):
+    """Executa a função várias vezes e retorna o tempo mínimo e a mediana, em milissegundos.
+
+    Se informado, preparar() roda antes de cada repetição, fora da medição.
+    """
+    tempos = []
+    for _ in range(repeticoes):
+        if preparar is not None:
+            preparar()
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return {"min_ms": round(min(tempos), 3), "mediana_ms": round(statistics.median(tempos), 3), "repeticoes": repeticoes}
+
+
+def _geradores(pasta):
+    """Os mesmos geradores do app, mas gravando dentro da pasta do benchmark."""
+    pasta_publicacao = os.path.join(pasta, "jornal")
+    return (
+        functools.partial(gerar_publicacao, pasta_saida=pasta_publicacao),
+        functools.partial(gerar_indice_busca, pasta_saida=os.path.join(pasta_publicacao, "busca")),
+        functools.partial(
+            gerar_paginas_estaticas,
+            pasta_saida=os.path.join(pasta, "paginas"),
+            arquivo_cache=os.path.join(pasta, "cache-renderizacao.json"),
+        ),
+    )
+
+
+def _editar_aleatoria(sessao, aleatorio):
+    """Muda a data (e o título) de uma notícia qualquer, forçando a reordenação."""
+    repositorio = sessao.repositorio
+    original = repositorio[aleatorio.randrange(len(repositorio))]
+    noticia = dict(original)
+    noticia["data"] = f"{aleatorio.randint(2010, 2026)}-{aleatorio.randint(1, 12):02d}-{aleatorio.randint(1, 28):02d}"
+    noticia["titulo"] = original["titulo"] + " (atualizada)"
+    sessao.editar(original["id"], noticia, repositorio.eh_destaque(original["id"]))
+
+
+def _filtrar_digitando(repositorio, aleatorio):
+    """Digita, tecla a tecla, uma busca de duas palavras (e depois um período), como no filtro da lista.
+
+    Retorna o número de filtragens feitas.
+    """
+    busca = f"{aleatorio.choice(CATEGORIAS_TITULO)} {aleatorio.choice(PALAVRAS)}"
+    # Cada busca começa sem cache, como depois de uma edição
+    repositorio.indice_texto._cache.clear()
+    visao = repositorio
+    for tamanho in range(1, len(busca) + 1):
+        visao = repositorio.filtrar(busca[:tamanho], anterior=visao)
+        if len(visao):
+            _reconstruir_lista(visao, aleatorio)
+    ano = str(aleatorio.randint(2010, 2026))
+    repositorio.filtrar(busca, inicio=ano, fim=ano, anterior=visao)
+    return len(busca) + 1
+
+
+def _reconstruir_lista(repositorio, aleatorio):
+    """O que atualizar_lista_noticias pede ao repositório: o total, a posição da
+    seleção e as linhas visíveis (a ListaVirtualNoticias só lê essas)."""
+    total = len(repositorio)
+    selecionada = repositorio[aleatorio.randrange(total)]["id"]
+    primeiro = max(0, min(repositorio.posicao_de(selecionada), total - LINHAS_VISIVEIS))
+    return [
+        (noticia.get("id"), noticia.get("titulo", "Sem título"))
+        for noticia in (repositorio[indice] for indice in range(primeiro, min(total, primeiro + LINHAS_VISIVEIS)))
+    ]
+
+
+def _aguardar(fila, trabalho):
+    """Espera o fim de um trabalho da FilaGit e levanta a exceção se ele falhou."""
+    while True:
+        origem, evento, resultado = fila.eventos.get()
+        if origem is trabalho and evento in ("concluido", "erro", "cancelado"):
+            if evento == "erro":
+                raise resultado
+            return resultado
+
+
+def medir_git(pasta, sessao, aleatorio):
+    """Mede commit e push com a FilaGit do app, usando um repositório bare local como 'origin'."""
+    try:
+        import git
+        from fila_git import FilaGit
+    except ImportError as e:
+        return {"indisponivel": f"GitPython não instalado ({e})"}
+
+    remoto = git.Repo.init(os.path.join(pasta, "remoto.git"), bare=True)
+    repo = git.Repo.init(pasta)
+    with repo.config_writer() as configuracao:
+        configuracao.set_value("user", "name", "Benchmark")
+        configuracao.set_value("user", "email", "benchmark@localhost")
+    repo.create_remote("origin", remoto.working_dir)
+
+    resultados = {}
+    fila = FilaGit(pasta)
+    try:
+        arquivos = [sessao.caminho_arquivo]
+        for subpasta in ("jornal", "paginas"):
+            for raiz, _, nomes in os.walk(os.path.join(pasta, subpasta)):
+                arquivos.extend(os.path.join(raiz, nome) for nome in nomes)
+
+        inicio = time.perf_counter()
+        _aguardar(fila, fila.commit(arquivos, "Importa jornal sintético"))
+        resultados["commit_inicial_ms"] = round((time.perf_counter() - inicio) * 1000, 3)
+
+        # O primeiro envio também cria o ramo no remoto e define o upstream
+        inicio = time.perf_counter()
+        repo.git.push("-u", "origin", "HEAD")
+        resultados["push_inicial_ms"] = round((time.perf_counter() - inicio) * 1000, 3)
+
+        # Caso do dia a dia: uma notícia editada, salva e publicada
+        _editar_aleatoria(sessao, aleatorio)
+        mensagem, arquivos = sessao.salvar()
+
+        inicio = time.perf_counter()
+        _aguardar(fila, fila.commit(arquivos, mensagem))
+        resultados["commit_ms"] = round((time.perf_counter() - inicio) * 1000, 3)
+        resultados["arquivos_no_commit"] = len(arquivos)
+
+        inicio = time.perf_counter()
+        _aguardar(fila, fila.push())
+        resultados["push_ms"] = round((time.perf_counter() - inicio) * 1000, 3)
+    finally:
+        fila.encerrar()
+    return resultados
+
+
+def medir_inicializacao(repeticoes=REPETICOES_PADRAO):
+    """Mede o tempo de importar o app.py em processos novos e lista os módulos pesados carregados."""
+    alvo = "app" if importlib.util.find_spec("customtkinter") else MODULOS_APP_SEM_INTERFACE
+    codigo = (
+        "import json, sys, time\n"
+        "inicio = time.perf_counter()\n"
+        f"import {alvo}\n"
+        "tempo = (time.perf_counter() - inicio) * 1000\n"
+        f"print(json.dumps([tempo, [m for m in {MODULOS_PESADOS!r} if m in sys.modules]]))"
+    )
+
+    tempos = []
+    pesados = set()
+    for _ in range(repeticoes):
+        saida = subprocess.run([sys.executable, "-c", codigo], cwd=PASTA_DADOS, capture_output=True, text=True, check=True)
+        tempo, carregados = json.loads(saida.stdout.strip().splitlines()[-1])
+        tempos.append(tempo)
+        pesados.update(carregados)
+
+    return {
+        "importado": alvo,
+        "importar": {"min_ms": round(min(tempos), 3), "mediana_ms": round(statistics.median(tempos), 3), "repeticoes": repeticoes},
+        "modulos_pesados": sorted(pesados),
+    }
+
+
+def executar_tamanho(quantidade, semente, repeticoes, com_git=True):
+    """Roda todas as medições para um jornal com a quantidade de notícias informada."""
+    aleatorio = random.Random(semente + 1)
+    pasta = tempfile.mkdtemp(prefix="benchmark-jornal-")
+    try:
+        caminho = os.path.join(pasta, "jornal.json")
+        dados = gerar_jornal(quantidade, semente)
+        escrever_json_atomico(caminho, dados)
+        resultados = {"noticias": quantidade, "tamanho_arquivo_bytes": os.path.getsize(caminho)}
+
+        # carregar_dados: leitura do JSON + montagem do índice ordenado
+        resultados["carregar"] = medir(lambda: RepositorioNoticias(carregar_jornal(caminho)), repeticoes)
+
+        dados = carregar_jornal(caminho)
+        repositorio = RepositorioNoticias(dados)
+        resultados["reconstruir_lista"] = medir(lambda: _reconstruir_lista(repositorio, aleatorio), repeticoes)
+
+        # Filtro da lista: montagem do índice de termos e o tempo médio por tecla de uma busca
+        resultados["indexar_texto"] = medir(repositorio.indexar_texto, repeticoes)
+        teclas = _filtrar_digitando(repositorio, random.Random(semente))
+        medicao = medir(lambda: _filtrar_digitando(repositorio, random.Random(semente)), repeticoes)
+        resultados["filtrar_por_tecla"] = {
+            "min_ms": round(medicao["min_ms"] / teclas, 4),
+            "mediana_ms": round(medicao["mediana_ms"] / teclas, 4),
+            "repeticoes": repeticoes,
+            "teclas_por_repeticao": teclas,
+        }
+
+        # Editar e reordenar: tempo médio de uma edição que muda a data
+        sessao = SessaoEdicao(repositorio, caminho, dados, geradores=_geradores(pasta))
+        edicoes = min(EDICOES_POR_RODADA, quantidade)
+        medicao = medir(lambda: [_editar_aleatoria(sessao, aleatorio) for _ in range(edicoes)], repeticoes)
+        resultados["editar_reordenar"] = {
+            "min_ms": round(medicao["min_ms"] / edicoes, 4),
+            "mediana_ms": round(medicao["mediana_ms"] / edicoes, 4),
+            "repeticoes": repeticoes,
+            "edicoes_por_repeticao": edicoes,
+        }
+
+        # A primeira gravação cria todos os arquivos derivados; as seguintes só os que mudaram
+        inicio = time.perf_counter()
+        sessao.salvar()
+        resultados["salvar_inicial_ms"] = round((time.perf_counter() - inicio) * 1000, 3)
+
+        sessao_sem_geradores = SessaoEdicao(repositorio, caminho, dados)
+        resultados["salvar_json"] = medir(
+            sessao_sem_geradores.salvar, repeticoes, preparar=lambda: _editar_aleatoria(sessao_sem_geradores, aleatorio)
+        )
+        resultados["salvar_com_geradores"] = medir(
+            sessao.salvar, repeticoes, preparar=lambda: _editar_aleatoria(sessao, aleatorio)
+        )
+
+        if com_git:
+            resultados["git"] = medir_git(pasta, sessao, aleatorio)
+        return resultados
+    finally:
+        shutil.rmtree(pasta, ignore_errors=True)
+
+
+# --- Comparação com uma execução anterior ---
+
+def _medicoes(resultado):
+    """Achata o resultado de um tamanho em {nome: milissegundos}."""
+    medicoes = {}
+    for nome, valor in resultado.items():
+        if isinstance(valor, dict) and "mediana_ms" in valor:
+            medicoes[nome] = valor["mediana_ms"]
+        elif nome.endswith("_ms"):
+            medicoes[nome] = valor
+        elif nome == "git" and isinstance(valor, dict):
+            medicoes.update({f"git.{chave}": tempo for chave, tempo in valor.items() if chave.endswith("_ms")})
+    return medicoes
+
+
+def comparar(atual, anterior, tolerancia):
+    """Retorna a lista de medições que ficaram mais lentas que (1 + tolerância) vezes a anterior."""
+    anteriores = {str(resultado["noticias"]): _medicoes(resultado) for resultado in anterior["resultados"]}
+    regressoes = []
+
+    inicializacao, anterior_inicializacao = atual.get("inicializacao"), anterior.get("inicializacao")
+    if inicializacao and anterior_inicializacao:
+        tempo, base = inicializacao["importar"]["mediana_ms"], anterior_inicializacao["importar"]["mediana_ms"]
+        if base > 0 and tempo > base * (1 + tolerancia):
+            regressoes.append(f"inicialização: {base:.1f} ms -> {tempo:.1f} ms")
+        novos = set(inicializacao["modulos_pesados"]) - set(anterior_inicializacao["modulos_pesados"])
+        if novos:
+            regressoes.append(f"inicialização: passou a importar {', '.join(sorted(novos))}")
+
+    for resultado in atual["resultados"]:
+        base = anteriores.get(str(resultado["noticias"]), {})
+        for nome, tempo in _medicoes(resultado).items():
+            if nome in base and base[nome] > 0 and tempo > base[nome] * (1 + tolerancia):
+                regressoes.append(f"{resultado['noticias']} notícias, {nome}: {base[nome]:.1f} ms -> {tempo:.1f} ms")
+    return regressoes
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Mede o desempenho do gerenciador de notícias com dados sintéticos.")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    parser_executar = subcomandos.add_parser("executar", help="Roda as medições e grava os resultados em JSON.")
+    parser_executar.add_argument("--tamanhos", type=int, nargs="+", default=list(TAMANHOS_PADRAO))
+    parser_executar.add_argument("--semente", type=int, default=SEMENTE_PADRAO)
+    parser_executar.add_argument("--repeticoes", type=int, default=REPETICOES_PADRAO)
+    parser_executar.add_argument("--sem-git", action="store_true", help="Pula as medições de commit e push.")
+    parser_executar.add_argument("--saida", default=ARQUIVO_RESULTADOS)
+    parser_executar.add_argument("--comparar", help="Arquivo de resultados anterior para detectar regressões.")
+    parser_executar.add_argument("--tolerancia", type=float, default=0.25, help="Piora aceita (0.25 = 25%%).")
+
+    parser_gerar = subcomandos.add_parser("gerar", help="Só gera um jornal.json sintético.")
+    parser_gerar.add_argument("quantidade", type=int)
+    parser_gerar.add_argument("arquivo")
+    parser_gerar.add_argument("--semente", type=int, default=SEMENTE_PADRAO)
+
+    argumentos = parser.parse_args(argumentos)
+
+    if argumentos.comando == "gerar":
+        escrever_json_atomico(argumentos.arquivo, gerar_jornal(argumentos.quantidade, argumentos.semente))
+        print(f"Jornal com {argumentos.quantidade} notícia(s) gravado em '{argumentos.arquivo}'.")
+        return 0
+
+    relatorio = {
+        "data": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "semente": argumentos.semente,
+        "resultados": [],
+    }
+
+    print("Medindo a inicialização...", flush=True)
+    relatorio["inicializacao"] = medir_inicializacao(argumentos.repeticoes)
+    print(f"  importar {relatorio['inicializacao']['importado']}: {relatorio['inicializacao']['importar']['mediana_ms']:.2f} ms")
+    if relatorio["inicializacao"]["modulos_pesados"]:
+        print(f"  módulos pesados já importados: {', '.join(relatorio['inicializacao']['modulos_pesados'])}")
+    for quantidade in argumentos.tamanhos:
+        print(f"Medindo com {quantidade} notícia(s)...", flush=True)
+        resultado = executar_tamanho(quantidade, argumentos.semente, argumentos.repeticoes, com_git=not argumentos.sem_git)
+        relatorio["resultados"].append(resultado)
+        for nome, tempo in _medicoes(resultado).items():
+            print(f"  {nome}: {tempo:.2f} ms")
+        if "indisponivel" in resultado.get("git", {}):
+            print(f"  git: {resultado['git']['indisponivel']}")
+
+    escrever_json_atomico(argumentos.saida, relatorio)
+    print(f"Resultados gravados em '{argumentos.saida}'.")
+
+    if argumentos.comparar:
+        with open(argumentos.comparar, "r", encoding="utf-8") as f:
+            regressoes = comparar(relatorio, json.load(f), argumentos.tolerancia)
+        for regressao in regressoes:
+            print(f"Regressão: {regressao}", file=sys.stderr)
+        if regressoes:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+"""Build dos arquivos estáticos do site antes de publicar.
+
+Cada CSS, JS e JSON de dados ganha uma cópia com o hash do conteúdo no nome
+(css/style.css -> css/style.1a2b3c4d5e.css), acompanhada das versões .gz e .br,
+e as referências em index.html e pages/**/*.html passam a apontar para as
+cópias. Como o nome muda sempre que o conteúdo muda, o servidor pode mandar
+guardar esses arquivos em cache por um ano (Cache-Control: max-age=31536000,
+immutable); o HTML continua com nome fixo e cache curto.
+
+O manifesto (manifesto-assets.json, na raiz) liga cada arquivo à sua cópia
+atual; arquivos que não mudaram mantêm o mesmo nome entre builds. As cópias do
+build anterior são mantidas por uma geração, para quem ainda estiver com a
+página antiga aberta.
+
+Os arquivos originais não são alterados (só o HTML, que é reescrito no lugar).
+Antes das cópias, a agenda e os pacotes das páginas são regenerados, para que
+edições feitas à mão nos JSON de origem cheguem ao site mesmo sem um salvamento
+do jornal.
+
+    python construcao_site.py
+"""
+import glob
+import gzip
+import hashlib
+import json
+import os
+import posixpath
+import re
+
+from agenda_eventos import gerar_agenda_eventos
+from arquivos import escrever_atomico, escrever_json_atomico, escrever_se_mudou
+from pacotes_paginas import gerar_pacotes_paginas
+
+# Brotli é opcional: sem ele, só as versões .gz são geradas
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+PASTA_DADOS = os.path.dirname(os.path.abspath(__file__))
+PASTA_RAIZ = os.path.dirname(PASTA_DADOS)
+ARQUIVO_MANIFESTO = "manifesto-assets.json"
+
+PADROES_ASSETS = ("data/*.json", "css/*.css", "js/*.js")
+PADROES_HTML = ("index.html", "pages/**/*.html")
+
+# O jornal.json completo só é lido pelo site como reserva (o normal é data/jornal/),
+# e copiá-lo a cada publicação faria o repositório crescer à toa
+NAO_VERSIONAR = {"data/jornal.json"}
+
+TAMANHO_HASH = 10
+PADRAO_COM_HASH = re.compile(r"\.[0-9a-f]{%d}\.(?:css|js|json)$" % TAMANHO_HASH)
+PADRAO_REFERENCIA_HTML = re.compile(r'((?:href|src)=")([^"]+)(")')
+# Caminhos de dados escritos nos scripts, relativos à página ("../../data/memoria.json")
+PADRAO_REFERENCIA_DADOS = re.compile(r"((?:\.\./)*)(data/[A-Za-z0-9_.-]+\.json)")
+
+
+def nome_com_hash(relativo, conteudo):
+    """css/style.css + conteúdo -> css/style.<hash>.css"""
+    base, extensao = posixpath.splitext(relativo)
+    return f"{base}.{hashlib.sha256(conteudo).hexdigest()[:TAMANHO_HASH]}{extensao}"
+
+
+def _ler_manifesto(raiz):
+    try:
+        with open(os.path.join(raiz, ARQUIVO_MANIFESTO), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"arquivos": {}, "anteriores": {}}
+
+
+def _fontes(raiz):
+    """Arquivos originais (sem hash no nome), como caminhos relativos com '/'."""
+    fontes = []
+    for padrao in PADROES_ASSETS:
+        for caminho in sorted(glob.glob(os.path.join(raiz, *padrao.split("/")))):
+            relativo = os.path.relpath(caminho, raiz).replace(os.sep, "/")
+            if not PADRAO_COM_HASH.search(relativo) and relativo not in NAO_VERSIONAR:
+                fontes.append(relativo)
+    return fontes
+
+
+def _gravar_copia(raiz, relativo_hash, conteudo, comprimir):
+    """Grava a cópia com hash e as versões comprimidas que ainda não existem. Retorna os caminhos criados."""
+    criados = []
+    destino = os.path.join(raiz, *relativo_hash.split("/"))
+    versoes = [(destino, lambda: conteudo)]
+    if comprimir:
+        # mtime=0: o mesmo conteúdo gera sempre o mesmo .gz
+        versoes.append((destino + ".gz", lambda: gzip.compress(conteudo, compresslevel=9, mtime=0)))
+        if brotli is not None:
+            versoes.append((destino + ".br", lambda: brotli.compress(conteudo, quality=11)))
+
+    for caminho, gerar in versoes:
+        # O nome já diz o conteúdo: se o arquivo existe, está certo
+        if not os.path.exists(caminho):
+            escrever_atomico(caminho, gerar(), modo="wb")
+            criados.append(caminho)
+    return criados
+
+
+def _reescrever_dados(texto, mapa):
+    """Troca, no texto de um script, os caminhos data/*.json pelos nomes com hash."""
+    def trocar(encontrado):
+        destino = mapa.get(encontrado.group(2))
+        return encontrado.group(1) + destino if destino else encontrado.group(0)
+    return PADRAO_REFERENCIA_DADOS.sub(trocar, texto)
+
+
+def _reescrever_html(texto, pasta_html, mapa, originais):
+    """Aponta os href/src do HTML (em 'pasta_html', relativa à raiz) para as cópias atuais."""
+    def trocar(encontrado):
+        valor = encontrado.group(2)
+        if re.match(r"^(?:[a-z]+:|//|/|#)", valor):
+            return encontrado.group(0)
+        caminho, separador, resto = (re.split(r"([?#])", valor, maxsplit=1) + ["", ""])[:3]
+        resolvido = posixpath.normpath(posixpath.join(pasta_html, caminho))
+        logico = originais.get(resolvido, resolvido)
+        if logico not in mapa:
+            return encontrado.group(0)
+        novo = posixpath.relpath(mapa[logico], pasta_html or ".")
+        return f"{encontrado.group(1)}{novo}{separador}{resto}{encontrado.group(3)}"
+    return PADRAO_REFERENCIA_HTML.sub(trocar, texto)
+
+
+def construir_site(raiz=PASTA_RAIZ, comprimir=True):
+    """Gera as cópias com hash, reescreve o HTML e atualiza o manifesto.
+
+    Retorna a lista de arquivos criados, alterados ou removidos (para o commit).
+    """
+    anterior = _ler_manifesto(raiz)
+    mapa = {}
+
+    # A agenda vem antes dos pacotes, que incluem o proximos.json
+    pasta_dados = os.path.join(raiz, "data")
+    alterados = gerar_agenda_eventos(pasta_saida=os.path.join(pasta_dados, "agenda"), pasta_dados=pasta_dados)
+    alterados += gerar_pacotes_paginas(pasta=pasta_dados)
+
+    conteudos = {}
+    for relativo in _fontes(raiz):
+        with open(os.path.join(raiz, *relativo.split("/")), "rb") as f:
+            conteudos[relativo] = f.read()
+
+    # Só vale copiar os dados que algum script realmente busca
+    citados = set()
+    for relativo, conteudo in conteudos.items():
+        if relativo.startswith("js/"):
+            citados.update(encontrado.group(2) for encontrado in PADRAO_REFERENCIA_DADOS.finditer(conteudo.decode("utf-8")))
+
+    # Dados e CSS primeiro; os scripts citam os dados, então são copiados já apontando para eles
+    for relativo in sorted(conteudos, key=lambda r: r.startswith("js/")):
+        conteudo = conteudos[relativo]
+        if relativo.startswith("data/") and relativo not in citados:
+            continue
+        if relativo.startswith("js/"):
+            conteudo = _reescrever_dados(conteudo.decode("utf-8"), mapa).encode("utf-8")
+        mapa[relativo] = nome_com_hash(relativo, conteudo)
+        alterados.extend(_gravar_copia(raiz, mapa[relativo], conteudo, comprimir))
+
+    # Qualquer nome com hash conhecido (atual ou anterior) volta ao original antes de ser trocado
+    originais = {}
+    for geracao in (anterior.get("anteriores", {}), anterior.get("arquivos", {}), mapa):
+        originais.update({com_hash: original for original, com_hash in geracao.items()})
+
+    for padrao in PADROES_HTML:
+        for caminho in sorted(glob.glob(os.path.join(raiz, *padrao.split("/")), recursive=True)):
+            relativo = os.path.relpath(caminho, raiz).replace(os.sep, "/")
+            with open(caminho, "r", encoding="utf-8") as f:
+                texto = f.read()
+            if escrever_se_mudou(caminho, _reescrever_html(texto, posixpath.dirname(relativo), mapa, originais)):
+                alterados.append(caminho)
+
+    # O build anterior fica mais uma geração; os mais antigos são apagados
+    anteriores = anterior.get("arquivos", {}) if anterior.get("arquivos", {}) != mapa else anterior.get("anteriores", {})
+    manter = set(mapa.values()) | set(anteriores.values())
+    for relativo_hash in set(anterior.get("arquivos", {}).values()) | set(anterior.get("anteriores", {}).values()):
+        if relativo_hash in manter:
+            continue
+        for sufixo in ("", ".gz", ".br"):
+            caminho = os.path.join(raiz, *relativo_hash.split("/")) + sufixo
+            if os.path.exists(caminho):
+                os.remove(caminho)
+                alterados.append(caminho)
+
+    manifesto = {"arquivos": mapa, "anteriores": anteriores}
+    if manifesto != anterior:
+        caminho = os.path.join(raiz, ARQUIVO_MANIFESTO)
+        escrever_json_atomico(caminho, manifesto)
+        alterados.append(caminho)
+    return alterados
+
+
+if __name__ == "__main__":
+    arquivos = construir_site()
+    print(f"{len(arquivos)} arquivo(s) do site criado(s), alterado(s) ou removido(s).")
+    if brotli is None:
+        print("Aviso: o módulo 'brotli' não está instalado; só as versões .gz foram geradas.")
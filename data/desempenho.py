@@ -0,0 +1,181 @@
+"""Medição de tempo das operações do gerenciador.
+
+Cada trecho medido (um "span") vira uma linha JSON no log de desempenho
+(data/desempenho.jsonl, com rotação por tamanho) e fica na memória para o
+painel de desempenho do app mostrar p50/p95 recentes por operação.
+
+Nada é registrado até que ativar() seja chamado (o app.py o faz ao iniciar),
+então a CLI e o benchmark podem usar os mesmos módulos sem gerar log.
+
+Com a variável de ambiente PAROQUIA_PERFIL definida, perfil_da_sessao() roda a
+sessão inteira sob o cProfile e grava as estatísticas ao sair ("1" usa um nome
+de arquivo com data e hora; qualquer outro valor é usado como caminho).
+"""
+import collections
+import contextlib
+import datetime
+import json
+import logging
+import logging.handlers
+import os
+import threading
+import time
+
+PASTA_DADOS = os.path.dirname(os.path.abspath(__file__))
+ARQUIVO_LOG = os.path.join(PASTA_DADOS, "desempenho.jsonl")
+TAMANHO_MAXIMO_LOG = 1024 * 1024
+ARQUIVOS_ANTIGOS = 3
+AMOSTRAS_POR_OPERACAO = 500
+
+VARIAVEL_PERFIL = "PAROQUIA_PERFIL"
+
+
+def percentil(valores_ordenados, fracao):
+    """Percentil pelo método do posto mais próximo (valores já ordenados)."""
+    if not valores_ordenados:
+        return None
+    posicao = max(0, min(len(valores_ordenados) - 1, round(fracao * len(valores_ordenados) + 0.5) - 1))
+    return valores_ordenados[posicao]
+
+
+class RegistroDesempenho:
+    """Guarda as durações recentes por operação e as acrescenta ao log JSONL."""
+
+    def __init__(self, caminho=ARQUIVO_LOG, tamanho_maximo=TAMANHO_MAXIMO_LOG, arquivos_antigos=ARQUIVOS_ANTIGOS):
+        self.caminho = caminho
+        self.amostras = collections.defaultdict(lambda: collections.deque(maxlen=AMOSTRAS_POR_OPERACAO))
+        self._trava = threading.Lock()
+        self._historico_carregado = not caminho # O log anterior só é lido quando o painel pede o resumo
+
+        # O RotatingFileHandler já é seguro entre threads (a FilaGit e o diário também medem)
+        self._logger = logging.getLogger(f"paroquia.desempenho.{id(self)}")
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+        if caminho:
+            manipulador = logging.handlers.RotatingFileHandler(
+                caminho, maxBytes=tamanho_maximo, backupCount=arquivos_antigos, encoding="utf-8"
+            )
+            manipulador.setFormatter(logging.Formatter("%(message)s"))
+            self._logger.addHandler(manipulador)
+
+    def registrar(self, operacao, duracao_ms, **detalhes):
+        with self._trava:
+            self.amostras[operacao].append(duracao_ms)
+        linha = {
+            "momento": datetime.datetime.now().isoformat(timespec="milliseconds"),
+            "operacao": operacao,
+            "duracao_ms": round(duracao_ms, 3),
+            "thread": threading.current_thread().name,
+            **detalhes,
+        }
+        self._logger.info(json.dumps(linha, ensure_ascii=False, default=str))
+
+    @contextlib.contextmanager
+    def medir(self, operacao, **detalhes):
+        inicio = time.perf_counter()
+        erro = None
+        try:
+            yield
+        except BaseException as e:
+            erro = type(e).__name__
+            raise
+        finally:
+            if erro is not None:
+                detalhes["erro"] = erro
+            self.registrar(operacao, (time.perf_counter() - inicio) * 1000, **detalhes)
+
+    def resumo(self):
+        """Retorna {operação: {"quantidade", "p50_ms", "p95_ms", "ultimo_ms"}}, em ordem alfabética."""
+        if not self._historico_carregado:
+            self._carregar_historico()
+        with self._trava:
+            copia = {operacao: list(valores) for operacao, valores in self.amostras.items() if valores}
+        resumo = {}
+        for operacao in sorted(copia):
+            ordenados = sorted(copia[operacao])
+            resumo[operacao] = {
+                "quantidade": len(ordenados),
+                "p50_ms": percentil(ordenados, 0.50),
+                "p95_ms": percentil(ordenados, 0.95),
+                "ultimo_ms": copia[operacao][-1],
+            }
+        return resumo
+
+    def _carregar_historico(self):
+        # As últimas medições de sessões anteriores também aparecem no painel, antes das desta sessão
+        anteriores = collections.defaultdict(list)
+        try:
+            with open(self.caminho, "r", encoding="utf-8") as f:
+                for linha in f:
+                    try:
+                        span = json.loads(linha)
+                        anteriores[span["operacao"]].append(span["duracao_ms"])
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        pass
+        except FileNotFoundError:
+            pass
+
+        with self._trava:
+            if self._historico_carregado:
+                return
+            # O arquivo também já contém as medições desta sessão, que não podem entrar duas vezes
+            for operacao, valores in anteriores.items():
+                atuais = self.amostras[operacao]
+                antigos = valores[:len(valores) - len(atuais)]
+                self.amostras[operacao] = collections.deque(antigos + list(atuais), maxlen=AMOSTRAS_POR_OPERACAO)
+            self._historico_carregado = True
+
+
+_registro = None
+
+
+def ativar(caminho=ARQUIVO_LOG):
+    """Liga o registro das medições (uma vez por processo) e o retorna."""
+    global _registro
+    if _registro is None:
+        _registro = RegistroDesempenho(caminho)
+    return _registro
+
+
+def registro_ativo():
+    """Retorna o registro ligado por ativar(), ou None."""
+    return _registro
+
+
+@contextlib.contextmanager
+def medir(operacao, **detalhes):
+    """Mede o bloco 'with' como um span da operação (não faz nada se o registro estiver desligado)."""
+    if _registro is None:
+        yield
+        return
+    with _registro.medir(operacao, **detalhes):
+        yield
+
+
+def registrar(operacao, duracao_ms, **detalhes):
+    """Registra uma duração medida à parte (por exemplo, entre dois callbacks do Tk)."""
+    if _registro is not None:
+        _registro.registrar(operacao, duracao_ms, **detalhes)
+
+
+@contextlib.contextmanager
+def perfil_da_sessao():
+    """Roda o bloco sob o cProfile se PAROQUIA_PERFIL estiver definida, gravando o resultado ao final."""
+    destino = os.environ.get(VARIAVEL_PERFIL)
+    if not destino:
+        yield None
+        return
+
+    if destino == "1":
+        destino = os.path.join(PASTA_DADOS, f"perfil-{datetime.datetime.now():%Y%m%d-%H%M%S}.prof")
+
+    import cProfile
+
+    perfilador = cProfile.Profile()
+    perfilador.enable()
+    try:
+        yield perfilador
+    finally:
+        perfilador.disable()
+        perfilador.dump_stats(destino)
+        print(f"Perfil da sessão gravado em '{destino}' (abra com: python -m pstats {destino}).")
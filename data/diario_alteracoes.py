@@ -0,0 +1,211 @@
+import json
+import os
+import threading
+
+from arquivos import escrever_atomico, escrever_json_atomico
+from repositorio_noticias import RepositorioNoticias
+
+
+def aplicar_operacao(alvo, operacao):
+    """Aplica uma operação do diário em um RepositorioNoticias (ou SessaoEdicao).
+
+    A reaplicação é tolerante: se o diário for reproduzido sobre um arquivo que já
+    contém a operação (queda entre a gravação e a limpeza do diário), o resultado
+    final é o mesmo.
+    """
+    tipo = operacao["op"]
+    repositorio = getattr(alvo, "repositorio", alvo)
+
+    if tipo == "adicionar":
+        noticia = operacao["noticia"]
+        if noticia["id"] in repositorio:
+            alvo.editar(noticia["id"], noticia, operacao.get("destaque", False))
+        else:
+            alvo.adicionar(noticia, operacao.get("destaque", False))
+
+    elif tipo == "editar":
+        noticia = operacao["noticia"]
+        if operacao["id_original"] in repositorio:
+            if noticia["id"] != operacao["id_original"] and noticia["id"] in repositorio:
+                alvo.remover(noticia["id"])
+            alvo.editar(operacao["id_original"], noticia, operacao.get("destaque", False))
+        elif noticia["id"] in repositorio:
+            alvo.editar(noticia["id"], noticia, operacao.get("destaque", False))
+        else:
+            alvo.adicionar(noticia, operacao.get("destaque", False))
+
+    elif tipo == "remover":
+        if operacao["id"] in repositorio:
+            alvo.remover(operacao["id"])
+
+    elif tipo == "destaque":
+        if operacao["id"] in repositorio:
+            alvo.definir_destaque(operacao["id"], operacao["valor"])
+
+    else:
+        raise ValueError(f"Operação desconhecida no diário: {tipo}")
+
+
+def diferencas(estado, base):
+    """Retorna as operações do diário que levam 'base' a 'estado' (ambos no formato do jornal.json).
+
+    Uma notícia que mudou de ID vira uma remoção e uma adição.
+    """
+    noticias_base = {noticia["id"]: noticia for noticia in base.get("noticias", [])}
+    destaques_base = set(base.get("destaques", []))
+    destaques = set(estado.get("destaques", []))
+    ids = {noticia["id"] for noticia in estado.get("noticias", [])}
+
+    operacoes = [{"op": "remover", "id": id_noticia} for id_noticia in noticias_base if id_noticia not in ids]
+    for noticia in estado.get("noticias", []):
+        destaque = noticia["id"] in destaques
+        anterior = noticias_base.get(noticia["id"])
+        if anterior is None:
+            operacoes.append({"op": "adicionar", "noticia": noticia, "destaque": destaque})
+        elif anterior != noticia or destaque != (noticia["id"] in destaques_base):
+            operacoes.append({"op": "editar", "id_original": noticia["id"], "noticia": noticia, "destaque": destaque})
+    return operacoes
+
+
+class DiarioAlteracoes:
+    """Diário (JSONL, só acrescenta no fim) das alterações feitas no jornal.json.
+
+    Cada alteração vira uma linha gravada com fsync, então salvar custa o tamanho
+    da alteração e não o tamanho do arquivo inteiro. Um compactador em segundo
+    plano, disparado depois de alguns segundos sem novas alterações, resume o
+    diário às diferenças em relação ao jornal.json (várias edições da mesma
+    notícia viram uma linha só).
+
+    O jornal.json só é gravado por compactar(dados), ao salvar: ele é rastreado
+    pelo Git e pelo observador de arquivos, então não pode receber alterações que
+    o usuário ainda não salvou.
+    """
+
+    def __init__(self, caminho_arquivo, caminho_diario=None, atraso_compactacao=3.0):
+        self.caminho_arquivo = caminho_arquivo
+        self.caminho_diario = caminho_diario or os.path.splitext(caminho_arquivo)[0] + ".diario.jsonl"
+        self.atraso_compactacao = atraso_compactacao
+        self.ao_erro = None # Função chamada (na thread do compactador) se a compactação falhar
+
+        self._trava_escrita = threading.Lock() # Protege o arquivo do diário
+        self._trava_compactacao = threading.Lock() # Uma compactação por vez
+        self._temporizador = None
+
+    # --- Escrita ---
+
+    def registrar(self, operacao):
+        """Acrescenta uma operação ao fim do diário e garante que ela foi para o disco."""
+        linha = json.dumps(operacao, ensure_ascii=False) + "\n"
+        with self._trava_escrita:
+            with open(self.caminho_diario, "a", encoding="utf-8") as f:
+                f.write(linha)
+                f.flush()
+                os.fsync(f.fileno())
+
+    # --- Leitura / recuperação ---
+
+    def pendentes(self):
+        """Retorna as operações ainda não incorporadas ao jornal.json."""
+        with self._trava_escrita:
+            conteudo = self._ler_bytes()
+        return self._decodificar(conteudo)
+
+    # --- Compactação ---
+
+    def agendar_compactacao(self):
+        """(Re)inicia a contagem para compactar; várias alterações seguidas geram uma só compactação."""
+        if self._temporizador is not None:
+            self._temporizador.cancel()
+        self._temporizador = threading.Timer(self.atraso_compactacao, self._compactar_em_segundo_plano)
+        self._temporizador.daemon = True
+        self._temporizador.start()
+
+    def compactar(self, dados=None):
+        """Resume o diário às diferenças em relação ao jornal.json.
+
+        Se 'dados' for informado (o estado salvo, que já contém as operações do
+        diário registradas até então), ele é gravado no jornal.json e o diário fica
+        só com o que mudou depois. Sem 'dados', o jornal.json não é alterado.
+        Retorna a quantidade de operações que ficaram no diário.
+        """
+        self._cancelar_temporizador()
+
+        with self._trava_compactacao:
+            with self._trava_escrita:
+                conteudo = self._ler_bytes()
+            if dados is not None:
+                escrever_json_atomico(self.caminho_arquivo, dados)
+            if not conteudo:
+                return 0
+
+            base = dados if dados is not None else self._ler_arquivo()
+            repositorio = RepositorioNoticias(base)
+            for operacao in self._decodificar(conteudo):
+                aplicar_operacao(repositorio, operacao)
+            operacoes = diferencas(repositorio.para_dict(), base)
+            self._substituir_inicio(len(conteudo), operacoes)
+            return len(operacoes)
+
+    def reescrever(self, estado, base):
+        """Troca o diário inteiro pelas diferenças entre 'estado' (o que está em memória) e 'base' (o jornal.json no disco).
+
+        Para quando a memória deixa de ser o arquivo mais o diário, como ao trazer
+        alterações feitas fora do gerenciador.
+        """
+        self._cancelar_temporizador()
+
+        with self._trava_compactacao:
+            with self._trava_escrita:
+                tamanho = len(self._ler_bytes())
+            self._substituir_inicio(tamanho, diferencas(estado, base))
+
+    def _compactar_em_segundo_plano(self):
+        try:
+            self.compactar()
+        except Exception as e:
+            print(f"Erro ao compactar o diário: {e}")
+            if self.ao_erro is not None:
+                self.ao_erro(e)
+
+    # --- Auxiliares ---
+
+    def _ler_bytes(self):
+        try:
+            with open(self.caminho_diario, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return b""
+
+    def _decodificar(self, conteudo):
+        operacoes = []
+        for linha in conteudo.decode("utf-8", errors="replace").splitlines():
+            if not linha.strip():
+                continue
+            try:
+                operacoes.append(json.loads(linha))
+            except json.JSONDecodeError:
+                # Linha cortada por uma queda no meio da escrita: as anteriores continuam valendo
+                print("Linha incompleta ignorada no diário de alterações.")
+        return operacoes
+
+    def _ler_arquivo(self):
+        try:
+            with open(self.caminho_arquivo, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"destaques": [], "noticias": []}
+
+    def _cancelar_temporizador(self):
+        if self._temporizador is not None:
+            self._temporizador.cancel()
+            self._temporizador = None
+
+    def _substituir_inicio(self, tamanho, operacoes):
+        """Troca os primeiros 'tamanho' bytes do diário pelas operações informadas, mantendo o que chegou depois."""
+        inicio = "".join(json.dumps(operacao, ensure_ascii=False) + "\n" for operacao in operacoes).encode("utf-8")
+        with self._trava_escrita:
+            conteudo = inicio + self._ler_bytes()[tamanho:]
+            if conteudo:
+                escrever_atomico(self.caminho_diario, conteudo, modo="wb")
+            elif os.path.exists(self.caminho_diario):
+                os.remove(self.caminho_diario)
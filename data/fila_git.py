@@ -0,0 +1,291 @@
+import functools
+import os
+import queue
+import threading
+
+from desempenho import medir
+
+# O GitPython (que procura o executável do git ao ser importado) só é carregado
+# na primeira operação, dentro da thread da fila, para não atrasar a abertura do app
+git = None
+
+
+def importar_git():
+    """Importa o GitPython na primeira chamada e o retorna."""
+    global git
+    if git is None:
+        import git as modulo_git
+        git = modulo_git
+    return git
+
+
+class TrabalhoCancelado(Exception):
+    """Levantada na thread do Git quando um trabalho para no meio por ter sido cancelado."""
+
+
+class TrabalhoGit:
+    """Uma operação (commit, push ou status) aguardando ou em execução na FilaGit."""
+
+    def __init__(self, tipo, descricao, chave=None, **parametros):
+        self.tipo = tipo
+        self.descricao = descricao
+        self.chave = chave # Trabalhos com a mesma chave aguardando na fila são um só (ver FilaGit._agendar)
+        self.parametros = parametros
+        self.cancelado = False
+        self.processo = None # Processo do git em andamento (apenas no pull/push)
+
+    def cancelar(self):
+        """Cancela o trabalho: se ainda está na fila, é descartado; se é um push em andamento, o processo é encerrado.
+
+        Um commit que já começou vai até o fim: o evento final diz o que aconteceu de fato.
+        """
+        self.cancelado = True
+        processo = self.processo
+        if processo is not None:
+            try:
+                processo.proc.kill()
+            except Exception:
+                pass # O processo já terminou
+
+
+@functools.lru_cache(maxsize=None)
+def classe_progresso():
+    """Cria (uma única vez) a classe ProgressoGit, que depende do GitPython já importado."""
+    git = importar_git()
+
+    class ProgressoGit(git.RemoteProgress):
+        """Repassa o progresso do GitPython para a fila de eventos."""
+
+        ETAPAS = {
+            git.RemoteProgress.COUNTING: "Contando objetos",
+            git.RemoteProgress.COMPRESSING: "Comprimindo objetos",
+            git.RemoteProgress.WRITING: "Enviando objetos",
+            git.RemoteProgress.RECEIVING: "Recebendo objetos",
+            git.RemoteProgress.RESOLVING: "Resolvendo diferenças",
+        }
+
+        def __init__(self, fila, trabalho):
+            super().__init__()
+            self.fila = fila
+            self.trabalho = trabalho
+
+        def update(self, op_code, cur_count, max_count=None, message=""):
+            percentual = (cur_count / max_count) if max_count else None
+            etapa = self.ETAPAS.get(op_code & self.OP_MASK, "Processando")
+            self.fila._emitir(self.trabalho, "progresso", (message or etapa, percentual))
+
+    return ProgressoGit
+
+
+class FilaGit:
+    """Executa as operações do Git em uma thread separada, fora do mainloop do Tk.
+
+    Mantém um único git.Repo aberto durante toda a sessão. Os resultados são
+    colocados em self.eventos como tuplas (trabalho, evento, dados), onde evento é
+    'inicio', 'progresso', 'concluido', 'erro' ou 'cancelado'. Todo trabalho
+    agendado termina com exatamente um 'concluido', 'erro' ou 'cancelado' (mesmo
+    os cancelados antes de começar). A interface deve ler essa fila
+    periodicamente (com after), já que o Tk não é thread-safe.
+    """
+
+    def __init__(self, caminho="."):
+        self.caminho = caminho
+        self.eventos = queue.Queue()
+        self._trabalhos = queue.Queue()
+        self._repo = None
+        self._pendentes = {} # chave -> trabalho ainda na fila (push, construção do site)
+        self._trava = threading.Lock()
+        self.trabalho_atual = None
+
+        self._thread = threading.Thread(target=self._executar, name="fila-git", daemon=True)
+        self._thread.start()
+
+    # --- API usada pela interface ---
+
+    def commit(self, arquivos, mensagem, preparar=None, chave=None):
+        """Agenda 'git add' + 'git commit' dos arquivos informados.
+
+        Se 'preparar' for informada, ela é chamada na thread do Git logo antes do
+        commit, e os arquivos que retornar também entram no commit. Ela roda antes
+        de abrir o repositório, então o que grava não depende do Git estar disponível.
+
+        Se 'chave' for informada e já houver um commit com a mesma chave aguardando
+        na fila, ele é reaproveitado (como a construção do site a cada "Publicar").
+        """
+        # Caminhos absolutos: não dependem da pasta atual quando a thread os usar
+        arquivos = [os.path.abspath(arquivo) for arquivo in arquivos]
+        return self._agendar(TrabalhoGit("commit", f"Commit: {mensagem}", chave, arquivos=arquivos, mensagem=mensagem, preparar=preparar))
+
+    def push(self):
+        """Agenda um 'git push'. Se já houver um push aguardando na fila, reaproveita-o."""
+        return self._agendar(TrabalhoGit("push", "Enviando alterações para o servidor", chave="push"))
+
+    def status(self):
+        """Agenda uma consulta de estado (alterações pendentes e commits a enviar)."""
+        trabalho = TrabalhoGit("status", "Verificando o repositório")
+        self._trabalhos.put(trabalho)
+        return trabalho
+
+    def cancelar_todos(self):
+        """Cancela o trabalho em andamento e todos os que estão na fila.
+
+        Os da fila continuam nela, só marcados: a thread os descarta emitindo 'cancelado' para cada um.
+        """
+        with self._trava:
+            self._pendentes = {}
+        with self._trabalhos.mutex:
+            na_fila = [trabalho for trabalho in self._trabalhos.queue if trabalho is not None]
+        for trabalho in na_fila:
+            trabalho.cancelar()
+        if self.trabalho_atual is not None:
+            self.trabalho_atual.cancelar()
+
+    def encerrar(self):
+        """Pede para a thread terminar depois do trabalho atual."""
+        self._trabalhos.put(None)
+
+    def _agendar(self, trabalho):
+        """Põe o trabalho na fila; se ele tem chave e outro com a mesma chave ainda aguarda, devolve o que já está lá."""
+        if trabalho.chave is not None:
+            with self._trava:
+                pendente = self._pendentes.get(trabalho.chave)
+                if pendente is not None and not pendente.cancelado:
+                    return pendente
+                self._pendentes[trabalho.chave] = trabalho
+        self._trabalhos.put(trabalho)
+        return trabalho
+
+    # --- Thread de trabalho ---
+
+    def _executar(self):
+        while True:
+            trabalho = self._trabalhos.get()
+            if trabalho is None:
+                break
+
+            with self._trava:
+                if trabalho.chave is not None and self._pendentes.get(trabalho.chave) is trabalho:
+                    del self._pendentes[trabalho.chave] # Novos cliques em "Publicar" geram outro trabalho
+
+            if trabalho.cancelado:
+                self._emitir(trabalho, "cancelado", None)
+                continue
+
+            self.trabalho_atual = trabalho
+            self._emitir(trabalho, "inicio", None)
+            try:
+                resultado = getattr(self, f"_executar_{trabalho.tipo}")(trabalho)
+            except TrabalhoCancelado:
+                self._emitir(trabalho, "cancelado", None)
+            except Exception as e:
+                self._emitir(trabalho, "erro", e)
+            else:
+                # Cancelar depois do ponto sem volta (commit criado, push terminado) não desfaz nada
+                self._emitir(trabalho, "concluido", resultado)
+            finally:
+                self.trabalho_atual = None
+
+    def _emitir(self, trabalho, evento, dados):
+        self.eventos.put((trabalho, evento, dados))
+
+    def _abrir_repo(self):
+        if self._repo is None:
+            self._repo = importar_git().Repo(self.caminho, search_parent_directories=True)
+        return self._repo
+
+    def _executar_commit(self, trabalho):
+        # Cancelar só vale até aqui: depois, preparar grava os arquivos e o commit é feito
+        if trabalho.cancelado:
+            raise TrabalhoCancelado()
+        arquivos = trabalho.parametros["arquivos"]
+        if trabalho.parametros["preparar"] is not None:
+            arquivos = arquivos + [os.path.abspath(arquivo) for arquivo in trabalho.parametros["preparar"]()]
+        repo = self._abrir_repo()
+        relativos = [os.path.relpath(arquivo, repo.working_tree_dir) for arquivo in arquivos]
+
+        # Verifica se algum arquivo foi realmente modificado (ou é novo)
+        with medir("git_is_dirty", arquivos=len(arquivos)):
+            nao_rastreados = set(repo.untracked_files)
+            alterados = [
+                arquivo for arquivo, relativo in zip(arquivos, relativos)
+                if relativo.replace(os.sep, "/") in nao_rastreados or repo.is_dirty(path=arquivo)
+            ]
+        if not alterados:
+            return None
+
+        # Arquivos apagados saem do índice; os demais são adicionados
+        removidos = [arquivo for arquivo in alterados if not os.path.exists(arquivo)]
+        with medir("git_index_add", arquivos=len(alterados)):
+            if removidos:
+                repo.index.remove(removidos, ignore_unmatch=True)
+            existentes = [arquivo for arquivo in alterados if os.path.exists(arquivo)]
+            if existentes:
+                repo.index.add(existentes)
+        with medir("git_index_commit"):
+            commit = repo.index.commit(trabalho.parametros["mensagem"])
+        return commit.hexsha
+
+    def _executar_push(self, trabalho):
+        repo = self._abrir_repo()
+
+        # Verifica se existe um remoto chamado 'origin'
+        if "origin" not in [remote.name for remote in repo.remotes]:
+            raise RuntimeError("Nenhum repositório remoto 'origin' configurado.\n\nConfigure-o via linha de comando com 'git remote add origin <URL>'.")
+
+        # Traz antes o que outra pessoa publicou, para o push não ser recusado
+        self._puxar(repo, trabalho)
+        if trabalho.cancelado:
+            raise TrabalhoCancelado()
+
+        with medir("git_push"):
+            self._executar_processo(trabalho, lambda: repo.git.push("origin", porcelain=True, progress=True, as_process=True))
+        return None
+
+    def _puxar(self, repo, trabalho):
+        """'git pull --ff-only' do branch rastreado; o observador de arquivos da janela incorpora o que chegar.
+
+        Só avança o branch (sem merge automático): se o histórico divergiu, o push
+        é interrompido com uma mensagem pedindo para resolver pela linha de comando.
+        """
+        try:
+            rastreado = repo.active_branch.tracking_branch()
+        except TypeError:
+            return # HEAD destacado (detached): não há branch para atualizar
+        if rastreado is None:
+            return
+
+        with medir("git_pull"):
+            try:
+                self._executar_processo(trabalho, lambda: repo.git.pull(rastreado.remote_name, rastreado.remote_head, ff_only=True, progress=True, as_process=True))
+            except importar_git().GitCommandError as e:
+                raise RuntimeError(f"Não foi possível atualizar a partir de '{rastreado.name}' antes de publicar (o histórico local e o do servidor divergiram?).\n\nResolva com 'git pull' pela linha de comando e publique de novo.\n\n{e}") from e
+
+    def _executar_processo(self, trabalho, iniciar):
+        """Roda um comando git como processo, para que possa ser interrompido por cancelar(), repassando o progresso."""
+        from git.cmd import handle_process_output
+
+        progresso = classe_progresso()(self, trabalho)
+        trabalho.processo = iniciar()
+        try:
+            if trabalho.cancelado:
+                trabalho.cancelar()
+            handle_process_output(trabalho.processo, lambda linha: None, progresso.new_message_handler(), decode_streams=False)
+            erros = "\n".join(progresso.error_lines)
+            trabalho.processo.wait(stderr=erros) # Levanta GitCommandError se o comando falhar
+        except Exception as e:
+            if trabalho.cancelado:
+                raise TrabalhoCancelado() from e # O processo foi encerrado por cancelar()
+            raise
+        finally:
+            trabalho.processo = None
+
+    def _executar_status(self, trabalho):
+        repo = self._abrir_repo()
+        a_enviar = 0
+        try:
+            rastreado = repo.active_branch.tracking_branch()
+            if rastreado is not None:
+                a_enviar = sum(1 for _ in repo.iter_commits(f"{rastreado.name}..{repo.active_branch.name}"))
+        except TypeError:
+            pass # HEAD destacado (detached): não há branch ativo
+        return {"alterado": repo.is_dirty(untracked_files=True), "a_enviar": a_enviar}
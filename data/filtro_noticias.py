@@ -0,0 +1,139 @@
+"""Filtro da lista de notícias do gerenciador: busca enquanto se digita, período e destaques.
+
+O índice de termos (IndiceTexto) é montado uma vez, ao carregar o jornal
+(RepositorioNoticias.indexar_texto), e atualizado pelo repositório a cada notícia
+adicionada, editada ou removida. O período não precisa de índice próprio: a lista
+'ordem' do repositório já está ordenada por data e é cortada com bisect.
+"""
+import bisect
+
+from indice_busca import PADRAO_TERMO, PALAVRAS_IGNORADAS, TAMANHO_PREFIXO, dobrar_acentos, extrair_termos
+
+CAMPOS_TEXTO = ("titulo", "subtitulo", "conteudo", "conteudo_adicional")
+
+# Maior que qualquer caractere de um termo: [prefixo, prefixo + FIM_PREFIXO) são os termos com o prefixo
+FIM_PREFIXO = "\uffff"
+
+# Resultados de prefixos guardados entre as teclas (o cache é limpo a cada alteração)
+LIMITE_CACHE = 256
+
+
+def termos_da_busca(texto):
+    """Termos digitados, sem acento e sem repetição.
+
+    Os de uma letra e as palavras comuns ("da", "para"...) ficam de fora, como no índice:
+    "festa da catequese" encontra o mesmo que "festa catequese". A última palavra
+    é exceção, como na busca do site (js/jornal.js): ela pode estar incompleta,
+    e "para" a caminho de "paraíso" já é um prefixo.
+    """
+    palavras = PADRAO_TERMO.findall(dobrar_acentos(texto or ""))
+    return list(dict.fromkeys(
+        termo for posicao, termo in enumerate(palavras)
+        if len(termo) >= TAMANHO_PREFIXO and (posicao == len(palavras) - 1 or termo not in PALAVRAS_IGNORADAS)
+    ))
+
+
+def termos_da_noticia(noticia):
+    # Um texto só por notícia: extrair_termos tem um custo fixo por chamada que pesa ao indexar todo o jornal
+    return frozenset(extrair_termos(" ".join(noticia.get(campo) or "" for campo in CAMPOS_TEXTO)))
+
+
+class IndiceTexto:
+    """Índice invertido termo -> IDs, com o vocabulário em ordem alfabética para buscar por prefixo."""
+
+    def __init__(self, noticias=()):
+        self.ids_por_termo = {}
+        self.termos_por_id = {}
+        self._cache = {}
+
+        for noticia in noticias:
+            termos = termos_da_noticia(noticia)
+            self.termos_por_id[noticia["id"]] = termos
+            for termo in termos:
+                self.ids_por_termo.setdefault(termo, set()).add(noticia["id"])
+        self.vocabulario = sorted(self.ids_por_termo)
+
+    def adicionar(self, noticia):
+        termos = termos_da_noticia(noticia)
+        self.termos_por_id[noticia["id"]] = termos
+        for termo in termos:
+            ids = self.ids_por_termo.get(termo)
+            if ids is None:
+                ids = self.ids_por_termo[termo] = set()
+                bisect.insort(self.vocabulario, termo)
+            ids.add(noticia["id"])
+        self._cache.clear()
+
+    def remover(self, id_noticia):
+        for termo in self.termos_por_id.pop(id_noticia, ()):
+            ids = self.ids_por_termo[termo]
+            ids.discard(id_noticia)
+            if not ids:
+                del self.ids_por_termo[termo]
+                del self.vocabulario[bisect.bisect_left(self.vocabulario, termo)]
+        self._cache.clear()
+
+    def com_prefixo(self, prefixo):
+        """IDs das notícias com algum termo começando pelo prefixo."""
+        ids = self._cache.get(prefixo)
+        if ids is None:
+            inicio = bisect.bisect_left(self.vocabulario, prefixo)
+            fim = bisect.bisect_left(self.vocabulario, prefixo + FIM_PREFIXO, inicio)
+            ids = set().union(*(self.ids_por_termo[termo] for termo in self.vocabulario[inicio:fim]))
+            if len(self._cache) >= LIMITE_CACHE:
+                self._cache.clear()
+            self._cache[prefixo] = ids
+        return ids
+
+    def buscar(self, texto):
+        """IDs das notícias que têm todos os termos digitados (cada um como começo de palavra).
+
+        Retorna None se o texto não tiver nenhum termo pesquisável (vazio ou só letras soltas).
+        """
+        termos = termos_da_busca(texto)
+        if not termos:
+            return None
+        # Do menor conjunto para o maior: a interseção encolhe logo no começo
+        conjuntos = sorted((self.com_prefixo(termo) for termo in termos), key=len)
+        # Com um termo só, devolve o conjunto do cache sem copiar (quem chama não o altera)
+        return conjuntos[0].intersection(*conjuntos[1:]) if len(conjuntos) > 1 else conjuntos[0]
+
+
+class VisaoFiltrada:
+    """Resultado de RepositorioNoticias.filtrar: uma sequência de notícias (0 = mais recente)
+    com a mesma interface de consulta do repositório, para a lista da interface exibir no lugar dele.
+    """
+
+    def __init__(self, repositorio, chaves, filtro, versao):
+        self.repositorio = repositorio
+        self.chaves = chaves # Em ordem crescente, como repositorio.ordem
+        self.filtro = filtro # (termos, início, fim, só destaques)
+        self.versao = versao # repositorio.versao quando o filtro foi aplicado
+        self._posicoes = None
+
+    def __len__(self):
+        return len(self.chaves)
+
+    def __getitem__(self, posicao):
+        if posicao < 0:
+            posicao += len(self.chaves)
+        if not 0 <= posicao < len(self.chaves):
+            raise IndexError(posicao)
+        return self.repositorio.por_id[self.chaves[-1 - posicao][2]]
+
+    def __iter__(self):
+        for chave in reversed(self.chaves):
+            yield self.repositorio.por_id[chave[2]]
+
+    def __contains__(self, id_noticia):
+        return id_noticia in self._mapa_posicoes()
+
+    def posicao_de(self, id_noticia):
+        return self._mapa_posicoes()[id_noticia]
+
+    def _mapa_posicoes(self):
+        # Montado só quando alguém procura uma notícia (a seleção), não a cada tecla
+        if self._posicoes is None:
+            ultimo = len(self.chaves) - 1
+            self._posicoes = {chave[2]: ultimo - indice for indice, chave in enumerate(self.chaves)}
+        return self._posicoes
@@ -0,0 +1,121 @@
+import datetime
+import json
+import os
+import random
+import re
+
+from arquivos import escrever_se_mudou
+
+PASTA_DADOS = os.path.dirname(os.path.abspath(__file__))
+PASTA_QUIZ = os.path.join(PASTA_DADOS, "quiz")
+
+# Tema do js/quiz.js -> (arquivo completo, chave da lista de sub-temas; None se o tema não tiver sub-temas)
+TEMAS = {
+    "paroquia": ("quiz_paroquia.json", None),
+    "santos": ("quiz_santos.json", "santos"),
+    "diario": ("quiz_diario.json", "temas"),
+}
+
+# Temas cuja ordem das perguntas é a mesma para todos em um mesmo dia
+TEMAS_COM_AGENDA = ("diario",)
+
+# Agenda do mês anterior (fusos diferentes na virada do mês) até dois meses à frente
+MESES_ANTES = 1
+MESES_DEPOIS = 2
+
+
+def nome_fragmento(id_subtema):
+    return re.sub(r"[^A-Za-z0-9_-]", "_", id_subtema) + ".json"
+
+
+def meses_da_agenda(hoje):
+    """Lista de (ano, mês) da janela da agenda em torno de 'hoje'."""
+    indice = hoje.year * 12 + hoje.month - 1
+    return [divmod(i, 12) for i in range(indice - MESES_ANTES, indice + MESES_DEPOIS + 1)]
+
+
+def ordem_do_dia(tema, id_subtema, dia, quantidade):
+    """Ordem das perguntas do sub-tema no dia: sempre a mesma para o mesmo dia e a mesma quantidade."""
+    ordem = list(range(quantidade))
+    random.Random(f"{tema}:{id_subtema}:{dia.isoformat()}").shuffle(ordem)
+    return ordem
+
+
+def montar_agenda(tema, id_subtema, quantidade, ano, mes):
+    dia = datetime.date(ano, mes + 1, 1)
+    dias = []
+    while dia.month == mes + 1:
+        dias.append(ordem_do_dia(tema, id_subtema, dia, quantidade))
+        dia += datetime.timedelta(days=1)
+    return {"perguntas": quantidade, "dias": dias}
+
+
+def montar_fragmentos_quiz(pasta_dados=PASTA_DADOS, hoje=None):
+    """Divide os quizzes em arquivos pequenos para o site. Retorna {caminho relativo: conteúdo}.
+
+    - manifesto.json: temas e sub-temas (id, nome, número de perguntas e arquivo);
+    - <tema>.json ou <tema>/<sub-tema>.json: as perguntas de um único sub-tema;
+    - agenda/<AAAA-MM>/<sub-tema>.json: para os temas de TEMAS_COM_AGENDA, a ordem
+      das perguntas de cada dia do mês (índices do fragmento do sub-tema).
+    """
+    hoje = hoje or datetime.date.today()
+    arquivos = {}
+    manifesto = {"temas": {}}
+
+    for tema, (nome_arquivo, chave) in TEMAS.items():
+        with open(os.path.join(pasta_dados, nome_arquivo), "r", encoding="utf-8") as f:
+            quiz = json.load(f)
+
+        if chave is None:
+            arquivos[f"{tema}.json"] = {"perguntas": quiz["perguntas"]}
+            manifesto["temas"][tema] = {"titulo": quiz.get("titulo", ""), "perguntas": len(quiz["perguntas"]), "arquivo": f"{tema}.json"}
+            continue
+
+        subtemas = []
+        for subtema in quiz[chave]:
+            relativo = f"{tema}/{nome_fragmento(subtema['id'])}"
+            arquivos[relativo] = {"perguntas": subtema["perguntas"]}
+            subtemas.append({"id": subtema["id"], "nome": subtema["nome"], "perguntas": len(subtema["perguntas"]), "arquivo": relativo})
+
+            if tema in TEMAS_COM_AGENDA:
+                for ano, mes in meses_da_agenda(hoje):
+                    agenda = montar_agenda(tema, subtema["id"], len(subtema["perguntas"]), ano, mes)
+                    arquivos[f"agenda/{ano:04d}-{mes + 1:02d}/{nome_fragmento(subtema['id'])}"] = agenda
+        manifesto["temas"][tema] = {"titulo": quiz.get("titulo", ""), "subtemas": subtemas}
+
+    arquivos["manifesto.json"] = manifesto
+    return arquivos
+
+
+def gerar_fragmentos_quiz(dados=None, pasta_saida=PASTA_QUIZ, pasta_dados=PASTA_DADOS, hoje=None):
+    """Grava os arquivos de montar_fragmentos_quiz, tocando só nos que mudaram.
+
+    Recebe 'dados' só para servir de gerador da SessaoEdicao: rodando a cada
+    salvamento, a janela da agenda acompanha a data. Fragmentos e meses que
+    deixaram de existir são apagados. Retorna a lista de caminhos alterados.
+    """
+    alterados = []
+    desejados = set()
+
+    for relativo, conteudo in montar_fragmentos_quiz(pasta_dados, hoje).items():
+        caminho = os.path.join(pasta_saida, *relativo.split("/"))
+        desejados.add(os.path.abspath(caminho))
+        texto = json.dumps(conteudo, ensure_ascii=False, separators=(",", ":"))
+        if escrever_se_mudou(caminho, texto):
+            alterados.append(caminho)
+
+    for raiz, pastas, nomes in os.walk(pasta_saida, topdown=False):
+        for nome in nomes:
+            caminho = os.path.join(raiz, nome)
+            if os.path.abspath(caminho) not in desejados:
+                os.remove(caminho)
+                alterados.append(caminho)
+        if raiz != pasta_saida and not os.listdir(raiz):
+            os.rmdir(raiz)
+
+    return alterados
+
+
+if __name__ == "__main__":
+    arquivos = gerar_fragmentos_quiz()
+    print(f"{len(arquivos)} arquivo(s) do quiz atualizado(s).")
@@ -0,0 +1,260 @@
+"""Importação das fotos da galeria (data/fotos.json).
+
+Percorre as pastas das seções do fotos.json, gera para cada foto uma miniatura
+(WebP + JPEG) e um placeholder minúsculo (data: URI, mostrado borrado enquanto a
+miniatura carrega) em um pool de processos, e regrava o fotos.json com a
+largura e a altura de cada foto, as miniaturas e o total real de fotos.
+
+  - Fotos listadas que não existem mais são retiradas (e informadas);
+  - Nas pastas dentro de images/galeria/, fotos novas entram sozinhas: as da
+    raiz da pasta vão para a subgaleria "Outras fotos" e as de uma subpasta,
+    para a subgaleria com o nome dela. Pastas de fora (images/eventos/...) são
+    compartilhadas com o resto do site, então só as fotos listadas são usadas;
+  - Endereços externos (http...) são mantidos como estão.
+
+O cache (data/.cache/galeria.json) guarda mtime, tamanho e hash de cada foto:
+rodar de novo só processa as fotos novas ou alteradas.
+
+    python galeria.py
+    python galeria.py --simular
+"""
+import argparse
+import base64
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from arquivos import escrever_json_atomico
+from imagens import hash_arquivo, importar_pillow
+
+PASTA_DADOS = os.path.dirname(os.path.abspath(__file__))
+PASTA_RAIZ = os.path.dirname(PASTA_DADOS)
+ARQUIVO_FOTOS = os.path.join(PASTA_DADOS, "fotos.json")
+ARQUIVO_CACHE = os.path.join(PASTA_DADOS, ".cache", "galeria.json")
+PASTA_GALERIA = "images/galeria/"
+PASTA_MINIATURAS = "images/galeria/miniaturas/"
+FOTO_SEM_CAPA = "images/galeria/placeholder.jpg"
+
+# Mude ao alterar o formato das miniaturas, para que todas sejam refeitas
+VERSAO_MINIATURAS = "1"
+LARGURA_MINIATURA = 400
+LARGURA_PLACEHOLDER = 16
+QUALIDADE_MINIATURA = 78
+QUALIDADE_PLACEHOLDER = 50
+
+EXTENSOES = (".jpg", ".jpeg", ".png", ".webp", ".gif")
+SUBGALERIA_AVULSAS = "Outras fotos"
+
+
+def processar_foto(caminho_origem, pasta_miniaturas, url_miniaturas, nome_base):
+    """Gera a miniatura e o placeholder de uma foto. Roda dentro de um processo do pool.
+
+    Retorna {"largura", "altura", "miniatura", "miniatura_webp", "placeholder"}.
+    """
+    Image, ImageOps = importar_pillow()
+    if Image is None:
+        raise RuntimeError("O Pillow é necessário para importar a galeria (pip install pillow).")
+
+    os.makedirs(pasta_miniaturas, exist_ok=True)
+    with Image.open(caminho_origem) as original:
+        imagem = ImageOps.exif_transpose(original).convert("RGB")
+        largura, altura = imagem.size
+
+        largura_miniatura = min(LARGURA_MINIATURA, largura)
+        miniatura = imagem.resize((largura_miniatura, max(1, round(altura * largura_miniatura / largura))), Image.LANCZOS)
+        nome = f"{nome_base}-{largura_miniatura}"
+        miniatura.save(os.path.join(pasta_miniaturas, f"{nome}.webp"), "WEBP", quality=QUALIDADE_MINIATURA, method=6)
+        miniatura.save(os.path.join(pasta_miniaturas, f"{nome}.jpg"), "JPEG", quality=QUALIDADE_MINIATURA, optimize=True, progressive=True)
+
+        placeholder = imagem.resize((LARGURA_PLACEHOLDER, max(1, round(altura * LARGURA_PLACEHOLDER / largura))), Image.BILINEAR)
+        memoria = io.BytesIO()
+        placeholder.save(memoria, "JPEG", quality=QUALIDADE_PLACEHOLDER)
+
+    return {
+        "largura": largura,
+        "altura": altura,
+        "miniatura": f"{url_miniaturas}{nome}.jpg",
+        "miniatura_webp": f"{url_miniaturas}{nome}.webp",
+        "placeholder": "data:image/jpeg;base64," + base64.b64encode(memoria.getvalue()).decode("ascii"),
+    }
+
+
+def _ler_json(caminho, padrao):
+    try:
+        with open(caminho, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return padrao
+
+
+def _nome_foto(foto):
+    """Aceita o formato antigo (só o nome do arquivo) e o novo ({"arquivo": ...})."""
+    return foto if isinstance(foto, str) else foto.get("arquivo", "")
+
+
+def _externa(nome):
+    return nome.startswith(("http://", "https://", "//"))
+
+
+def _arquivos_da_pasta(pasta):
+    """Fotos da pasta (relativas a ela), incluindo as de subpastas, menos as miniaturas."""
+    encontrados = []
+    absoluta = os.path.join(PASTA_RAIZ, *pasta.split("/"))
+    miniaturas = os.path.join(PASTA_RAIZ, *PASTA_MINIATURAS.rstrip("/").split("/"))
+    for raiz, pastas, nomes in os.walk(absoluta):
+        pastas[:] = sorted(p for p in pastas if os.path.join(raiz, p) != miniaturas)
+        for nome in sorted(nomes):
+            if nome.lower().endswith(EXTENSOES):
+                encontrados.append(os.path.relpath(os.path.join(raiz, nome), absoluta).replace(os.sep, "/"))
+    return encontrados
+
+
+def organizar_secoes(fotos):
+    """Monta, para cada seção, a lista final de fotos por subgaleria e o que foi retirado.
+
+    Retorna (secoes {chave: [(subgaleria, [nomes])]}, ausentes [caminhos]).
+    """
+    organizadas = {}
+    ausentes = []
+    for chave, secao in fotos.get("secoes", {}).items():
+        pasta = secao.get("pasta", "")
+        existentes = set(_arquivos_da_pasta(pasta)) if pasta else set()
+        listados = set()
+        subgalerias = []
+
+        for subgaleria in secao.get("subgalerias", []):
+            nomes = []
+            for foto in subgaleria.get("fotos", []):
+                nome = _nome_foto(foto)
+                listados.add(nome)
+                if _externa(nome) or nome in existentes:
+                    nomes.append(nome)
+                else:
+                    ausentes.append(pasta + nome)
+            subgalerias.append((subgaleria, nomes))
+
+        # Fotos novas só entram sozinhas nas pastas da própria galeria
+        if pasta.startswith(PASTA_GALERIA):
+            por_nome = {subgaleria.get("nome", "").lower(): nomes for subgaleria, nomes in subgalerias}
+            for nome in sorted(existentes - listados):
+                destino = nome.split("/", 1)[0] if "/" in nome else SUBGALERIA_AVULSAS
+                if destino.lower() not in por_nome:
+                    novas = []
+                    subgalerias.append(({"nome": destino}, novas))
+                    por_nome[destino.lower()] = novas
+                por_nome[destino.lower()].append(nome)
+
+        organizadas[chave] = [(subgaleria, nomes) for subgaleria, nomes in subgalerias if nomes]
+    return organizadas, ausentes
+
+
+def importar_galeria(arquivo_fotos=ARQUIVO_FOTOS, arquivo_cache=ARQUIVO_CACHE, processos=None, simular=False):
+    """Atualiza o fotos.json a partir das pastas. Retorna (fotos processadas, fotos retiradas)."""
+    fotos = _ler_json(arquivo_fotos, {"secoes": {}})
+    cache = _ler_json(arquivo_cache, {})
+    if cache.get("versao") != VERSAO_MINIATURAS:
+        cache = {"versao": VERSAO_MINIATURAS, "fotos": {}}
+
+    secoes, ausentes = organizar_secoes(fotos)
+
+    # Capas: a foto de origem da capa anterior ou o "thumbnail" escrito à mão, se for uma foto local que existe
+    capas = {}
+    for chave, secao in fotos.get("secoes", {}).items():
+        capa = secao.get("capa", {}).get("arquivo") or secao.get("thumbnail", "")
+        if capa and not _externa(capa) and not capa.startswith(PASTA_MINIATURAS) and capa != FOTO_SEM_CAPA and os.path.isfile(os.path.join(PASTA_RAIZ, *capa.split("/"))):
+            capas[chave] = capa
+
+    # Caminhos (a partir da raiz do site) de todas as fotos locais usadas
+    caminhos = set(capas.values())
+    for chave, subgalerias in secoes.items():
+        pasta = fotos["secoes"][chave].get("pasta", "")
+        caminhos.update(pasta + nome for _, nomes in subgalerias for nome in nomes if not _externa(nome))
+
+    # Só processa o que é novo ou mudou (mtime e tamanho; na dúvida, o hash decide)
+    registros = {}
+    pendentes = {}
+    for caminho in sorted(caminhos):
+        absoluto = os.path.join(PASTA_RAIZ, *caminho.split("/"))
+        estado = os.stat(absoluto)
+        anterior = cache["fotos"].get(caminho)
+        miniatura_existe = anterior and anterior["registro"] and os.path.isfile(os.path.join(PASTA_RAIZ, *anterior["registro"]["miniatura"].split("/")))
+        if anterior and miniatura_existe and (anterior["mtime"], anterior["tamanho"]) == (estado.st_mtime_ns, estado.st_size):
+            registros[caminho] = anterior["registro"]
+            continue
+        hash_foto = hash_arquivo(absoluto)
+        if anterior and miniatura_existe and anterior["hash"] == hash_foto:
+            registros[caminho] = anterior["registro"]
+        else:
+            pendentes[caminho] = hash_foto
+        cache["fotos"][caminho] = {"mtime": estado.st_mtime_ns, "tamanho": estado.st_size, "hash": hash_foto, "registro": registros.get(caminho)}
+
+    if pendentes and not simular:
+        pasta_miniaturas = os.path.join(PASTA_RAIZ, *PASTA_MINIATURAS.split("/"))
+        with ProcessPoolExecutor(max_workers=processos) as pool:
+            futuros = {
+                caminho: pool.submit(processar_foto, os.path.join(PASTA_RAIZ, *caminho.split("/")), pasta_miniaturas, PASTA_MINIATURAS, hash_foto)
+                for caminho, hash_foto in pendentes.items()
+            }
+            for caminho, futuro in futuros.items():
+                registros[caminho] = cache["fotos"][caminho]["registro"] = futuro.result()
+
+    if simular:
+        return sorted(pendentes), ausentes
+
+    # Regrava o fotos.json mantendo os demais campos de cada seção e subgaleria
+    for chave, secao in fotos.get("secoes", {}).items():
+        pasta = secao.get("pasta", "")
+        novas_subgalerias = []
+        for subgaleria, nomes in secoes[chave]:
+            itens = []
+            for nome in nomes:
+                registro = registros.get(pasta + nome)
+                itens.append({"arquivo": nome, **registro} if registro else {"arquivo": nome})
+            novas_subgalerias.append({**subgaleria, "fotos": itens})
+        secao["subgalerias"] = novas_subgalerias
+        secao["total_fotos"] = sum(len(subgaleria["fotos"]) for subgaleria in novas_subgalerias)
+
+        # Capa externa escolhida à mão fica; sem capa válida, a primeira foto local da seção vira a capa
+        if _externa(secao.get("thumbnail", "")):
+            continue
+        capa = capas.get(chave)
+        if capa is None:
+            capa = next((pasta + item["arquivo"] for subgaleria in novas_subgalerias for item in subgaleria["fotos"] if "miniatura" in item), None)
+        if capa is not None:
+            secao["thumbnail"] = registros[capa]["miniatura"]
+            secao["capa"] = {"arquivo": capa, **registros[capa]}
+        else:
+            secao["thumbnail"] = FOTO_SEM_CAPA
+            secao.pop("capa", None)
+
+    escrever_json_atomico(arquivo_fotos, fotos)
+
+    # Miniaturas e entradas do cache de fotos que saíram da galeria
+    cache["fotos"] = {caminho: item for caminho, item in cache["fotos"].items() if caminho in caminhos}
+    usadas = {os.path.basename(registro[campo]) for registro in registros.values() for campo in ("miniatura", "miniatura_webp")}
+    pasta_miniaturas = os.path.join(PASTA_RAIZ, *PASTA_MINIATURAS.split("/"))
+    if os.path.isdir(pasta_miniaturas):
+        for nome in os.listdir(pasta_miniaturas):
+            if nome not in usadas:
+                os.remove(os.path.join(pasta_miniaturas, nome))
+    escrever_json_atomico(arquivo_cache, cache)
+
+    return sorted(pendentes), ausentes
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Atualiza o fotos.json a partir das pastas de imagens da galeria.")
+    parser.add_argument("--processos", type=int, help="Processos em paralelo (padrão: um por CPU).")
+    parser.add_argument("--simular", action="store_true", help="Só mostra o que seria feito, sem gravar nada.")
+    argumentos = parser.parse_args(argumentos)
+
+    processadas, ausentes = importar_galeria(processos=argumentos.processos, simular=argumentos.simular)
+    for caminho in ausentes:
+        print(f"Não encontrada (retirada do fotos.json): {caminho}")
+    verbo = "seriam processadas" if argumentos.simular else "processadas"
+    print(f"{len(processadas)} foto(s) nova(s) ou alterada(s) {verbo}; {len(ausentes)} ausente(s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""Gera com antecedência os jogos de caça-palavras do site.
+
+Lê as palavras de caca-palavras-data.json e monta, em paralelo, uma biblioteca
+de jogos já validados para cada dificuldade, gravada em data/caca-palavras/:
+
+  - manifesto.json: palavras, direções e, por dificuldade, o tamanho da grade e
+    quantos arquivos/jogos existem;
+  - <dificuldade>/NNN.json: blocos de JOGOS_POR_ARQUIVO jogos. Cada jogo é
+    [letras da grade em uma única string, [[palavra, linha, coluna, direção], ...]],
+    com a palavra e a direção como índices das listas do manifesto.
+
+O js/caca-palavras.js só escolhe um jogo e o desenha. A geração é determinística
+(mesma semente, mesmos jogos), então rodar de novo sem mudar as palavras não
+altera nenhum arquivo.
+
+    python gerador_caca_palavras.py
+    python gerador_caca_palavras.py --quantidade 500 --processos 8
+"""
+import argparse
+import json
+import os
+import random
+import string
+from concurrent.futures import ProcessPoolExecutor
+
+from arquivos import escrever_se_mudou
+
+PASTA_DADOS = os.path.dirname(os.path.abspath(__file__))
+ARQUIVO_PALAVRAS = os.path.join(PASTA_DADOS, "caca-palavras-data.json")
+PASTA_SAIDA = os.path.join(PASTA_DADOS, "caca-palavras")
+
+# Mesmos valores do DIFFICULTIES do js/caca-palavras.js
+DIFICULDADES = {
+    "easy": {"tamanho": 10, "palavras": 5},
+    "medium": {"tamanho": 15, "palavras": 10},
+    "hard": {"tamanho": 20, "palavras": 15},
+}
+
+# (linha, coluna) de cada direção; a ordem faz parte do formato dos arquivos
+DIRECOES = [(0, 1), (1, 0), (1, 1), (1, -1), (0, -1), (-1, 0), (-1, -1), (-1, 1)]
+
+QUANTIDADE_PADRAO = 200
+JOGOS_POR_ARQUIVO = 20
+SEMENTE_PADRAO = 1
+
+# Limites de busca: quem passar disso é descartado (e outra semente é tentada)
+LIMITE_PASSOS = 2000
+TENTATIVAS_PREENCHIMENTO = 20
+LETRAS = string.ascii_uppercase
+
+
+def _candidatos(grade, tamanho, palavra, rng):
+    """Posições possíveis para a palavra, as que mais cruzam letras já colocadas primeiro."""
+    candidatos = []
+    comprimento = len(palavra)
+    for direcao, (dl, dc) in enumerate(DIRECOES):
+        for linha in range(tamanho):
+            if not 0 <= linha + dl * (comprimento - 1) < tamanho:
+                continue
+            for coluna in range(tamanho):
+                if not 0 <= coluna + dc * (comprimento - 1) < tamanho:
+                    continue
+                cruzamentos = 0
+                for k, letra in enumerate(palavra):
+                    atual = grade[(linha + dl * k) * tamanho + coluna + dc * k]
+                    if atual:
+                        if atual != letra:
+                            break
+                        cruzamentos += 1
+                else:
+                    # Uma palavra inteira por cima de outra não conta como colocada
+                    if cruzamentos < comprimento:
+                        candidatos.append((cruzamentos, rng.random(), linha, coluna, direcao))
+    candidatos.sort(reverse=True)
+    return candidatos
+
+
+def posicionar(palavras, tamanho, rng, limite=LIMITE_PASSOS):
+    """Coloca todas as palavras na grade por backtracking.
+
+    Retorna (grade, [(índice, linha, coluna, direção), ...]) ou None se não couberem dentro do limite.
+    """
+    grade = [""] * (tamanho * tamanho)
+    colocacoes = []
+    passos = 0
+    # As mais longas primeiro: são as mais difíceis de encaixar
+    ordem = sorted(range(len(palavras)), key=lambda i: (-len(palavras[i]), i))
+
+    def colocar(posicao):
+        nonlocal passos
+        if posicao == len(ordem):
+            return True
+        indice = ordem[posicao]
+        palavra = palavras[indice]
+        for _, _, linha, coluna, direcao in _candidatos(grade, tamanho, palavra, rng):
+            passos += 1
+            if passos > limite:
+                return False
+            dl, dc = DIRECOES[direcao]
+            escritas = []
+            for k, letra in enumerate(palavra):
+                celula = (linha + dl * k) * tamanho + coluna + dc * k
+                if not grade[celula]:
+                    grade[celula] = letra
+                    escritas.append(celula)
+            colocacoes.append((indice, linha, coluna, direcao))
+            if colocar(posicao + 1):
+                return True
+            colocacoes.pop()
+            for celula in escritas:
+                grade[celula] = ""
+        return False
+
+    if not colocar(0):
+        return None
+    return grade, colocacoes
+
+
+def ocorrencias(letras, tamanho, palavra):
+    """Conjuntos de células distintos onde a palavra pode ser lida (em qualquer direção)."""
+    encontradas = set()
+    comprimento = len(palavra)
+    for dl, dc in DIRECOES:
+        for linha in range(tamanho):
+            if not 0 <= linha + dl * (comprimento - 1) < tamanho:
+                continue
+            for coluna in range(tamanho):
+                if not 0 <= coluna + dc * (comprimento - 1) < tamanho:
+                    continue
+                celulas = tuple((linha + dl * k) * tamanho + coluna + dc * k for k in range(comprimento))
+                if all(letras[celula] == letra for celula, letra in zip(celulas, palavra)):
+                    # Lida de trás para frente é a mesma ocorrência
+                    encontradas.add(frozenset(celulas))
+    return encontradas
+
+
+def gerar_jogo(palavras, dificuldade, semente):
+    """Gera um jogo validado: cada palavra escolhida aparece exatamente uma vez na grade. Retorna None se falhar."""
+    configuracao = DIFICULDADES[dificuldade]
+    tamanho = configuracao["tamanho"]
+    rng = random.Random(f"{semente}:{dificuldade}")
+
+    escolhidas = rng.sample(range(len(palavras)), min(configuracao["palavras"], len(palavras)))
+    resultado = posicionar([palavras[i] for i in escolhidas], tamanho, rng)
+    if resultado is None:
+        return None
+    grade, colocacoes = resultado
+
+    vazias = [celula for celula, letra in enumerate(grade) if not letra]
+    colocadas = {}
+    for i, linha, coluna, direcao in colocacoes:
+        dl, dc = DIRECOES[direcao]
+        colocadas[escolhidas[i]] = frozenset((linha + dl * k) * tamanho + coluna + dc * k for k in range(len(palavras[escolhidas[i]])))
+
+    # Preenche ao acaso e depois sorteia de novo as letras que formaram uma palavra a mais
+    for celula in vazias:
+        grade[celula] = rng.choice(LETRAS)
+    vazias = set(vazias)
+    for _ in range(TENTATIVAS_PREENCHIMENTO):
+        letras = "".join(grade)
+        sobrando = [celulas for indice, colocada in colocadas.items() for celulas in ocorrencias(letras, tamanho, palavras[indice]) if celulas != colocada]
+        if not sobrando:
+            return [letras, [[escolhidas[i], linha, coluna, direcao] for i, linha, coluna, direcao in colocacoes]]
+        for celulas in sobrando:
+            trocaveis = sorted(celulas & vazias)
+            if not trocaveis:
+                return None # A palavra extra é formada só por letras de outras palavras
+            grade[rng.choice(trocaveis)] = rng.choice(LETRAS)
+    return None
+
+
+def _gerar_lote(palavras, dificuldade, sementes):
+    return [gerar_jogo(palavras, dificuldade, semente) for semente in sementes]
+
+
+def gerar_biblioteca(palavras, dificuldade, quantidade, semente=SEMENTE_PADRAO, processos=None):
+    """Gera 'quantidade' jogos da dificuldade, distribuindo as sementes entre os processos."""
+    jogos = []
+    proxima = 0
+    with ProcessPoolExecutor(max_workers=processos) as pool:
+        while len(jogos) < quantidade:
+            # Pede um pouco mais do que falta, já que algumas sementes falham
+            faltam = quantidade - len(jogos)
+            sementes = [f"{semente}:{numero}" for numero in range(proxima, proxima + faltam + faltam // 10 + 1)]
+            proxima += len(sementes)
+            lotes = [sementes[i:i + JOGOS_POR_ARQUIVO] for i in range(0, len(sementes), JOGOS_POR_ARQUIVO)]
+            for resultado in pool.map(_gerar_lote, [palavras] * len(lotes), [dificuldade] * len(lotes), lotes):
+                jogos.extend(jogo for jogo in resultado if jogo is not None)
+            if proxima > quantidade * 10 and not jogos:
+                raise ValueError(f"Não foi possível gerar jogos '{dificuldade}' com essas palavras.")
+    return jogos[:quantidade]
+
+
+def gerar_caca_palavras(quantidade=QUANTIDADE_PADRAO, semente=SEMENTE_PADRAO, processos=None,
+                        arquivo_palavras=ARQUIVO_PALAVRAS, pasta_saida=PASTA_SAIDA):
+    """Gera a biblioteca de todas as dificuldades. Retorna os arquivos criados, alterados ou removidos."""
+    with open(arquivo_palavras, "r", encoding="utf-8") as f:
+        palavras = [palavra.strip().upper() for palavra in json.load(f)["words"]]
+
+    alterados = []
+    desejados = set()
+
+    def gravar(relativo, conteudo):
+        caminho = os.path.join(pasta_saida, *relativo.split("/"))
+        desejados.add(os.path.abspath(caminho))
+        if escrever_se_mudou(caminho, json.dumps(conteudo, ensure_ascii=False, separators=(",", ":"))):
+            alterados.append(caminho)
+
+    manifesto = {"palavras": palavras, "direcoes": DIRECOES, "dificuldades": {}}
+    for dificuldade, configuracao in DIFICULDADES.items():
+        jogos = gerar_biblioteca(palavras, dificuldade, quantidade, semente, processos)
+        blocos = [jogos[i:i + JOGOS_POR_ARQUIVO] for i in range(0, len(jogos), JOGOS_POR_ARQUIVO)]
+        for numero, bloco in enumerate(blocos, start=1):
+            gravar(f"{dificuldade}/{numero:03d}.json", bloco)
+        manifesto["dificuldades"][dificuldade] = {"tamanho": configuracao["tamanho"], "arquivos": len(blocos), "jogos": len(jogos)}
+    gravar("manifesto.json", manifesto)
+
+    for raiz, _, nomes in os.walk(pasta_saida):
+        for nome in nomes:
+            caminho = os.path.join(raiz, nome)
+            if os.path.abspath(caminho) not in desejados:
+                os.remove(caminho)
+                alterados.append(caminho)
+    return alterados
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Gera a biblioteca de jogos de caça-palavras do site.")
+    parser.add_argument("--quantidade", type=int, default=QUANTIDADE_PADRAO, help="Jogos por dificuldade.")
+    parser.add_argument("--semente", default=SEMENTE_PADRAO, help="Mesma semente, mesmos jogos.")
+    parser.add_argument("--processos", type=int, help="Processos em paralelo (padrão: um por CPU).")
+    argumentos = parser.parse_args(argumentos)
+
+    arquivos = gerar_caca_palavras(argumentos.quantidade, argumentos.semente, argumentos.processos)
+    print(f"{len(arquivos)} arquivo(s) do caça-palavras atualizado(s) em '{PASTA_SAIDA}'.")
+
+
+if __name__ == "__main__":
+    main()
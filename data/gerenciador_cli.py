@@ -0,0 +1,252 @@
+"""Gerenciador de notícias pela linha de comando (sem interface gráfica).
+
+Usa a mesma validação, gravação e commit do app.py, mas sem importar o
+customtkinter, para importar/exportar muitas notícias de uma vez:
+
+    python gerenciador_cli.py importar boletins.csv
+    python gerenciador_cli.py importar boletins.jsonl --sem-commit
+    python gerenciador_cli.py exportar backup.csv --desde 2025-01-01
+"""
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sys
+
+from imagens import CAMPOS_FOTO, pipeline_padrao
+from repositorio_noticias import RepositorioNoticias
+from sessao_edicao import GERADORES_PADRAO, SessaoEdicao, carregar_jornal, validar_noticia
+from validacao_dados import formatar_problema, so_erros, validar_dados
+
+PASTA_DADOS = os.path.dirname(os.path.abspath(__file__))
+CAMINHO_JORNAL = os.path.join(PASTA_DADOS, "jornal.json")
+
+CAMPOS = ["id", "data", "titulo", "subtitulo", "foto_principal", "foto_secundaria", "conteudo", "conteudo_adicional", "destaque"]
+VALORES_VERDADEIROS = {"1", "true", "sim", "s", "yes", "x"}
+
+
+def detectar_formato(caminho, formato):
+    if formato:
+        return formato
+    return "csv" if caminho.lower().endswith(".csv") else "jsonl"
+
+
+def ler_registros(caminho, formato):
+    """Lê o arquivo de entrada registro a registro (sem carregar tudo na memória)."""
+    with open(caminho, "r", encoding="utf-8-sig", newline="") as f:
+        if formato == "csv":
+            yield from csv.DictReader(f)
+        else:
+            for numero, linha in enumerate(f, start=1):
+                if linha.strip():
+                    try:
+                        registro = json.loads(linha)
+                    except json.JSONDecodeError as e:
+                        raise ValueError(f"Linha {numero} inválida: {e}") from e
+                    if not isinstance(registro, dict):
+                        raise ValueError(f"Linha {numero} inválida: deveria ser um objeto JSON")
+                    yield registro
+
+
+def id_derivado(data, titulo):
+    """ID de um registro sem ID: o mesmo para a mesma data e título, para que reimportar o arquivo atualize em vez de duplicar."""
+    return f"noticia-{hashlib.sha256(f'{data}|{titulo}'.encode('utf-8')).hexdigest()[:8]}"
+
+
+def normalizar_registro(registro):
+    """Converte um registro do CSV/JSONL para o formato de notícia do jornal.json."""
+    data = (registro.get("data") or "").strip()
+    titulo = (registro.get("titulo") or "").strip()
+    noticia = {
+        "id": (registro.get("id") or "").strip() or id_derivado(data, titulo),
+        "data": data,
+        "titulo": titulo,
+        "subtitulo": registro.get("subtitulo") or "",
+        "foto_principal": (registro.get("foto_principal") or "").strip(),
+        "foto_secundaria": (registro.get("foto_secundaria") or "").strip() or None,
+        "conteudo": registro.get("conteudo") or "",
+        "conteudo_adicional": registro.get("conteudo_adicional") or "",
+    }
+    destaque = registro.get("destaque")
+    eh_destaque = destaque is True or str(destaque or "").strip().lower() in VALORES_VERDADEIROS
+    return noticia, eh_destaque
+
+
+def mesma_noticia(a, b):
+    """Compara duas notícias tratando campo ausente, vazio e null como iguais."""
+    return all((a.get(campo) or None) == (b.get(campo) or None) for campo in set(a) | set(b))
+
+
+def importar(caminho, formato=None, commit=True, mensagem=None, forcar=False):
+    """Importa as notícias do arquivo, grava o jornal.json uma vez e faz um único commit.
+
+    Antes de gravar, todos os JSON de dados são validados (com o jornal já com as
+    notícias importadas); havendo erros, nada é gravado, a não ser com forcar=True.
+    """
+    formato = detectar_formato(caminho, formato)
+    pasta_entrada = os.path.dirname(os.path.abspath(caminho))
+
+    dados = carregar_jornal(CAMINHO_JORNAL)
+    repositorio = RepositorioNoticias(dados)
+    sessao = SessaoEdicao(repositorio, CAMINHO_JORNAL, dados, geradores=GERADORES_PADRAO)
+    pipeline = pipeline_padrao()
+
+    # Primeiro valida tudo e manda as imagens para o pool (em paralelo); depois aplica.
+    # A leitura fica dentro do try: uma linha inválida no meio do arquivo ainda encerra o pool
+    try:
+        pendentes = []
+        erros = 0
+        for numero, registro in enumerate(ler_registros(caminho, formato), start=1):
+            noticia, eh_destaque = normalizar_registro(registro)
+            problemas = validar_noticia(noticia)
+            if problemas:
+                erros += 1
+                print(f"Registro {numero} ignorado ({noticia['titulo'] or 'sem título'}): {' '.join(problemas)}", file=sys.stderr)
+                continue
+
+            # Caminhos de arquivos locais passam pelo mesmo processamento do selecionar_imagem
+            imagens = {}
+            for campo in CAMPOS_FOTO:
+                valor = noticia[campo]
+                if not valor:
+                    continue
+                arquivo = valor if os.path.isabs(valor) else os.path.join(pasta_entrada, valor)
+                if os.path.isfile(arquivo) and not valor.startswith("../images/"):
+                    try:
+                        imagens[campo] = pipeline.enviar(arquivo)
+                    except OSError as e:
+                        problemas.append(f"Não foi possível ler a imagem '{valor}': {e}")
+            if problemas:
+                erros += 1
+                print(f"Registro {numero} ignorado ({noticia['titulo']}): {' '.join(problemas)}", file=sys.stderr)
+                continue
+            pendentes.append((numero, noticia, eh_destaque, imagens))
+
+        for numero, noticia, eh_destaque, imagens in pendentes:
+            # Uma imagem que falhou ignora só o registro dela; as demais continuam no pool
+            try:
+                registros_imagens = {campo: futuro.result() for campo, futuro in imagens.items()}
+            except Exception as e:
+                erros += 1
+                print(f"Registro {numero} ignorado ({noticia['titulo']}): não foi possível processar a imagem: {e}", file=sys.stderr)
+                continue
+            for campo, registro_imagem in registros_imagens.items():
+                noticia[campo] = registro_imagem["src"]
+                if registro_imagem["webp"]:
+                    noticia[f"{campo}_srcset"] = registro_imagem
+
+            # Reimportar a mesma notícia (mesmo ID) a atualiza em vez de duplicar
+            existente = repositorio.obter(noticia["id"])
+            if existente is not None:
+                for campo in CAMPOS_FOTO:
+                    # Foto não trocada: mantém as versões redimensionadas já geradas
+                    if campo not in imagens and noticia[campo] == existente.get(campo) and existente.get(f"{campo}_srcset"):
+                        noticia[f"{campo}_srcset"] = existente[f"{campo}_srcset"]
+                if mesma_noticia(existente, noticia) and repositorio.eh_destaque(noticia["id"]) == eh_destaque:
+                    continue
+                sessao.editar(noticia["id"], noticia, eh_destaque)
+            else:
+                sessao.adicionar(noticia, eh_destaque)
+    finally:
+        pipeline.encerrar()
+
+    if not sessao.tem_alteracoes:
+        print(f"Nenhuma alteração a importar ({erros} registro(s) ignorado(s)).")
+        return erros == 0
+
+    erros_validacao = so_erros(validar_dados(substitutos={os.path.basename(CAMINHO_JORNAL): {**dados, **repositorio.para_dict()}}))
+    for problema in erros_validacao:
+        print(f"Erro de validação: {formatar_problema(problema)}", file=sys.stderr)
+    if erros_validacao and not forcar:
+        print("Nada foi gravado: corrija os dados ou use --forcar.", file=sys.stderr)
+        return False
+
+    quantidade = len(sessao.alteracoes)
+    mensagem_padrao, arquivos = sessao.salvar()
+    print(f"{quantidade} notícia(s) importada(s), {erros} ignorada(s). Arquivo '{CAMINHO_JORNAL}' salvo.")
+
+    if commit:
+        commitar(arquivos, mensagem or mensagem_padrao)
+    return erros == 0
+
+
+def commitar(arquivos, mensagem):
+    """Faz o commit pela mesma FilaGit do app e espera o resultado."""
+    from fila_git import FilaGit # Só quem vai commitar precisa do GitPython
+
+    fila = FilaGit(PASTA_DADOS)
+    trabalho = fila.commit(arquivos, mensagem)
+    while True:
+        origem, evento, resultado = fila.eventos.get()
+        if origem is not trabalho or evento not in ("concluido", "erro", "cancelado"):
+            continue
+        break
+    fila.encerrar()
+
+    if evento == "erro":
+        raise RuntimeError(f"Ocorreu um erro durante o commit no Git: {resultado}")
+    if resultado is None:
+        print("Nenhuma alteração detectada para commitar.")
+    else:
+        print(f"Commit realizado com sucesso ({resultado[:7]}).")
+
+
+def exportar(caminho, formato=None, desde=None, ate=None):
+    """Exporta as notícias (da mais recente para a mais antiga), escrevendo uma por vez."""
+    formato = detectar_formato(caminho, formato)
+    repositorio = RepositorioNoticias(carregar_jornal(CAMINHO_JORNAL))
+
+    quantidade = 0
+    with open(caminho, "w", encoding="utf-8", newline="") as f:
+        escritor = csv.DictWriter(f, fieldnames=CAMPOS, extrasaction="ignore") if formato == "csv" else None
+        if escritor:
+            escritor.writeheader()
+
+        for noticia in repositorio:
+            if (desde and noticia.get("data", "") < desde) or (ate and noticia.get("data", "") > ate):
+                continue
+            linha = {**noticia, "destaque": repositorio.eh_destaque(noticia["id"])}
+            if escritor:
+                escritor.writerow({**linha, "foto_secundaria": linha.get("foto_secundaria") or ""})
+            else:
+                f.write(json.dumps(linha, ensure_ascii=False) + "\n")
+            quantidade += 1
+
+    print(f"{quantidade} notícia(s) exportada(s) para '{caminho}'.")
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Importa e exporta notícias do jornal.json sem abrir a interface gráfica.")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    parser_importar = subcomandos.add_parser("importar", help="Importa notícias de um arquivo CSV ou JSONL.")
+    parser_importar.add_argument("arquivo")
+    parser_importar.add_argument("--formato", choices=["csv", "jsonl"], help="Padrão: pela extensão do arquivo.")
+    parser_importar.add_argument("--sem-commit", action="store_true", help="Só grava os arquivos, sem commit no Git.")
+    parser_importar.add_argument("--mensagem", help="Mensagem do commit (padrão: resumo das alterações).")
+    parser_importar.add_argument("--forcar", action="store_true", help="Grava e commita mesmo com erros na validação dos dados.")
+
+    parser_exportar = subcomandos.add_parser("exportar", help="Exporta as notícias para um arquivo CSV ou JSONL.")
+    parser_exportar.add_argument("arquivo")
+    parser_exportar.add_argument("--formato", choices=["csv", "jsonl"], help="Padrão: pela extensão do arquivo.")
+    parser_exportar.add_argument("--desde", help="Data inicial (AAAA-MM-DD).")
+    parser_exportar.add_argument("--ate", help="Data final (AAAA-MM-DD).")
+
+    argumentos = parser.parse_args(argumentos)
+
+    try:
+        if argumentos.comando == "importar":
+            sucesso = importar(argumentos.arquivo, argumentos.formato, commit=not argumentos.sem_commit, mensagem=argumentos.mensagem, forcar=argumentos.forcar)
+            return 0 if sucesso else 1
+
+        exportar(argumentos.arquivo, argumentos.formato, argumentos.desde, argumentos.ate)
+        return 0
+    except (OSError, ValueError) as e:
+        # Arquivo que não existe ou não pode ser lido/gravado, linha do JSONL inválida...
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
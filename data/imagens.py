@@ -0,0 +1,290 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import shutil
+from concurrent.futures import Future, ProcessPoolExecutor
+
+
+LARGURAS_PADRAO = (480, 960, 1600)
+QUALIDADE_WEBP = 80
+QUALIDADE_JPEG = 82
+
+PASTA_DADOS = os.path.dirname(os.path.abspath(__file__))
+PASTA_RAIZ = os.path.dirname(PASTA_DADOS)
+PASTA_NOTICIAS = os.path.join(PASTA_RAIZ, "images", "noticias")
+URL_NOTICIAS = "../images/noticias" # Caminho usado pelo site (sempre com "/")
+
+# Arquivos do armazenamento por conteúdo: <hash>.json, <hash>.<ext> ou <hash>-<largura>.<ext>
+TAMANHO_HASH = 16
+PADRAO_ARQUIVO_HASH = re.compile(r"^([0-9a-f]{%d})(?:-\d+)?\.[a-z0-9]+$" % TAMANHO_HASH)
+
+# Campos de imagem de uma notícia (cada um pode ter o registro das versões em "<campo>_srcset")
+CAMPOS_FOTO = ("foto_principal", "foto_secundaria")
+
+
+def importar_pillow():
+    """Retorna (Image, ImageOps) do Pillow, ou (None, None) se ele não estiver instalado.
+
+    Pillow é opcional (sem ele, as imagens são apenas copiadas) e só é importado
+    dentro dos processos do pool, para não pesar na abertura do app.
+    """
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        return None, None
+    return Image, ImageOps
+
+
+def hash_arquivo(caminho):
+    """Calcula o hash (SHA-256, encurtado) do conteúdo do arquivo, lendo-o em blocos."""
+    sha = hashlib.sha256()
+    with open(caminho, "rb") as f:
+        for bloco in iter(lambda: f.read(1024 * 1024), b""):
+            sha.update(bloco)
+    return sha.hexdigest()[:TAMANHO_HASH]
+
+
+def consultar_indice(pasta_destino, nome_base):
+    """Procura no índice em disco (o .json ao lado das imagens) uma imagem já processada.
+
+    Retorna o registro, ou None se ela ainda não existe ou se algum arquivo sumiu.
+    """
+    try:
+        with open(os.path.join(pasta_destino, f"{nome_base}.json"), "r", encoding="utf-8") as f:
+            registro = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    urls = [registro["src"]] + [url for url, _ in registro["webp"] + registro["jpg"]]
+    for url in urls:
+        if not os.path.exists(os.path.join(pasta_destino, url.rsplit("/", 1)[-1])):
+            return None
+    return registro
+
+
+def processar_imagem(caminho_origem, pasta_destino, url_destino, nome_base, larguras=LARGURAS_PADRAO):
+    """Gera as versões redimensionadas (WebP + JPEG) de uma imagem e o arquivo .json com as dimensões.
+
+    Roda dentro de um processo do pool. Retorna o registro usado no jornal.json:
+    {"src": ..., "largura": ..., "altura": ..., "webp": [[url, largura], ...], "jpg": [[url, largura], ...]}
+    """
+    os.makedirs(pasta_destino, exist_ok=True)
+    Image, ImageOps = importar_pillow()
+
+    if Image is None or caminho_origem.lower().endswith(".gif"):
+        # Sem Pillow (ou GIF animado): mantém o arquivo original
+        extensao = os.path.splitext(caminho_origem)[1].lower()
+        nome_arquivo = f"{nome_base}{extensao}"
+        destino = os.path.join(pasta_destino, nome_arquivo)
+        if os.path.abspath(caminho_origem) != os.path.abspath(destino):
+            shutil.copy(caminho_origem, destino)
+        registro = {"src": f"{url_destino}/{nome_arquivo}", "largura": None, "altura": None, "webp": [], "jpg": []}
+        _gravar_registro(pasta_destino, nome_base, registro)
+        return registro
+
+    with Image.open(caminho_origem) as original:
+        # Aplica a rotação indicada no EXIF antes de descartá-lo
+        imagem = ImageOps.exif_transpose(original)
+        largura_original, altura_original = imagem.size
+
+        # Só reduz: larguras maiores que a original viram uma única versão no tamanho original
+        alvos = sorted({min(largura, largura_original) for largura in larguras})
+
+        registro = {"src": None, "largura": largura_original, "altura": altura_original, "webp": [], "jpg": []}
+        com_transparencia = imagem.mode in ("RGBA", "LA") or (imagem.mode == "P" and "transparency" in imagem.info)
+
+        for largura in alvos:
+            altura = max(1, round(altura_original * largura / largura_original))
+            versao = imagem if largura == largura_original else imagem.resize((largura, altura), Image.LANCZOS)
+
+            # WebP (mantém transparência). Como não passamos exif=, os metadados são descartados
+            nome_webp = f"{nome_base}-{largura}.webp"
+            versao.convert("RGBA" if com_transparencia else "RGB").save(
+                os.path.join(pasta_destino, nome_webp), "WEBP", quality=QUALIDADE_WEBP, method=6
+            )
+
+            # JPEG de reserva (fundo branco no lugar da transparência)
+            if com_transparencia:
+                fundo = Image.new("RGB", versao.size, (255, 255, 255))
+                fundo.paste(versao.convert("RGBA"), mask=versao.convert("RGBA").split()[-1])
+                versao_jpeg = fundo
+            else:
+                versao_jpeg = versao.convert("RGB")
+            nome_jpg = f"{nome_base}-{largura}.jpg"
+            versao_jpeg.save(
+                os.path.join(pasta_destino, nome_jpg), "JPEG", quality=QUALIDADE_JPEG, optimize=True, progressive=True
+            )
+
+            registro["webp"].append([f"{url_destino}/{nome_webp}", largura])
+            registro["jpg"].append([f"{url_destino}/{nome_jpg}", largura])
+
+    # A versão de reserva é a maior JPEG gerada
+    registro["src"] = registro["jpg"][-1][0]
+
+    _gravar_registro(pasta_destino, nome_base, registro)
+    return registro
+
+
+def _gravar_registro(pasta_destino, nome_base, registro):
+    # Gravado por último: é ele que marca a imagem como pronta no índice
+    with open(os.path.join(pasta_destino, f"{nome_base}.json"), "w", encoding="utf-8") as f:
+        json.dump(registro, f, indent=2, ensure_ascii=False)
+
+
+class PipelineImagens:
+    """Processa as imagens escolhidas em um pool de processos, sem travar a interface."""
+
+    def __init__(self, pasta_destino=PASTA_NOTICIAS, url_destino=URL_NOTICIAS, larguras=LARGURAS_PADRAO, max_processos=None):
+        self.pasta_destino = pasta_destino
+        self.url_destino = url_destino
+        self.larguras = larguras
+        self.max_processos = max_processos or min(4, os.cpu_count() or 1)
+        self._pool = None
+
+    def enviar(self, caminho_origem):
+        """Agenda o processamento e retorna um Future com o registro da imagem.
+
+        Os arquivos são nomeados pelo hash do conteúdo: duas fotos diferentes com o
+        mesmo nome não se sobrescrevem, e reenviar a mesma foto só consulta o índice.
+        """
+        nome_base = hash_arquivo(caminho_origem)
+
+        registro = consultar_indice(self.pasta_destino, nome_base)
+        if registro is not None:
+            futuro = Future()
+            futuro.set_result(registro)
+            return futuro
+
+        if self._pool is None:
+            # Criado só no primeiro uso: iniciar processos tem custo
+            self._pool = ProcessPoolExecutor(max_workers=self.max_processos)
+
+        return self._pool.submit(
+            processar_imagem,
+            os.path.abspath(caminho_origem),
+            os.path.abspath(self.pasta_destino),
+            self.url_destino,
+            nome_base,
+            self.larguras,
+        )
+
+    def encerrar(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+def arquivos_da_noticia(noticia, pasta_destino=PASTA_NOTICIAS, url_destino=URL_NOTICIAS):
+    """Arquivos do armazenamento usados pelas imagens da notícia (as versões e o .json de cada imagem).
+
+    São os arquivos que processar_imagem gerou e que precisam entrar no mesmo
+    commit do jornal.json que aponta para eles.
+    """
+    urls = set()
+    for campo in CAMPOS_FOTO:
+        if noticia.get(campo):
+            urls.add(noticia[campo])
+        registro = noticia.get(f"{campo}_srcset")
+        if registro:
+            urls.add(registro["src"])
+            urls.update(url for url, _ in registro["webp"] + registro["jpg"])
+
+    arquivos = set()
+    for url in urls:
+        if not url.startswith(url_destino + "/"):
+            continue
+        nome = url.rsplit("/", 1)[-1]
+        arquivos.add(os.path.join(pasta_destino, nome))
+        encontrado = PADRAO_ARQUIVO_HASH.match(nome)
+        if encontrado:
+            arquivos.add(os.path.join(pasta_destino, f"{encontrado.group(1)}.json"))
+    return sorted(arquivo for arquivo in arquivos if os.path.exists(arquivo))
+
+
+_pipeline_padrao = None
+
+
+def pipeline_padrao():
+    """Retorna o pipeline compartilhado das imagens de notícias."""
+    global _pipeline_padrao
+    if _pipeline_padrao is None:
+        _pipeline_padrao = PipelineImagens()
+    return _pipeline_padrao
+
+
+# --- Coleta de lixo ---
+
+def referencias_imagens(pasta_dados=PASTA_DADOS):
+    """Retorna os caminhos (a partir de 'images/') citados em qualquer data/*.json ou diário pendente."""
+    referencias = set()
+
+    def percorrer(valor):
+        if isinstance(valor, str):
+            if "images/" in valor:
+                referencias.add("images/" + valor.split("images/", 1)[1])
+        elif isinstance(valor, dict):
+            for item in valor.values():
+                percorrer(item)
+        elif isinstance(valor, list):
+            for item in valor:
+                percorrer(item)
+
+    for caminho in sorted(glob.glob(os.path.join(pasta_dados, "*.json"))):
+        with open(caminho, "r", encoding="utf-8") as f:
+            percorrer(json.load(f))
+
+    # Alterações ainda não incorporadas também contam como referência
+    for caminho in glob.glob(os.path.join(pasta_dados, "*.diario.jsonl")):
+        with open(caminho, "r", encoding="utf-8") as f:
+            for linha in f:
+                try:
+                    percorrer(json.loads(linha))
+                except json.JSONDecodeError:
+                    pass
+
+    return referencias
+
+
+def coletar_lixo(pasta_destino=PASTA_NOTICIAS, pasta_dados=PASTA_DADOS, aplicar=False):
+    """Encontra (e, com aplicar=True, apaga) as imagens do armazenamento por hash que nenhum JSON usa.
+
+    Só considera arquivos nomeados por hash; imagens colocadas à mão não são tocadas.
+    Retorna a lista de arquivos removidos (ou que seriam removidos).
+    """
+    prefixo = os.path.relpath(pasta_destino, PASTA_RAIZ).replace(os.sep, "/") + "/"
+    hashes_usados = set()
+    for referencia in referencias_imagens(pasta_dados):
+        if referencia.startswith(prefixo):
+            encontrado = PADRAO_ARQUIVO_HASH.match(referencia[len(prefixo):])
+            if encontrado:
+                hashes_usados.add(encontrado.group(1))
+
+    removidos = []
+    for nome in sorted(os.listdir(pasta_destino)):
+        encontrado = PADRAO_ARQUIVO_HASH.match(nome)
+        # Mantém todas as versões de uma imagem se qualquer uma delas estiver em uso
+        if encontrado and encontrado.group(1) not in hashes_usados:
+            removidos.append(os.path.join(pasta_destino, nome))
+            if aplicar:
+                os.remove(os.path.join(pasta_destino, nome))
+    return removidos
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manutenção das imagens das notícias.")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+    gc = subcomandos.add_parser("gc", help="Remove imagens que não são mais usadas em nenhum data/*.json.")
+    gc.add_argument("--aplicar", action="store_true", help="Apaga de fato (sem esta opção, só lista).")
+    argumentos = parser.parse_args()
+
+    if argumentos.comando == "gc":
+        arquivos = coletar_lixo(aplicar=argumentos.aplicar)
+        for arquivo in arquivos:
+            print(("Removido: " if argumentos.aplicar else "Não usado: ") + os.path.relpath(arquivo, PASTA_RAIZ))
+        if not arquivos:
+            print("Nenhuma imagem sem uso.")
+        elif not argumentos.aplicar:
+            print(f"{len(arquivos)} arquivo(s). Use --aplicar para apagar.")
@@ -0,0 +1,155 @@
+import html
+import json
+import os
+import re
+import unicodedata
+
+from arquivos import escrever_se_mudou
+
+PASTA_DADOS = os.path.dirname(os.path.abspath(__file__))
+PASTA_BUSCA = os.path.join(PASTA_DADOS, "jornal", "busca")
+
+# Letras iniciais usadas para dividir o índice: "catequese" fica no arquivo "ca.json"
+TAMANHO_PREFIXO = 2
+
+# Peso de cada campo na pontuação de um termo
+PESOS_CAMPOS = {"titulo": 3, "subtitulo": 2, "conteudo": 1, "conteudo_adicional": 1}
+
+# Palavras muito comuns que só aumentariam o índice
+PALAVRAS_IGNORADAS = {
+    "a", "ao", "aos", "as", "com", "como", "da", "das", "de", "do", "dos", "e", "em", "na", "nas",
+    "no", "nos", "o", "os", "ou", "para", "pela", "pelas", "pelo", "pelos", "por", "que", "se",
+    "um", "uma", "uns", "umas", "sua", "seu", "suas", "seus", "nao", "mais", "ja", "foi", "sao",
+}
+
+PADRAO_TAG = re.compile(r"<[^>]+>")
+PADRAO_TERMO = re.compile(r"[a-z0-9]+")
+PADRAO_ACENTOS = re.compile("[\u0300-\u036f]+")
+
+
+def dobrar_acentos(texto):
+    """Converte para minúsculas e remove acentos ('Celebração' -> 'celebracao').
+
+    Faz o mesmo que a busca do site (toLowerCase, normalize('NFD') e remove
+    U+0300 a U+036F): com NFKD, "ª", "º" e ligaduras seriam indexados de um jeito
+    e buscados de outro. Com uma regex, e não caractere a caractere, porque o
+    filtro do gerenciador passa todo o jornal por aqui.
+    """
+    return PADRAO_ACENTOS.sub("", unicodedata.normalize("NFD", texto.lower()))
+
+
+def extrair_termos(texto):
+    """Quebra o texto (HTML permitido) em termos sem acento, descartando os muito curtos e os comuns."""
+    texto = html.unescape(PADRAO_TAG.sub(" ", texto or ""))
+    return [
+        termo for termo in PADRAO_TERMO.findall(dobrar_acentos(texto))
+        if len(termo) >= TAMANHO_PREFIXO and termo not in PALAVRAS_IGNORADAS
+    ]
+
+
+def numerar_documentos(noticias, anteriores=()):
+    """Número de cada notícia no índice, estável entre os salvamentos.
+
+    'anteriores' é a lista de documentos do indice.json atual (posição = número,
+    None = vaga livre). Notícias que já estavam mantêm o número; as que saíram
+    liberam a vaga, que é reaproveitada pelas novas (as demais vão para o fim).
+    Assim, uma notícia nova ou removida só muda as listas dos termos dela, e não
+    renumera todo o índice. Retorna a nova lista de documentos.
+    """
+    ids = {noticia["id"] for noticia in noticias}
+    documentos = [id_noticia if id_noticia in ids else None for id_noticia in anteriores]
+    numerados = set(documentos)
+    vagas = (posicao for posicao, id_noticia in enumerate(documentos) if id_noticia is None)
+    for noticia in noticias:
+        if noticia["id"] in numerados:
+            continue
+        posicao = next(vagas, None)
+        if posicao is None:
+            documentos.append(noticia["id"])
+        else:
+            documentos[posicao] = noticia["id"]
+        numerados.add(noticia["id"])
+
+    while documentos and documentos[-1] is None:
+        documentos.pop()
+    return documentos
+
+
+def montar_indice(dados, documentos_anteriores=()):
+    """Monta o índice invertido. Retorna {caminho relativo: conteúdo}.
+
+    - indice.json: lista de IDs (a posição é o número do documento, None = vaga
+      livre; ver numerar_documentos) e os prefixos existentes;
+    - <prefixo>.json: termos em ordem alfabética e, alinhadas a eles, as listas de
+      ocorrências [documento, peso, documento, peso, ...].
+    A ordem alfabética permite achar por busca binária todos os termos que começam
+    com o que o visitante está digitando.
+    """
+    # As novas recebem número na ordem das datas (mais recentes primeiro), para o resultado não depender da ordem do arquivo
+    noticias = sorted(dados.get("noticias", []), key=lambda n: n.get("data", ""), reverse=True)
+    documentos = numerar_documentos(noticias, documentos_anteriores)
+    numero = {id_noticia: posicao for posicao, id_noticia in enumerate(documentos) if id_noticia is not None}
+
+    ocorrencias = {} # termo -> {documento: peso}
+    for noticia in noticias:
+        documento = numero[noticia["id"]]
+        for campo, peso in PESOS_CAMPOS.items():
+            for termo in extrair_termos(noticia.get(campo)):
+                por_documento = ocorrencias.setdefault(termo, {})
+                por_documento[documento] = por_documento.get(documento, 0) + peso
+
+    blocos = {}
+    for termo in sorted(ocorrencias):
+        bloco = blocos.setdefault(termo[:TAMANHO_PREFIXO], {"termos": [], "ocorrencias": []})
+        lista = []
+        for documento, peso in sorted(ocorrencias[termo].items()):
+            lista.extend((documento, peso))
+        bloco["termos"].append(termo)
+        bloco["ocorrencias"].append(lista)
+
+    arquivos = {f"{prefixo}.json": bloco for prefixo, bloco in blocos.items()}
+    arquivos["indice.json"] = {
+        "documentos": documentos,
+        "prefixos": sorted(blocos),
+        "tamanho_prefixo": TAMANHO_PREFIXO,
+        "ignoradas": sorted(PALAVRAS_IGNORADAS),
+    }
+    return arquivos
+
+
+def ler_documentos(pasta_saida=PASTA_BUSCA):
+    """Lista de documentos do indice.json já gravado (vazia se ainda não existir)."""
+    try:
+        with open(os.path.join(pasta_saida, "indice.json"), "r", encoding="utf-8") as f:
+            return json.load(f).get("documentos", [])
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+
+
+def gerar_indice_busca(dados, pasta_saida=PASTA_BUSCA):
+    """Grava os arquivos do índice que mudaram e apaga os prefixos que sumiram. Retorna os caminhos alterados.
+
+    Os números dos documentos vêm do indice.json atual: só os blocos dos termos
+    das notícias adicionadas, editadas ou removidas são regravados.
+    """
+    alterados = []
+    arquivos = montar_indice(dados, ler_documentos(pasta_saida))
+
+    for nome, conteudo in arquivos.items():
+        caminho = os.path.join(pasta_saida, nome)
+        if escrever_se_mudou(caminho, json.dumps(conteudo, ensure_ascii=False, separators=(",", ":"))):
+            alterados.append(caminho)
+
+    for nome in os.listdir(pasta_saida):
+        if nome.endswith(".json") and nome not in arquivos:
+            caminho = os.path.join(pasta_saida, nome)
+            os.remove(caminho)
+            alterados.append(caminho)
+
+    return alterados
+
+
+if __name__ == "__main__":
+    with open(os.path.join(PASTA_DADOS, "jornal.json"), "r", encoding="utf-8") as f:
+        alterados = gerar_indice_busca(json.load(f))
+    print(f"{len(alterados)} arquivo(s) do índice de busca atualizado(s).")
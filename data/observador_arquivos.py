@@ -0,0 +1,150 @@
+"""Observa os JSON da pasta data/ e avisa quando um deles muda fora do gerenciador.
+
+Mudanças chegam por um 'git pull', pela edição à mão ou por outro programa. No
+Linux, com o pacote opcional inotify_simple (pip install inotify-simple), o
+sistema avisa na hora; sem ele, a pasta é verificada a cada INTERVALO_VERIFICACAO.
+
+Em ambos os casos a mudança é confirmada pelo mtime/tamanho e depois pelo hash do
+conteúdo (um 'touch' ou um checkout com o mesmo conteúdo não geram aviso), e o
+JSON é lido na própria thread do observador. Os resultados ficam em self.eventos
+como tuplas (caminho, dados, erro); a interface lê essa fila com after, como a da FilaGit.
+"""
+import fnmatch
+import hashlib
+import json
+import os
+import queue
+import threading
+
+from construcao_site import PADRAO_COM_HASH
+
+try:
+    from inotify_simple import INotify, flags
+except ImportError:
+    INotify = None
+
+INTERVALO_VERIFICACAO = 1.0 # s, sem inotify (ou como garantia, com ele)
+ESPERA_RAJADA = 0.2 # s: um checkout grava vários arquivos em sequência; espera terminar
+
+# Gerados pelo próprio gerenciador: não são fonte de dados
+IGNORADOS = ("pacote-*.json",)
+
+
+def hash_arquivo(caminho):
+    with open(caminho, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class ObservadorArquivos:
+    """Thread que acompanha os arquivos 'padrao' da pasta (menos os gerados) e publica as mudanças em self.eventos."""
+
+    def __init__(self, pasta, padrao="*.json", ignorados=IGNORADOS):
+        self.pasta = pasta
+        self.padrao = padrao
+        self.ignorados = ignorados
+        self.eventos = queue.Queue()
+        # caminho -> (mtime_ns, tamanho, hash) da última versão vista
+        self._conhecidos = {}
+        self._trava = threading.Lock()
+        self._parar = threading.Event()
+        self._thread = threading.Thread(target=self._executar, name="observador-arquivos", daemon=True)
+        self._thread.start()
+
+    def conhecer(self, caminho):
+        """Registra o conteúdo atual como já visto (para o próprio gerenciador não se avisar do que gravou)."""
+        caminho = os.path.abspath(caminho)
+        with self._trava:
+            self._conhecidos[caminho] = self._assinatura(caminho)
+
+    def verificar_agora(self):
+        """Verifica a pasta na hora, na thread de quem chamou (antes de gravar por cima, por exemplo)."""
+        self._verificar()
+
+    def encerrar(self):
+        self._parar.set()
+
+    # --- Thread do observador ---
+
+    def _executar(self):
+        # O estado inicial não gera eventos, só o que mudar daqui em diante (lido aqui para não travar a janela)
+        for caminho in self._arquivos():
+            try:
+                self.conhecer(caminho)
+            except OSError:
+                pass
+
+        inotify = None
+        if INotify is not None:
+            try:
+                inotify = INotify()
+                inotify.add_watch(self.pasta, flags.CLOSE_WRITE | flags.MOVED_TO | flags.CREATE | flags.DELETE)
+            except OSError:
+                inotify = None # Limite de watches do sistema, por exemplo: segue verificando
+
+        while not self._parar.is_set():
+            if inotify is not None:
+                if inotify.read(timeout=int(INTERVALO_VERIFICACAO * 1000)):
+                    self._parar.wait(ESPERA_RAJADA)
+                    inotify.read(timeout=0) # Descarta o resto da rajada
+            else:
+                self._parar.wait(INTERVALO_VERIFICACAO)
+            if not self._parar.is_set():
+                self._verificar()
+
+        if inotify is not None:
+            inotify.close()
+
+    def _verificar(self):
+        atuais = set(self._arquivos())
+        with self._trava:
+            caminhos = atuais | set(self._conhecidos)
+
+        for caminho in sorted(caminhos):
+            with self._trava:
+                anterior = self._conhecidos.get(caminho)
+
+            if caminho not in atuais:
+                with self._trava:
+                    self._conhecidos.pop(caminho, None)
+                self.eventos.put((caminho, None, None))
+                continue
+
+            try:
+                estado = os.stat(caminho)
+                if anterior is not None and anterior[:2] == (estado.st_mtime_ns, estado.st_size):
+                    continue
+                # Lê uma vez só: o mesmo conteúdo dá o hash e os dados
+                with open(caminho, "rb") as f:
+                    conteudo = f.read()
+            except OSError:
+                continue # Sumiu ou ainda está sendo gravado: fica para a próxima verificação
+
+            assinatura = (estado.st_mtime_ns, estado.st_size, hashlib.sha256(conteudo).hexdigest())
+            with self._trava:
+                self._conhecidos[caminho] = assinatura
+            if anterior is not None and anterior[2] == assinatura[2]:
+                continue # Mesmo conteúdo, só o mtime mudou
+
+            try:
+                dados = json.loads(conteudo.decode("utf-8"))
+            except ValueError as e:
+                # Edição à mão pela metade: avisa uma vez; a próxima gravação é lida de novo
+                self.eventos.put((caminho, None, e))
+                continue
+            self.eventos.put((caminho, dados, None))
+
+    def _arquivos(self):
+        try:
+            nomes = os.listdir(self.pasta)
+        except FileNotFoundError:
+            return []
+        return [
+            os.path.abspath(os.path.join(self.pasta, nome)) for nome in nomes
+            if fnmatch.fnmatch(nome, self.padrao) and not PADRAO_COM_HASH.search(nome)
+            and not any(fnmatch.fnmatch(nome, ignorado) for ignorado in self.ignorados)
+        ]
+
+    def _assinatura(self, caminho):
+        """(mtime_ns, tamanho, hash do conteúdo) do arquivo."""
+        estado = os.stat(caminho)
+        return (estado.st_mtime_ns, estado.st_size, hash_arquivo(caminho))
@@ -0,0 +1,83 @@
+"""Pacotes de dados por página do site.
+
+Em vez de cada script da página inicial buscar o seu JSON (informações,
+eventos, missas, história, fotos...), o site busca um único arquivo
+data/pacote-<página>.json, com só os campos que os scripts usam e sem espaços.
+
+Cada pacote é descrito por um "formato" por arquivo de origem:
+  - True mantém o valor inteiro;
+  - {"campo": formato} mantém só os campos listados;
+  - {"*": formato} mantém todas as chaves (anos, meses, seções...) aplicando o formato aos valores;
+  - [formato] aplica o formato a cada item da lista.
+
+Os pacotes são regenerados a cada salvamento (junto com os arquivos do jornal)
+e a cada publicação (construcao_site.py), e só são regravados quando mudam.
+"""
+import json
+import os
+
+from arquivos import escrever_se_mudou
+
+PASTA_DADOS = os.path.dirname(os.path.abspath(__file__))
+
+# página -> {chave no pacote: (arquivo de origem, formato)}
+PACOTES = {
+    "inicio": {
+        "informacoes": ("informacoes.json", {"informacoes": [{"titulo": True, "subtitulo": True, "texto": True}]}),
+        # Próximos eventos e missas festivas, já filtrados e ordenados (data/agenda_eventos.py)
+        "agenda": ("agenda/proximos.json", {"eventos": True, "missas_festivas": True}),
+        "historia": ("historia.json", {"timeline": [{"ano": True, "titulo": True, "descricao": True, "imagem": True, "destaque": True}]}),
+        "missas": ("missas.json", {
+            "horarios_regulares": {"*": {"horarios": True, "destaque": True, "observacao": True}},
+            "eventos_especiais": [{"nome": True, "descricao": True, "imagem": True}],
+        }),
+        "fotos": ("fotos.json", {"secoes": {"*": {
+            "nome": True, "descricao": True, "thumbnail": True, "capa": True, "pasta": True, "total_fotos": True,
+            "subgalerias": [{"nome": True, "fotos": True}],
+        }}}),
+    },
+}
+
+
+def nome_pacote(pagina):
+    return f"pacote-{pagina}.json"
+
+
+def projetar(valor, formato):
+    """Reduz o valor ao formato (ver a descrição do módulo)."""
+    if formato is True:
+        return valor
+    if isinstance(formato, list):
+        return [projetar(item, formato[0]) for item in valor] if isinstance(valor, list) else valor
+    if not isinstance(valor, dict):
+        return valor
+    if "*" in formato:
+        return {chave: projetar(item, formato["*"]) for chave, item in valor.items()}
+    return {campo: projetar(valor[campo], sub) for campo, sub in formato.items() if campo in valor}
+
+
+def montar_pacote(pagina, pasta=PASTA_DADOS):
+    pacote = {}
+    for chave, (arquivo, formato) in PACOTES[pagina].items():
+        with open(os.path.join(pasta, arquivo), "r", encoding="utf-8") as f:
+            pacote[chave] = projetar(json.load(f), formato)
+    return pacote
+
+
+def gerar_pacotes_paginas(dados=None, pasta=PASTA_DADOS):
+    """Gera os pacotes de todas as páginas e retorna os arquivos regravados.
+
+    Recebe 'dados' só para servir de gerador da SessaoEdicao; os pacotes vêm dos outros JSON da pasta.
+    """
+    alterados = []
+    for pagina in PACOTES:
+        caminho = os.path.join(pasta, nome_pacote(pagina))
+        texto = json.dumps(montar_pacote(pagina, pasta), ensure_ascii=False, separators=(",", ":"))
+        if escrever_se_mudou(caminho, texto):
+            alterados.append(caminho)
+    return alterados
+
+
+if __name__ == "__main__":
+    arquivos = gerar_pacotes_paginas()
+    print(f"{len(arquivos)} pacote(s) atualizado(s).")
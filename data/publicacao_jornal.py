@@ -0,0 +1,135 @@
+import json
+import os
+import re
+
+from arquivos import escrever_se_mudou
+
+PASTA_DADOS = os.path.dirname(os.path.abspath(__file__))
+PASTA_PUBLICACAO = os.path.join(PASTA_DADOS, "jornal")
+
+NOTICIAS_POR_PAGINA = 20
+TAMANHO_RESUMO = 250
+
+# Mesmas palavras-chave usadas por js/jornal.js para classificar as notícias
+MAPA_CATEGORIAS = {
+    "avisos": ["aviso", "avisos"],
+    "eventos": ["festa", "campanha", "celebração", "sucesso"],
+    "catequese": ["catequese", "inscrições", "crisma", "inscrição"],
+}
+
+
+def nome_arquivo_artigo(id_noticia):
+    """Nome do arquivo do corpo da notícia (o js/jornal.js faz a mesma conversão)."""
+    return re.sub(r"[^A-Za-z0-9_-]", "_", id_noticia) + ".json"
+
+
+def categorias_da_noticia(noticia):
+    """Retorna (categoria principal, todas as categorias cujas palavras-chave aparecem no texto)."""
+    texto = f"{noticia.get('titulo', '')} {noticia.get('conteudo', '')}".lower()
+    encontradas = [
+        categoria for categoria, palavras in MAPA_CATEGORIAS.items()
+        if any(palavra in texto for palavra in palavras)
+    ]
+    principal = (noticia.get("categoria") or (encontradas[0] if encontradas else "geral")).lower()
+    return principal, encontradas
+
+
+def montar_publicacao(dados):
+    """Divide o jornal em arquivos pequenos para o site. Retorna {caminho relativo: conteúdo}.
+
+    - manifesto.json: lista leve (id, data, título, foto, categorias) e os destaques;
+    - paginas/NNN.json: subtítulo e resumo, em blocos de NOTICIAS_POR_PAGINA, por data;
+    - artigos/<id>.json: o corpo completo, baixado só quando a notícia é aberta.
+    """
+    noticias = sorted(dados.get("noticias", []), key=lambda n: n.get("data", ""), reverse=True)
+    arquivos = {}
+
+    itens_manifesto = []
+    paginas = []
+    for inicio in range(0, len(noticias), NOTICIAS_POR_PAGINA):
+        bloco = noticias[inicio:inicio + NOTICIAS_POR_PAGINA]
+        numero = len(paginas) + 1
+        nome_pagina = f"paginas/{numero:03d}.json"
+        paginas.append(nome_pagina)
+        arquivos[nome_pagina] = {
+            "pagina": numero,
+            "noticias": [
+                {
+                    "id": noticia["id"],
+                    "subtitulo": noticia.get("subtitulo", ""),
+                    "resumo": noticia.get("conteudo", "")[:TAMANHO_RESUMO],
+                }
+                for noticia in bloco
+            ],
+        }
+
+        for noticia in bloco:
+            categoria, categorias = categorias_da_noticia(noticia)
+            item = {
+                "id": noticia["id"],
+                "data": noticia.get("data", ""),
+                "titulo": noticia.get("titulo", ""),
+                "foto_principal": noticia.get("foto_principal", ""),
+                "categoria": categoria,
+                "categorias": categorias,
+                "pagina": numero,
+            }
+            if noticia.get("foto_principal_srcset"):
+                item["foto_principal_srcset"] = noticia["foto_principal_srcset"]
+            itens_manifesto.append(item)
+
+            artigo = {
+                "id": noticia["id"],
+                "conteudo": noticia.get("conteudo", ""),
+                "conteudo_adicional": noticia.get("conteudo_adicional", ""),
+                "foto_secundaria": noticia.get("foto_secundaria"),
+            }
+            if noticia.get("foto_secundaria_srcset"):
+                artigo["foto_secundaria_srcset"] = noticia["foto_secundaria_srcset"]
+            arquivos[f"artigos/{nome_arquivo_artigo(noticia['id'])}"] = artigo
+
+    # Destaques que apontam para notícias inexistentes ficam de fora
+    ids = {noticia["id"] for noticia in noticias}
+    arquivos["manifesto.json"] = {
+        "total": len(noticias),
+        "noticias_por_pagina": NOTICIAS_POR_PAGINA,
+        "paginas": paginas,
+        "destaques": [id_noticia for id_noticia in dados.get("destaques", []) if id_noticia in ids],
+        "noticias": itens_manifesto,
+    }
+    return arquivos
+
+
+def gerar_publicacao(dados, pasta_saida=PASTA_PUBLICACAO):
+    """Grava os arquivos de montar_publicacao, tocando só nos que mudaram.
+
+    Arquivos de páginas e artigos que deixaram de existir são apagados.
+    Retorna a lista de caminhos criados, alterados ou removidos (para o commit).
+    """
+    alterados = []
+    desejados = set()
+
+    for relativo, conteudo in montar_publicacao(dados).items():
+        caminho = os.path.join(pasta_saida, *relativo.split("/"))
+        desejados.add(os.path.abspath(caminho))
+        texto = json.dumps(conteudo, ensure_ascii=False, separators=(",", ":"))
+        if escrever_se_mudou(caminho, texto):
+            alterados.append(caminho)
+
+    for subpasta in ("paginas", "artigos"):
+        pasta = os.path.join(pasta_saida, subpasta)
+        if not os.path.isdir(pasta):
+            continue
+        for nome in os.listdir(pasta):
+            caminho = os.path.join(pasta, nome)
+            if os.path.abspath(caminho) not in desejados:
+                os.remove(caminho)
+                alterados.append(caminho)
+
+    return alterados
+
+
+if __name__ == "__main__":
+    with open(os.path.join(PASTA_DADOS, "jornal.json"), "r", encoding="utf-8") as f:
+        arquivos = gerar_publicacao(json.load(f))
+    print(f"{len(arquivos)} arquivo(s) de publicação atualizado(s).")
@@ -0,0 +1,294 @@
+import hashlib
+import html
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from arquivos import escrever_json_atomico, escrever_se_mudou
+from publicacao_jornal import NOTICIAS_POR_PAGINA, nome_arquivo_artigo
+
+PASTA_DADOS = os.path.dirname(os.path.abspath(__file__))
+PASTA_RAIZ = os.path.dirname(PASTA_DADOS)
+ARQUIVO_MODELO = os.path.join(PASTA_RAIZ, "pages", "jornal.html")
+PASTA_ESTATICA = os.path.join(PASTA_RAIZ, "pages", "jornal")
+ARQUIVO_CACHE = os.path.join(PASTA_DADOS, ".cache", "renderizacao_jornal.json")
+
+# Mude ao alterar o HTML gerado, para que todas as páginas sejam refeitas
+VERSAO_RENDERIZACAO = "1"
+
+# Abaixo disso, iniciar processos custa mais do que renderizar tudo aqui mesmo
+MINIMO_PARA_POOL = 500
+
+# Caminhos relativos (css, js, imagens...) que precisam subir um nível a mais
+PADRAO_CAMINHO_RELATIVO = re.compile(r'((?:href|src)=")(?!https?:|//|/|#|mailto:|data:|javascript:)')
+PADRAO_MAIN = re.compile(r"<main class=\"main\">.*?</main>", re.S)
+PADRAO_DESTAQUES = re.compile(r'<div id="noticias-destaque" class="destaques-grid">\s*<!--[^>]*-->\s*</div>')
+PADRAO_RECENTES = re.compile(r'<div id="noticias-recentes" class="noticias-lista">\s*<!--[^>]*-->\s*</div>')
+
+
+# --- Modelo (pages/jornal.html) ---
+
+def carregar_modelo(caminho=ARQUIVO_MODELO):
+    """Lê o pages/jornal.html e ajusta os caminhos relativos para as páginas dentro de pages/jornal/.
+
+    Retorna (modelo da listagem, modelo do artigo). Os artigos ficam um nível abaixo
+    (pages/jornal/noticias/), então recebem mais um "../".
+    """
+    with open(caminho, "r", encoding="utf-8") as f:
+        texto = f.read()
+    if not (PADRAO_MAIN.search(texto) and PADRAO_DESTAQUES.search(texto) and PADRAO_RECENTES.search(texto)):
+        raise ValueError(f"O modelo '{caminho}' não tem as áreas de notícias esperadas.")
+
+    listagem = PADRAO_CAMINHO_RELATIVO.sub(r"\1../", texto)
+    artigo = PADRAO_CAMINHO_RELATIVO.sub(r"\1../", listagem).replace("<body>", '<body data-pagina="artigo">', 1)
+    return listagem, artigo
+
+
+def ajustar_url(url, niveis):
+    """Ajusta um caminho salvo no jornal.json (relativo a pages/) para uma página 'niveis' pastas abaixo."""
+    if url and url.startswith("../"):
+        return "../" * niveis + url
+    return url
+
+
+def nome_pagina_artigo(id_noticia):
+    """Nome do HTML da notícia: o mesmo do arquivo em data/jornal/artigos/, com .html."""
+    return os.path.splitext(nome_arquivo_artigo(id_noticia))[0] + ".html"
+
+
+def _titulo_pagina(modelo, titulo):
+    return re.sub(r"<title>.*?</title>", f"<title>{html.escape(titulo)}</title>", modelo, count=1, flags=re.S)
+
+
+def _data_br(data):
+    ano, mes, dia = (data.split("-") + ["", "", ""])[:3]
+    return f"{dia}/{mes}/{ano}" if dia else data
+
+
+def imagem_responsiva(noticia, campo, classe, sizes, niveis, estilo=""):
+    """Mesma marcação do imagemResponsiva do js/jornal.js (WebP + JPEG quando houver versões)."""
+    src = ajustar_url(noticia.get(campo) or "", niveis)
+    if not src:
+        return ""
+    atributos = f'alt="{html.escape(noticia.get("titulo", ""))}"'
+    if classe:
+        atributos += f' class="{classe}"'
+    if estilo:
+        atributos += f' style="{estilo}"'
+
+    versoes = noticia.get(f"{campo}_srcset")
+    if not versoes or not versoes.get("webp"):
+        return f'<img src="{src}" {atributos} loading="lazy">'
+
+    def srcset(lista):
+        return ", ".join(f"{ajustar_url(url, niveis)} {largura}w" for url, largura in lista)
+
+    return (
+        f'<picture><source type="image/webp" srcset="{srcset(versoes["webp"])}" sizes="{sizes}">'
+        f'<img src="{ajustar_url(versoes.get("src") or noticia.get(campo), niveis)}" srcset="{srcset(versoes["jpg"])}" '
+        f'sizes="{sizes}" width="{versoes["largura"]}" height="{versoes["altura"]}" {atributos} loading="lazy"></picture>'
+    )
+
+
+# --- Páginas ---
+
+def renderizar_artigo(modelo, noticia, anterior, proxima):
+    """Página completa de uma notícia. 'anterior' e 'proxima' são (id, título) ou None."""
+    navegacao = []
+    if anterior:
+        navegacao.append(f'<a href="{nome_pagina_artigo(anterior[0])}" class="btn btn-secondary">&larr; {html.escape(anterior[1])}</a>')
+    navegacao.append('<a href="../index.html" class="btn btn-primary">Voltar ao Jornal</a>')
+    if proxima:
+        navegacao.append(f'<a href="{nome_pagina_artigo(proxima[0])}" class="btn btn-secondary">{html.escape(proxima[1])} &rarr;</a>')
+
+    # A mesma foto do modal do js/jornal.js (a secundária); sem ela, a principal
+    estilo_foto = "width:100%; height:auto; border-radius: 8px; margin-bottom: 1rem;"
+    foto = (
+        imagem_responsiva(noticia, "foto_secundaria", "", "(max-width: 768px) 100vw, 800px", 2, estilo_foto)
+        or imagem_responsiva(noticia, "foto_principal", "", "(max-width: 768px) 100vw, 800px", 2, estilo_foto)
+    )
+    conteudo_adicional = noticia.get("conteudo_adicional") or ""
+    principal = f"""<main class="main">
+        <section id="jornal" class="section">
+            <div class="container">
+                <article class="noticia-completa" data-id="{html.escape(noticia['id'])}">
+                    <h2 class="section-title text-left mb-2">{html.escape(noticia.get('titulo', ''))}</h2>
+                    <p class="section-subtitle text-left mb-3">{html.escape(noticia.get('subtitulo', ''))}</p>
+                    <p class="mb-3"><em>Publicado em: {_data_br(noticia.get('data', ''))}</em></p>
+                    {foto}
+                    <div class="card-body">
+                        <p>{(noticia.get('conteudo') or '').replace(chr(10), '')}</p>
+                        {f'<div class="conteudo-adicional mt-4">{conteudo_adicional}</div>' if conteudo_adicional else ''}
+                    </div>
+                </article>
+                <nav class="pagination">{''.join(navegacao)}</nav>
+            </div>
+        </section>
+    </main>"""
+    pagina = _titulo_pagina(modelo, f"{noticia.get('titulo', '')} - Jornal da Paróquia")
+    return PADRAO_MAIN.sub(lambda _: principal, pagina, count=1)
+
+
+def _card_destaque(noticia):
+    link = f"noticias/{nome_pagina_artigo(noticia['id'])}"
+    return f"""
+                    <div class="card card-destaque">
+                        {imagem_responsiva(noticia, 'foto_principal', 'card-img-top', '(max-width: 768px) 100vw, 33vw', 1)}
+                        <div class="card-body">
+                            <span class="badge badge-primary">Destaque</span>
+                            <h3 class="card-title">{html.escape(noticia.get('titulo', ''))}</h3>
+                            <p class="card-subtitle">{html.escape(noticia.get('subtitulo', ''))}</p>
+                            <p class="card-conteudo">{html.escape((noticia.get('conteudo') or '')[:100])}...</p>
+                            <a href="{link}" class="btn btn-primary leia-mais-btn" data-id="{html.escape(noticia['id'])}">Leia Mais</a>
+                        </div>
+                    </div>"""
+
+
+def _card_noticia(noticia):
+    link = f"noticias/{nome_pagina_artigo(noticia['id'])}"
+    return f"""
+                    <div class="card card-noticia" data-id="{html.escape(noticia['id'])}">
+                        <div class="noticia-imagem">
+                            {imagem_responsiva(noticia, 'foto_principal', 'card-img-list', '(max-width: 768px) 100vw, 300px', 1)}
+                        </div>
+                        <div class="noticia-conteudo">
+                            <span class="noticia-data">{_data_br(noticia.get('data', ''))}</span>
+                            <h4 class="noticia-titulo">{html.escape(noticia.get('titulo', ''))}</h4>
+                            <p class="noticia-subtitulo">{html.escape((noticia.get('conteudo') or '')[:120])}...</p>
+                            <a href="{link}" class="leia-mais-link">Ver notícia completa &rarr;</a>
+                        </div>
+                    </div>"""
+
+
+def nome_pagina_listagem(numero):
+    return "index.html" if numero == 1 else f"pagina-{numero:03d}.html"
+
+
+def renderizar_listagem(modelo, destaques, noticias, numero, total_paginas):
+    """Uma página da listagem: os destaques (só na primeira) e um bloco das demais notícias.
+
+    O js/jornal.js reconhece o data-estatico e mantém este HTML até que os filtros sejam usados.
+    """
+    if destaques:
+        html_destaques = '<div id="noticias-destaque" class="destaques-grid">' + "".join(map(_card_destaque, destaques)) + "\n                </div>"
+    else:
+        html_destaques = '<div id="noticias-destaque" class="destaques-grid" style="display: none;"></div>'
+
+    links = []
+    if total_paginas > 1:
+        for pagina in range(1, total_paginas + 1):
+            ativo = " active" if pagina == numero else ""
+            links.append(f'<a href="{nome_pagina_listagem(pagina)}" class="pagination-link{ativo}">{pagina}</a>')
+    html_recentes = (
+        '<div id="noticias-recentes" class="noticias-lista" data-estatico="1">' + "".join(map(_card_noticia, noticias))
+        + f'\n                </div>\n                <div id="paginacao-container" class="pagination">{"".join(links)}</div>'
+    )
+
+    pagina = _titulo_pagina(modelo, "Jornal da Paróquia - Paróquia São Francisco de Assis" + (f" - Página {numero}" if numero > 1 else ""))
+    pagina = PADRAO_DESTAQUES.sub(lambda _: html_destaques, pagina, count=1)
+    return PADRAO_RECENTES.sub(lambda _: html_recentes, pagina, count=1)
+
+
+# --- Geração incremental ---
+
+def _hash(*partes):
+    sha = hashlib.sha256()
+    for parte in partes:
+        sha.update(json.dumps(parte, ensure_ascii=False, sort_keys=True).encode("utf-8"))
+        sha.update(b"\0")
+    return sha.hexdigest()[:16]
+
+
+def _renderizar_lote(modelo, tarefas):
+    """Roda em um processo do pool: renderiza vários artigos de uma vez."""
+    return [(relativo, renderizar_artigo(modelo, *argumentos)) for relativo, argumentos in tarefas]
+
+
+def _ler_cache(caminho):
+    try:
+        with open(caminho, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def gerar_paginas_estaticas(dados, pasta_saida=PASTA_ESTATICA, arquivo_modelo=ARQUIVO_MODELO, arquivo_cache=ARQUIVO_CACHE):
+    """Gera o HTML pronto das notícias e da listagem paginada em pages/jornal/.
+
+    Só os artigos cujo conteúdo (ou o dos vizinhos, usados nos links de navegação,
+    ou o modelo) mudou desde a última geração são renderizados de novo; o cache
+    guarda o hash de cada página gerada. Muitos artigos são renderizados em um
+    pool de processos. Retorna a lista de arquivos criados, alterados ou removidos.
+    """
+    modelo_listagem, modelo_artigo = carregar_modelo(arquivo_modelo)
+    hash_modelo = _hash(VERSAO_RENDERIZACAO, modelo_artigo)
+
+    noticias = sorted(dados.get("noticias", []), key=lambda n: n.get("data", ""), reverse=True)
+    cache = _ler_cache(arquivo_cache)
+    novo_cache = {}
+    alterados = []
+
+    # Artigos (da mais recente para a mais antiga: "anterior" é a mais nova)
+    tarefas = []
+    for posicao, noticia in enumerate(noticias):
+        anterior = noticias[posicao - 1] if posicao > 0 else None
+        proxima = noticias[posicao + 1] if posicao + 1 < len(noticias) else None
+        argumentos = (
+            noticia,
+            (anterior["id"], anterior.get("titulo", "")) if anterior else None,
+            (proxima["id"], proxima.get("titulo", "")) if proxima else None,
+        )
+        relativo = f"noticias/{nome_pagina_artigo(noticia['id'])}"
+        assinatura = _hash(hash_modelo, argumentos)
+        novo_cache[relativo] = assinatura
+        if cache.get(relativo) != assinatura or not os.path.exists(os.path.join(pasta_saida, *relativo.split("/"))):
+            tarefas.append((relativo, argumentos))
+
+    if len(tarefas) >= MINIMO_PARA_POOL:
+        lotes = [tarefas[inicio:inicio + 200] for inicio in range(0, len(tarefas), 200)]
+        with ProcessPoolExecutor() as pool:
+            renderizados = [item for lote in pool.map(_renderizar_lote, [modelo_artigo] * len(lotes), lotes) for item in lote]
+    else:
+        renderizados = _renderizar_lote(modelo_artigo, tarefas)
+
+    for relativo, pagina in renderizados:
+        caminho = os.path.join(pasta_saida, *relativo.split("/"))
+        if escrever_se_mudou(caminho, pagina):
+            alterados.append(caminho)
+
+    # Listagem: barata de montar, é sempre refeita (e só gravada se mudou)
+    ids = {noticia["id"] for noticia in noticias}
+    ids_destaque = [id_noticia for id_noticia in dados.get("destaques", []) if id_noticia in ids]
+    destaques_por_id = set(ids_destaque)
+    por_id = {noticia["id"]: noticia for noticia in noticias}
+    destaques = [por_id[id_noticia] for id_noticia in ids_destaque]
+    normais = [noticia for noticia in noticias if noticia["id"] not in destaques_por_id]
+
+    blocos = [normais[inicio:inicio + NOTICIAS_POR_PAGINA] for inicio in range(0, len(normais), NOTICIAS_POR_PAGINA)] or [[]]
+    for numero, bloco in enumerate(blocos, start=1):
+        relativo = nome_pagina_listagem(numero)
+        novo_cache[relativo] = "listagem"
+        pagina = renderizar_listagem(modelo_listagem, destaques if numero == 1 else [], bloco, numero, len(blocos))
+        caminho = os.path.join(pasta_saida, relativo)
+        if escrever_se_mudou(caminho, pagina):
+            alterados.append(caminho)
+
+    # Remove páginas de notícias excluídas e de listagem que sobraram
+    for pasta, prefixo in ((pasta_saida, ""), (os.path.join(pasta_saida, "noticias"), "noticias/")):
+        if not os.path.isdir(pasta):
+            continue
+        for nome in os.listdir(pasta):
+            if nome.endswith(".html") and f"{prefixo}{nome}" not in novo_cache:
+                caminho = os.path.join(pasta, nome)
+                os.remove(caminho)
+                alterados.append(caminho)
+
+    escrever_json_atomico(arquivo_cache, novo_cache)
+    return alterados
+
+
+if __name__ == "__main__":
+    with open(os.path.join(PASTA_DADOS, "jornal.json"), "r", encoding="utf-8") as f:
+        arquivos = gerar_paginas_estaticas(json.load(f))
+    print(f"{len(arquivos)} página(s) estática(s) atualizada(s).")
@@ -0,0 +1,226 @@
+import bisect
+import itertools
+
+from filtro_noticias import FIM_PREFIXO, IndiceTexto, VisaoFiltrada, termos_da_busca
+
+
+class RepositorioNoticias:
+    """Guarda as notícias do jornal.json em memória, com índices para acesso rápido.
+
+    - por_id: dicionário id -> notícia (busca em O(1));
+    - ordem: lista de chaves (data, sequência, id) mantida ordenada com bisect;
+    - destaques: conjunto de ids em destaque (dict sem valores, para manter a ordem no arquivo);
+    - indice_texto: termos sem acento -> ids, para o filtro da interface (só depois de indexar_texto).
+
+    A posição 0 é sempre a notícia mais recente, como na lista da interface.
+    """
+
+    def __init__(self, dados=None):
+        self.por_id = {}
+        self.ordem = []
+        self.chave_por_id = {}
+        self.destaques = {}
+        self._sequencia = itertools.count()
+        self.indice_texto = None
+        self.versao = 0 # Muda a cada alteração; diz se um resultado de filtrar ainda vale
+        self.ids_repetidos = [] # IDs que apareciam mais de uma vez no último carregar
+
+        if dados:
+            self.carregar(dados)
+
+    def carregar(self, dados):
+        """Reconstrói os índices a partir de um dicionário {'destaques': [...], 'noticias': [...]}."""
+        self.por_id = {}
+        self.chave_por_id = {}
+        self._sequencia = itertools.count()
+        self.versao += 1
+
+        # IDs repetidos no arquivo: vale a primeira ocorrência, e as demais são avisadas
+        unicas = {}
+        self.ids_repetidos = []
+        for noticia in dados.get("noticias", []):
+            if noticia["id"] in unicas:
+                self.ids_repetidos.append(noticia["id"])
+            else:
+                unicas[noticia["id"]] = noticia
+        if self.ids_repetidos:
+            print(f"{len(self.ids_repetidos)} notícia(s) com ID repetido ignorada(s) (vale a primeira): {', '.join(sorted(set(self.ids_repetidos)))}")
+
+        # Percorre de trás para frente para que, em datas iguais, a ordem do arquivo seja mantida
+        for noticia in reversed(list(unicas.values())):
+            self.por_id[noticia["id"]] = noticia
+            self.chave_por_id[noticia["id"]] = self._nova_chave(noticia)
+
+        self.ordem = sorted(self.chave_por_id.values())
+        self.destaques = dict.fromkeys(dados.get("destaques", []))
+        if self.indice_texto is not None:
+            self.indexar_texto()
+
+    def indexar_texto(self):
+        """Monta o índice de termos usado por filtrar; daí em diante ele acompanha cada alteração.
+
+        Fica de fora do construtor porque só a interface precisa dele (a CLI e o benchmark não pagam o custo).
+        """
+        self.indice_texto = IndiceTexto(self.por_id.values())
+
+    # --- Consulta ---
+
+    def __len__(self):
+        return len(self.ordem)
+
+    def __getitem__(self, posicao):
+        """Retorna a notícia na posição informada (0 = mais recente)."""
+        if posicao < 0:
+            posicao += len(self.ordem)
+        if not 0 <= posicao < len(self.ordem):
+            raise IndexError(posicao)
+        return self.por_id[self.ordem[-1 - posicao][2]]
+
+    def __iter__(self):
+        for chave in reversed(self.ordem):
+            yield self.por_id[chave[2]]
+
+    def __contains__(self, id_noticia):
+        return id_noticia in self.por_id
+
+    def obter(self, id_noticia):
+        """Retorna a notícia com o ID informado, ou None."""
+        return self.por_id.get(id_noticia)
+
+    def posicao_de(self, id_noticia):
+        """Retorna a posição (0 = mais recente) da notícia na lista ordenada."""
+        chave = self.chave_por_id[id_noticia]
+        return len(self.ordem) - 1 - bisect.bisect_left(self.ordem, chave)
+
+    def eh_destaque(self, id_noticia):
+        return id_noticia in self.destaques
+
+    def filtrar(self, texto="", inicio="", fim="", so_destaques=False, anterior=None):
+        """Notícias que passam pelos filtros, da mais recente para a mais antiga.
+
+        - texto: todos os termos (sem diferença de acentos) como começo de alguma palavra;
+        - inicio/fim: datas AAAA-MM-DD, ou só o começo delas (AAAA, AAAA-MM), inclusive;
+        - so_destaques: só as notícias em destaque.
+        Retorna uma VisaoFiltrada ou, sem filtro nenhum, o próprio repositório.
+
+        'anterior' é o resultado da tecla anterior: se a busca só ficou mais restrita
+        (termos completados, mesmos período e destaques), o novo resultado sai dele em
+        vez de percorrer todo o período.
+        """
+        ids = None
+        if texto:
+            if self.indice_texto is None:
+                self.indexar_texto()
+            ids = self.indice_texto.buscar(texto)
+        if so_destaques:
+            ids = set(self.destaques) if ids is None else ids & self.destaques.keys()
+        if ids is None and not inicio and not fim:
+            return self
+
+        # A lista 'ordem' já está ordenada por data: o período é só um intervalo dela
+        primeiro = bisect.bisect_left(self.ordem, (inicio,)) if inicio else 0
+        ultimo = bisect.bisect_left(self.ordem, (fim + FIM_PREFIXO,)) if fim else len(self.ordem)
+        termos = tuple(termos_da_busca(texto))
+        filtro = (termos, inicio, fim, so_destaques)
+        base = self.ordem[primeiro:ultimo] if ids is None or not self._restringe(anterior, filtro) else anterior.chaves
+        if ids is None:
+            chaves = base
+        elif len(ids) * 8 < len(base):
+            # Poucos resultados: mais rápido ordenar só eles do que percorrer o período
+            limite_inicio, limite_fim = (inicio,), (fim + FIM_PREFIXO,)
+            chaves = sorted(
+                chave for chave in map(self.chave_por_id.get, ids)
+                if chave is not None and (not inicio or chave >= limite_inicio) and (not fim or chave < limite_fim)
+            )
+        else:
+            chaves = [chave for chave in base if chave[2] in ids]
+        return VisaoFiltrada(self, chaves, filtro, self.versao)
+
+    def _restringe(self, anterior, filtro):
+        """Diz se o resultado anterior contém tudo o que o novo filtro pode encontrar."""
+        if not isinstance(anterior, VisaoFiltrada) or anterior.repositorio is not self or anterior.versao != self.versao:
+            return False
+        termos_anteriores, *resto_anterior = anterior.filtro
+        termos, *resto = filtro
+        return resto_anterior == resto and all(any(termo.startswith(antigo) for termo in termos) for antigo in termos_anteriores)
+
+    # --- Alteração ---
+
+    def adicionar(self, noticia, eh_destaque=False):
+        """Insere uma nova notícia e retorna a sua posição na lista."""
+        if noticia["id"] in self.por_id:
+            raise ValueError(f"Já existe uma notícia com o ID '{noticia['id']}'.")
+
+        chave = self._nova_chave(noticia)
+        self.por_id[noticia["id"]] = noticia
+        self.chave_por_id[noticia["id"]] = chave
+        bisect.insort(self.ordem, chave)
+        self.definir_destaque(noticia["id"], eh_destaque)
+        self.versao += 1
+        if self.indice_texto is not None:
+            self.indice_texto.adicionar(noticia)
+        return self.posicao_de(noticia["id"])
+
+    def editar(self, id_original, noticia, eh_destaque=False):
+        """Substitui uma notícia (o ID pode mudar) e retorna a sua nova posição."""
+        if id_original not in self.por_id:
+            raise KeyError(id_original)
+        if noticia["id"] != id_original and noticia["id"] in self.por_id:
+            raise ValueError(f"Já existe uma notícia com o ID '{noticia['id']}'.")
+
+        chave_antiga = self.chave_por_id.pop(id_original)
+        del self.por_id[id_original]
+
+        if chave_antiga[0] == noticia.get("data", "") and noticia["id"] == id_original:
+            # A data não mudou: a posição continua a mesma
+            chave = chave_antiga
+        else:
+            self._remover_chave(chave_antiga)
+            chave = self._nova_chave(noticia)
+            bisect.insort(self.ordem, chave)
+
+        self.por_id[noticia["id"]] = noticia
+        self.chave_por_id[noticia["id"]] = chave
+
+        self.destaques.pop(id_original, None)
+        self.definir_destaque(noticia["id"], eh_destaque)
+        self.versao += 1
+        if self.indice_texto is not None:
+            self.indice_texto.remover(id_original)
+            self.indice_texto.adicionar(noticia)
+        return self.posicao_de(noticia["id"])
+
+    def remover(self, id_noticia):
+        """Remove a notícia (e o destaque, se houver) e a retorna."""
+        noticia = self.por_id.pop(id_noticia)
+        self._remover_chave(self.chave_por_id.pop(id_noticia))
+        self.destaques.pop(id_noticia, None)
+        self.versao += 1
+        if self.indice_texto is not None:
+            self.indice_texto.remover(id_noticia)
+        return noticia
+
+    def definir_destaque(self, id_noticia, eh_destaque):
+        self.versao += 1
+        if eh_destaque:
+            self.destaques.setdefault(id_noticia)
+        else:
+            self.destaques.pop(id_noticia, None)
+
+    # --- Serialização ---
+
+    def para_dict(self):
+        """Retorna os dados no formato do jornal.json (notícias da mais recente para a mais antiga)."""
+        return {
+            "destaques": list(self.destaques),
+            "noticias": list(self)
+        }
+
+    # --- Auxiliares ---
+
+    def _nova_chave(self, noticia):
+        return (noticia.get("data", ""), next(self._sequencia), noticia["id"])
+
+    def _remover_chave(self, chave):
+        posicao = bisect.bisect_left(self.ordem, chave)
+        del self.ordem[posicao]
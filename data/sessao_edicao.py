@@ -0,0 +1,284 @@
+import datetime
+import json
+import os
+import re
+
+from agenda_eventos import gerar_agenda_eventos
+from arquivos import escrever_json_atomico
+from desempenho import medir
+from diario_alteracoes import aplicar_operacao
+from fragmentos_quiz import gerar_fragmentos_quiz
+from imagens import arquivos_da_noticia
+from indice_busca import gerar_indice_busca
+from pacotes_paginas import gerar_pacotes_paginas
+from publicacao_jornal import gerar_publicacao
+from renderizacao_jornal import gerar_paginas_estaticas
+
+# Arquivos derivados do jornal.json, regenerados a cada salvamento
+# (a agenda vem antes dos pacotes, que incluem o proximos.json)
+GERADORES_PADRAO = (gerar_publicacao, gerar_indice_busca, gerar_paginas_estaticas, gerar_agenda_eventos,
+                    gerar_pacotes_paginas, gerar_fragmentos_quiz)
+
+PADRAO_DATA = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def carregar_jornal(caminho):
+    """Lê o jornal.json; se ele não existir ou for inválido, começa com uma estrutura vazia."""
+    try:
+        with medir("json_load", arquivo=os.path.basename(caminho)):
+            with open(caminho, "r", encoding="utf-8") as f:
+                return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"destaques": [], "noticias": []}
+
+
+def retrato(dados):
+    """Estado de um jornal.json para comparar versões: ({id: notícia}, {IDs em destaque})."""
+    return {noticia["id"]: noticia for noticia in dados.get("noticias", [])}, set(dados.get("destaques", []))
+
+
+def validar_noticia(noticia):
+    """Retorna a lista de problemas da notícia (vazia se estiver tudo certo)."""
+    erros = []
+    if not noticia.get("id"):
+        erros.append("O campo 'ID' é obrigatório.")
+    if not noticia.get("titulo") or not noticia.get("data"):
+        erros.append("Os campos 'Título' e 'Data' são obrigatórios.")
+    elif not PADRAO_DATA.match(noticia["data"]):
+        erros.append("A data deve estar no formato AAAA-MM-DD.")
+    else:
+        try:
+            datetime.date.fromisoformat(noticia["data"])
+        except ValueError:
+            erros.append(f"A data {noticia['data']} não existe (mês ou dia fora do calendário).")
+    return erros
+
+
+
+class SessaoEdicao:
+    """Acumula as alterações feitas nas notícias até que o usuário peça para salvar.
+
+    Enquanto isso, as mudanças ficam apenas no RepositorioNoticias (em memória) e
+    os IDs alterados ficam em self.alteracoes. Ao salvar, o jornal.json é gravado
+    uma única vez (de forma atômica) e é gerada uma mensagem de commit que resume
+    todas as alterações.
+
+    Os geradores (funções que recebem os dados e retornam a lista de arquivos que
+    alteraram, como gerar_publicacao) rodam depois da gravação, para que os
+    arquivos derivados entrem no mesmo commit. A interface salva em três partes
+    (preparar_salvamento, gravar e concluir_salvamento) para que a gravação e os
+    geradores rodem fora da thread do Tk.
+
+    As imagens processadas das notícias alteradas (images/noticias/<hash>-*.webp,
+    .jpg e o <hash>.json) são acumuladas em self.arquivos_imagens e também entram
+    no commit, para o jornal.json publicado não apontar para arquivos fora do repositório.
+
+    Se um DiarioAlteracoes for informado, cada alteração também é acrescentada a
+    ele assim que acontece, para que nada se perca se o programa fechar antes de
+    salvar.
+    """
+
+    LIMITE_LINHAS_RESUMO = 50
+
+    VERBOS = {"adicionada": "Adiciona", "editada": "Edita", "excluida": "Exclui"}
+    ROTULOS = {"adicionada": "adicionada(s)", "editada": "editada(s)", "excluida": "excluída(s)"}
+
+    def __init__(self, repositorio, caminho_arquivo, dados=None, diario=None, geradores=()):
+        self.repositorio = repositorio
+        self.caminho_arquivo = caminho_arquivo
+        # Chaves do jornal.json que não são notícias/destaques são preservadas
+        self.dados = dados if dados is not None else {}
+        self.diario = diario
+        self.geradores = list(geradores)
+        self.alteracoes = {} # id -> (operação, título)
+        self.arquivos_imagens = set()
+        self._reproduzindo = False
+
+    @property
+    def tem_alteracoes(self):
+        return bool(self.alteracoes)
+
+    def adicionar(self, noticia, eh_destaque=False):
+        posicao = self.repositorio.adicionar(noticia, eh_destaque)
+        self.alteracoes[noticia["id"]] = ("adicionada", noticia.get("titulo", ""))
+        self.arquivos_imagens.update(arquivos_da_noticia(noticia))
+        self._registrar({"op": "adicionar", "noticia": noticia, "destaque": eh_destaque})
+        return posicao
+
+    def editar(self, id_original, noticia, eh_destaque=False):
+        posicao = self.repositorio.editar(id_original, noticia, eh_destaque)
+
+        operacao_anterior = self.alteracoes.pop(id_original, (None, ""))[0]
+        # Uma notícia criada nesta sessão continua sendo "adicionada", mesmo depois de editada
+        operacao = "adicionada" if operacao_anterior == "adicionada" else "editada"
+        self.alteracoes[noticia["id"]] = (operacao, noticia.get("titulo", ""))
+        self.arquivos_imagens.update(arquivos_da_noticia(noticia))
+        self._registrar({"op": "editar", "id_original": id_original, "noticia": noticia, "destaque": eh_destaque})
+        return posicao
+
+    def remover(self, id_noticia):
+        noticia = self.repositorio.remover(id_noticia)
+
+        operacao_anterior = self.alteracoes.pop(id_noticia, (None, ""))[0]
+        if operacao_anterior != "adicionada":
+            # Adicionar e excluir na mesma sessão não deixa rastro no arquivo
+            self.alteracoes[id_noticia] = ("excluida", noticia.get("titulo", ""))
+        self._registrar({"op": "remover", "id": id_noticia})
+        return noticia
+
+    def definir_destaque(self, id_noticia, eh_destaque):
+        if self.repositorio.eh_destaque(id_noticia) == eh_destaque:
+            return
+        self.repositorio.definir_destaque(id_noticia, eh_destaque)
+        # Sempre uma tupla nova (mantendo a operação anterior), para concluir_salvamento ver a mudança
+        operacao = self.alteracoes.get(id_noticia, ("editada",))[0]
+        self.alteracoes[id_noticia] = (operacao, self.repositorio.obter(id_noticia).get("titulo", ""))
+        self._registrar({"op": "destaque", "id": id_noticia, "valor": eh_destaque})
+
+    def comparar_externo(self, base, externo):
+        """Compara o jornal.json alterado fora do gerenciador com a última versão conhecida dele.
+
+        'base' é o retrato dessa versão. Retorna (externas, conflitos): IDs alterados
+        só no arquivo e IDs alterados no arquivo e também nesta sessão (ainda não
+        salvos). Notícias que já estão iguais em memória, como as que o próprio
+        gerenciador gravou, ficam de fora.
+        """
+        noticias_base, destaques_base = base
+        noticias_externo, destaques_externo = retrato(externo)
+        externas, conflitos = [], []
+        for id_noticia in sorted(noticias_base.keys() | noticias_externo.keys()):
+            noticia = noticias_externo.get(id_noticia)
+            em_destaque = id_noticia in destaques_externo
+            if noticia == noticias_base.get(id_noticia) and em_destaque == (id_noticia in destaques_base):
+                continue
+            if noticia == self.repositorio.obter(id_noticia) and em_destaque == self.repositorio.eh_destaque(id_noticia):
+                continue
+            (conflitos if id_noticia in self.alteracoes else externas).append(id_noticia)
+        return externas, conflitos
+
+    def aplicar_externas(self, externo, ids):
+        """Traz para a memória a versão do arquivo das notícias informadas, sem contá-las como alterações da sessão.
+
+        Alterações locais dessas notícias são descartadas. Com diário, ele passa a
+        guardar só a diferença entre a memória e o arquivo, para que uma recuperação
+        não reaplique por cima a versão descartada (o jornal.json não é gravado).
+        """
+        if not ids:
+            return
+        noticias_externo, destaques_externo = retrato(externo)
+        for id_noticia in ids:
+            noticia = noticias_externo.get(id_noticia)
+            em_destaque = id_noticia in destaques_externo
+            if noticia is None:
+                if id_noticia in self.repositorio:
+                    self.repositorio.remover(id_noticia)
+            elif id_noticia in self.repositorio:
+                self.repositorio.editar(id_noticia, noticia, em_destaque)
+            else:
+                self.repositorio.adicionar(noticia, em_destaque)
+            self.alteracoes.pop(id_noticia, None)
+
+        # As demais chaves do jornal.json seguem o arquivo
+        self.dados.update({chave: valor for chave, valor in externo.items() if chave not in ("noticias", "destaques")})
+        if self.diario is not None:
+            self.diario.reescrever({**self.dados, **self.repositorio.para_dict()}, externo)
+
+    def reproduzir(self, operacoes):
+        """Reaplica operações recuperadas do diário (sem gravá-las de novo) e retorna quantas foram aplicadas."""
+        self._reproduzindo = True
+        try:
+            for operacao in operacoes:
+                aplicar_operacao(self, operacao)
+        finally:
+            self._reproduzindo = False
+        return len(operacoes)
+
+    def resumo(self):
+        """Gera a mensagem de commit com todas as alterações da sessão."""
+        if not self.alteracoes:
+            return "Atualiza conteúdo: jornal.json"
+        if len(self.alteracoes) == 1:
+            operacao, titulo = next(iter(self.alteracoes.values()))
+            return f"{self.VERBOS[operacao]} notícia: {titulo[:30]}..."
+
+        contagem = {}
+        for operacao, _ in self.alteracoes.values():
+            contagem[operacao] = contagem.get(operacao, 0) + 1
+        partes = [f"{quantidade} {self.ROTULOS[operacao]}" for operacao, quantidade in contagem.items()]
+
+        linhas = [f"Atualiza jornal: {', '.join(partes)}", ""]
+        for operacao, titulo in list(self.alteracoes.values())[:self.LIMITE_LINHAS_RESUMO]:
+            linhas.append(f"- {self.VERBOS[operacao]}: {titulo}")
+        if len(self.alteracoes) > self.LIMITE_LINHAS_RESUMO:
+            linhas.append(f"- ... e mais {len(self.alteracoes) - self.LIMITE_LINHAS_RESUMO}")
+        return "\n".join(linhas)
+
+    def salvar(self):
+        """Grava o jornal.json de uma vez só, roda os geradores e retorna (mensagem de commit, arquivos alterados).
+
+        As alterações só deixam de ficar pendentes depois que os geradores
+        terminam: se a gravação ou algum gerador falhar, elas continuam em
+        self.alteracoes e o próximo salvamento grava tudo de novo.
+        """
+        salvamento = self.preparar_salvamento()
+        arquivos = self.gravar(salvamento)
+        self.concluir_salvamento(salvamento)
+        return salvamento["mensagem"], arquivos
+
+    # O salvamento em três partes permite gravar fora da thread da interface:
+    # preparar_salvamento e concluir_salvamento rodam nela, gravar em outra thread
+
+    def preparar_salvamento(self):
+        """Tira o retrato do que vai ser salvo: mensagem de commit, dados, alterações e imagens."""
+        return {
+            "mensagem": self.resumo(),
+            "dados": {**self.dados, **self.repositorio.para_dict()},
+            "alteracoes": dict(self.alteracoes),
+            "arquivos_imagens": set(self.arquivos_imagens),
+        }
+
+    def gravar(self, salvamento):
+        """Grava o jornal.json do retrato, roda os geradores e retorna a lista de arquivos alterados.
+
+        Não mexe no repositório nem nas alterações pendentes, então pode rodar em
+        outra thread enquanto a interface continua editando.
+        """
+        dados = salvamento["dados"]
+        if self.diario is not None:
+            # Grava o retrato e deixa no diário só o que mudou depois dele
+            self.diario.compactar(dados)
+        else:
+            escrever_json_atomico(self.caminho_arquivo, dados)
+
+        arquivos = [self.caminho_arquivo, *sorted(salvamento["arquivos_imagens"])]
+        for gerador in self.geradores:
+            with medir("gerar_arquivos_site", gerador=getattr(gerador, "__name__", repr(gerador))):
+                arquivos.extend(gerador(dados))
+        return arquivos
+
+    def concluir_salvamento(self, salvamento):
+        """Dá por salvo o retrato gravado: continuam pendentes só as notícias alteradas depois dele."""
+        salvas = salvamento["alteracoes"]
+        # Cada alteração gera uma tupla nova: a mesma tupla quer dizer que a notícia não mudou desde o retrato
+        mudadas = [id_noticia for id_noticia in [*self.alteracoes, *salvas.keys() - self.alteracoes.keys()]
+                   if self.alteracoes.get(id_noticia) is not salvas.get(id_noticia)]
+
+        pendentes = {}
+        if mudadas:
+            noticias_salvas, destaques_salvos = retrato(salvamento["dados"])
+            for id_noticia in mudadas:
+                salva, atual = noticias_salvas.get(id_noticia), self.repositorio.obter(id_noticia)
+                if salva == atual and (id_noticia in destaques_salvos) == self.repositorio.eh_destaque(id_noticia):
+                    continue
+                operacao = "adicionada" if salva is None else "excluida" if atual is None else "editada"
+                pendentes[id_noticia] = (operacao, (atual or salva).get("titulo", ""))
+
+        self.alteracoes = pendentes
+        self.arquivos_imagens -= salvamento["arquivos_imagens"]
+        self.dados.update(salvamento["dados"])
+
+    def _registrar(self, operacao):
+        if self.diario is None or self._reproduzindo:
+            return
+        self.diario.registrar(operacao)
+        self.diario.agendar_compactacao()
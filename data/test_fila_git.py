@@ -0,0 +1,83 @@
+"""Testes da FilaGit: todo trabalho agendado termina com um evento final que diz o que aconteceu.
+
+    python -m unittest test_fila_git
+"""
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import unittest
+
+from fila_git import FilaGit, importar_git
+
+FINAIS = ("concluido", "erro", "cancelado")
+ESPERA = 10 # s
+
+
+class TesteCancelamento(unittest.TestCase):
+
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp(prefix="fila-git-")
+        repo = importar_git().Repo.init(self.pasta)
+        with repo.config_writer() as configuracao:
+            configuracao.set_value("user", "name", "Teste")
+            configuracao.set_value("user", "email", "teste@example.com")
+        self.fila = FilaGit(self.pasta)
+
+    def tearDown(self):
+        self.fila.encerrar()
+        shutil.rmtree(self.pasta, ignore_errors=True)
+
+    def eventos_finais(self, trabalhos):
+        """Lê a fila de eventos até cada trabalho ter o seu evento final; retorna {trabalho: (evento, dados)}."""
+        finais = {}
+        while len(finais) < len(trabalhos):
+            try:
+                trabalho, evento, dados = self.fila.eventos.get(timeout=ESPERA)
+            except queue.Empty:
+                self.fail(f"Sem evento final para: {[t.descricao for t in trabalhos if t not in finais]}")
+            if evento in FINAIS:
+                self.assertNotIn(trabalho, finais, "mais de um evento final para o mesmo trabalho")
+                finais[trabalho] = (evento, dados)
+        return finais
+
+    def commit_bloqueado(self, nome):
+        """Agenda um commit cujo 'preparar' só grava o arquivo depois de liberado."""
+        comecou, liberar = threading.Event(), threading.Event()
+
+        def preparar():
+            comecou.set()
+            liberar.wait(ESPERA)
+            caminho = os.path.join(self.pasta, nome)
+            with open(caminho, "w", encoding="utf-8") as f:
+                f.write(nome)
+            return [caminho]
+
+        return self.fila.commit([], f"Adiciona {nome}", preparar=preparar), comecou, liberar
+
+    def test_trabalho_na_fila_cancelado_emite_evento(self):
+        primeiro, comecou, liberar = self.commit_bloqueado("a.txt")
+        segundo = self.fila.commit([], "Segundo commit")
+        self.assertTrue(comecou.wait(ESPERA))
+
+        self.fila.cancelar_todos()
+        liberar.set()
+
+        finais = self.eventos_finais([primeiro, segundo])
+        self.assertEqual(finais[segundo], ("cancelado", None))
+
+    def test_commit_em_andamento_nao_e_cancelado(self):
+        trabalho, comecou, liberar = self.commit_bloqueado("b.txt")
+        self.assertTrue(comecou.wait(ESPERA))
+
+        self.fila.cancelar_todos()
+        liberar.set()
+
+        evento, hexsha = self.eventos_finais([trabalho])[trabalho]
+        self.assertEqual(evento, "concluido")
+        self.assertEqual(importar_git().Repo(self.pasta).head.commit.hexsha, hexsha)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,461 @@
+"""Validação dos JSON de data/ antes de cada commit (e pela linha de comando).
+
+Cada arquivo de dados tem um esquema em ESQUEMAS, escrito como os formatos de
+pacotes_paginas.py e compilado uma única vez em uma função de verificação:
+  - str, int, bool: o tipo do valor;
+  - DATA: texto AAAA-MM-DD de um dia que existe; IMAGEM: caminho de imagem, conferido em images/;
+  - Opcional(esquema): o campo pode faltar ou ser null;
+  - Um(esquema, ...): o valor segue um dos esquemas;
+  - {"campo": esquema}: os campos listados (outros campos são aceitos);
+  - {"*": esquema}: todas as chaves (anos, meses, seções...);
+  - [esquema]: cada item da lista;
+  - Regra(esquema, funcao): além do esquema, uma verificação que cruza campos
+    (destaques que existem, respostaCorreta entre as opções...).
+
+Cada arquivo é lido uma vez e descartado, guardando só os problemas e as
+imagens citadas. O cache (data/.cache/validacao.json) guarda isso junto com o
+mtime, o tamanho e o hash do conteúdo: arquivos que não mudaram nem são lidos,
+e só a existência das imagens citadas é conferida de novo.
+
+Ficam de fora as cópias com hash do build (data/*.<hash>.json), os pacotes
+pacote-*.json e as pastas geradas (agenda/, quiz/, caca-palavras/, jornal/).
+Imagens que faltam são avisos (o site mostra uma imagem padrão no lugar); o
+resto são erros.
+
+    python validacao_dados.py
+"""
+import argparse
+import datetime
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import sys
+
+from arquivos import escrever_json_atomico
+from construcao_site import PADRAO_COM_HASH
+from desempenho import medir
+
+PASTA_DADOS = os.path.dirname(os.path.abspath(__file__))
+PASTA_RAIZ = os.path.dirname(PASTA_DADOS)
+ARQUIVO_CACHE = os.path.join(PASTA_DADOS, ".cache", "validacao.json")
+
+# Mude ao alterar os esquemas ou as regras, para que todos os arquivos sejam validados de novo
+VERSAO_ESQUEMAS = "2"
+
+# Gerados a partir dos outros: são conferidos na origem
+IGNORADOS = ("pacote-*.json",)
+
+ERRO = "erro"
+AVISO = "aviso"
+
+PADRAO_DATA = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+PADRAO_SUBIDAS = re.compile(r"^(?:\.\./|\./)+")
+EXTERNOS = ("http://", "https://", "//", "data:")
+
+
+# --- Linguagem dos esquemas ---
+
+DATA = object()
+IMAGEM = object()
+
+
+class Opcional:
+    def __init__(self, esquema):
+        self.esquema = esquema
+
+
+class Um:
+    def __init__(self, *esquemas):
+        self.esquemas = esquemas
+
+
+class Regra:
+    def __init__(self, esquema, funcao):
+        self.esquema = esquema
+        self.funcao = funcao
+
+
+NOMES_TIPOS = {str: "um texto", int: "um número inteiro", bool: "true ou false", float: "um número"}
+
+
+class Contexto:
+    """Problemas e imagens encontrados em um arquivo.
+
+    Os caminhos dentro do JSON andam como tuplas (pai, chave) e só viram texto
+    ("noticias[3].data") quando há algo a registrar.
+    """
+
+    def __init__(self):
+        self.problemas = []
+        self.imagens = {} # url -> primeiro caminho em que aparece
+
+    def problema(self, caminho, mensagem):
+        self.problemas.append((ERRO, formatar_caminho(caminho), mensagem))
+
+    def imagem(self, caminho, url):
+        if url and not url.startswith(EXTERNOS) and url not in self.imagens:
+            self.imagens[url] = formatar_caminho(caminho)
+
+
+def formatar_caminho(caminho):
+    partes = []
+    while caminho is not None:
+        caminho, chave = caminho
+        partes.append(f"[{chave}]" if isinstance(chave, int) else f".{chave}")
+    return "".join(reversed(partes)).lstrip(".")
+
+
+def compilar(esquema):
+    """Transforma o esquema em uma função verificar(valor, caminho, contexto)."""
+    if isinstance(esquema, Regra):
+        verificar_estrutura = compilar(esquema.esquema)
+        funcao = esquema.funcao
+
+        def verificar_regra(valor, caminho, contexto):
+            verificar_estrutura(valor, caminho, contexto)
+            try:
+                funcao(valor, caminho, contexto)
+            except (KeyError, TypeError, AttributeError):
+                pass # Estrutura errada em algum ponto: o esquema já apontou onde
+        return verificar_regra
+
+    if isinstance(esquema, Opcional):
+        verificar_valor = compilar(esquema.esquema)
+
+        def verificar_opcional(valor, caminho, contexto):
+            if valor is not None:
+                verificar_valor(valor, caminho, contexto)
+        return verificar_opcional
+
+    if isinstance(esquema, Um):
+        alternativas = [compilar(alternativa) for alternativa in esquema.esquemas]
+
+        def verificar_um(valor, caminho, contexto):
+            for verificar in alternativas:
+                tentativa = Contexto()
+                verificar(valor, caminho, tentativa)
+                if not tentativa.problemas:
+                    for url, onde in tentativa.imagens.items():
+                        contexto.imagens.setdefault(url, onde)
+                    return
+            contexto.problema(caminho, "formato não reconhecido")
+        return verificar_um
+
+    if esquema is DATA:
+        def verificar_data(valor, caminho, contexto):
+            if not isinstance(valor, str) or not PADRAO_DATA.match(valor):
+                contexto.problema(caminho, f"deveria ser uma data AAAA-MM-DD (está {valor!r})")
+                return
+            try:
+                datetime.date.fromisoformat(valor)
+            except ValueError:
+                # No site, new Date() daria "Invalid Date" e os filtros e cartões mostrariam "NaN"
+                contexto.problema(caminho, f"data inexistente: {valor} (mês ou dia fora do calendário)")
+        return verificar_data
+
+    if esquema is IMAGEM:
+        def verificar_imagem(valor, caminho, contexto):
+            if not isinstance(valor, str):
+                contexto.problema(caminho, "deveria ser o caminho de uma imagem")
+            else:
+                contexto.imagem(caminho, valor)
+        return verificar_imagem
+
+    if isinstance(esquema, type):
+        nome = NOMES_TIPOS[esquema]
+        # bool é subclasse de int no Python, mas true não é um número no JSON
+        aceita_bool = esquema is bool
+
+        def verificar_tipo(valor, caminho, contexto):
+            if not isinstance(valor, esquema) or (isinstance(valor, bool) and not aceita_bool):
+                contexto.problema(caminho, f"deveria ser {nome}")
+        return verificar_tipo
+
+    if isinstance(esquema, list):
+        verificar_item = compilar(esquema[0])
+
+        def verificar_lista(valor, caminho, contexto):
+            if not isinstance(valor, list):
+                contexto.problema(caminho, "deveria ser uma lista")
+                return
+            for indice, item in enumerate(valor):
+                verificar_item(item, (caminho, indice), contexto)
+        return verificar_lista
+
+    if "*" in esquema:
+        verificar_cada = compilar(esquema["*"])
+
+        def verificar_mapa(valor, caminho, contexto):
+            if not isinstance(valor, dict):
+                contexto.problema(caminho, "deveria ser um objeto")
+                return
+            for chave, item in valor.items():
+                verificar_cada(item, (caminho, chave), contexto)
+        return verificar_mapa
+
+    campos = [
+        (campo, isinstance(sub, Opcional), compilar(sub.esquema if isinstance(sub, Opcional) else sub))
+        for campo, sub in esquema.items()
+    ]
+
+    def verificar_objeto(valor, caminho, contexto):
+        if not isinstance(valor, dict):
+            contexto.problema(caminho, "deveria ser um objeto")
+            return
+        for campo, opcional, verificar in campos:
+            item = valor.get(campo)
+            if item is not None:
+                verificar(item, (caminho, campo), contexto)
+            elif not opcional:
+                contexto.problema((caminho, campo), "campo obrigatório vazio" if campo in valor else "campo obrigatório ausente")
+    return verificar_objeto
+
+
+# --- Regras que cruzam campos ---
+
+def ids_unicos(itens, caminho, contexto):
+    vistos = set()
+    for indice, item in enumerate(itens):
+        id_item = item.get("id") if isinstance(item, dict) else None
+        if id_item is None:
+            continue
+        if id_item in vistos:
+            contexto.problema((caminho, indice), f"ID repetido: {id_item}")
+        vistos.add(id_item)
+
+
+def destaques_existentes(jornal, caminho, contexto):
+    ids = {noticia.get("id") for noticia in jornal["noticias"] if isinstance(noticia, dict)}
+    for indice, id_noticia in enumerate(jornal["destaques"]):
+        if id_noticia not in ids:
+            contexto.problema(((caminho, "destaques"), indice), f"destaque de uma notícia que não existe: {id_noticia}")
+
+
+def resposta_entre_opcoes(pergunta, caminho, contexto):
+    if isinstance(pergunta["opcoes"], list) and pergunta["respostaCorreta"] not in pergunta["opcoes"]:
+        contexto.problema((caminho, "respostaCorreta"), f"a resposta {pergunta['respostaCorreta']!r} não está entre as opções")
+
+
+def pares_disponiveis(memoria, caminho, contexto):
+    for indice, nivel in enumerate(memoria["niveis"]):
+        if isinstance(nivel.get("pares"), int) and nivel["pares"] > len(memoria["cartas"]):
+            contexto.problema(((caminho, "niveis"), indice), f"o nível pede {nivel['pares']} pares, mas só há {len(memoria['cartas'])} cartas")
+
+
+def fotos_da_secao(secao, caminho, contexto):
+    """As fotos das subgalerias são nomes relativos à 'pasta' da seção (ver galeria.py)."""
+    for indice_sub, subgaleria in enumerate(secao["subgalerias"]):
+        for indice, foto in enumerate(subgaleria["fotos"]):
+            nome = foto if isinstance(foto, str) else foto.get("arquivo")
+            if not isinstance(nome, str):
+                continue
+            url = nome if nome.startswith(EXTERNOS) else secao["pasta"] + nome
+            contexto.imagem(((((caminho, "subgalerias"), indice_sub), "fotos"), indice), url)
+
+
+# --- Esquemas ---
+
+PERGUNTA = Regra({"pergunta": str, "opcoes": [str], "respostaCorreta": str, "curiosidade": Opcional(str)}, resposta_entre_opcoes)
+TEMAS_QUIZ = Regra([{"id": str, "nome": str, "perguntas": [PERGUNTA]}], ids_unicos)
+
+NOTICIA = {
+    "id": str, "data": DATA, "titulo": str, "subtitulo": Opcional(str),
+    "foto_principal": Opcional(IMAGEM), "foto_secundaria": Opcional(IMAGEM),
+    "conteudo": Opcional(str), "conteudo_adicional": Opcional(str),
+}
+
+EVENTO = {
+    "id": str, "titulo": str, "data": Um(DATA, [DATA]), "horario": Opcional(str), "local": Opcional(str),
+    "descricao": Opcional(str), "organizador": Opcional(str), "videos": Opcional([str]), "fotos": Opcional([IMAGEM]),
+}
+
+FOTO_GALERIA = {
+    "arquivo": str, "largura": Opcional(int), "altura": Opcional(int),
+    "miniatura": Opcional(IMAGEM), "miniatura_webp": Opcional(IMAGEM), "placeholder": Opcional(str),
+}
+
+PESSOA = {"nome": str, "funcao": Opcional(str), "foto": Opcional(IMAGEM)}
+
+GRUPO = {
+    "id": str, "nome": str, "descricao_curta": Opcional(str), "icone": Opcional(str),
+    "historia": Opcional([{"ano": int, "titulo": str, "descricao": Opcional(str)}]),
+    "horarios": Opcional([{"titulo": str, "dia": str, "hora": str}]),
+    "coordenadores": Opcional([PESSOA]),
+    "membros": Opcional([PESSOA]),
+    "eventos": Opcional([{"titulo": str, "data": str, "descricao": Opcional(str)}]),
+    "galeria_fotos": Opcional({"titulo": Opcional(str), "fotos": [{"url": IMAGEM, "legenda": Opcional(str)}]}),
+    "redes_sociais": Opcional({"titulo": Opcional(str), "links": [{"nome": str, "url": str, "icone": Opcional(str)}]}),
+    "lista_necessidades": Opcional({"titulo": Opcional(str), "itens": [str]}),
+}
+
+# arquivo -> esquema (arquivos sem esquema só precisam ser JSON válido)
+ESQUEMAS = {
+    "jornal.json": Regra({"destaques": [str], "noticias": Regra([NOTICIA], ids_unicos)}, destaques_existentes),
+    "eventos.json": {"titulo": Opcional(str), "anos": {"*": {"*": [EVENTO]}}},
+    "missas-festivas.json": {"missas_festivas": Regra([{
+        "id": str, "titulo": str, "data": DATA, "horario": Opcional(str), "descricao": Opcional(str),
+    }], ids_unicos)},
+    "missas.json": {
+        "titulo": Opcional(str),
+        "horarios_regulares": {"*": {"horarios": [str], "destaque": Opcional(bool), "observacao": Opcional(str)}},
+        "eventos_especiais": Opcional([{"nome": str, "descricao": Opcional(str), "imagem": Opcional(IMAGEM)}]),
+    },
+    "historia.json": {"titulo": Opcional(str), "introducao": Opcional(str), "timeline": [{
+        "ano": int, "titulo": str, "descricao": str, "imagem": Opcional(IMAGEM), "destaque": Opcional(bool),
+    }]},
+    "informacoes.json": {"informacoes": [{"titulo": str, "subtitulo": Opcional(str), "texto": str}]},
+    "fotos.json": {"titulo": Opcional(str), "secoes": {"*": Regra({
+        "nome": str, "descricao": Opcional(str), "pasta": str, "total_fotos": Opcional(int),
+        "thumbnail": Opcional(IMAGEM), "capa": Opcional(FOTO_GALERIA),
+        "subgalerias": [{"nome": str, "fotos": [Um(str, FOTO_GALERIA)]}],
+    }, fotos_da_secao)}},
+    "capelas-pastorais.json": {"capelas": Regra([GRUPO], ids_unicos), "pastorais": Regra([GRUPO], ids_unicos)},
+    "quiz_paroquia.json": {"titulo": Opcional(str), "perguntas": [PERGUNTA]},
+    "quiz_diario.json": {"titulo": Opcional(str), "temas": TEMAS_QUIZ},
+    "quiz_santos.json": {"titulo": Opcional(str), "santos": TEMAS_QUIZ},
+    "citacoes.json": {"titulo": Opcional(str), "citacoes": [Regra({
+        "frase": str, "opcoes": [str], "respostaCorreta": str, "contexto": Opcional(str),
+    }, resposta_entre_opcoes)]},
+    "memoria.json": Regra({
+        "titulo": Opcional(str),
+        "niveis": [{"id": str, "nome": str, "pares": int, "grid": str}],
+        "cartas": Regra([{"id": str, "nome": str, "imagem": IMAGEM}], ids_unicos),
+    }, pares_disponiveis),
+    "caca-palavras-data.json": {"title": Opcional(str), "description": Opcional(str), "words": [str]},
+}
+
+_compilados = {}
+
+
+def verificador(nome):
+    """Função de verificação do arquivo, compilada na primeira vez que é pedida (None se não houver esquema)."""
+    if nome not in _compilados:
+        _compilados[nome] = compilar(ESQUEMAS[nome]) if nome in ESQUEMAS else None
+    return _compilados[nome]
+
+
+# --- Validação ---
+
+def arquivos_de_dados(pasta_dados=PASTA_DADOS):
+    """Nomes dos JSON de dados da pasta (sem os gerados)."""
+    return sorted(
+        nome for nome in os.listdir(pasta_dados)
+        if nome.endswith(".json") and not PADRAO_COM_HASH.search(nome)
+        and not any(fnmatch.fnmatch(nome, ignorado) for ignorado in IGNORADOS)
+        and os.path.isfile(os.path.join(pasta_dados, nome))
+    )
+
+
+def caminho_imagem(url):
+    """Caminho da imagem a partir da raiz do site ("../images/x.jpg" -> "images/x.jpg")."""
+    url = url.split("?", 1)[0].split("#", 1)[0]
+    if "images/" in url:
+        return "images/" + url.split("images/", 1)[1]
+    return PADRAO_SUBIDAS.sub("", url)
+
+
+def validar_valor(nome, dados):
+    """Valida os dados já lidos de um arquivo; retorna {"problemas": [...], "imagens": [[caminho, url]...]}."""
+    contexto = Contexto()
+    verificar = verificador(nome)
+    if verificar is not None:
+        verificar(dados, None, contexto)
+    return {"problemas": contexto.problemas, "imagens": [[onde, url] for url, onde in contexto.imagens.items()]}
+
+
+def validar_conteudo(nome, conteudo):
+    try:
+        dados = json.loads(conteudo.decode("utf-8"))
+    except (UnicodeDecodeError, ValueError) as e:
+        return {"problemas": [(ERRO, "", f"JSON inválido: {e}")], "imagens": []}
+    return validar_valor(nome, dados)
+
+
+def _ler_cache(arquivo_cache):
+    try:
+        with open(arquivo_cache, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return cache.get("arquivos", {}) if cache.get("versao") == VERSAO_ESQUEMAS else {}
+
+
+def validar_dados(pasta_dados=PASTA_DADOS, substitutos=None, arquivo_cache=ARQUIVO_CACHE):
+    """Valida todos os JSON de dados e as imagens que eles citam.
+
+    'substitutos' ({nome do arquivo: dados}) valida os dados informados no lugar
+    do arquivo, como o jornal em memória antes de ser gravado. Retorna a lista de
+    problemas (nível, arquivo, caminho no JSON, mensagem), com os erros primeiro.
+    """
+    substitutos = substitutos or {}
+    anteriores = _ler_cache(arquivo_cache) if arquivo_cache else {}
+    atuais = {}
+    problemas = []
+    imagens_existentes = {}
+
+    with medir("validar_dados"):
+        for nome in sorted(set(arquivos_de_dados(pasta_dados)) | set(substitutos)):
+            resultado = anteriores.get(nome)
+            if nome in substitutos:
+                # O arquivo em disco pode estar desatualizado: o que ele tinha no cache continua valendo para ele
+                if resultado is not None:
+                    atuais[nome] = resultado
+                resultado = validar_valor(nome, substitutos[nome])
+            else:
+                caminho = os.path.join(pasta_dados, nome)
+                try:
+                    estado = os.stat(caminho)
+                    if resultado is None or (resultado["mtime_ns"], resultado["tamanho"]) != (estado.st_mtime_ns, estado.st_size):
+                        with open(caminho, "rb") as f:
+                            conteudo = f.read()
+                        hash_conteudo = hashlib.sha256(conteudo).hexdigest()
+                        if resultado is None or resultado["hash"] != hash_conteudo:
+                            resultado = validar_conteudo(nome, conteudo)
+                        resultado = {**resultado, "mtime_ns": estado.st_mtime_ns, "tamanho": estado.st_size, "hash": hash_conteudo}
+                except OSError:
+                    continue # Apagado durante a validação
+                atuais[nome] = resultado
+
+            problemas.extend((nivel, nome, onde, mensagem) for nivel, onde, mensagem in resultado["problemas"])
+            # As imagens são conferidas sempre (podem sumir sem o JSON mudar)
+            for onde, url in resultado["imagens"]:
+                relativo = caminho_imagem(url)
+                if relativo not in imagens_existentes:
+                    imagens_existentes[relativo] = os.path.isfile(os.path.join(PASTA_RAIZ, *relativo.split("/")))
+                if not imagens_existentes[relativo]:
+                    problemas.append((AVISO, nome, onde, f"imagem não encontrada: {url}"))
+
+    if arquivo_cache and atuais != anteriores:
+        escrever_json_atomico(arquivo_cache, {"versao": VERSAO_ESQUEMAS, "arquivos": atuais}, indent=None)
+
+    # Ordenação estável: os erros vêm antes, cada nível na ordem dos arquivos
+    return sorted(problemas, key=lambda problema: problema[0] != ERRO)
+
+
+def so_erros(problemas):
+    return [problema for problema in problemas if problema[0] == ERRO]
+
+
+def formatar_problema(problema):
+    _nivel, arquivo, onde, mensagem = problema
+    return f"{arquivo} {onde}: {mensagem}" if onde else f"{arquivo}: {mensagem}"
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Valida os JSON de data/ e as imagens que eles citam.")
+    parser.add_argument("--sem-cache", action="store_true", help="Valida todos os arquivos de novo, sem usar nem gravar o cache.")
+    parser.add_argument("--sem-avisos", action="store_true", help="Mostra só os erros (sem as imagens não encontradas).")
+    argumentos = parser.parse_args(argumentos)
+
+    problemas = validar_dados(arquivo_cache=None if argumentos.sem_cache else ARQUIVO_CACHE)
+    erros = so_erros(problemas)
+    for problema in erros if argumentos.sem_avisos else problemas:
+        print(f"{problema[0].upper()}: {formatar_problema(problema)}")
+    print(f"{len(erros)} erro(s), {len(problemas) - len(erros)} aviso(s).")
+    return 1 if erros else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
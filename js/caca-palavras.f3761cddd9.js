@@ -0,0 +1,540 @@
+// js/caca-palavras.js
+
+// Definições dos níveis de dificuldade
+const DIFFICULTIES = {
+    easy: { size: 10, wordCount: 5, cellSize: '30px', mobileSize: '24px' },
+    medium: { size: 15, wordCount: 10, cellSize: '28px', mobileSize: '20px' },
+    hard: { size: 20, wordCount: 15, cellSize: '24px', mobileSize: '16px' }
+};
+
+const GRID_ELEMENT = document.getElementById('word-search-grid');
+const WORD_LIST_ELEMENT = document.getElementById('word-list');
+const MESSAGE_ELEMENT = document.getElementById('message');
+const RESTART_BUTTON = document.getElementById('restart-button');
+const DIFFICULTY_BUTTONS = document.querySelectorAll('.difficulty-selector button');
+
+let gameData = null;
+let currentDifficulty = DIFFICULTIES.medium; // Padrão: Médio
+let currentGridSize = currentDifficulty.size;
+let grid = [];
+let wordsToFind = [];
+let foundWords = new Set();
+let isSelecting = false;
+let startCell = null;
+let endCell = null;
+let selectedCells = [];
+
+// Jogos gerados com antecedência por data/gerador_caca_palavras.py
+const PASTA_JOGOS = '../../data/caca-palavras/';
+let manifestoJogos = null;
+let partidaAtual = 0;
+
+// --- Funções de Utilitário ---
+
+/**
+ * Embaralha um array (Fisher-Yates).
+ * @param {Array} array - O array a ser embaralhado.
+ * @returns {Array} O array embaralhado.
+ */
+function shuffleArray(array) {
+    for (let i = array.length - 1; i > 0; i--) {
+        const j = Math.floor(Math.random() * (i + 1));
+        [array[i], array[j]] = [array[j], array[i]];
+    }
+    return array;
+}
+
+/**
+ * Seleciona palavras aleatoriamente do pool de palavras.
+ * @param {Array<string>} pool - O pool de palavras disponíveis.
+ * @param {number} count - O número de palavras a selecionar.
+ * @returns {Array<string>} As palavras selecionadas.
+ */
+function selectRandomWords(pool, count) {
+    const shuffled = shuffleArray([...pool]);
+    return shuffled.slice(0, count);
+}
+
+// --- Funções de Geração do Grid ---
+
+function createEmptyGrid(size) {
+    const newGrid = [];
+    for (let i = 0; i < size; i++) {
+        newGrid[i] = new Array(size).fill('');
+    }
+    return newGrid;
+}
+
+/**
+ * Tenta encontrar um local válido para colocar uma palavra no grid.
+ * @param {Array<Array<string>>} currentGrid - O grid atual.
+ * @param {string} word - A palavra a ser colocada.
+ * @returns {{start: {r: number, c: number}, direction: {dr: number, dc: number}} | null}
+ *          Retorna o ponto inicial e a direção se for possível, ou null.
+ */
+function findPlacement(currentGrid, word) {
+    const size = currentGrid.length;
+    const directions = [
+        { dr: 0, dc: 1 },   // Horizontal (direita)
+        { dr: 1, dc: 0 },   // Vertical (baixo)
+        { dr: 1, dc: 1 },   // Diagonal (baixo-direita)
+        { dr: 1, dc: -1 },  // Diagonal (baixo-esquerda)
+        { dr: 0, dc: -1 },  // Horizontal (esquerda)
+        { dr: -1, dc: 0 },  // Vertical (cima)
+        { dr: -1, dc: -1 }, // Diagonal (cima-esquerda)
+        { dr: -1, dc: 1 }   // Diagonal (cima-direita)
+    ];
+
+    const allPossibleStarts = [];
+    for (let r = 0; r < size; r++) {
+        for (let c = 0; c < size; c++) {
+            allPossibleStarts.push({ r, c });
+        }
+    }
+    shuffleArray(allPossibleStarts);
+    shuffleArray(directions);
+
+    for (const start of allPossibleStarts) {
+        for (const direction of directions) {
+            let canPlace = true;
+            for (let k = 0; k < word.length; k++) {
+                const r = start.r + k * direction.dr;
+                const c = start.c + k * direction.dc;
+
+                if (r < 0 || r >= size || c < 0 || c >= size) {
+                    canPlace = false;
+                    break;
+                }
+
+                const currentCell = currentGrid[r][c];
+                if (currentCell !== '' && currentCell !== word[k]) {
+                    canPlace = false;
+                    break;
+                }
+            }
+
+            if (canPlace) {
+                return { start, direction };
+            }
+        }
+    }
+
+    return null;
+}
+
+function placeWord(currentGrid, word, start, direction) {
+    for (let k = 0; k < word.length; k++) {
+        const r = start.r + k * direction.dr;
+        const c = start.c + k * direction.dc;
+        currentGrid[r][c] = word[k];
+    }
+}
+
+function fillEmptyCells(currentGrid) {
+    const alphabet = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ';
+    const size = currentGrid.length;
+    for (let r = 0; r < size; r++) {
+        for (let c = 0; c < size; c++) {
+            if (currentGrid[r][c] === '') {
+                currentGrid[r][c] = alphabet.charAt(Math.floor(Math.random() * alphabet.length));
+            }
+        }
+    }
+}
+
+function generateWordSearch(words) {
+    let newGrid = createEmptyGrid(currentGridSize);
+
+    const sortedWords = words.map(w => w.toUpperCase()).sort((a, b) => b.length - a.length);
+
+    sortedWords.forEach(word => {
+        const placement = findPlacement(newGrid, word);
+        if (placement) {
+            placeWord(newGrid, word, placement.start, placement.direction);
+        } else {
+            console.warn(`Não foi possível colocar a palavra: ${word}`);
+        }
+    });
+
+    fillEmptyCells(newGrid);
+
+    return newGrid;
+}
+
+/**
+ * Sorteia um dos jogos prontos da dificuldade.
+ * @param {string} difficultyKey - 'easy', 'medium' ou 'hard'.
+ * @returns {Promise<{grid: Array<Array<string>>, words: Array<string>}>}
+ */
+async function carregarJogoPronto(difficultyKey) {
+    if (!manifestoJogos) {
+        manifestoJogos = buscarJSON(PASTA_JOGOS + 'manifesto.json');
+    }
+    const manifesto = await manifestoJogos;
+    const info = manifesto.dificuldades[difficultyKey];
+    if (!info || info.tamanho !== DIFFICULTIES[difficultyKey].size || !info.arquivos) {
+        throw new Error(`Sem jogos prontos para '${difficultyKey}'.`);
+    }
+
+    const numero = String(1 + Math.floor(Math.random() * info.arquivos)).padStart(3, '0');
+    const bloco = await buscarJSON(`${PASTA_JOGOS}${difficultyKey}/${numero}.json`);
+    const [letras, colocacoes] = bloco[Math.floor(Math.random() * bloco.length)];
+
+    const novoGrid = [];
+    for (let r = 0; r < info.tamanho; r++) {
+        novoGrid.push(letras.slice(r * info.tamanho, (r + 1) * info.tamanho).split(''));
+    }
+    return { grid: novoGrid, words: shuffleArray(colocacoes.map(([indice]) => manifesto.palavras[indice])) };
+}
+
+async function buscarJSON(caminho) {
+    const response = await fetch(caminho);
+    if (!response.ok) throw new Error(`HTTP ${response.status} ao carregar ${caminho}`);
+    return response.json();
+}
+
+// --- Funções de Renderização e Interação ---
+
+function renderGrid() {
+    GRID_ELEMENT.innerHTML = '';
+    
+    // Ajusta as variáveis CSS para o tamanho do grid
+    GRID_ELEMENT.style.setProperty('--grid-cols', currentGridSize);
+    GRID_ELEMENT.style.setProperty('--cell-size', currentDifficulty.cellSize);
+    
+    // Ajusta o tamanho da célula para mobile (se necessário)
+    GRID_ELEMENT.style.setProperty('--cell-size-mobile', currentDifficulty.mobileSize);
+
+    grid.forEach((row, r) => {
+        row.forEach((cell, c) => {
+            const cellDiv = document.createElement('div');
+            cellDiv.classList.add('grid-cell');
+            cellDiv.textContent = cell;
+            cellDiv.dataset.row = r;
+            cellDiv.dataset.col = c;
+            
+            // Eventos de Mouse
+            cellDiv.addEventListener('mousedown', handleMouseDown);
+            cellDiv.addEventListener('mouseover', handleMouseOver);
+            cellDiv.addEventListener('mouseup', handleMouseUp);
+            
+            // Eventos de Toque para Mobile
+            cellDiv.addEventListener('touchstart', handleTouchStart, { passive: false });
+            cellDiv.addEventListener('touchmove', handleTouchMove, { passive: false });
+            cellDiv.addEventListener('touchend', handleTouchEnd, { passive: false });
+            
+            GRID_ELEMENT.appendChild(cellDiv);
+        });
+    });
+}
+
+function renderWordList() {
+    WORD_LIST_ELEMENT.innerHTML = '';
+    wordsToFind.forEach(word => {
+        const listItem = document.createElement('li');
+        listItem.textContent = word;
+        listItem.dataset.word = word.toUpperCase();
+        if (foundWords.has(word.toUpperCase())) {
+            listItem.classList.add('found');
+        }
+        WORD_LIST_ELEMENT.appendChild(listItem);
+    });
+}
+
+function markCellsAsFound(cells) {
+    cells.forEach(cell => {
+        const cellElement = GRID_ELEMENT.querySelector(`[data-row="${cell.r}"][data-col="${cell.c}"]`);
+        if (cellElement) {
+            cellElement.classList.add('found');
+        }
+    });
+}
+
+/**
+ * Obtém as células entre o ponto inicial e final.
+ * @param {{r: number, c: number}} start - Célula inicial.
+ * @param {{r: number, c: number}} end - Célula final.
+ * @returns {Array<{r: number, c: number}>} Lista de células selecionadas.
+ */
+function getCellsBetween(start, end) {
+    const cells = [];
+    const dr = Math.sign(end.r - start.r);
+    const dc = Math.sign(end.c - start.c);
+
+    if (dr !== 0 && dc !== 0 && Math.abs(end.r - start.r) !== Math.abs(end.c - start.c)) {
+        return [];
+    }
+    if (dr === 0 && dc === 0) {
+        return [{ r: start.r, c: start.c }];
+    }
+
+    let r = start.r;
+    let c = start.c;
+
+    while (true) {
+        cells.push({ r, c });
+        if (r === end.r && c === end.c) break;
+        r += dr;
+        c += dc;
+    }
+
+    return cells;
+}
+
+function updateSelectionVisual(cells) {
+    GRID_ELEMENT.querySelectorAll('.grid-cell.selected').forEach(cellElement => {
+        cellElement.classList.remove('selected');
+    });
+
+    selectedCells = cells;
+
+    selectedCells.forEach(cell => {
+        const cellElement = GRID_ELEMENT.querySelector(`[data-row="${cell.r}"][data-col="${cell.c}"]`);
+        if (cellElement) {
+            cellElement.classList.add('selected');
+        }
+    });
+}
+
+function checkSelection(cells) {
+    if (cells.length === 0) return;
+
+    const selectedWord = cells.map(cell => grid[cell.r][cell.c]).join('');
+    const reversedWord = selectedWord.split('').reverse().join('');
+
+    const wordFound = wordsToFind.find(word => {
+        const upperWord = word.toUpperCase();
+        return upperWord === selectedWord || upperWord === reversedWord;
+    });
+
+    if (wordFound && !foundWords.has(wordFound.toUpperCase())) {
+        foundWords.add(wordFound.toUpperCase());
+        markCellsAsFound(cells);
+        renderWordList();
+        MESSAGE_ELEMENT.textContent = `Palavra encontrada: ${wordFound}!`;
+
+        if (foundWords.size === wordsToFind.length) {
+            MESSAGE_ELEMENT.textContent = 'Parabéns! Você encontrou todas as palavras!';
+            RESTART_BUTTON.style.display = 'block';
+        }
+    } else if (wordFound && foundWords.has(wordFound.toUpperCase())) {
+        MESSAGE_ELEMENT.textContent = `Você já encontrou a palavra ${wordFound}!`;
+    } else {
+        MESSAGE_ELEMENT.textContent = 'Tente novamente!';
+    }
+
+    updateSelectionVisual([]);
+}
+
+// --- Funções Auxiliares de Toque ---
+
+/**
+ * Obtém a célula do grid sob o toque.
+ * @param {TouchEvent} event - O evento de toque.
+ * @returns {HTMLElement | null} A célula do grid ou null.
+ */
+function getTouchCell(event) {
+    // Usa o primeiro toque
+    const touch = event.touches[0] || event.changedTouches[0];
+    // Encontra o elemento na coordenada do toque
+    const target = document.elementFromPoint(touch.clientX, touch.clientY);
+    
+       
+    if (target && target.classList.contains('grid-cell')) {
+      
+        return target;
+    }
+       return null;
+}
+
+// --- Handlers de Eventos de Mouse ---
+
+function handleMouseDown(event) {
+    if (event.button !== 0) return;
+    const cell = event.target;
+    startCell = {
+        r: parseInt(cell.dataset.row),
+        c: parseInt(cell.dataset.col)
+    };
+    isSelecting = true;
+    MESSAGE_ELEMENT.textContent = '';
+    updateSelectionVisual([startCell]);
+}
+
+function handleMouseOver(event) {
+    if (!isSelecting) return;
+    const cell = event.target;
+    const currentCell = {
+        r: parseInt(cell.dataset.row),
+        c: parseInt(cell.dataset.col)
+    };
+
+    if (startCell) {
+        const cells = getCellsBetween(startCell, currentCell);
+        updateSelectionVisual(cells);
+    }
+}
+
+function handleMouseUp(event) {
+    if (!isSelecting) return;
+    isSelecting = false;
+
+    const cell = event.target;
+    endCell = {
+        r: parseInt(cell.dataset.row),
+        c: parseInt(cell.dataset.col)
+    };
+
+    if (startCell && endCell) {
+        const cells = getCellsBetween(startCell, endCell);
+        checkSelection(cells);
+    }
+
+    startCell = null;
+    endCell = null;
+}
+
+// --- Handlers de Eventos de Toque ---
+
+function handleTouchStart(event) {
+    event.preventDefault(); // Previne o scroll e o zoom
+    
+    const cell = getTouchCell(event);
+    if (!cell) return;
+
+    startCell = {
+        r: parseInt(cell.dataset.row),
+        c: parseInt(cell.dataset.col)
+    };
+    isSelecting = true;
+    MESSAGE_ELEMENT.textContent = '';
+    updateSelectionVisual([startCell]);
+   }
+
+function handleTouchMove(event) {
+    if (!isSelecting) return;
+    
+    const cell = getTouchCell(event);
+    if (!cell) return;
+
+    const currentCell = {
+        r: parseInt(cell.dataset.row),
+        c: parseInt(cell.dataset.col)
+    };
+
+    if (startCell) {
+        const cells = getCellsBetween(startCell, currentCell);
+        updateSelectionVisual(cells);
+           }
+}
+
+function handleTouchEnd(event) {
+    if (!isSelecting) return;
+    isSelecting = false;
+    
+
+    const cell = getTouchCell(event);
+    
+    // Se o toque terminar fora do grid, usa a última célula selecionada como endCell
+    if (!cell) {
+        if (selectedCells.length > 0) {
+            const lastCell = selectedCells[selectedCells.length - 1];
+            endCell = { r: lastCell.r, c: lastCell.c };
+                   } else {
+            
+            return;
+        }
+    } else {
+        endCell = {
+            r: parseInt(cell.dataset.row),
+            c: parseInt(cell.dataset.col)
+        };
+        console.log(`[DEBUG] handleTouchEnd: Toque final em (${endCell.r}, ${endCell.c})`);
+    }
+
+    if (startCell && endCell) {
+        
+        const cells = getCellsBetween(startCell, endCell);
+        checkSelection(cells);
+    }
+
+    startCell = null;
+    endCell = null;
+}
+
+// --- Lógica de Nível de Dificuldade ---
+
+function setActiveDifficultyButton(difficulty) {
+    DIFFICULTY_BUTTONS.forEach(button => {
+        button.classList.remove('btn-primary');
+        button.classList.add('btn-secondary');
+        if (button.dataset.difficulty === difficulty) {
+            button.classList.add('btn-primary');
+            button.classList.remove('btn-secondary');
+        }
+    });
+}
+
+async function startGame(difficultyKey) {
+    // Um clique em outra dificuldade durante o carregamento vence o anterior
+    const partida = ++partidaAtual;
+    let novoGrid;
+    let novasPalavras;
+
+    // 1. Sorteia um jogo pronto; sem eles, gera a grade aqui mesmo
+    try {
+        ({ grid: novoGrid, words: novasPalavras } = await carregarJogoPronto(difficultyKey));
+    } catch (error) {
+        console.warn('Jogos prontos indisponíveis, gerando no navegador:', error);
+        if (!gameData) {
+            gameData = await buscarJSON('../../data/caca-palavras-data.65b6855001.json');
+        }
+        currentGridSize = DIFFICULTIES[difficultyKey].size;
+        novasPalavras = selectRandomWords(gameData.words, DIFFICULTIES[difficultyKey].wordCount);
+        novoGrid = generateWordSearch(novasPalavras);
+    }
+    if (partida !== partidaAtual) return;
+
+    currentDifficulty = DIFFICULTIES[difficultyKey];
+    currentGridSize = currentDifficulty.size;
+    wordsToFind = novasPalavras;
+
+    // 2. Limpa o estado e define o botão ativo
+    foundWords.clear();
+    isSelecting = false;
+    startCell = null;
+    endCell = null;
+    selectedCells = [];
+    RESTART_BUTTON.style.display = 'none';
+    MESSAGE_ELEMENT.textContent = 'Clique e arraste para selecionar uma palavra!';
+    setActiveDifficultyButton(difficultyKey);
+
+    // 3. Renderiza o novo grid
+    grid = novoGrid;
+    renderGrid();
+    renderWordList();
+}
+
+// --- Inicialização do Jogo ---
+
+async function initGame() {
+    try {
+        // Adiciona listeners aos botões de dificuldade
+        DIFFICULTY_BUTTONS.forEach(button => {
+            button.addEventListener('click', (e) => {
+                startGame(e.target.dataset.difficulty);
+            });
+        });
+
+        RESTART_BUTTON.addEventListener('click', () => startGame(Object.keys(DIFFICULTIES).find(key => DIFFICULTIES[key] === currentDifficulty)));
+
+        // Inicia o jogo no nível médio por padrão
+        await startGame('medium');
+
+    } catch (error) {
+        console.error('Erro ao carregar ou inicializar o jogo:', error);
+        MESSAGE_ELEMENT.textContent = 'Erro ao carregar o jogo. Verifique o arquivo de dados.';
+    }
+}
+
+document.addEventListener('DOMContentLoaded', initGame);
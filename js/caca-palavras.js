@@ -24,6 +24,11 @@ let startCell = null;
 let endCell = null;
 let selectedCells = [];
 
+// Jogos gerados com antecedência por data/gerador_caca_palavras.py
+const PASTA_JOGOS = '../../data/caca-palavras/';
+let manifestoJogos = null;
+let partidaAtual = 0;
+
 // --- Funções de Utilitário ---
 
 /**
@@ -156,6 +161,38 @@ function generateWordSearch(words) {
     return newGrid;
 }
 
+/**
+ * Sorteia um dos jogos prontos da dificuldade.
+ * @param {string} difficultyKey - 'easy', 'medium' ou 'hard'.
+ * @returns {Promise<{grid: Array<Array<string>>, words: Array<string>}>}
+ */
+async function carregarJogoPronto(difficultyKey) {
+    if (!manifestoJogos) {
+        manifestoJogos = buscarJSON(PASTA_JOGOS + 'manifesto.json');
+    }
+    const manifesto = await manifestoJogos;
+    const info = manifesto.dificuldades[difficultyKey];
+    if (!info || info.tamanho !== DIFFICULTIES[difficultyKey].size || !info.arquivos) {
+        throw new Error(`Sem jogos prontos para '${difficultyKey}'.`);
+    }
+
+    const numero = String(1 + Math.floor(Math.random() * info.arquivos)).padStart(3, '0');
+    const bloco = await buscarJSON(`${PASTA_JOGOS}${difficultyKey}/${numero}.json`);
+    const [letras, colocacoes] = bloco[Math.floor(Math.random() * bloco.length)];
+
+    const novoGrid = [];
+    for (let r = 0; r < info.tamanho; r++) {
+        novoGrid.push(letras.slice(r * info.tamanho, (r + 1) * info.tamanho).split(''));
+    }
+    return { grid: novoGrid, words: shuffleArray(colocacoes.map(([indice]) => manifesto.palavras[indice])) };
+}
+
+async function buscarJSON(caminho) {
+    const response = await fetch(caminho);
+    if (!response.ok) throw new Error(`HTTP ${response.status} ao carregar ${caminho}`);
+    return response.json();
+}
+
 // --- Funções de Renderização e Interação ---
 
 function renderGrid() {
@@ -438,12 +475,29 @@ function setActiveDifficultyButton(difficulty) {
     });
 }
 
-function startGame(difficultyKey) {
+async function startGame(difficultyKey) {
+    // Um clique em outra dificuldade durante o carregamento vence o anterior
+    const partida = ++partidaAtual;
+    let novoGrid;
+    let novasPalavras;
+
+    // 1. Sorteia um jogo pronto; sem eles, gera a grade aqui mesmo
+    try {
+        ({ grid: novoGrid, words: novasPalavras } = await carregarJogoPronto(difficultyKey));
+    } catch (error) {
+        console.warn('Jogos prontos indisponíveis, gerando no navegador:', error);
+        if (!gameData) {
+            gameData = await buscarJSON('../../data/caca-palavras-data.json');
+        }
+        currentGridSize = DIFFICULTIES[difficultyKey].size;
+        novasPalavras = selectRandomWords(gameData.words, DIFFICULTIES[difficultyKey].wordCount);
+        novoGrid = generateWordSearch(novasPalavras);
+    }
+    if (partida !== partidaAtual) return;
+
     currentDifficulty = DIFFICULTIES[difficultyKey];
     currentGridSize = currentDifficulty.size;
-    
-    // 1. Seleciona as palavras
-    wordsToFind = selectRandomWords(gameData.words, currentDifficulty.wordCount);
+    wordsToFind = novasPalavras;
 
     // 2. Limpa o estado e define o botão ativo
     foundWords.clear();
@@ -455,8 +509,8 @@ function startGame(difficultyKey) {
     MESSAGE_ELEMENT.textContent = 'Clique e arraste para selecionar uma palavra!';
     setActiveDifficultyButton(difficultyKey);
 
-    // 3. Gera e renderiza o novo grid
-    grid = generateWordSearch(wordsToFind);
+    // 3. Renderiza o novo grid
+    grid = novoGrid;
     renderGrid();
     renderWordList();
 }
@@ -465,10 +519,6 @@ function startGame(difficultyKey) {
 
 async function initGame() {
     try {
-        // Carrega o arquivo JSON
-        const response = await fetch('../../data/caca-palavras-data.json');
-        gameData = await response.json();
-        
         // Adiciona listeners aos botões de dificuldade
         DIFFICULTY_BUTTONS.forEach(button => {
             button.addEventListener('click', (e) => {
@@ -479,7 +529,7 @@ async function initGame() {
         RESTART_BUTTON.addEventListener('click', () => startGame(Object.keys(DIFFICULTIES).find(key => DIFFICULTIES[key] === currentDifficulty)));
 
         // Inicia o jogo no nível médio por padrão
-        startGame('medium');
+        await startGame('medium');
 
     } catch (error) {
         console.error('Erro ao carregar ou inicializar o jogo:', error);
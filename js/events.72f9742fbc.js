@@ -0,0 +1,589 @@
+// Events system functionality
+
+// Agenda gerada pelo gerenciador (data/agenda_eventos.py): um manifesto com a contagem
+// de eventos de cada mês e um arquivo por mês, buscado só quando o mês é aberto
+const PASTA_AGENDA = 'data/agenda/';
+
+function buscarJSONAgenda(arquivo) {
+    return fetch(PASTA_AGENDA + arquivo).then(response => {
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        return response.json();
+    });
+}
+
+class EventsManager {
+    constructor(containerId) {
+        this.container = document.getElementById(containerId);
+        this.manifesto = null;
+        this.mesesPendentes = {};  // arquivo -> promessa dos eventos do mês
+        this.meses = {};           // arquivo -> eventos do mês já carregados
+        this.versaoRender = 0;
+        this.currentFilters = {
+            year: 'all',
+            month: 'all',
+            search: ''
+        };
+        this.init();
+    }
+    
+    async init() {
+        try {
+            this.manifesto = await buscarJSONAgenda('eventos/manifesto.json');
+            this.render();
+            this.bindEvents();
+        } catch (error) {
+            console.error('Error loading events data:', error);
+        }
+    }
+    
+    async render() {
+        if (!this.container || !this.manifesto) return;
+        
+        // Uma busca pode terminar depois de outra mais recente; só a última desenha
+        const versao = ++this.versaoRender;
+        const filteredData = await this.applyFilters();
+        if (versao !== this.versaoRender) return;
+        const eventsHTML = this.generateEventsHTML(filteredData);
+        
+        this.container.innerHTML = eventsHTML;
+        this.bindAccordionEvents();
+    }
+    
+    carregarMes(arquivo) {
+        if (!this.mesesPendentes[arquivo]) {
+            this.mesesPendentes[arquivo] = buscarJSONAgenda(arquivo).then(data => {
+                this.meses[arquivo] = data.eventos;
+                return data.eventos;
+            });
+        }
+        return this.mesesPendentes[arquivo];
+    }
+    
+    generateEventsHTML(data) {
+        if (!data.anos || Object.keys(data.anos).length === 0) {
+            return '<div class="no-events">Nenhum evento encontrado.</div>';
+        }
+        
+        return Object.entries(data.anos)
+            .sort(([a], [b]) => parseInt(b) - parseInt(a)) // Sort years descending
+            .map(([ano, meses]) => {
+                const totalEventos = Object.values(meses).reduce((total, mes) => total + mes.total, 0);
+                
+                return `
+                    <div class="evento-ano" data-year="${ano}">
+                        <div class="evento-ano-header">
+                            <div class="evento-ano-info">
+                                <span class="evento-ano-title">${ano}</span>
+                                <span class="evento-ano-count">${totalEventos} evento${totalEventos !== 1 ? 's' : ''}</span>
+                            </div>
+                            <div class="evento-ano-toggle">
+                                <span class="toggle-icon">▼</span>
+                            </div>
+                        </div>
+                        <div class="evento-ano-content">
+                            ${this.generateMesesHTML(meses, ano)}
+                        </div>
+                    </div>
+                `;
+            }).join('');
+    }
+    
+    generateMesesHTML(meses, ano) {
+        const monthNames = {
+            'janeiro': 'Janeiro', 'fevereiro': 'Fevereiro', 'março': 'Março',
+            'abril': 'Abril', 'maio': 'Maio', 'junho': 'Junho',
+            'julho': 'Julho', 'agosto': 'Agosto', 'setembro': 'Setembro',
+            'outubro': 'Outubro', 'novembro': 'Novembro', 'dezembro': 'Dezembro'
+        };
+        
+        return Object.entries(meses)
+            .sort(([a], [b]) => {
+                const monthOrder = Object.keys(monthNames);
+                return monthOrder.indexOf(a.toLowerCase()) - monthOrder.indexOf(b.toLowerCase());
+            })
+            .map(([mes, { arquivo, total, eventos }]) => `
+                <div class="evento-mes" data-month="${mes}" data-year="${ano}" data-arquivo="${arquivo}">
+                    <div class="evento-mes-header">
+                        <div class="evento-mes-info">
+                            <span class="evento-mes-title">${monthNames[mes] || mes}</span>
+                            <span class="evento-mes-count">${total} evento${total !== 1 ? 's' : ''}</span>
+                        </div>
+                        <div class="evento-mes-toggle">
+                            <span class="toggle-icon">▼</span>
+                        </div>
+                    </div>
+                    <div class="evento-mes-content">
+                        ${eventos ? this.generateEventosHTML(eventos) : '<div class="no-events">Carregando eventos...</div>'}
+                    </div>
+                </div>
+            `).join('');
+    }
+    
+    generateEventosHTML(eventos) {
+        return eventos.map(evento => {
+            // Verifica se o horário existe e não está vazio. Se não, usa "O dia todo".
+            const horarioDisplay = evento.horario ? `<span class="evento-horario">${evento.horario}</span>` : '<span class="evento-horario">O dia todo</span>';
+
+            return`
+            <div class="evento-item" data-evento-id="${evento.id}">
+                <div class="evento-item-content">
+                    <div class="evento-titulo">${evento.titulo}</div>
+                    <div class="evento-meta">
+                        <span class="evento-data">${this.formatDate(evento.data)}</span></br>
+                        ${horarioDisplay}
+                        <span class="evento-local"> - ${evento.local}</span>
+                    </div>
+                    <div class="evento-organizador">Organizado por: ${evento.organizador}</div>
+                </div>
+                <div class="evento-actions">
+                    <button class="btn-evento-details" onclick="eventsManager.showEventDetails('${evento.id}')">
+                        Ver Detalhes
+                    </button>
+                </div>
+            </div>
+        `}).join('');
+    }
+    
+    bindEvents() {
+        // Search functionality
+        const searchInput = document.getElementById('events-search');
+        if (searchInput) {
+            searchInput.addEventListener('input', (e) => {
+                this.currentFilters.search = e.target.value;
+                this.debounce(() => this.render(), 300);
+            });
+        }
+        
+        // Year filter
+        const yearFilter = document.getElementById('year-filter');
+        if (yearFilter) {
+            yearFilter.addEventListener('change', (e) => {
+                this.currentFilters.year = e.target.value;
+                this.render();
+            });
+        }
+        
+        // Month filter
+        const monthFilter = document.getElementById('month-filter');
+        if (monthFilter) {
+            monthFilter.addEventListener('change', (e) => {
+                this.currentFilters.month = e.target.value;
+                this.render();
+            });
+        }
+    }
+    
+    bindAccordionEvents() {
+        // Year accordion
+        this.container.querySelectorAll('.evento-ano-header').forEach(header => {
+            header.addEventListener('click', (e) => {
+                const anoElement = header.parentElement;
+                const content = anoElement.querySelector('.evento-ano-content');
+                const icon = header.querySelector('.toggle-icon');
+                
+                content.classList.toggle('active');
+                icon.style.transform = content.classList.contains('active') ? 'rotate(180deg)' : 'rotate(0deg)';
+            });
+        });
+        
+        // Month accordion
+        this.container.querySelectorAll('.evento-mes-header').forEach(header => {
+            header.addEventListener('click', async (e) => {
+                e.stopPropagation();
+                const mesElement = header.parentElement;
+                const content = mesElement.querySelector('.evento-mes-content');
+                const icon = header.querySelector('.toggle-icon');
+                
+                content.classList.toggle('active');
+                icon.style.transform = content.classList.contains('active') ? 'rotate(180deg)' : 'rotate(0deg)';
+                
+                // Primeira vez que o mês é aberto: busca o arquivo do mês
+                if (!content.querySelector('.evento-item')) {
+                    try {
+                        const eventos = await this.carregarMes(mesElement.dataset.arquivo);
+                        content.innerHTML = this.generateEventosHTML(eventos);
+                        this.bindItemEvents(content);
+                    } catch (error) {
+                        console.error('Error loading events data:', error);
+                        content.innerHTML = '<div class="no-events">Não foi possível carregar os eventos.</div>';
+                    }
+                }
+            });
+        });
+        
+        this.bindItemEvents(this.container);
+    }
+    
+    bindItemEvents(container) {
+        // Event item hover effects
+        container.querySelectorAll('.evento-item').forEach(item => {
+            item.addEventListener('mouseenter', () => {
+                item.classList.add('hover');
+            });
+            
+            item.addEventListener('mouseleave', () => {
+                item.classList.remove('hover');
+            });
+        });
+    }
+    
+    async applyFilters() {
+        if (!this.manifesto) return { anos: {} };
+        
+        // Ano e mês filtram pelo manifesto; a busca por texto precisa dos eventos dos meses que sobraram
+        const searchTerm = this.currentFilters.search.toLowerCase();
+        const selecionados = [];
+        Object.entries(this.manifesto.anos).forEach(([ano, meses]) => {
+            // Year filter
+            if (this.currentFilters.year !== 'all' && ano !== this.currentFilters.year) {
+                return;
+            }
+            Object.entries(meses).forEach(([mes, info]) => {
+                // Month filter
+                if (this.currentFilters.month !== 'all' && mes !== this.currentFilters.month) {
+                    return;
+                }
+                selecionados.push([ano, mes, info]);
+            });
+        });
+        
+        if (searchTerm) {
+            await Promise.all(selecionados.map(([, , info]) => this.carregarMes(info.arquivo)));
+        }
+        
+        let filteredData = { anos: {} };
+        selecionados.forEach(([ano, mes, info]) => {
+            let eventos = this.meses[info.arquivo] || null;
+            
+            // Search filter
+            if (searchTerm) {
+                eventos = eventos.filter(evento => 
+                    evento.titulo.toLowerCase().includes(searchTerm) ||
+                    evento.descricao.toLowerCase().includes(searchTerm) ||
+                    evento.local.toLowerCase().includes(searchTerm) ||
+                    evento.organizador.toLowerCase().includes(searchTerm)
+                );
+                if (eventos.length === 0) return;
+            }
+            
+            filteredData.anos[ano] = filteredData.anos[ano] || {};
+            filteredData.anos[ano][mes] = { arquivo: info.arquivo, total: eventos ? eventos.length : info.eventos, eventos };
+        });
+        
+        return filteredData;
+    }
+    
+    showEventDetails(eventoId) {
+        const evento = this.findEventById(eventoId);
+        if (!evento) return;
+        
+        const modalContent = document.getElementById('evento-modal-content');
+        if (!modalContent) return;
+        
+        const fotosHTML = evento.fotos && evento.fotos.length > 0 ? `
+            <div class="evento-fotos">
+                <h4>Fotos do Evento</h4>
+                <div class="image-grid">
+                    ${evento.fotos.map(foto => {
+                        
+                        const imgSrc = foto.startsWith('http' ) ? foto : `images/eventos/${foto}`;
+                    
+                        return`
+                        <div class="image-item" onclick="openImageModal('${imgSrc}')">
+                            <img src="${imgSrc}" alt="${evento.titulo}" onerror="this.style.display='none'">
+                            <div class="image-overlay">
+                                <span>Ver imagem</span>
+                            </div>
+                        </div>
+                    `}).join('')}
+                </div>
+            </div>
+        ` : '';
+        
+        const videosHTML = evento.videos && evento.videos.length > 0 ? `
+            <div class="evento-videos">
+                <h4>Vídeos do Evento</h4>
+                <div class="videos-grid">
+                    ${evento.videos.map(videoUrl => {
+                        // A URL já é a URL de embed do Cloudinary
+                        return `
+                            <div class="video-item">
+                                <iframe 
+                                    src="${videoUrl}" 
+                                    width="100%" 
+                                    height="auto" 
+                                    style="aspect-ratio: 16/9;" 
+                                    frameborder="0" 
+                                    allow="autoplay; fullscreen; encrypted-media; picture-in-picture" 
+                                    allowfullscreen>
+                                </iframe>
+                            </div>
+                        `;
+                    }).join('')}
+                </div>
+            </div>
+        ` : '';
+        
+        modalContent.innerHTML = `
+            <div class="evento-details">
+                <div class="evento-header">
+                    <h3>${evento.titulo}</h3>
+                    <div class="evento-meta-details">
+                        <div class="meta-item">
+                            <strong>Data:</strong> ${this.formatDate(evento.data)}
+                        </div>
+                        <div class="meta-item">
+                            <strong>Horário:</strong> ${evento.horario}
+                        </div>
+                        <div class="meta-item">
+                            <strong>Local:</strong> ${evento.local}
+                        </div>
+                        <div class="meta-item">
+                            <strong>Organizador:</strong> ${evento.organizador}
+                        </div>
+                    </div>
+                </div>
+                
+                <div class="evento-description">
+                    <h4>Descrição</h4>
+                    <p>${evento.descricao}</p>
+                </div>
+                
+                ${fotosHTML}
+                ${videosHTML}
+            </div>
+        `;
+
+        this.bindImageClickEvents(modalContent);
+        
+        openModal('evento-modal');
+    }
+
+    bindImageClickEvents(container) {
+        const imageItems = container.querySelectorAll('.js-open-image-modal');
+        imageItems.forEach(item => {
+            // Removemos qualquer escutador antigo para evitar duplicação
+            item.replaceWith(item.cloneNode(true));
+        });
+
+        // Adicionamos os novos escutadores
+        container.querySelectorAll('.js-open-image-modal').forEach(item => {
+            item.addEventListener('click', (event) => {
+                event.stopPropagation(); 
+                const imageSrc = item.getAttribute('data-src');
+                
+                // Chama a função GLOBAL openImageModal
+                openImageModal(imageSrc); 
+            });
+        });
+    }
+    
+    findEventById(eventoId) {
+        // Só os meses já carregados: o evento veio de um deles
+        for (const eventos of Object.values(this.meses)) {
+            const evento = eventos.find(e => e.id === eventoId);
+            if (evento) return evento;
+        }
+        return null;
+    }
+    
+    formatDate(data) {
+        // Verifica se a data é um array
+        if (Array.isArray(data)) {
+            // Se o array estiver vazio, retorna uma string vazia
+            if (data.length === 0) {
+                return '';
+            }
+
+            const dataInicialStr = data[0];
+            // Se houver apenas uma data no array ou se a data final for igual à inicial
+            if (data.length === 1 || data[0] === data[data.length - 1]) {
+                const dataObj = new Date(dataInicialStr + 'T00:00:00'); // Adiciona T00:00:00 para evitar problemas de fuso
+                return dataObj.toLocaleDateString('pt-BR', {
+                    day: '2-digit',
+                    month: 'long',
+                    year: 'numeric',
+                    timeZone: 'UTC' // Importante para consistência
+                });
+            }
+
+            // Se as datas inicial e final forem diferentes
+            const dataFinalStr = data[data.length - 1];
+            const dataInicialObj = new Date(dataInicialStr + 'T00:00:00');
+            const dataFinalObj = new Date(dataFinalStr + 'T00:00:00');
+
+            const dataInicialFormatada = dataInicialObj.toLocaleDateString('pt-BR', { day: '2-digit', month: '2-digit', year: 'numeric', timeZone: 'UTC' });
+            const dataFinalFormatada = dataFinalObj.toLocaleDateString('pt-BR', { day: '2-digit', month: '2-digit', year: 'numeric', timeZone: 'UTC' });
+
+            return `De ${dataInicialFormatada} até ${dataFinalFormatada}`;
+
+        } else {
+            // Se for uma string (data única)
+            const dataObj = new Date(data + 'T00:00:00');
+            return dataObj.toLocaleDateString('pt-BR', {
+                day: '2-digit',
+                month: 'long',
+                year: 'numeric',
+                timeZone: 'UTC'
+            });
+        }
+    }
+    
+    debounce(func, wait) {
+        clearTimeout(this.debounceTimer);
+        this.debounceTimer = setTimeout(func, wait);
+    }
+    
+    // Export events to calendar
+    exportToCalendar(eventoId) {
+        const evento = this.findEventById(eventoId);
+        if (!evento) return;
+        
+        const startDate = new Date(evento.data + 'T' + evento.horario);
+        const endDate = new Date(startDate.getTime() + 2 * 60 * 60 * 1000); // 2 hours duration
+        
+        const icsContent = `BEGIN:VCALENDAR
+        VERSION:2.0
+        PRODID:-//Paróquia São José//Eventos//PT
+        BEGIN:VEVENT
+        UID:${evento.id}@paroquiasaojose.org.br
+        DTSTAMP:${new Date().toISOString().replace(/[-:]/g, '').split('.')[0]}Z
+        DTSTART:${startDate.toISOString().replace(/[-:]/g, '').split('.')[0]}Z
+        DTEND:${endDate.toISOString().replace(/[-:]/g, '').split('.')[0]}Z
+        SUMMARY:${evento.titulo}
+        DESCRIPTION:${evento.descricao}
+        LOCATION:${evento.local}
+        ORGANIZER:${evento.organizador}
+        END:VEVENT
+        END:VCALENDAR`;
+        
+        const blob = new Blob([icsContent], { type: 'text/calendar' });
+        const url = URL.createObjectURL(blob);
+        const a = document.createElement('a');
+        a.href = url;
+        a.download = `${evento.titulo.replace(/[^a-zA-Z0-9]/g, '_')}.ics`;
+        a.click();
+        URL.revokeObjectURL(url);
+    }
+    
+    // Share event
+    shareEvent(eventoId) {
+        const evento = this.findEventById(eventoId);
+        if (!evento) return;
+        
+        const shareData = {
+            title: evento.titulo,
+            text: `${evento.titulo} - ${this.formatDate(evento.data)} às ${evento.horario} em ${evento.local}`,
+            url: `${window.location.origin}${window.location.pathname}#eventos`
+        };
+        
+        if (navigator.share) {
+            navigator.share(shareData);
+        } else {
+            // Fallback: copy to clipboard
+            navigator.clipboard.writeText(`${shareData.title}\n${shareData.text}\n${shareData.url}`)
+                .then(() => {
+                    alert('Link do evento copiado para a área de transferência!');
+                });
+        }
+    }
+}
+
+// Create events filters
+function createEventsFilters() {
+    const filtersHTML = `
+        <div class="events-filters">
+            <div class="filter-row">
+                <div class="search-box">
+                    <input type="text" id="events-search" placeholder="Buscar eventos..." class="search-input">
+                    <button class="search-button">🔍</button>
+                </div>
+                
+                <select id="year-filter" class="filter-select">
+                    <option value="all">Todos os anos</option>
+                    <option value="2025">2025</option>
+                </select>
+                
+                <select id="month-filter" class="filter-select">
+                    <option value="all">Todos os meses</option>
+                    <option value="janeiro">Janeiro</option>
+                    <option value="fevereiro">Fevereiro</option>
+                    <option value="março">Março</option>
+                    <option value="abril">Abril</option>
+                    <option value="maio">Maio</option>
+                    <option value="junho">Junho</option>
+                    <option value="julho">Julho</option>
+                    <option value="agosto">Agosto</option>
+                    <option value="setembro">Setembro</option>
+                    <option value="outubro">Outubro</option>
+                    <option value="novembro">Novembro</option>
+                    <option value="dezembro">Dezembro</option>
+                </select>
+                
+                <button class="btn btn-secondary" onclick="resetEventsFilters()">
+                    Limpar Filtros
+                </button>
+                
+                <a class="btn btn-secondary" href="${PASTA_AGENDA}paroquia.ics" download>
+                    Adicionar ao calendário
+                </a>
+            </div>
+        </div>
+    `;
+    
+    const eventosSection = document.getElementById('eventos');
+    if (eventosSection) {
+        const sectionHeader = eventosSection.querySelector('.section-header');
+        sectionHeader.insertAdjacentHTML('afterend', filtersHTML);
+    }
+}
+
+function resetEventsFilters() {
+    if (window.eventsManager) {
+        window.eventsManager.currentFilters = {
+            year: 'all',
+            month: 'all',
+            search: ''
+        };
+        
+        document.getElementById('events-search').value = '';
+        document.getElementById('year-filter').value = 'all';
+        document.getElementById('month-filter').value = 'all';
+        
+        window.eventsManager.render();
+    }
+}
+
+function openImageModal(imageSrc) {
+    const modalContent = document.getElementById('foto-modal-content');
+    if (!modalContent) {
+        console.error('Elemento #foto-modal-content não encontrado!');
+        return;
+    }
+
+    // Adicionamos um console.log para depuração
+    console.log('Abrindo modal com a imagem:', imageSrc);
+
+    if (!imageSrc) {
+        console.error('A URL da imagem está vazia!');
+        modalContent.innerHTML = `<p style="color: red;">Erro: a URL da imagem não foi fornecida.</p>`;
+        openModal('foto-modal');
+        return;
+    }
+
+    modalContent.innerHTML = `
+        <div class="image-modal-content">
+            <img src="${imageSrc}" alt="Imagem do evento" style="max-width: 100%; max-height: 80vh; height: auto;">
+        </div>
+    `;
+    openModal('foto-modal');
+}
+
+// Initialize events manager
+document.addEventListener('DOMContentLoaded', function() {
+    setTimeout(() => {
+        window.eventsManager = new EventsManager('eventos-list');
+        createEventsFilters();
+    }, 500);
+});
+
@@ -1,8 +1,23 @@
 // Events system functionality
+
+// Agenda gerada pelo gerenciador (data/agenda_eventos.py): um manifesto com a contagem
+// de eventos de cada mês e um arquivo por mês, buscado só quando o mês é aberto
+const PASTA_AGENDA = 'data/agenda/';
+
+function buscarJSONAgenda(arquivo) {
+    return fetch(PASTA_AGENDA + arquivo).then(response => {
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        return response.json();
+    });
+}
+
 class EventsManager {
     constructor(containerId) {
         this.container = document.getElementById(containerId);
-        this.data = null;
+        this.manifesto = null;
+        this.mesesPendentes = {};  // arquivo -> promessa dos eventos do mês
+        this.meses = {};           // arquivo -> eventos do mês já carregados
+        this.versaoRender = 0;
         this.currentFilters = {
             year: 'all',
             month: 'all',
@@ -13,8 +28,7 @@ class EventsManager {
     
     async init() {
         try {
-            const response = await fetch('data/eventos.json');
-            this.data = await response.json();
+            this.manifesto = await buscarJSONAgenda('eventos/manifesto.json');
             this.render();
             this.bindEvents();
         } catch (error) {
@@ -22,16 +36,29 @@ class EventsManager {
         }
     }
     
-    render() {
-        if (!this.container || !this.data) return;
+    async render() {
+        if (!this.container || !this.manifesto) return;
         
-        const filteredData = this.applyFilters();
+        // Uma busca pode terminar depois de outra mais recente; só a última desenha
+        const versao = ++this.versaoRender;
+        const filteredData = await this.applyFilters();
+        if (versao !== this.versaoRender) return;
         const eventsHTML = this.generateEventsHTML(filteredData);
         
         this.container.innerHTML = eventsHTML;
         this.bindAccordionEvents();
     }
     
+    carregarMes(arquivo) {
+        if (!this.mesesPendentes[arquivo]) {
+            this.mesesPendentes[arquivo] = buscarJSONAgenda(arquivo).then(data => {
+                this.meses[arquivo] = data.eventos;
+                return data.eventos;
+            });
+        }
+        return this.mesesPendentes[arquivo];
+    }
+    
     generateEventsHTML(data) {
         if (!data.anos || Object.keys(data.anos).length === 0) {
             return '<div class="no-events">Nenhum evento encontrado.</div>';
@@ -40,7 +67,7 @@ class EventsManager {
         return Object.entries(data.anos)
             .sort(([a], [b]) => parseInt(b) - parseInt(a)) // Sort years descending
             .map(([ano, meses]) => {
-                const totalEventos = Object.values(meses).reduce((total, eventos) => total + eventos.length, 0);
+                const totalEventos = Object.values(meses).reduce((total, mes) => total + mes.total, 0);
                 
                 return `
                     <div class="evento-ano" data-year="${ano}">
@@ -74,19 +101,19 @@ class EventsManager {
                 const monthOrder = Object.keys(monthNames);
                 return monthOrder.indexOf(a.toLowerCase()) - monthOrder.indexOf(b.toLowerCase());
             })
-            .map(([mes, eventos]) => `
-                <div class="evento-mes" data-month="${mes}" data-year="${ano}">
+            .map(([mes, { arquivo, total, eventos }]) => `
+                <div class="evento-mes" data-month="${mes}" data-year="${ano}" data-arquivo="${arquivo}">
                     <div class="evento-mes-header">
                         <div class="evento-mes-info">
                             <span class="evento-mes-title">${monthNames[mes] || mes}</span>
-                            <span class="evento-mes-count">${eventos.length} evento${eventos.length !== 1 ? 's' : ''}</span>
+                            <span class="evento-mes-count">${total} evento${total !== 1 ? 's' : ''}</span>
                         </div>
                         <div class="evento-mes-toggle">
                             <span class="toggle-icon">▼</span>
                         </div>
                     </div>
                     <div class="evento-mes-content">
-                        ${this.generateEventosHTML(eventos)}
+                        ${eventos ? this.generateEventosHTML(eventos) : '<div class="no-events">Carregando eventos...</div>'}
                     </div>
                 </div>
             `).join('');
@@ -161,7 +188,7 @@ class EventsManager {
         
         // Month accordion
         this.container.querySelectorAll('.evento-mes-header').forEach(header => {
-            header.addEventListener('click', (e) => {
+            header.addEventListener('click', async (e) => {
                 e.stopPropagation();
                 const mesElement = header.parentElement;
                 const content = mesElement.querySelector('.evento-mes-content');
@@ -169,11 +196,27 @@ class EventsManager {
                 
                 content.classList.toggle('active');
                 icon.style.transform = content.classList.contains('active') ? 'rotate(180deg)' : 'rotate(0deg)';
+                
+                // Primeira vez que o mês é aberto: busca o arquivo do mês
+                if (!content.querySelector('.evento-item')) {
+                    try {
+                        const eventos = await this.carregarMes(mesElement.dataset.arquivo);
+                        content.innerHTML = this.generateEventosHTML(eventos);
+                        this.bindItemEvents(content);
+                    } catch (error) {
+                        console.error('Error loading events data:', error);
+                        content.innerHTML = '<div class="no-events">Não foi possível carregar os eventos.</div>';
+                    }
+                }
             });
         });
         
+        this.bindItemEvents(this.container);
+    }
+    
+    bindItemEvents(container) {
         // Event item hover effects
-        this.container.querySelectorAll('.evento-item').forEach(item => {
+        container.querySelectorAll('.evento-item').forEach(item => {
             item.addEventListener('mouseenter', () => {
                 item.classList.add('hover');
             });
@@ -184,45 +227,47 @@ class EventsManager {
         });
     }
     
-    applyFilters() {
-        if (!this.data) return { anos: {} };
-        
-        let filteredData = { anos: {} };
+    async applyFilters() {
+        if (!this.manifesto) return { anos: {} };
         
-        Object.entries(this.data.anos).forEach(([ano, meses]) => {
+        // Ano e mês filtram pelo manifesto; a busca por texto precisa dos eventos dos meses que sobraram
+        const searchTerm = this.currentFilters.search.toLowerCase();
+        const selecionados = [];
+        Object.entries(this.manifesto.anos).forEach(([ano, meses]) => {
             // Year filter
             if (this.currentFilters.year !== 'all' && ano !== this.currentFilters.year) {
                 return;
             }
-            
-            let filteredMeses = {};
-            
-            Object.entries(meses).forEach(([mes, eventos]) => {
+            Object.entries(meses).forEach(([mes, info]) => {
                 // Month filter
                 if (this.currentFilters.month !== 'all' && mes !== this.currentFilters.month) {
                     return;
                 }
-                
-                // Search filter
-                let filteredEventos = eventos;
-                if (this.currentFilters.search) {
-                    const searchTerm = this.currentFilters.search.toLowerCase();
-                    filteredEventos = eventos.filter(evento => 
-                        evento.titulo.toLowerCase().includes(searchTerm) ||
-                        evento.descricao.toLowerCase().includes(searchTerm) ||
-                        evento.local.toLowerCase().includes(searchTerm) ||
-                        evento.organizador.toLowerCase().includes(searchTerm)
-                    );
-                }
-                
-                if (filteredEventos.length > 0) {
-                    filteredMeses[mes] = filteredEventos;
-                }
+                selecionados.push([ano, mes, info]);
             });
+        });
+        
+        if (searchTerm) {
+            await Promise.all(selecionados.map(([, , info]) => this.carregarMes(info.arquivo)));
+        }
+        
+        let filteredData = { anos: {} };
+        selecionados.forEach(([ano, mes, info]) => {
+            let eventos = this.meses[info.arquivo] || null;
             
-            if (Object.keys(filteredMeses).length > 0) {
-                filteredData.anos[ano] = filteredMeses;
+            // Search filter
+            if (searchTerm) {
+                eventos = eventos.filter(evento => 
+                    evento.titulo.toLowerCase().includes(searchTerm) ||
+                    evento.descricao.toLowerCase().includes(searchTerm) ||
+                    evento.local.toLowerCase().includes(searchTerm) ||
+                    evento.organizador.toLowerCase().includes(searchTerm)
+                );
+                if (eventos.length === 0) return;
             }
+            
+            filteredData.anos[ano] = filteredData.anos[ano] || {};
+            filteredData.anos[ano][mes] = { arquivo: info.arquivo, total: eventos ? eventos.length : info.eventos, eventos };
         });
         
         return filteredData;
@@ -334,13 +379,10 @@ class EventsManager {
     }
     
     findEventById(eventoId) {
-        if (!this.data) return null;
-        
-        for (const [ano, meses] of Object.entries(this.data.anos)) {
-            for (const [mes, eventos] of Object.entries(meses)) {
-                const evento = eventos.find(e => e.id === eventoId);
-                if (evento) return evento;
-            }
+        // Só os meses já carregados: o evento veio de um deles
+        for (const eventos of Object.values(this.meses)) {
+            const evento = eventos.find(e => e.id === eventoId);
+            if (evento) return evento;
         }
         return null;
     }
@@ -481,6 +523,10 @@ function createEventsFilters() {
                 <button class="btn btn-secondary" onclick="resetEventsFilters()">
                     Limpar Filtros
                 </button>
+                
+                <a class="btn btn-secondary" href="${PASTA_AGENDA}paroquia.ics" download>
+                    Adicionar ao calendário
+                </a>
             </div>
         </div>
     `;
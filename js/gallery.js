@@ -11,8 +11,7 @@ class GalleryManager {
     
     async init() {
         try {
-            const response = await fetch('data/fotos.json');
-            this.data = await response.json();
+            this.data = (await carregarPacoteInicio()).fotos;
             this.render();
             this.bindEvents();
         } catch (error) {
@@ -26,7 +25,7 @@ class GalleryManager {
         const sectionsHTML = Object.entries(this.data.secoes).map(([key, secao]) => `
             <div class="galeria-secao" data-section="${key}">
                 <div class="galeria-secao-image">
-                    <img src="${secao.thumbnail}" alt="${secao.nome}" onerror="this.src='images/galeria/placeholder.jpg'">
+                    ${imagemGaleria(capaSecao(secao), secao.nome)}
                     <div class="galeria-secao-overlay">
                         <div class="overlay-content">
                             <h3>${secao.nome}</h3>
@@ -91,12 +90,9 @@ class GalleryManager {
                     <h4>${sub.nome}</h4>
                     <div class="image-grid">
                         ${sub.fotos.map((foto, fotoIndex) => {
-                            const imgSrc = foto.startsWith('http' ) ? foto : secao.pasta + foto;
                             return`
                             <div class="image-item" data-image-index="${fotoIndex}" data-subgaleria="${subIndex}">
-                                <img src="${imgSrc}" alt="${sub.nome}" 
-                                     onerror="this.src='images/galeria/placeholder.jpg'"
-                                     loading="lazy">
+                                ${imagemGaleria(dadosFoto(foto, secao.pasta), sub.nome)}
                                 <div class="image-overlay">
                                     <div class="overlay-content">
                                         <span class="view-icon">🔍</span>
@@ -151,12 +147,12 @@ class GalleryManager {
         if (!secao || !secao.subgalerias[subgaleriaIndex]) return;
         
         const subgaleria = secao.subgalerias[subgaleriaIndex];
-        const fotoPath = subgaleria.fotos[imageIndex];
-
-        const imgSrc = fotoPath.startsWith('http' ) ? fotoPath : secao.pasta + fotoPath;
+        const foto = dadosFoto(subgaleria.fotos[imageIndex], secao.pasta);
 
         this.currentImages = [{
-            src: imgSrc,
+            src: foto.src,
+            largura: foto.largura,
+            altura: foto.altura,
             alt: subgaleria.nome,
             caption: `${subgaleria.nome} - ${secao.nome}`
         }];
@@ -190,7 +186,7 @@ class GalleryManager {
                 
                 <div class="lightbox-body">
                     <div class="lightbox-image-container">
-                        <img src="${currentImage.src}" alt="${currentImage.alt}" class="lightbox-image">
+                        <img src="${currentImage.src}" alt="${currentImage.alt}" class="lightbox-image"${currentImage.largura ? ` width="${currentImage.largura}" height="${currentImage.altura}"` : ''}>
                         <div class="lightbox-loading">Carregando...</div>
                     </div>
                 </div>
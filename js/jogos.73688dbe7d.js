@@ -0,0 +1,39 @@
+document.addEventListener('DOMContentLoaded', () => {
+    function initMobileMenu() {
+        const mobileMenuBtn = document.getElementById('mobile-menu-btn');
+        const nav = document.getElementById('nav');
+        
+        if (mobileMenuBtn && nav) {
+            mobileMenuBtn.addEventListener('click', function() {
+                this.classList.toggle('active');
+                nav.classList.toggle('active');
+            });
+            
+            // Fecha ao clicar fora
+            document.addEventListener('click', function(e) {
+                if (!nav.contains(e.target) && !mobileMenuBtn.contains(e.target)) {
+                    closeMobileMenu();
+                }
+            });
+            
+            // Fecha ao redimensionar
+            window.addEventListener('resize', function() {
+                if (window.innerWidth > 768) {
+                    closeMobileMenu();
+                }
+            });
+        }
+    }
+
+    function closeMobileMenu() {
+        const mobileMenuBtn = document.getElementById('mobile-menu-btn');
+        const nav = document.getElementById('nav');
+        
+        if (mobileMenuBtn && nav) {
+            mobileMenuBtn.classList.remove('active');
+            nav.classList.remove('active');
+        }
+    }
+
+    initMobileMenu();
+});
\ No newline at end of file
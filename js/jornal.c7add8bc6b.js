@@ -0,0 +1,946 @@
+// Raiz do site, calculada a partir deste script: as páginas pré-renderizadas pelo
+// gerenciador ficam em outras pastas (pages/jornal/ e pages/jornal/noticias/)
+const RAIZ_SITE = new URL('../', document.currentScript.src);
+
+document.addEventListener('DOMContentLoaded', () => {
+    // Página de uma notícia gerada pelo gerenciador: o conteúdo já está no HTML
+    if (document.body.dataset.pagina === 'artigo') {
+        initMobileMenu();
+        return;
+    }
+
+    const destaqueContainer = document.getElementById('noticias-destaque');
+    const recentesContainer = document.getElementById('noticias-recentes');
+    const modal = document.getElementById('modal-noticia');
+    const modalBody = document.getElementById('modal-body');
+    const filtroCategoria = document.getElementById('filtro-categoria');
+    const filtroData = document.getElementById('filtro-data');
+    const filtroBusca = document.getElementById('filtro-busca');
+    const limparFiltrosBtn = document.getElementById('limpar-filtros-btn');
+    const imprimirBtn = document.getElementById('imprimir-btn');
+    const modalImpressao = document.getElementById('modal-impressao');
+    const closeModalImpressaoBtn = document.getElementById('modal-close-impressao');
+    const gerarImpressaoBtn = document.getElementById('gerar-impressao-btn');
+    const dataInicialInput = document.getElementById('data-inicial');
+    const dataFinalInput = document.getElementById('data-final');
+    const categoriaImpressaoSelect = document.getElementById('categoria-impressao');
+    const capaImpressaoSelect = document.getElementById('capa-impressao');
+
+    let todasAsNoticias = [];
+    let noticiasFiltradas = [];
+    let paginaAtual = 1;
+    const itensPorPagina = 5;
+
+    const mapaCategorias = {
+        avisos: ['aviso', 'avisos'],
+        eventos: ['festa', 'campanha', 'celebração', 'sucesso'],
+        catequese: ['catequese', 'inscrições', 'crisma', 'inscrição']
+    };
+
+    function initMobileMenu() {
+        const mobileMenuBtn = document.getElementById('mobile-menu-btn');
+        const nav = document.getElementById('nav');
+        
+        if (mobileMenuBtn && nav) {
+            mobileMenuBtn.addEventListener('click', function() {
+                this.classList.toggle('active');
+                nav.classList.toggle('active');
+            });
+            
+            // Fecha ao clicar fora
+            document.addEventListener('click', function(e) {
+                if (!nav.contains(e.target) && !mobileMenuBtn.contains(e.target)) {
+                    closeMobileMenu();
+                }
+            });
+            
+            // Fecha ao redimensionar
+            window.addEventListener('resize', function() {
+                if (window.innerWidth > 768) {
+                    closeMobileMenu();
+                }
+            });
+        }
+    }
+
+    function closeMobileMenu() {
+        const mobileMenuBtn = document.getElementById('mobile-menu-btn');
+        const nav = document.getElementById('nav');
+        
+        if (mobileMenuBtn && nav) {
+            mobileMenuBtn.classList.remove('active');
+            nav.classList.remove('active');
+        }
+    }
+
+    // Arquivos gerados pelo gerenciador (data/publicacao_jornal.py): um manifesto leve,
+    // páginas com resumos e um arquivo por notícia com o corpo completo.
+    const PASTA_PUBLICACAO = new URL('data/jornal/', RAIZ_SITE).href;
+    const PASTA_PAGINAS = new URL('pages/', RAIZ_SITE);
+
+    // As imagens no jornal.json são relativas a pages/ ("../images/...")
+    function urlDoSite(caminho) {
+        return caminho && caminho.startsWith('../') ? new URL(caminho, PASTA_PAGINAS).href : caminho;
+    }
+    let manifesto = null;
+    const noticiaPorId = new Map();
+    const paginasCarregadas = new Map(); // número da página -> Promise
+    const artigosCarregados = new Map(); // id -> Promise
+
+    function categoriasDoTexto(noticia) {
+        const texto = (noticia.titulo + ' ' + noticia.conteudo).toLowerCase();
+        return Object.keys(mapaCategorias).filter(cat =>
+            mapaCategorias[cat].some(palavra => texto.includes(palavra))
+        );
+    }
+
+    async function carregarNoticias() {
+        try {
+            let noticias;
+            try {
+                noticias = await carregarManifesto();
+            } catch (erroManifesto) {
+                // Sem os arquivos gerados, usa o jornal.json completo (como antes)
+                console.warn('Manifesto do jornal indisponível, carregando jornal.json:', erroManifesto);
+                noticias = await carregarArquivoCompleto();
+            }
+
+            todasAsNoticias = noticias;
+            todasAsNoticias.forEach(noticia => noticiaPorId.set(noticia.id, noticia));
+
+            popularFiltros(todasAsNoticias);
+
+            if (recentesContainer.dataset.estatico) {
+                ativarPaginaEstatica();
+            } else {
+                aplicarFiltros();
+            }
+
+        } catch (error) {
+            console.error('Erro ao carregar e processar notícias:', error);
+            recentesContainer.innerHTML = '<p class="alert alert-error">Não foi possível carregar as notícias. Tente novamente mais tarde.</p>';
+        }
+    }
+
+    async function carregarManifesto() {
+        const response = await fetch(`${PASTA_PUBLICACAO}manifesto.json`);
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        manifesto = await response.json();
+
+        const idsDestaque = new Set(manifesto.destaques);
+        const noticias = manifesto.noticias.map(noticia => ({
+            ...noticia,
+            destaque: idsDestaque.has(noticia.id)
+        }));
+
+        // A primeira página (as mais recentes) já vem junto, para a primeira exibição
+        noticias.forEach(noticia => noticiaPorId.set(noticia.id, noticia));
+        if (manifesto.paginas.length > 0) {
+            await carregarPagina(1);
+        }
+        return noticias; // Já estão ordenadas por data
+    }
+
+    async function carregarArquivoCompleto() {
+        const response = await fetch(new URL('data/jornal.json', RAIZ_SITE));
+        const dados = await response.json(); // Agora 'dados' contém { destaques: [...], noticias: [...] }
+
+        // Pega a lista de IDs que devem ser destaque
+        const idsDestaque = dados.destaques;
+
+        // Mapeia a lista de notícias original, adicionando a propriedade 'destaque: true' se o ID estiver na lista de destaques
+        const noticiasComDestaque = dados.noticias.map(noticia => {
+            const categorias = categoriasDoTexto(noticia);
+            const categoria = (noticia.categoria || categorias[0] || 'geral').toLowerCase();
+
+            return {
+                ...noticia,
+                destaque: idsDestaque.includes(noticia.id),
+                categoria: categoria, // Usa a categoria do JSON ou a automática
+                categorias: categorias,
+                resumoCarregado: true,
+                completa: true
+            };
+        });
+
+        return noticiasComDestaque.sort((a, b) => new Date(b.data) - new Date(a.data));
+    }
+
+    function carregarPagina(numero) {
+        if (!paginasCarregadas.has(numero)) {
+            const promessa = fetch(`${PASTA_PUBLICACAO}${manifesto.paginas[numero - 1]}`)
+                .then(response => response.json())
+                .then(pagina => {
+                    pagina.noticias.forEach(({ id, subtitulo, resumo }) => {
+                        const noticia = noticiaPorId.get(id);
+                        if (noticia && !noticia.completa) {
+                            Object.assign(noticia, { subtitulo, conteudo: resumo, resumoCarregado: true });
+                        }
+                    });
+                })
+                .catch(erro => {
+                    paginasCarregadas.delete(numero); // Permite tentar de novo
+                    throw erro;
+                });
+            paginasCarregadas.set(numero, promessa);
+        }
+        return paginasCarregadas.get(numero);
+    }
+
+    // Garante que subtítulo e resumo das notícias informadas já foram baixados
+    function garantirResumos(noticias) {
+        const paginas = new Set(noticias.filter(n => !n.resumoCarregado).map(n => n.pagina));
+        return Promise.all([...paginas].map(carregarPagina));
+    }
+
+    // Baixa o corpo completo da notícia (só na primeira vez que ela é aberta)
+    function carregarArtigo(id) {
+        const noticia = noticiaPorId.get(id);
+        if (!noticia || noticia.completa) return Promise.resolve(noticia);
+
+        if (!artigosCarregados.has(id)) {
+            const arquivo = id.replace(/[^A-Za-z0-9_-]/g, '_');
+            const promessa = Promise.all([
+                fetch(`${PASTA_PUBLICACAO}artigos/${arquivo}.json`).then(response => response.json()),
+                garantirResumos([noticia])
+            ])
+                .then(([artigo]) => {
+                    Object.assign(noticia, artigo, { completa: true });
+                    return noticia;
+                })
+                .catch(erro => {
+                    artigosCarregados.delete(id);
+                    throw erro;
+                });
+            artigosCarregados.set(id, promessa);
+        }
+        return artigosCarregados.get(id);
+    }
+
+    // ===== BUSCA =====
+    // Índice invertido gerado pelo gerenciador (data/indice_busca.py), dividido pelas
+    // duas primeiras letras de cada termo: cada busca baixa só os blocos que precisa.
+    const PASTA_BUSCA = `${PASTA_PUBLICACAO}busca/`;
+    let indiceBusca = null; // Promise
+    const blocosBusca = new Map(); // prefixo -> Promise
+    let resultadoBusca = null; // Set de IDs encontrados (null = sem índice, usa a busca simples)
+    let buscaAtual = 0;
+    let temporizadorBusca = null;
+
+    function dobrarAcentos(texto) {
+        return texto.toLowerCase().normalize('NFD').replace(/[\u0300-\u036f]/g, '');
+    }
+
+    function carregarIndiceBusca() {
+        if (!indiceBusca) {
+            indiceBusca = fetch(`${PASTA_BUSCA}indice.json`)
+                .then(response => {
+                    if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                    return response.json();
+                })
+                .catch(erro => {
+                    indiceBusca = null;
+                    throw erro;
+                });
+        }
+        return indiceBusca;
+    }
+
+    function carregarBlocoBusca(prefixo) {
+        if (!blocosBusca.has(prefixo)) {
+            const promessa = fetch(`${PASTA_BUSCA}${prefixo}.json`)
+                .then(response => response.json())
+                .catch(erro => {
+                    blocosBusca.delete(prefixo);
+                    throw erro;
+                });
+            blocosBusca.set(prefixo, promessa);
+        }
+        return blocosBusca.get(prefixo);
+    }
+
+    // Documentos que contêm algum termo começando com 'termo' (busca binária na lista ordenada)
+    function documentosComPrefixo(bloco, termo) {
+        let inicio = 0;
+        let fim = bloco.termos.length;
+        while (inicio < fim) {
+            const meio = (inicio + fim) >> 1;
+            if (bloco.termos[meio] < termo) inicio = meio + 1;
+            else fim = meio;
+        }
+
+        const documentos = new Set();
+        for (let i = inicio; i < bloco.termos.length && bloco.termos[i].startsWith(termo); i++) {
+            const ocorrencias = bloco.ocorrencias[i];
+            for (let j = 0; j < ocorrencias.length; j += 2) {
+                documentos.add(ocorrencias[j]);
+            }
+        }
+        return documentos;
+    }
+
+    // Retorna o conjunto de IDs que contêm todos os termos da consulta, ou null se não der para usar o índice
+    async function buscarNoIndice(consulta) {
+        if (!manifesto) return null;
+
+        const indice = await carregarIndiceBusca();
+        const palavras = dobrarAcentos(consulta).match(/[a-z0-9]+/g) || [];
+        const ignoradas = new Set(indice.ignoradas);
+        // A última palavra pode estar incompleta (o visitante ainda está digitando)
+        const termos = palavras.filter((termo, i) =>
+            termo.length >= indice.tamanho_prefixo && (i === palavras.length - 1 || !ignoradas.has(termo))
+        );
+        if (termos.length === 0) return null;
+
+        let resultado = null;
+        for (const termo of termos) {
+            const prefixo = termo.slice(0, indice.tamanho_prefixo);
+            const documentos = indice.prefixos.includes(prefixo)
+                ? documentosComPrefixo(await carregarBlocoBusca(prefixo), termo)
+                : new Set();
+            resultado = resultado ? new Set([...resultado].filter(d => documentos.has(d))) : documentos;
+            if (resultado.size === 0) break;
+        }
+        return new Set([...resultado].map(documento => indice.documentos[documento]));
+    }
+
+    async function atualizarBusca() {
+        const consulta = filtroBusca.value.trim();
+        const numero = ++buscaAtual;
+
+        let resultado = null;
+        if (consulta) {
+            try {
+                resultado = await buscarNoIndice(consulta);
+            } catch (erro) {
+                console.warn('Índice de busca indisponível, usando a busca simples:', erro);
+            }
+        }
+        if (numero !== buscaAtual) return; // Já chegou outra tecla
+
+        resultadoBusca = resultado;
+        aplicarFiltros();
+    }
+
+    // Monta a imagem com as versões geradas pelo gerenciador (WebP + JPEG em vários tamanhos),
+    // para o navegador baixar a menor que sirva. Notícias antigas têm só o caminho simples.
+    function imagemResponsiva(noticia, campo, classe, sizes, estilo = '') {
+        const src = urlDoSite(noticia[campo]);
+        const versoes = noticia[`${campo}_srcset`];
+        const atributos = `alt="${noticia.titulo}"${classe ? ` class="${classe}"` : ''}${estilo ? ` style="${estilo}"` : ''}`;
+
+        if (!versoes || !versoes.webp || versoes.webp.length === 0) {
+            return `<img src="${src}" ${atributos} loading="lazy">`;
+        }
+
+        const srcset = lista => lista.map(([url, largura]) => `${urlDoSite(url)} ${largura}w`).join(', ');
+        return `
+            <picture>
+                <source type="image/webp" srcset="${srcset(versoes.webp)}" sizes="${sizes}">
+                <img src="${urlDoSite(versoes.src) || src}" srcset="${srcset(versoes.jpg)}" sizes="${sizes}" width="${versoes.largura}" height="${versoes.altura}" ${atributos} loading="lazy">
+            </picture>
+        `;
+    }
+
+    function popularFiltros(noticias) {
+        // 1. Pega todas as categorias e converte para minúsculas para evitar duplicatas.
+        const categoriasBrutas = noticias.map(n => n.categoria.toLowerCase());
+        
+        // 2. Cria um conjunto de categorias únicas e depois converte de volta para um array.
+        const categoriasUnicas = [...new Set(categoriasBrutas)];
+
+        // 3. Formata o nome para ter a primeira letra maiúscula.
+        const categoriasFormatadas = categoriasUnicas.map(cat => cat.charAt(0).toUpperCase() + cat.slice(1));
+
+        // 4. Limpa os filtros de categoria existentes (mantendo a primeira opção "Todas").
+        filtroCategoria.innerHTML = '<option value="todas">Todas as Notícias</option>';
+        categoriaImpressaoSelect.innerHTML = '<option value="todas">Todas as Notícias</option>';
+
+        // 5. Adiciona as categorias únicas e formatadas aos selects.
+        const opcoesHTML = categoriasUnicas.map(cat => {
+            const nomeFormatado = cat.charAt(0).toUpperCase() + cat.slice(1);
+            return `<option value="${cat}">${nomeFormatado}</option>`;
+        }).join('');
+
+        filtroCategoria.innerHTML += opcoesHTML;
+        categoriaImpressaoSelect.innerHTML += opcoesHTML;
+
+        // Popula filtro de datas (Mês/Ano) - Lógica inalterada
+        const datas = [...new Set(noticias.map(n => {
+            const d = new Date(n.data + "T00:00:00");
+            return `${d.getFullYear()}-${String(d.getMonth() + 1).padStart(2, '0')}`;
+        }))];
+        
+        // Limpa filtro de data antes de popular
+        filtroData.innerHTML = '<option value="todas">Todas as Datas</option>';
+        filtroData.innerHTML += datas.map(data => {
+            const [ano, mes] = data.split('-');
+            const nomeMes = new Date(ano, mes - 1).toLocaleString('pt-BR', { month: 'long' });
+            return `<option value="${data}">${nomeMes.charAt(0).toUpperCase() + nomeMes.slice(1)} de ${ano}</option>`;
+        }).join('');
+    }
+
+    function aplicarFiltros() {
+        const categoriaSelecionada = filtroCategoria.value;
+        const data = filtroData.value;
+        const busca = filtroBusca.value.toLowerCase();
+
+        noticiasFiltradas = todasAsNoticias.filter(noticia => {
+            let matchCategoria = true;
+
+            if (categoriaSelecionada !== 'todas') {
+                // A notícia precisa conter pelo menos UMA das palavras-chave da categoria
+                // (calculado de antemão, já que o texto completo só é baixado ao abrir a notícia)
+                matchCategoria = noticia.categorias.includes(categoriaSelecionada);
+            }
+            
+            const d = new Date(noticia.data + "T00:00:00");
+            const dataNoticia = `${d.getFullYear()}-${String(d.getMonth() + 1).padStart(2, '0')}`;
+            const matchData = data === 'todas' || dataNoticia === data;
+
+            const matchBusca = busca === '' || (resultadoBusca
+                ? resultadoBusca.has(noticia.id)
+                : noticia.titulo.toLowerCase().includes(busca) || 
+                  (noticia.subtitulo || '').toLowerCase().includes(busca) ||
+                  (noticia.conteudo || '').toLowerCase().includes(busca));
+
+            return matchCategoria && matchData && matchBusca;
+        });
+
+        const noticiasDestaque = noticiasFiltradas.filter(n => n.destaque); // Assumindo que o JSON pode ter "destaque: true"
+        const noticiasNormais = noticiasFiltradas.filter(n => !n.destaque);
+
+        noticiasFiltradas = [...noticiasDestaque, ...noticiasNormais];
+
+        paginaAtual = 1; 
+        exibirDestaques(noticiasDestaque);
+        exibirRecentes(noticiasNormais);
+
+        // ===== LÓGICA DE VISIBILIDADE ADICIONADA AQUI =====
+        const divisor = document.querySelector('.divider');
+        const tituloRecentes = document.getElementById('titulo-recentes');
+
+        // Mostra o divisor e o título apenas se AMBAS as seções tiverem conteúdo
+        if (noticiasDestaque.length > 0 && noticiasNormais.length > 0) {
+            divisor.style.display = 'block';
+            tituloRecentes.style.display = 'block';
+        } else {
+            // Esconde se uma das seções estiver vazia para evitar separações desnecessárias
+            divisor.style.display = 'none';
+            tituloRecentes.style.display = 'none';
+        }
+    }
+
+    // Página da listagem pré-renderizada pelo gerenciador (pages/jornal/): o HTML já
+    // está pronto, então só liga os cliques ao modal. Ao usar os filtros, a lista
+    // passa a ser montada aqui, como na página comum.
+    function ativarPaginaEstatica() {
+        noticiasFiltradas = [
+            ...todasAsNoticias.filter(n => n.destaque),
+            ...todasAsNoticias.filter(n => !n.destaque)
+        ];
+
+        document.querySelectorAll('#noticias-destaque [data-id], #noticias-recentes [data-id]').forEach(elemento => {
+            elemento.addEventListener('click', (e) => {
+                e.preventDefault(); // Sem JavaScript, o link leva à página da notícia
+                abrirModalComNoticia(elemento.dataset.id);
+            });
+        });
+    }
+
+    filtroCategoria.addEventListener('change', aplicarFiltros);
+    filtroData.addEventListener('change', aplicarFiltros);
+    filtroBusca.addEventListener('input', () => { // 'input' para filtrar enquanto digita
+        clearTimeout(temporizadorBusca);
+        temporizadorBusca = setTimeout(atualizarBusca, 150);
+    });
+    limparFiltrosBtn.addEventListener('click', () => {
+        filtroCategoria.value = 'todas';
+        filtroData.value = 'todas';
+        filtroBusca.value = '';
+        resultadoBusca = null;
+        buscaAtual++;
+        aplicarFiltros();
+    });
+
+    let exibicaoDestaques = 0;
+    let exibicaoRecentes = 0;
+
+    async function exibirDestaques(noticias) {
+        const exibicao = ++exibicaoDestaques;
+        if (noticias.length === 0) {
+            destaqueContainer.style.display = 'none';
+            return;
+        }
+
+        await garantirResumos(noticias);
+        if (exibicao !== exibicaoDestaques) return; // Os filtros mudaram enquanto baixava
+
+        destaqueContainer.style.display = '';
+        destaqueContainer.innerHTML = noticias.map(noticia => `
+            <div class="card card-destaque">
+                ${imagemResponsiva(noticia, 'foto_principal', 'card-img-top', '(max-width: 768px) 100vw, 33vw')}
+                <div class="card-body">
+                    <span class="badge badge-primary">Destaque</span>
+                    <h3 class="card-title">${noticia.titulo}</h3>
+                    <p class="card-subtitle">${noticia.subtitulo}</p>
+                    <p class="card-conteudo">${noticia.conteudo.substring(0, 100)}...</p>
+                    <a href="#" class="btn btn-primary leia-mais-btn" data-id="${noticia.id}">Leia Mais</a>
+                </div>
+            </div>
+        `).join('');
+
+        document.querySelectorAll('.leia-mais-btn').forEach(button => {
+            button.addEventListener('click', (e) => {
+                e.preventDefault(); // Impede que o link '#' recarregue a página
+                const noticiaId = e.target.getAttribute('data-id');
+                abrirModalComNoticia(noticiaId);
+            });
+        });
+    }
+
+    async function exibirRecentes(noticias) {
+        const exibicao = ++exibicaoRecentes;
+
+        if (noticias.length === 0) {
+            recentesContainer.innerHTML = '<p class="alert alert-info">Nenhuma notícia encontrada com os filtros selecionados.</p>';
+            document.getElementById('paginacao-container')?.remove();
+            return;
+        }
+
+        const inicio = (paginaAtual - 1) * itensPorPagina;
+        const fim = inicio + itensPorPagina;
+        const itensDaPagina = noticias.slice(inicio, fim);
+
+        // Baixa só os resumos das notícias desta página
+        await garantirResumos(itensDaPagina);
+        if (exibicao !== exibicaoRecentes) return; // Os filtros mudaram enquanto baixava
+
+        recentesContainer.innerHTML = ''; // Limpa o container
+
+        itensDaPagina.forEach((noticia, index) => {
+            const isDestaque = noticia.destaque ? ' is-destaque' : '';
+	        const destaqueBadge = noticia.destaque ? '<span class="badge badge-destaque">DESTAQUE</span>' : '';
+
+            const cardHTML = `
+	                <div class="card card-noticia${isDestaque}" data-id="${noticia.id}">
+	                    <div class="noticia-imagem">
+	                        ${imagemResponsiva(noticia, 'foto_principal', 'card-img-list', '(max-width: 768px) 100vw, 300px')}
+	                    </div>
+	                    <div class="noticia-conteudo">
+	                        ${destaqueBadge}
+	                        <span class="noticia-data">${new Date(noticia.data + "T00:00:00").toLocaleDateString('pt-BR')}</span>
+	                        <h4 class="noticia-titulo">${noticia.titulo}</h4>
+	                        <p class="noticia-subtitulo">${noticia.conteudo.substring(0, 120)}...</p>
+	                        <span class="leia-mais-link">Ver notícia completa &rarr;</span>
+	                    </div>
+	                </div>
+	            `;
+            // Adiciona o HTML do card ao container
+            recentesContainer.insertAdjacentHTML('beforeend', cardHTML);
+
+            // Encontra o card que acabamos de adicionar
+            const cardElement = recentesContainer.lastElementChild;
+            
+            // Aplica a classe de animação com um pequeno atraso em cascata
+            cardElement.style.animationDelay = `${index * 100}ms`; // Atraso de 100ms por card
+            cardElement.classList.add('card-fade-in');
+
+            // Adiciona o evento de clique
+            cardElement.addEventListener('click', () => {
+                abrirModalComNoticia(cardElement.dataset.id);
+            });
+        });
+
+        renderizarControlesPaginacao(noticias.length);
+    }
+
+    function renderizarControlesPaginacao(totalItens) {
+        const totalPaginas = Math.ceil(totalItens / itensPorPagina);
+        let paginacaoContainer = document.getElementById('paginacao-container');
+        
+        if (!paginacaoContainer) {
+            paginacaoContainer = document.createElement('div');
+            paginacaoContainer.id = 'paginacao-container';
+            paginacaoContainer.className = 'pagination';
+            recentesContainer.insertAdjacentElement('afterend', paginacaoContainer);
+        }
+
+        paginacaoContainer.innerHTML = '';
+
+        if (totalPaginas <= 1) return;
+
+        for (let i = 1; i <= totalPaginas; i++) {
+            const pageLink = document.createElement('a');
+            pageLink.href = '#';
+            pageLink.textContent = i;
+            pageLink.className = 'pagination-link';
+            if (i === paginaAtual) {
+                pageLink.classList.add('active');
+            }
+            pageLink.addEventListener('click', (e) => {
+                e.preventDefault();
+                paginaAtual = i;
+                exibirRecentes(noticiasFiltradas.filter(n => !n.destaque));
+            });
+            paginacaoContainer.appendChild(pageLink);
+        }
+    }
+
+    async function abrirModalComNoticia(id) {
+        const noticiaIndex = noticiasFiltradas.findIndex(n => n.id === id);
+        if (noticiaIndex === -1) return;
+
+        let noticia;
+        try {
+            noticia = await carregarArtigo(id); // O corpo da notícia é baixado só agora
+        } catch (erro) {
+            console.error('Erro ao carregar a notícia:', erro);
+            alert('Não foi possível carregar a notícia. Tente novamente mais tarde.');
+            return;
+        }
+
+        // Verifica se há notícia anterior ou próxima
+        const temAnterior = noticiaIndex > 0;
+        const temProxima = noticiaIndex < noticiasFiltradas.length - 1;
+
+        const urlNoticia = `${window.location.origin}${window.location.pathname}?noticia=${noticia.id}`;
+
+        modalBody.innerHTML = `
+            <div class="modal-header-unified">
+                <h3 class="modal-title-header">Notícia</h3>
+                <div class="modal-controls">
+                    <button id="nav-anterior" class="btn-modal-nav" title="Notícia Anterior" ${!temAnterior ? 'disabled' : ''}>
+                        <
+                    </button>
+                    <button id="nav-proxima" class="btn-modal-nav" title="Próxima Notícia" ${!temProxima ? 'disabled' : ''}>
+                        >
+                    </button>
+                    <button id="share-btn" class="btn-share" title="Compartilhar">
+                        Compartilhar
+                    </button>
+                    <button class="btn-modal-nav btn-modal-close" id="modal-close-btn" title="Fechar">
+                        x
+                    </button>
+                </div>
+            </div>
+
+            <h2 class="section-title text-left mb-2">${noticia.titulo}</h2>
+            <p class="section-subtitle text-left mb-3">${noticia.subtitulo}</p>
+            <p class="mb-3"><em>Publicado em: ${new Date(noticia.data).toLocaleDateString('pt-BR')}</em></p>
+            ${imagemResponsiva(noticia, 'foto_secundaria', '', '(max-width: 768px) 100vw, 800px', 'width:100%; height:auto; border-radius: 8px; margin-bottom: 1rem;')}
+            <div class="card-body">
+                <p>${noticia.conteudo.replace(/\n/g, '')}</p>
+                ${noticia.conteudo_adicional ? `
+                    <div class="conteudo-adicional mt-4">
+                        ${noticia.conteudo_adicional}
+                    </div>
+                ` : ''}
+            </div>
+        `;
+        modal.classList.add('active');
+
+        document.getElementById('modal-close-btn').addEventListener('click', fecharModal);
+
+        if (temAnterior) {
+            document.getElementById('nav-anterior').addEventListener('click', () => {
+                abrirModalComNoticia(noticiasFiltradas[noticiaIndex - 1].id);
+            });
+        }
+        if (temProxima) {
+            document.getElementById('nav-proxima').addEventListener('click', () => {
+                abrirModalComNoticia(noticiasFiltradas[noticiaIndex + 1].id);
+            });
+        }
+
+        // ===== LÓGICA DO BOTÃO COMPARTILHAR =====
+        const shareBtn = document.getElementById('share-btn');
+        shareBtn.addEventListener('click', async () => {
+            const shareData = {
+                title: noticia.titulo,
+                text: noticia.subtitulo,
+                url: urlNoticia
+            };
+
+            try {
+                // Tenta usar a API nativa de compartilhamento
+                if (navigator.share) {
+                    await navigator.share(shareData);
+                    console.log('Notícia compartilhada com sucesso!');
+                } else {
+                    // Fallback: Copia a URL para a área de transferência
+                    await navigator.clipboard.writeText(urlNoticia);
+                    alert('Link da notícia copiado para a área de transferência!');
+                }
+            } catch (err) {
+                console.error('Erro ao compartilhar:', err);
+                // Fallback caso o usuário cancele o compartilhamento ou ocorra um erro
+                await navigator.clipboard.writeText(urlNoticia);
+                alert('Não foi possível compartilhar, mas o link foi copiado para você!');
+            }
+        });
+    }
+
+    function abrirNoticiaFromURL() {
+        const params = new URLSearchParams(window.location.search);
+        const noticiaId = params.get('noticia');
+        if (noticiaId) {
+            // Aguarda um instante para garantir que as notícias já foram carregadas
+            setTimeout(() => {
+                // Verifica se a notícia existe antes de tentar abrir
+                if (todasAsNoticias.some(n => n.id === noticiaId)) {
+                    abrirModalComNoticia(noticiaId);
+                } else {
+                    console.warn('Notícia com ID da URL não encontrada.');
+                }
+            }, 500); // 500ms de espera
+        }
+    }
+
+    function filtrarNoticiasParaImpressao(dataInicial, dataFinal, categoria) {
+        let noticiasFiltradasImpressao = todasAsNoticias.filter(noticia => {
+            const dataNoticia = new Date(noticia.data + "T00:00:00");
+            let matchData = true;
+            let matchCategoria = true;
+
+            // Filtro por Data
+            if (dataInicial) {
+                const inicio = new Date(dataInicial + "T00:00:00");
+                if (dataNoticia < inicio) {
+                    matchData = false;
+                }
+            }
+            if (dataFinal) {
+                const final = new Date(dataFinal + "T00:00:00");
+                if (dataNoticia > final) {
+                    matchData = false;
+                }
+            }
+
+            // Filtro por Categoria (reutilizando a lógica de palavras-chave)
+            if (categoria !== 'todas') {
+                matchCategoria = noticia.categorias.includes(categoria);
+            }
+
+            return matchData && matchCategoria;
+        });
+
+        // Ordenar por data, mais recente primeiro
+        return noticiasFiltradasImpressao.sort((a, b) => new Date(b.data) - new Date(a.data));
+    }
+
+    // VERSÃO FINAL E DEFINITIVA PARA SITE ESTÁTICO
+    async function gerarVisualizacaoImpressao(noticias) {
+        let printContainer = document.getElementById('print-container-temp');
+        if (!printContainer) {
+            printContainer = document.createElement('div');
+            printContainer.id = 'print-container-temp';
+            document.body.appendChild(printContainer);
+        }
+        
+        // O jornal impresso usa o texto completo de cada notícia
+        try {
+            noticias = await Promise.all(noticias.map(noticia => carregarArtigo(noticia.id)));
+        } catch (erro) {
+            console.error('Erro ao carregar as notícias para impressão:', erro);
+            alert('Não foi possível carregar as notícias para impressão. Tente novamente mais tarde.');
+            printContainer.remove();
+            return;
+        }
+
+        // 1. Lógica da Capa
+        let materiaCapa = noticias[0]; // A primeira notícia já é a capa (devido à reorganização anterior)
+        let noticiasRestantes = noticias.slice(1);
+        
+        // 2. Montagem do HTML
+        const dataAtual = new Date().toLocaleDateString('pt-BR', { day: '2-digit', month: 'long', year: 'numeric' });
+        let corpoJornalHTML = `
+            <div class="print-header">
+                <h1 class="print-title">Jornal da Paróquia São Francisco de Assis</h1>
+                <p class="print-date">Edição de ${dataAtual}</p>
+            </div>
+            <div class="print-grid">
+        `;
+
+        // Adiciona a Capa
+        if (materiaCapa) { 
+            corpoJornalHTML += `
+                <div class="print-card print-capa">
+                    <h2 class="print-card-title">${materiaCapa.titulo}</h2>
+                    <p class="print-card-date">${new Date(materiaCapa.data + "T00:00:00").toLocaleDateString('pt-BR')}</p>
+                    ${materiaCapa.foto_principal ? `<img src="${urlDoSite(materiaCapa.foto_principal)}" alt="${materiaCapa.titulo}" class="print-card-img">` : ''}
+                    <p class="print-card-subtitle">${materiaCapa.subtitulo || ''}</p>
+                    <div class="print-card-content">${materiaCapa.conteudo}</div>
+                    ${materiaCapa.conteudo_adicional ? `<div class="print-card-extra">${materiaCapa.conteudo_adicional}</div>` : ''}
+                </div>
+            `; 
+        }
+
+        // Agrupa as notícias restantes por categoria
+        const noticiasPorCategoria = noticiasRestantes.reduce((acc, noticia) => { 
+            const cat = noticia.categoria || 'geral'; 
+            if (!acc[cat]) { acc[cat] = []; } 
+            acc[cat].push(noticia); 
+            return acc; 
+        }, {});
+
+        // Define a ordem de exibição das categorias
+        const ordemCategorias = ['eventos', 'catequese', 'avisos', 'geral'];
+
+        // Adiciona as notícias por categoria
+        ordemCategorias.forEach(categoria => { 
+            if (noticiasPorCategoria[categoria] && noticiasPorCategoria[categoria].length > 0) { 
+                const noticiasDaCategoria = noticiasPorCategoria[categoria]; 
+                
+                corpoJornalHTML += `<h2 class="print-category-title">${categoria.charAt(0).toUpperCase() + categoria.slice(1)}</h2>`; 
+                
+                // Separa destaques secundários (até 2)
+                const destaquesSecundarios = noticiasDaCategoria.filter(n => n.destaque).slice(0, 2); 
+                const noticiasNormais = noticiasDaCategoria.filter(n => !destaquesSecundarios.map(d => d.id).includes(n.id)); 
+                
+                // Adiciona destaques secundários
+                if (destaquesSecundarios.length > 0) { 
+                    corpoJornalHTML += `<div class="print-secondary-highlights">`; 
+                    destaquesSecundarios.forEach(noticia => { 
+                        corpoJornalHTML += `
+                            <div class="print-card print-destaque-secundario">
+                                <h3 class="print-card-title">${noticia.titulo}</h3>
+                                <p class="print-card-date">${new Date(noticia.data + "T00:00:00").toLocaleDateString('pt-BR')}</p>
+                                ${noticia.foto_principal ? `<img src="${urlDoSite(noticia.foto_principal)}" alt="${noticia.titulo}" class="print-card-img">` : ''}
+                                <div class="print-card-content">${noticia.conteudo.substring(0, 250)}...</div>
+                            </div>
+                        `; 
+                    }); 
+                    corpoJornalHTML += `</div>`; 
+                } 
+                
+                // Adiciona notícias normais
+                noticiasNormais.forEach(noticia => { 
+                    corpoJornalHTML += `
+                        <div class="print-card print-normal">
+                            <h4 class="print-card-title">${noticia.titulo}</h4>
+                            <p class="print-card-date">${new Date(noticia.data + "T00:00:00").toLocaleDateString('pt-BR')}</p>
+                            <div class="print-card-content">${noticia.conteudo}</div>
+                        </div>
+                    `; 
+                }); 
+            } 
+        });
+
+        corpoJornalHTML += `</div>`;
+
+        // 3. Injeta o HTML no container temporário
+        printContainer.innerHTML = corpoJornalHTML;
+
+        // 4. Adiciona uma classe ao <body> para ativar os estilos de impressão
+        document.body.classList.add('printing-active');
+
+        // 5. Um pequeno timeout para garantir que o DOM foi atualizado antes de imprimir
+        setTimeout(() => {
+            window.print(); // Chama a impressão nativa
+
+            // 7. Limpeza: remove a classe do body e reexibe o conteúdo principal
+            document.body.classList.remove('printing-active');
+            printContainer.remove(); // Remove o contêiner temporário
+        }, 250);
+    }
+
+    function fecharModal() {
+        modal.classList.remove('active');
+        modalBody.innerHTML = ''; // Limpa o conteúdo ao fechar
+    }
+
+    document.addEventListener('keydown', (e) => {
+        if (e.key === 'Escape') {
+            fecharModal();
+        }
+    });
+
+    imprimirBtn.addEventListener('click', () => {
+        closeMobileMenu();
+        atualizarSeletorDeCapa(); 
+        modalImpressao.style.zIndex = '9999'; 
+        modalImpressao.style.display = 'block';
+        modalImpressao.classList.add('active');
+    });
+
+    closeModalImpressaoBtn.addEventListener('click', () => {
+        modalImpressao.classList.remove('active');
+        modalImpressao.style.zIndex = '';
+        modalImpressao.style.display = ''; 
+    });
+
+    function atualizarSeletorDeCapa() {
+        const noticiasFiltradasParaImpressao = filtrarNoticiasParaImpressao(
+            dataInicialInput.value, 
+            dataFinalInput.value, 
+            categoriaImpressaoSelect.value
+        );
+        popularSeletorDeCapa(noticiasFiltradasParaImpressao);
+    }
+
+    // Adiciona os eventos de 'change' para chamar a função auxiliar
+    dataInicialInput.addEventListener('change', atualizarSeletorDeCapa);
+    dataFinalInput.addEventListener('change', atualizarSeletorDeCapa);
+    categoriaImpressaoSelect.addEventListener('change', atualizarSeletorDeCapa);
+
+    gerarImpressaoBtn.addEventListener('click', () => {
+        const dataInicial = dataInicialInput.value;
+        const dataFinal = dataFinalInput.value;
+        const categoria = categoriaImpressaoSelect.value;
+        const idCapaSelecionada = capaImpressaoSelect.value; // Pega o ID da capa escolhida
+
+        const noticiasParaImpressao = filtrarNoticiasParaImpressao(dataInicial, dataFinal, categoria);
+
+        if (noticiasParaImpressao.length === 0) {
+            alert('Nenhuma notícia encontrada com os filtros selecionados.');
+            return;
+        }
+
+        // Reorganiza a lista de notícias com base na capa selecionada
+        let noticiasOrganizadas = [];
+        if (idCapaSelecionada && idCapaSelecionada !== 'auto') {
+            const capaIndex = noticiasParaImpressao.findIndex(n => n.id === idCapaSelecionada);
+            if (capaIndex > -1) {
+                const [capa] = noticiasParaImpressao.splice(capaIndex, 1); // Remove a capa da lista
+                noticiasOrganizadas = [capa, ...noticiasParaImpressao]; // Coloca a capa no início
+            } else {
+                noticiasOrganizadas = noticiasParaImpressao; // Caso não encontre, usa a ordem padrão
+            }
+        } else {
+            noticiasOrganizadas = noticiasParaImpressao; // Ordem padrão (mais recente primeiro)
+        }
+
+        gerarVisualizacaoImpressao(noticiasOrganizadas);
+        modalImpressao.classList.remove('active');
+    });
+
+    function popularSeletorDeCapa(noticias) {
+        // Limpa opções antigas, mantendo a primeira
+        capaImpressaoSelect.innerHTML = '<option value="auto">Destaque Automático (mais recente)</option>';
+
+        let noticiasParaCapa = noticias.filter(noticia => noticia.destaque);
+
+        if (noticiasParaCapa.length === 0) {
+            noticiasParaCapa = noticias;
+        }
+
+        if (noticiasParaCapa.length > 0) {
+            // Use 'noticiasParaCapa' aqui, e não 'noticias'
+            const opcoesHTML = noticiasParaCapa.map(noticia => {
+                const tituloCurto = noticia.titulo.length > 50 ? noticia.titulo.substring(0, 50) + '...' : noticia.titulo;
+                return `<option value="${noticia.id}">${tituloCurto}</option>`;
+            }).join('');
+            
+            capaImpressaoSelect.innerHTML += opcoesHTML;
+        }
+    }
+
+    async function init() {
+        await carregarNoticias();
+        abrirNoticiaFromURL(); // Chama a função depois de carregar tudo
+        initMobileMenu();
+    }
+
+    init();
+});
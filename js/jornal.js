@@ -1,4 +1,14 @@
+// Raiz do site, calculada a partir deste script: as páginas pré-renderizadas pelo
+// gerenciador ficam em outras pastas (pages/jornal/ e pages/jornal/noticias/)
+const RAIZ_SITE = new URL('../', document.currentScript.src);
+
 document.addEventListener('DOMContentLoaded', () => {
+    // Página de uma notícia gerada pelo gerenciador: o conteúdo já está no HTML
+    if (document.body.dataset.pagina === 'artigo') {
+        initMobileMenu();
+        return;
+    }
+
     const destaqueContainer = document.getElementById('noticias-destaque');
     const recentesContainer = document.getElementById('noticias-recentes');
     const modal = document.getElementById('modal-noticia');
@@ -63,35 +73,48 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
 
+    // Arquivos gerados pelo gerenciador (data/publicacao_jornal.py): um manifesto leve,
+    // páginas com resumos e um arquivo por notícia com o corpo completo.
+    const PASTA_PUBLICACAO = new URL('data/jornal/', RAIZ_SITE).href;
+    const PASTA_PAGINAS = new URL('pages/', RAIZ_SITE);
+
+    // As imagens no jornal.json são relativas a pages/ ("../images/...")
+    function urlDoSite(caminho) {
+        return caminho && caminho.startsWith('../') ? new URL(caminho, PASTA_PAGINAS).href : caminho;
+    }
+    let manifesto = null;
+    const noticiaPorId = new Map();
+    const paginasCarregadas = new Map(); // número da página -> Promise
+    const artigosCarregados = new Map(); // id -> Promise
+
+    function categoriasDoTexto(noticia) {
+        const texto = (noticia.titulo + ' ' + noticia.conteudo).toLowerCase();
+        return Object.keys(mapaCategorias).filter(cat =>
+            mapaCategorias[cat].some(palavra => texto.includes(palavra))
+        );
+    }
+
     async function carregarNoticias() {
         try {
-            const response = await fetch('../data/jornal.json');
-            const dados = await response.json(); // Agora 'dados' contém { destaques: [...], noticias: [...] }
-
-            // Pega a lista de IDs que devem ser destaque
-            const idsDestaque = dados.destaques;
-
-            // Mapeia a lista de notícias original, adicionando a propriedade 'destaque: true' se o ID estiver na lista de destaques
-            const noticiasComDestaque = dados.noticias.map(noticia => {
-                let categoria = (noticia.categoria || Object.keys(mapaCategorias).find(cat => 
-                    mapaCategorias[cat].some(palavra => 
-                        (noticia.titulo + ' ' + noticia.conteudo).toLowerCase().includes(palavra)
-                    )
-                ) || 'geral').toLowerCase();
-
-                return { 
-                    ...noticia, 
-                    destaque: idsDestaque.includes(noticia.id),
-                    categoria: categoria // Usa a categoria do JSON ou a automática
-                };
-            });
+            let noticias;
+            try {
+                noticias = await carregarManifesto();
+            } catch (erroManifesto) {
+                // Sem os arquivos gerados, usa o jornal.json completo (como antes)
+                console.warn('Manifesto do jornal indisponível, carregando jornal.json:', erroManifesto);
+                noticias = await carregarArquivoCompleto();
+            }
 
-            // Agora, o resto do seu código funcionará como esperado!
-            todasAsNoticias = noticiasComDestaque.sort((a, b) => new Date(b.data) - new Date(a.data));
+            todasAsNoticias = noticias;
+            todasAsNoticias.forEach(noticia => noticiaPorId.set(noticia.id, noticia));
 
             popularFiltros(todasAsNoticias);
 
-            aplicarFiltros();
+            if (recentesContainer.dataset.estatico) {
+                ativarPaginaEstatica();
+            } else {
+                aplicarFiltros();
+            }
 
         } catch (error) {
             console.error('Erro ao carregar e processar notícias:', error);
@@ -99,6 +122,226 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
 
+    async function carregarManifesto() {
+        const response = await fetch(`${PASTA_PUBLICACAO}manifesto.json`);
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        manifesto = await response.json();
+
+        const idsDestaque = new Set(manifesto.destaques);
+        const noticias = manifesto.noticias.map(noticia => ({
+            ...noticia,
+            destaque: idsDestaque.has(noticia.id)
+        }));
+
+        // A primeira página (as mais recentes) já vem junto, para a primeira exibição
+        noticias.forEach(noticia => noticiaPorId.set(noticia.id, noticia));
+        if (manifesto.paginas.length > 0) {
+            await carregarPagina(1);
+        }
+        return noticias; // Já estão ordenadas por data
+    }
+
+    async function carregarArquivoCompleto() {
+        const response = await fetch(new URL('data/jornal.json', RAIZ_SITE));
+        const dados = await response.json(); // Agora 'dados' contém { destaques: [...], noticias: [...] }
+
+        // Pega a lista de IDs que devem ser destaque
+        const idsDestaque = dados.destaques;
+
+        // Mapeia a lista de notícias original, adicionando a propriedade 'destaque: true' se o ID estiver na lista de destaques
+        const noticiasComDestaque = dados.noticias.map(noticia => {
+            const categorias = categoriasDoTexto(noticia);
+            const categoria = (noticia.categoria || categorias[0] || 'geral').toLowerCase();
+
+            return {
+                ...noticia,
+                destaque: idsDestaque.includes(noticia.id),
+                categoria: categoria, // Usa a categoria do JSON ou a automática
+                categorias: categorias,
+                resumoCarregado: true,
+                completa: true
+            };
+        });
+
+        return noticiasComDestaque.sort((a, b) => new Date(b.data) - new Date(a.data));
+    }
+
+    function carregarPagina(numero) {
+        if (!paginasCarregadas.has(numero)) {
+            const promessa = fetch(`${PASTA_PUBLICACAO}${manifesto.paginas[numero - 1]}`)
+                .then(response => response.json())
+                .then(pagina => {
+                    pagina.noticias.forEach(({ id, subtitulo, resumo }) => {
+                        const noticia = noticiaPorId.get(id);
+                        if (noticia && !noticia.completa) {
+                            Object.assign(noticia, { subtitulo, conteudo: resumo, resumoCarregado: true });
+                        }
+                    });
+                })
+                .catch(erro => {
+                    paginasCarregadas.delete(numero); // Permite tentar de novo
+                    throw erro;
+                });
+            paginasCarregadas.set(numero, promessa);
+        }
+        return paginasCarregadas.get(numero);
+    }
+
+    // Garante que subtítulo e resumo das notícias informadas já foram baixados
+    function garantirResumos(noticias) {
+        const paginas = new Set(noticias.filter(n => !n.resumoCarregado).map(n => n.pagina));
+        return Promise.all([...paginas].map(carregarPagina));
+    }
+
+    // Baixa o corpo completo da notícia (só na primeira vez que ela é aberta)
+    function carregarArtigo(id) {
+        const noticia = noticiaPorId.get(id);
+        if (!noticia || noticia.completa) return Promise.resolve(noticia);
+
+        if (!artigosCarregados.has(id)) {
+            const arquivo = id.replace(/[^A-Za-z0-9_-]/g, '_');
+            const promessa = Promise.all([
+                fetch(`${PASTA_PUBLICACAO}artigos/${arquivo}.json`).then(response => response.json()),
+                garantirResumos([noticia])
+            ])
+                .then(([artigo]) => {
+                    Object.assign(noticia, artigo, { completa: true });
+                    return noticia;
+                })
+                .catch(erro => {
+                    artigosCarregados.delete(id);
+                    throw erro;
+                });
+            artigosCarregados.set(id, promessa);
+        }
+        return artigosCarregados.get(id);
+    }
+
+    // ===== BUSCA =====
+    // Índice invertido gerado pelo gerenciador (data/indice_busca.py), dividido pelas
+    // duas primeiras letras de cada termo: cada busca baixa só os blocos que precisa.
+    const PASTA_BUSCA = `${PASTA_PUBLICACAO}busca/`;
+    let indiceBusca = null; // Promise
+    const blocosBusca = new Map(); // prefixo -> Promise
+    let resultadoBusca = null; // Set de IDs encontrados (null = sem índice, usa a busca simples)
+    let buscaAtual = 0;
+    let temporizadorBusca = null;
+
+    function dobrarAcentos(texto) {
+        return texto.toLowerCase().normalize('NFD').replace(/[\u0300-\u036f]/g, '');
+    }
+
+    function carregarIndiceBusca() {
+        if (!indiceBusca) {
+            indiceBusca = fetch(`${PASTA_BUSCA}indice.json`)
+                .then(response => {
+                    if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                    return response.json();
+                })
+                .catch(erro => {
+                    indiceBusca = null;
+                    throw erro;
+                });
+        }
+        return indiceBusca;
+    }
+
+    function carregarBlocoBusca(prefixo) {
+        if (!blocosBusca.has(prefixo)) {
+            const promessa = fetch(`${PASTA_BUSCA}${prefixo}.json`)
+                .then(response => response.json())
+                .catch(erro => {
+                    blocosBusca.delete(prefixo);
+                    throw erro;
+                });
+            blocosBusca.set(prefixo, promessa);
+        }
+        return blocosBusca.get(prefixo);
+    }
+
+    // Documentos que contêm algum termo começando com 'termo' (busca binária na lista ordenada)
+    function documentosComPrefixo(bloco, termo) {
+        let inicio = 0;
+        let fim = bloco.termos.length;
+        while (inicio < fim) {
+            const meio = (inicio + fim) >> 1;
+            if (bloco.termos[meio] < termo) inicio = meio + 1;
+            else fim = meio;
+        }
+
+        const documentos = new Set();
+        for (let i = inicio; i < bloco.termos.length && bloco.termos[i].startsWith(termo); i++) {
+            const ocorrencias = bloco.ocorrencias[i];
+            for (let j = 0; j < ocorrencias.length; j += 2) {
+                documentos.add(ocorrencias[j]);
+            }
+        }
+        return documentos;
+    }
+
+    // Retorna o conjunto de IDs que contêm todos os termos da consulta, ou null se não der para usar o índice
+    async function buscarNoIndice(consulta) {
+        if (!manifesto) return null;
+
+        const indice = await carregarIndiceBusca();
+        const palavras = dobrarAcentos(consulta).match(/[a-z0-9]+/g) || [];
+        const ignoradas = new Set(indice.ignoradas);
+        // A última palavra pode estar incompleta (o visitante ainda está digitando)
+        const termos = palavras.filter((termo, i) =>
+            termo.length >= indice.tamanho_prefixo && (i === palavras.length - 1 || !ignoradas.has(termo))
+        );
+        if (termos.length === 0) return null;
+
+        let resultado = null;
+        for (const termo of termos) {
+            const prefixo = termo.slice(0, indice.tamanho_prefixo);
+            const documentos = indice.prefixos.includes(prefixo)
+                ? documentosComPrefixo(await carregarBlocoBusca(prefixo), termo)
+                : new Set();
+            resultado = resultado ? new Set([...resultado].filter(d => documentos.has(d))) : documentos;
+            if (resultado.size === 0) break;
+        }
+        return new Set([...resultado].map(documento => indice.documentos[documento]));
+    }
+
+    async function atualizarBusca() {
+        const consulta = filtroBusca.value.trim();
+        const numero = ++buscaAtual;
+
+        let resultado = null;
+        if (consulta) {
+            try {
+                resultado = await buscarNoIndice(consulta);
+            } catch (erro) {
+                console.warn('Índice de busca indisponível, usando a busca simples:', erro);
+            }
+        }
+        if (numero !== buscaAtual) return; // Já chegou outra tecla
+
+        resultadoBusca = resultado;
+        aplicarFiltros();
+    }
+
+    // Monta a imagem com as versões geradas pelo gerenciador (WebP + JPEG em vários tamanhos),
+    // para o navegador baixar a menor que sirva. Notícias antigas têm só o caminho simples.
+    function imagemResponsiva(noticia, campo, classe, sizes, estilo = '') {
+        const src = urlDoSite(noticia[campo]);
+        const versoes = noticia[`${campo}_srcset`];
+        const atributos = `alt="${noticia.titulo}"${classe ? ` class="${classe}"` : ''}${estilo ? ` style="${estilo}"` : ''}`;
+
+        if (!versoes || !versoes.webp || versoes.webp.length === 0) {
+            return `<img src="${src}" ${atributos} loading="lazy">`;
+        }
+
+        const srcset = lista => lista.map(([url, largura]) => `${urlDoSite(url)} ${largura}w`).join(', ');
+        return `
+            <picture>
+                <source type="image/webp" srcset="${srcset(versoes.webp)}" sizes="${sizes}">
+                <img src="${urlDoSite(versoes.src) || src}" srcset="${srcset(versoes.jpg)}" sizes="${sizes}" width="${versoes.largura}" height="${versoes.altura}" ${atributos} loading="lazy">
+            </picture>
+        `;
+    }
+
     function popularFiltros(noticias) {
         // 1. Pega todas as categorias e converte para minúsculas para evitar duplicatas.
         const categoriasBrutas = noticias.map(n => n.categoria.toLowerCase());
@@ -146,19 +389,20 @@ document.addEventListener('DOMContentLoaded', () => {
             let matchCategoria = true;
 
             if (categoriaSelecionada !== 'todas') {
-                const palavrasChave = mapaCategorias[categoriaSelecionada];
-                const textoCompleto = (noticia.titulo + ' ' + noticia.conteudo).toLowerCase();
                 // A notícia precisa conter pelo menos UMA das palavras-chave da categoria
-                matchCategoria = palavrasChave.some(palavra => textoCompleto.includes(palavra));
+                // (calculado de antemão, já que o texto completo só é baixado ao abrir a notícia)
+                matchCategoria = noticia.categorias.includes(categoriaSelecionada);
             }
             
             const d = new Date(noticia.data + "T00:00:00");
             const dataNoticia = `${d.getFullYear()}-${String(d.getMonth() + 1).padStart(2, '0')}`;
             const matchData = data === 'todas' || dataNoticia === data;
 
-            const matchBusca = busca === '' || 
-                               noticia.titulo.toLowerCase().includes(busca) || 
-                               noticia.conteudo.toLowerCase().includes(busca);
+            const matchBusca = busca === '' || (resultadoBusca
+                ? resultadoBusca.has(noticia.id)
+                : noticia.titulo.toLowerCase().includes(busca) || 
+                  (noticia.subtitulo || '').toLowerCase().includes(busca) ||
+                  (noticia.conteudo || '').toLowerCase().includes(busca));
 
             return matchCategoria && matchData && matchBusca;
         });
@@ -187,24 +431,55 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
 
+    // Página da listagem pré-renderizada pelo gerenciador (pages/jornal/): o HTML já
+    // está pronto, então só liga os cliques ao modal. Ao usar os filtros, a lista
+    // passa a ser montada aqui, como na página comum.
+    function ativarPaginaEstatica() {
+        noticiasFiltradas = [
+            ...todasAsNoticias.filter(n => n.destaque),
+            ...todasAsNoticias.filter(n => !n.destaque)
+        ];
+
+        document.querySelectorAll('#noticias-destaque [data-id], #noticias-recentes [data-id]').forEach(elemento => {
+            elemento.addEventListener('click', (e) => {
+                e.preventDefault(); // Sem JavaScript, o link leva à página da notícia
+                abrirModalComNoticia(elemento.dataset.id);
+            });
+        });
+    }
+
     filtroCategoria.addEventListener('change', aplicarFiltros);
     filtroData.addEventListener('change', aplicarFiltros);
-    filtroBusca.addEventListener('input', aplicarFiltros); // 'input' para filtrar enquanto digita
+    filtroBusca.addEventListener('input', () => { // 'input' para filtrar enquanto digita
+        clearTimeout(temporizadorBusca);
+        temporizadorBusca = setTimeout(atualizarBusca, 150);
+    });
     limparFiltrosBtn.addEventListener('click', () => {
         filtroCategoria.value = 'todas';
         filtroData.value = 'todas';
         filtroBusca.value = '';
+        resultadoBusca = null;
+        buscaAtual++;
         aplicarFiltros();
     });
 
-    function exibirDestaques(noticias) {
+    let exibicaoDestaques = 0;
+    let exibicaoRecentes = 0;
+
+    async function exibirDestaques(noticias) {
+        const exibicao = ++exibicaoDestaques;
         if (noticias.length === 0) {
             destaqueContainer.style.display = 'none';
             return;
         }
+
+        await garantirResumos(noticias);
+        if (exibicao !== exibicaoDestaques) return; // Os filtros mudaram enquanto baixava
+
+        destaqueContainer.style.display = '';
         destaqueContainer.innerHTML = noticias.map(noticia => `
             <div class="card card-destaque">
-                <img src="${noticia.foto_principal}" alt="${noticia.titulo}" class="card-img-top">
+                ${imagemResponsiva(noticia, 'foto_principal', 'card-img-top', '(max-width: 768px) 100vw, 33vw')}
                 <div class="card-body">
                     <span class="badge badge-primary">Destaque</span>
                     <h3 class="card-title">${noticia.titulo}</h3>
@@ -224,8 +499,8 @@ document.addEventListener('DOMContentLoaded', () => {
         });
     }
 
-    function exibirRecentes(noticias) {
-        recentesContainer.innerHTML = ''; // Limpa o container
+    async function exibirRecentes(noticias) {
+        const exibicao = ++exibicaoRecentes;
 
         if (noticias.length === 0) {
             recentesContainer.innerHTML = '<p class="alert alert-info">Nenhuma notícia encontrada com os filtros selecionados.</p>';
@@ -237,6 +512,12 @@ document.addEventListener('DOMContentLoaded', () => {
         const fim = inicio + itensPorPagina;
         const itensDaPagina = noticias.slice(inicio, fim);
 
+        // Baixa só os resumos das notícias desta página
+        await garantirResumos(itensDaPagina);
+        if (exibicao !== exibicaoRecentes) return; // Os filtros mudaram enquanto baixava
+
+        recentesContainer.innerHTML = ''; // Limpa o container
+
         itensDaPagina.forEach((noticia, index) => {
             const isDestaque = noticia.destaque ? ' is-destaque' : '';
 	        const destaqueBadge = noticia.destaque ? '<span class="badge badge-destaque">DESTAQUE</span>' : '';
@@ -244,7 +525,7 @@ document.addEventListener('DOMContentLoaded', () => {
             const cardHTML = `
 	                <div class="card card-noticia${isDestaque}" data-id="${noticia.id}">
 	                    <div class="noticia-imagem">
-	                        <img src="${noticia.foto_principal}" alt="${noticia.titulo}" class="card-img-list">
+	                        ${imagemResponsiva(noticia, 'foto_principal', 'card-img-list', '(max-width: 768px) 100vw, 300px')}
 	                    </div>
 	                    <div class="noticia-conteudo">
 	                        ${destaqueBadge}
@@ -306,11 +587,18 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
 
-    function abrirModalComNoticia(id) {
+    async function abrirModalComNoticia(id) {
         const noticiaIndex = noticiasFiltradas.findIndex(n => n.id === id);
         if (noticiaIndex === -1) return;
 
-        const noticia = noticiasFiltradas[noticiaIndex];
+        let noticia;
+        try {
+            noticia = await carregarArtigo(id); // O corpo da notícia é baixado só agora
+        } catch (erro) {
+            console.error('Erro ao carregar a notícia:', erro);
+            alert('Não foi possível carregar a notícia. Tente novamente mais tarde.');
+            return;
+        }
 
         // Verifica se há notícia anterior ou próxima
         const temAnterior = noticiaIndex > 0;
@@ -340,7 +628,7 @@ document.addEventListener('DOMContentLoaded', () => {
             <h2 class="section-title text-left mb-2">${noticia.titulo}</h2>
             <p class="section-subtitle text-left mb-3">${noticia.subtitulo}</p>
             <p class="mb-3"><em>Publicado em: ${new Date(noticia.data).toLocaleDateString('pt-BR')}</em></p>
-            <img src="${noticia.foto_secundaria}" alt="${noticia.titulo}" style="width:100%; border-radius: 8px; margin-bottom: 1rem;">
+            ${imagemResponsiva(noticia, 'foto_secundaria', '', '(max-width: 768px) 100vw, 800px', 'width:100%; height:auto; border-radius: 8px; margin-bottom: 1rem;')}
             <div class="card-body">
                 <p>${noticia.conteudo.replace(/\n/g, '')}</p>
                 ${noticia.conteudo_adicional ? `
@@ -431,9 +719,7 @@ document.addEventListener('DOMContentLoaded', () => {
 
             // Filtro por Categoria (reutilizando a lógica de palavras-chave)
             if (categoria !== 'todas') {
-                const palavrasChave = mapaCategorias[categoria] || [];
-                const textoCompleto = (noticia.titulo + ' ' + noticia.conteudo).toLowerCase();
-                matchCategoria = palavrasChave.some(palavra => textoCompleto.includes(palavra));
+                matchCategoria = noticia.categorias.includes(categoria);
             }
 
             return matchData && matchCategoria;
@@ -452,6 +738,16 @@ document.addEventListener('DOMContentLoaded', () => {
             document.body.appendChild(printContainer);
         }
         
+        // O jornal impresso usa o texto completo de cada notícia
+        try {
+            noticias = await Promise.all(noticias.map(noticia => carregarArtigo(noticia.id)));
+        } catch (erro) {
+            console.error('Erro ao carregar as notícias para impressão:', erro);
+            alert('Não foi possível carregar as notícias para impressão. Tente novamente mais tarde.');
+            printContainer.remove();
+            return;
+        }
+
         // 1. Lógica da Capa
         let materiaCapa = noticias[0]; // A primeira notícia já é a capa (devido à reorganização anterior)
         let noticiasRestantes = noticias.slice(1);
@@ -472,7 +768,7 @@ document.addEventListener('DOMContentLoaded', () => {
                 <div class="print-card print-capa">
                     <h2 class="print-card-title">${materiaCapa.titulo}</h2>
                     <p class="print-card-date">${new Date(materiaCapa.data + "T00:00:00").toLocaleDateString('pt-BR')}</p>
-                    ${materiaCapa.foto_principal ? `<img src="${materiaCapa.foto_principal}" alt="${materiaCapa.titulo}" class="print-card-img">` : ''}
+                    ${materiaCapa.foto_principal ? `<img src="${urlDoSite(materiaCapa.foto_principal)}" alt="${materiaCapa.titulo}" class="print-card-img">` : ''}
                     <p class="print-card-subtitle">${materiaCapa.subtitulo || ''}</p>
                     <div class="print-card-content">${materiaCapa.conteudo}</div>
                     ${materiaCapa.conteudo_adicional ? `<div class="print-card-extra">${materiaCapa.conteudo_adicional}</div>` : ''}
@@ -510,7 +806,7 @@ document.addEventListener('DOMContentLoaded', () => {
                             <div class="print-card print-destaque-secundario">
                                 <h3 class="print-card-title">${noticia.titulo}</h3>
                                 <p class="print-card-date">${new Date(noticia.data + "T00:00:00").toLocaleDateString('pt-BR')}</p>
-                                ${noticia.foto_principal ? `<img src="${noticia.foto_principal}" alt="${noticia.titulo}" class="print-card-img">` : ''}
+                                ${noticia.foto_principal ? `<img src="${urlDoSite(noticia.foto_principal)}" alt="${noticia.titulo}" class="print-card-img">` : ''}
                                 <div class="print-card-content">${noticia.conteudo.substring(0, 250)}...</div>
                             </div>
                         `; 
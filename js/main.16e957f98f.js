@@ -0,0 +1,603 @@
+// Main JavaScript functionality
+document.addEventListener('DOMContentLoaded', function() {
+    // Initialize all components
+    initNavigation();
+    initMobileMenu();
+    initSmoothScroll();
+    initTimelineToggle();
+    initModals();
+    loadContent();
+    carregarProximaMissaFestiva();
+    carregarProximoEvento();
+    carregarInfoAleatoria();
+    initJogosToast();
+});
+
+// Dados da página inicial: um único pacote, gerado pelo gerenciador (data/pacotes_paginas.py)
+// com só os campos usados. A promessa é compartilhada por main.js, timeline.js, events.js e gallery.js.
+const ARQUIVOS_PACOTE_INICIO = {
+    informacoes: 'data/informacoes.a883ea11af.json',
+    agenda: 'data/agenda/proximos.json',
+    historia: 'data/historia.18cabec479.json',
+    missas: 'data/missas.015a1fb7cd.json',
+    fotos: 'data/fotos.648d7a0ddb.json'
+};
+let pacoteInicio = null;
+
+function carregarPacoteInicio() {
+    if (!pacoteInicio) {
+        pacoteInicio = fetch('data/pacote-inicio.a625248cca.json')
+            .then(response => {
+                if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                return response.json();
+            })
+            .catch(async () => {
+                // Sem o pacote (ainda não gerado), busca os arquivos separados
+                const chaves = Object.keys(ARQUIVOS_PACOTE_INICIO);
+                const valores = await Promise.all(chaves.map(chave => fetch(ARQUIVOS_PACOTE_INICIO[chave]).then(r => r.json())));
+                return Object.fromEntries(chaves.map((chave, i) => [chave, valores[i]]));
+            });
+    }
+    return pacoteInicio;
+}
+
+async function carregarInfoAleatoria() {
+    try {
+        const data = (await carregarPacoteInicio()).informacoes;
+        const informacoes = data.informacoes;
+
+        // Escolhe um índice aleatório da lista de informações
+        const indiceAleatorio = Math.floor(Math.random() * informacoes.length);
+        const info = informacoes[indiceAleatorio];
+
+        const card = document.getElementById('card-info-aleatoria');
+        if (card && info) {
+            card.querySelector('h3').textContent = info.titulo;
+            card.querySelector('.highlight-time').textContent = info.subtitulo;
+            card.querySelector('p:last-of-type').textContent = info.texto;
+        }
+    } catch (error) {
+        console.error('Erro ao carregar informação aleatória:', error);
+    }
+}
+
+// Data local de hoje no formato AAAA-MM-DD, o mesmo das datas da agenda
+function dataDeHoje() {
+    const hoje = new Date();
+    const mes = String(hoje.getMonth() + 1).padStart(2, '0');
+    const dia = String(hoje.getDate()).padStart(2, '0');
+    return `${hoje.getFullYear()}-${mes}-${dia}`;
+}
+
+async function carregarProximoEvento() {
+    try {
+        // Próximos eventos já em ordem de data, gerados pelo gerenciador (data/agenda_eventos.py).
+        // A lista pode ter sido gerada alguns dias atrás, então os dias que já passaram são descartados aqui.
+        const eventos = (await carregarPacoteInicio()).agenda.eventos;
+        const hoje = dataDeHoje();
+
+        let proximoEvento = null;
+        let proximaData = null;
+        for (const evento of eventos) {
+            proximaData = evento.datas.find(data => data >= hoje);
+            if (proximaData) {
+                proximoEvento = evento;
+                break;
+            }
+        }
+
+        const card = document.getElementById('card-proximo-evento');
+        if (card && proximoEvento) {
+            // Adiciona 'T00:00:00' para garantir que a data seja interpretada no fuso local
+            const dataEventoCorreta = new Date(proximaData + "T00:00:00");
+            const dataFormatada = dataEventoCorreta.toLocaleDateString('pt-BR', { day: 'numeric', month: 'long' });
+
+            card.querySelector('h3').textContent = proximoEvento.titulo;
+            card.querySelector('.highlight-time').textContent = `${dataFormatada}, ${proximoEvento.horario}`;
+            // Usamos uma versão curta da descrição para o card
+            card.querySelector('p:last-of-type').textContent = proximoEvento.descricao.substring(0, 50) + '...';
+        } else if (card) {
+            card.querySelector('.highlight-time').textContent = "Nenhum evento agendado.";
+            card.querySelector('p:last-of-type').textContent = "Fique atento para futuras atualizações.";
+        }
+    } catch (error) {
+        console.error('Erro ao carregar próximo evento:', error);
+    }
+}
+
+async function carregarProximaMissaFestiva() {
+    try {
+        const missas = (await carregarPacoteInicio()).agenda.missas_festivas;
+
+        // Encontra a primeira missa cuja data é hoje ou no futuro (as datas AAAA-MM-DD comparam como texto)
+        const hoje = dataDeHoje();
+        const proximaMissa = missas.find(missa => missa.data >= hoje);
+
+        const card = document.getElementById('card-missa-festiva');
+        if (card && proximaMissa) {
+            const dataFormatada = new Date(proximaMissa.data + "T00:00:00").toLocaleDateString('pt-BR', { day: '2-digit', month: 'long' });
+            
+            card.querySelector('h3').textContent = proximaMissa.titulo;
+            card.querySelector('.highlight-time').textContent = `${dataFormatada}, ${proximaMissa.horario}`;
+            card.querySelector('p:last-of-type').textContent = proximaMissa.descricao;
+        } else if (card) {
+            // Mensagem caso não haja mais missas futuras no JSON
+            card.querySelector('.highlight-time').textContent = "Nenhuma missa festiva agendada.";
+            card.querySelector('p:last-of-type').textContent = "Consulte a secretaria para mais informações.";
+        }
+    } catch (error) {
+        console.error('Erro ao carregar missas festivas:', error);
+    }
+}
+
+// Navigation functionality
+function initNavigation() {
+    const navLinks = document.querySelectorAll('.nav-link');
+    const sections = document.querySelectorAll('.section');
+    
+    // Handle navigation clicks
+    navLinks.forEach(link => {
+        link.addEventListener('click', function(e) {
+            const href = this.getAttribute('href');
+
+            if (href.startsWith('#')) {
+                e.preventDefault(); // só bloqueia se for âncora interna
+                const targetId = href.substring(1);
+                const targetSection = document.getElementById(targetId);
+                
+                if (targetSection) {
+                    // Update active nav link
+                    navLinks.forEach(l => l.classList.remove('active'));
+                    this.classList.add('active');
+                    
+                    // Scroll to section
+                    targetSection.scrollIntoView({
+                        behavior: 'smooth',
+                        block: 'start'
+                    });
+                    
+                    // Close mobile menu if open
+                    closeMobileMenu();
+                }
+            }
+            // se não for "#", deixa o navegador seguir normalmente
+        });
+    });
+    
+    // Handle scroll spy
+    window.addEventListener('scroll', function() {
+        let current = '';
+        sections.forEach(section => {
+            const sectionTop = section.offsetTop;
+            const sectionHeight = section.clientHeight;
+            if (pageYOffset >= sectionTop - 100) {
+                current = section.getAttribute('id');
+            }
+        });
+        
+        navLinks.forEach(link => {
+            link.classList.remove('active');
+            if (link.getAttribute('href') === '#' + current) {
+                link.classList.add('active');
+            }
+        });
+    });
+}
+
+function initTimelineToggle() {
+    const toggleBtn = document.getElementById('toggle-timeline-btn');
+    const timelineWrapper = document.getElementById('timeline-wrapper');
+
+    if (!toggleBtn || !timelineWrapper) {
+        console.error("Botão ou wrapper da timeline não encontrado.");
+        return;
+    }
+
+    toggleBtn.addEventListener('click', function() {
+        // Alterna a classe 'active' no wrapper
+        const isVisible = timelineWrapper.classList.toggle('active');
+
+        // Muda o texto do botão para indicar a ação
+        if (isVisible) {
+            this.innerHTML = '<i class="fas fa-eye-slash"></i> Ocultar Linha do Tempo';
+            // Rola suavemente para o início da timeline após ela aparecer
+            setTimeout(() => {
+                timelineWrapper.scrollIntoView({
+                    behavior: 'smooth',
+                    block: 'start'
+                });
+            }, 300); // Um pequeno delay para a animação começar
+        } else {
+            this.innerHTML = '<i class="fas fa-stream"></i> Explorar Linha do Tempo';
+        }
+    });
+}
+
+// Mobile menu functionality
+function initMobileMenu() {
+    const mobileMenuBtn = document.getElementById('mobile-menu-btn');
+    const nav = document.getElementById('nav');
+    
+    if (mobileMenuBtn && nav) {
+        mobileMenuBtn.addEventListener('click', function() {
+            this.classList.toggle('active');
+            nav.classList.toggle('active');
+        });
+        
+        // Close menu when clicking outside
+        document.addEventListener('click', function(e) {
+            if (!nav.contains(e.target) && !mobileMenuBtn.contains(e.target)) {
+                closeMobileMenu();
+            }
+        });
+        
+        // Close menu on window resize
+        window.addEventListener('resize', function() {
+            if (window.innerWidth > 768) {
+                closeMobileMenu();
+            }
+        });
+    }
+}
+
+function closeMobileMenu() {
+    const mobileMenuBtn = document.getElementById('mobile-menu-btn');
+    const nav = document.getElementById('nav');
+    
+    if (mobileMenuBtn && nav) {
+        mobileMenuBtn.classList.remove('active');
+        nav.classList.remove('active');
+    }
+}
+
+// Smooth scroll functionality
+function initSmoothScroll() {
+    // Already handled in navigation, but can be extended for other links
+    const allLinks = document.querySelectorAll('a[href^="#"]');
+    
+    allLinks.forEach(link => {
+        if (!link.classList.contains('nav-link')) {
+            link.addEventListener('click', function(e) {
+                const href = this.getAttribute('href');
+                if (href.startsWith('#')) {
+                    e.preventDefault();
+                    const targetId = href.substring(1);
+                    const targetElement = document.getElementById(targetId);
+                    
+                    if (targetElement) {
+                        targetElement.scrollIntoView({
+                            behavior: 'smooth',
+                            block: 'start'
+                        });
+                    }
+                }
+            });
+        }
+    });
+}
+
+// Modal functionality
+function initModals() {
+    const modals = document.querySelectorAll('.modal');
+    const modalCloses = document.querySelectorAll('.modal-close');
+    
+    // Close modal when clicking close button
+    modalCloses.forEach(close => {
+        close.addEventListener('click', function() {
+            const modal = this.closest('.modal');
+            closeModal(modal);
+        });
+    });
+    
+    // Close modal when clicking outside
+    modals.forEach(modal => {
+        modal.addEventListener('click', function(e) {
+            if (e.target === this) {
+                closeModal(this);
+            }
+        });
+    });
+    
+    // Close modal with Escape key
+    document.addEventListener('keydown', function(e) {
+        if (e.key === 'Escape') {
+            const activeModal = document.querySelector('.modal.active');
+            if (activeModal) {
+                closeModal(activeModal);
+            }
+        }
+    });
+}
+
+function openModal(modalId) {
+    const modal = document.getElementById(modalId);
+    if (modal) {
+        modal.classList.add('active');
+        document.body.style.overflow = 'hidden';
+    }
+}
+
+function closeModal(modal) {
+    if (modal) {
+        modal.classList.remove('active');
+        document.body.style.overflow = '';
+    }
+}
+
+// Load content from JSON files
+async function loadContent() {
+    try {
+        // Load all data (one request for the whole page)
+        const pacote = await carregarPacoteInicio();
+        
+        // Populate content
+        populateTimeline(pacote.historia);
+        populateMissas(pacote.missas);
+        populateGaleria(pacote.fotos);
+        
+    } catch (error) {
+        console.error('Error loading content:', error);
+        showErrorMessage('Erro ao carregar conteúdo. Tente recarregar a página.');
+    }
+}
+
+// Populate timeline
+function populateTimeline(data) {
+    const timeline = document.getElementById('timeline');
+    const timelineDetails = document.getElementById('timeline-details');
+    
+    if (!timeline || !data.timeline) return;
+    
+    timeline.innerHTML = '';
+    
+    data.timeline.forEach((item, index) => {
+        const timelineItem = document.createElement('div');
+        timelineItem.className = 'timeline-item';
+        timelineItem.innerHTML = `
+            <div class="timeline-point"></div>
+            <div class="timeline-content">
+                <div class="timeline-year">${item.ano}</div>
+                <div class="timeline-title">${item.titulo}</div>
+            </div>
+        `;
+        
+        timelineItem.addEventListener('click', function() {
+            // Remove active class from all items
+            document.querySelectorAll('.timeline-item').forEach(i => i.classList.remove('active'));
+            // Add active class to clicked item
+            this.classList.add('active');
+            
+            // Update details
+            timelineDetails.innerHTML = `
+                <div class="timeline-detail-card">
+                    <h3>${item.titulo} (${item.ano})</h3>
+                    <img src="${item.imagem}" alt="${item.titulo}" onerror="this.style.display='none'">
+                    <p>${item.descricao}</p>
+                </div>
+            `;
+        });
+        
+        timeline.appendChild(timelineItem);
+        
+        // Auto-select first item
+        if (index === 0) {
+            timelineItem.click();
+        }
+    });
+}
+
+// Populate missas
+function populateMissas(data) {
+    const horariosGrid = document.getElementById('horarios-grid');
+    const eventosEspeciaisGrid = document.getElementById('eventos-especiais-grid');
+    
+    if (!horariosGrid || !data.horarios_regulares) return;
+    
+    // Regular schedules
+    horariosGrid.innerHTML = '';
+    Object.entries(data.horarios_regulares).forEach(([dia, info]) => {
+        const card = document.createElement('div');
+        card.className = `horario-card ${info.destaque ? 'destaque' : ''}`;
+        card.innerHTML = `
+            <div class="horario-dia">${dia}</div>
+            <ul class="horario-lista">
+                ${info.horarios.map(horario => `<li>${horario}</li>`).join('')}
+            </ul>
+            ${info.observacao ? `<div class="horario-observacao">${info.observacao}</div>` : ''}
+        `;
+        horariosGrid.appendChild(card);
+    });
+    
+    // Special events
+    if (eventosEspeciaisGrid && data.eventos_especiais) {
+        eventosEspeciaisGrid.innerHTML = '';
+        data.eventos_especiais.forEach(evento => {
+            const card = document.createElement('div');
+            card.className = 'evento-especial-card';
+            card.innerHTML = `
+                <img src="${evento.imagem}" alt="${evento.nome}" onerror="this.style.display='none'">
+                <div class="evento-especial-content">
+                    <h4>${evento.nome}</h4>
+                    <p>${evento.descricao}</p>
+                </div>
+            `;
+            eventosEspeciaisGrid.appendChild(card);
+        });
+    }
+}
+
+// Fotos da galeria: só o nome do arquivo (formato antigo) ou o objeto gerado por data/galeria.py,
+// com largura, altura, miniatura e placeholder
+function dadosFoto(foto, pasta) {
+    const info = typeof foto === 'string' ? { arquivo: foto } : foto;
+    const src = /^(https?:)?\/\//.test(info.arquivo) ? info.arquivo : pasta + info.arquivo;
+    return { ...info, src };
+}
+
+function capaSecao(secao) {
+    return secao.capa ? dadosFoto(secao.capa, '') : { src: secao.thumbnail };
+}
+
+// Miniatura com as dimensões reservadas e o placeholder borrado de fundo até ela carregar
+function imagemGaleria(info, alt) {
+    const dimensoes = info.largura && info.altura ? ` width="${info.largura}" height="${info.altura}"` : '';
+    const fundo = info.placeholder ? ` style="background-image: url('${info.placeholder}')"` : '';
+    const img = `<img src="${info.miniatura || info.src}" alt="${alt}"${dimensoes}${fundo} class="foto-placeholder" loading="lazy" decoding="async" onerror="this.onerror=null; this.src='images/galeria/placeholder.jpg'">`;
+    return info.miniatura_webp ? `<picture><source type="image/webp" srcset="${info.miniatura_webp}">${img}</picture>` : img;
+}
+
+// Populate galeria
+function populateGaleria(data) {
+    const galeriaGrid = document.getElementById('galeria-grid');
+    
+    if (!galeriaGrid || !data.secoes) return;
+    
+    galeriaGrid.innerHTML = '';
+    
+    Object.entries(data.secoes).forEach(([key, secao]) => {
+        const galeriaSecao = document.createElement('div');
+        galeriaSecao.className = 'galeria-secao';
+        galeriaSecao.innerHTML = `
+            ${imagemGaleria(capaSecao(secao), secao.nome)}
+            <div class="galeria-secao-content">
+                <h3>${secao.nome}</h3>
+                <div class="galeria-secao-count">${secao.total_fotos} fotos</div>
+                <p>${secao.descricao}</p>
+            </div>
+        `;
+        
+        galeriaSecao.addEventListener('click', function() {
+            showGaleriaSecao(key, secao);
+        });
+        
+        galeriaGrid.appendChild(galeriaSecao);
+    });
+}
+
+// Show galeria section
+function showGaleriaSecao(key, secao) {
+    const modalContent = document.getElementById('foto-modal-content');
+    
+    let subgaleriasHTML = '';
+    if (secao.subgalerias) {
+        subgaleriasHTML = secao.subgalerias.map(sub => `
+            <div class="subgaleria">
+                <h4>${sub.nome}</h4>
+                <div class="image-grid">
+                    ${sub.fotos.map(foto => {
+                        return`
+                        <div class="image-item">
+                            ${imagemGaleria(dadosFoto(foto, secao.pasta), sub.nome)}
+                            <div class="image-overlay">
+                                <span>Ver imagem</span>
+                            </div>
+                        </div>
+                    `}).join('')}
+                </div>
+            </div>
+        `).join('');
+    }
+    
+    modalContent.innerHTML = `
+        <h3>${secao.nome}</h3>
+        <p>${secao.descricao}</p>
+        <div class="galeria-content">
+            ${subgaleriasHTML}
+        </div>
+    `;
+    
+    openModal('foto-modal');
+}
+
+// Utility functions
+function formatDate(dateString) {
+    const date = new Date(dateString);
+    return date.toLocaleDateString('pt-BR', {
+        day: '2-digit',
+        month: '2-digit',
+        year: 'numeric'
+    });
+}
+
+function showErrorMessage(message) {
+    const errorDiv = document.createElement('div');
+    errorDiv.className = 'alert alert-error';
+    errorDiv.innerHTML = message;
+    
+    const container = document.querySelector('.container');
+    if (container) {
+        container.insertBefore(errorDiv, container.firstChild);
+        
+        setTimeout(() => {
+            errorDiv.remove();
+        }, 5000);
+    }
+}
+
+// Loading state management
+function showLoading(element) {
+    if (element) {
+        element.innerHTML = '<div class="loading"></div>';
+    }
+}
+
+function hideLoading(element) {
+    if (element) {
+        const loading = element.querySelector('.loading');
+        if (loading) {
+            loading.remove();
+        }
+    }
+}
+
+// Intersection Observer for animations
+function initScrollAnimations() {
+    const observerOptions = {
+        threshold: 0.1,
+        rootMargin: '0px 0px -50px 0px'
+    };
+    
+    const observer = new IntersectionObserver((entries) => {
+        entries.forEach(entry => {
+            if (entry.isIntersecting) {
+                entry.target.classList.add('animate-in');
+            }
+        });
+    }, observerOptions);
+    
+    // Observe elements that should animate
+    document.querySelectorAll('.card, .timeline-item, .highlight-card').forEach(el => {
+        observer.observe(el);
+    });
+}
+
+// Função para controlar o balão flutuante de convite para os jogos
+function initJogosToast() {
+    const jogosToast = document.getElementById('jogos-toast');
+    const closeBtn = document.getElementById('jogos-toast-close');
+
+    if (!jogosToast || !closeBtn) return;
+
+    // Função para fechar o toast
+    const closeToast = () => {
+        jogosToast.classList.remove('show');
+    };
+
+    // Verifica se o usuário já viu o toast nesta sessão
+    if (sessionStorage.getItem('jogosToastVisto')) {
+        return;
+    }
+
+    // Abre o toast após 5 segundos
+    setTimeout(() => {
+        jogosToast.classList.add('show');
+        sessionStorage.setItem('jogosToastVisto', 'true'); // Marca como visto
+    }, 5000);
+
+    // Fecha ao clicar no 'X'
+    closeBtn.addEventListener('click', closeToast);
+}
+
+// Initialize scroll animations after content is loaded
+setTimeout(initScrollAnimations, 1000);
+
@@ -13,10 +13,37 @@ document.addEventListener('DOMContentLoaded', function() {
     initJogosToast();
 });
 
+// Dados da página inicial: um único pacote, gerado pelo gerenciador (data/pacotes_paginas.py)
+// com só os campos usados. A promessa é compartilhada por main.js, timeline.js, events.js e gallery.js.
+const ARQUIVOS_PACOTE_INICIO = {
+    informacoes: 'data/informacoes.json',
+    agenda: 'data/agenda/proximos.json',
+    historia: 'data/historia.json',
+    missas: 'data/missas.json',
+    fotos: 'data/fotos.json'
+};
+let pacoteInicio = null;
+
+function carregarPacoteInicio() {
+    if (!pacoteInicio) {
+        pacoteInicio = fetch('data/pacote-inicio.json')
+            .then(response => {
+                if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                return response.json();
+            })
+            .catch(async () => {
+                // Sem o pacote (ainda não gerado), busca os arquivos separados
+                const chaves = Object.keys(ARQUIVOS_PACOTE_INICIO);
+                const valores = await Promise.all(chaves.map(chave => fetch(ARQUIVOS_PACOTE_INICIO[chave]).then(r => r.json())));
+                return Object.fromEntries(chaves.map((chave, i) => [chave, valores[i]]));
+            });
+    }
+    return pacoteInicio;
+}
+
 async function carregarInfoAleatoria() {
     try {
-        const response = await fetch('data/informacoes.json');
-        const data = await response.json();
+        const data = (await carregarPacoteInicio()).informacoes;
         const informacoes = data.informacoes;
 
         // Escolhe um índice aleatório da lista de informações
@@ -34,37 +61,35 @@ async function carregarInfoAleatoria() {
     }
 }
 
+// Data local de hoje no formato AAAA-MM-DD, o mesmo das datas da agenda
+function dataDeHoje() {
+    const hoje = new Date();
+    const mes = String(hoje.getMonth() + 1).padStart(2, '0');
+    const dia = String(hoje.getDate()).padStart(2, '0');
+    return `${hoje.getFullYear()}-${mes}-${dia}`;
+}
+
 async function carregarProximoEvento() {
     try {
-        const response = await fetch('data/eventos.json');
-        const data = await response.json();
-        
-        const todosEventos = [];
-        // Coleta todos os eventos de todos os anos e meses em uma única lista
-        for (const ano in data.anos) {
-            for (const mes in data.anos[ano]) {
-                data.anos[ano][mes].forEach(evento => {
-                    todosEventos.push(evento);
-                });
+        // Próximos eventos já em ordem de data, gerados pelo gerenciador (data/agenda_eventos.py).
+        // A lista pode ter sido gerada alguns dias atrás, então os dias que já passaram são descartados aqui.
+        const eventos = (await carregarPacoteInicio()).agenda.eventos;
+        const hoje = dataDeHoje();
+
+        let proximoEvento = null;
+        let proximaData = null;
+        for (const evento of eventos) {
+            proximaData = evento.datas.find(data => data >= hoje);
+            if (proximaData) {
+                proximoEvento = evento;
+                break;
             }
         }
 
-        // Ordena os eventos por data
-        todosEventos.sort((a, b) => new Date(a.data) - new Date(b.data));
-
-        const hoje = new Date();
-        hoje.setHours(0, 0, 0, 0);
-
-        // Encontra o primeiro evento futuro
-        const proximoEvento = todosEventos.find(evento => {
-            // Adiciona 'T00:00:00' para garantir que a data seja interpretada no fuso local
-            const dataEvento = new Date(evento.data + "T00:00:00");
-            return dataEvento >= hoje;
-        });
-
         const card = document.getElementById('card-proximo-evento');
         if (card && proximoEvento) {
-            const dataEventoCorreta = new Date(proximoEvento.data + "T00:00:00");
+            // Adiciona 'T00:00:00' para garantir que a data seja interpretada no fuso local
+            const dataEventoCorreta = new Date(proximaData + "T00:00:00");
             const dataFormatada = dataEventoCorreta.toLocaleDateString('pt-BR', { day: 'numeric', month: 'long' });
 
             card.querySelector('h3').textContent = proximoEvento.titulo;
@@ -82,15 +107,11 @@ async function carregarProximoEvento() {
 
 async function carregarProximaMissaFestiva() {
     try {
-        const response = await fetch('data/missas-festivas.json');
-        const data = await response.json();
-        const missas = data.missas_festivas;
+        const missas = (await carregarPacoteInicio()).agenda.missas_festivas;
 
-        const hoje = new Date();
-        hoje.setHours(0, 0, 0, 0); // Zera o horário para comparar apenas a data
-
-        // Encontra a primeira missa cuja data é hoje ou no futuro
-        const proximaMissa = missas.find(missa => new Date(missa.data + "T00:00:00") >= hoje);
+        // Encontra a primeira missa cuja data é hoje ou no futuro (as datas AAAA-MM-DD comparam como texto)
+        const hoje = dataDeHoje();
+        const proximaMissa = missas.find(missa => missa.data >= hoje);
 
         const card = document.getElementById('card-missa-festiva');
         if (card && proximaMissa) {
@@ -306,19 +327,13 @@ function closeModal(modal) {
 // Load content from JSON files
 async function loadContent() {
     try {
-        // Load all data
-        const [historiaData, missasData, eventosData, fotosData] = await Promise.all([
-            fetch('data/historia.json').then(r => r.json()),
-            fetch('data/missas.json').then(r => r.json()),
-            fetch('data/eventos.json').then(r => r.json()),
-            fetch('data/fotos.json').then(r => r.json())
-        ]);
+        // Load all data (one request for the whole page)
+        const pacote = await carregarPacoteInicio();
         
         // Populate content
-        populateTimeline(historiaData);
-        populateMissas(missasData);
-        populateEventos(eventosData);
-        populateGaleria(fotosData);
+        populateTimeline(pacote.historia);
+        populateMissas(pacote.missas);
+        populateGaleria(pacote.fotos);
         
     } catch (error) {
         console.error('Error loading content:', error);
@@ -411,75 +426,24 @@ function populateMissas(data) {
     }
 }
 
-// Populate eventos
-function populateEventos(data) {
-    const eventosList = document.getElementById('eventos-list');
-    
-    if (!eventosList || !data.anos) return;
-    
-    eventosList.innerHTML = '';
-    
-    Object.entries(data.anos).forEach(([ano, meses]) => {
-        const totalEventos = Object.values(meses).reduce((total, eventos) => total + eventos.length, 0);
-        
-        const eventoAno = document.createElement('div');
-        eventoAno.className = 'evento-ano';
-        eventoAno.innerHTML = `
-            <div class="evento-ano-header">
-                <span class="evento-ano-title">${ano}</span>
-                <span class="evento-ano-count">${totalEventos} eventos</span>
-            </div>
-            <div class="evento-ano-content">
-                ${Object.entries(meses).map(([mes, eventos]) => `
-                    <div class="evento-mes">
-                        <div class="evento-mes-header">
-                            <span class="evento-mes-title">${mes}</span>
-                            <span class="evento-mes-count">${eventos.length} eventos</span>
-                        </div>
-                        <div class="evento-mes-content">
-                            ${eventos.map(evento => `
-                                <div class="evento-item" onclick="showEventoDetails('${evento.id}')">
-                                    <div class="evento-titulo">${evento.titulo}</div>
-                                    <div class="evento-data-local">${formatDate(evento.data)} - ${evento.local}</div>
-                                </div>
-                            `).join('')}
-                        </div>
-                    </div>
-                `).join('')}
-            </div>
-        `;
-        
-        // Add click handlers for accordion
-        const header = eventoAno.querySelector('.evento-ano-header');
-        const content = eventoAno.querySelector('.evento-ano-content');
-        
-        header.addEventListener('click', function() {
-            content.classList.toggle('active');
-        });
-        
-        // Add click handlers for months
-        eventoAno.querySelectorAll('.evento-mes-header').forEach(mesHeader => {
-            mesHeader.addEventListener('click', function(e) {
-                e.stopPropagation();
-                const mesContent = this.nextElementSibling;
-                mesContent.classList.toggle('active');
-            });
-        });
-        
-        eventosList.appendChild(eventoAno);
-    });
+// Fotos da galeria: só o nome do arquivo (formato antigo) ou o objeto gerado por data/galeria.py,
+// com largura, altura, miniatura e placeholder
+function dadosFoto(foto, pasta) {
+    const info = typeof foto === 'string' ? { arquivo: foto } : foto;
+    const src = /^(https?:)?\/\//.test(info.arquivo) ? info.arquivo : pasta + info.arquivo;
+    return { ...info, src };
 }
 
-// Show event details
-function showEventoDetails(eventoId) {
-    // This would fetch the specific event data and show in modal
-    // For now, we'll show a placeholder
-    const modalContent = document.getElementById('evento-modal-content');
-    modalContent.innerHTML = `
-        <h3>Detalhes do Evento</h3>
-        <p>Carregando detalhes do evento ${eventoId}...</p>
-    `;
-    openModal('evento-modal');
+function capaSecao(secao) {
+    return secao.capa ? dadosFoto(secao.capa, '') : { src: secao.thumbnail };
+}
+
+// Miniatura com as dimensões reservadas e o placeholder borrado de fundo até ela carregar
+function imagemGaleria(info, alt) {
+    const dimensoes = info.largura && info.altura ? ` width="${info.largura}" height="${info.altura}"` : '';
+    const fundo = info.placeholder ? ` style="background-image: url('${info.placeholder}')"` : '';
+    const img = `<img src="${info.miniatura || info.src}" alt="${alt}"${dimensoes}${fundo} class="foto-placeholder" loading="lazy" decoding="async" onerror="this.onerror=null; this.src='images/galeria/placeholder.jpg'">`;
+    return info.miniatura_webp ? `<picture><source type="image/webp" srcset="${info.miniatura_webp}">${img}</picture>` : img;
 }
 
 // Populate galeria
@@ -494,7 +458,7 @@ function populateGaleria(data) {
         const galeriaSecao = document.createElement('div');
         galeriaSecao.className = 'galeria-secao';
         galeriaSecao.innerHTML = `
-            <img src="${secao.thumbnail}" alt="${secao.nome}" onerror="this.src='images/galeria/placeholder.jpg'">
+            ${imagemGaleria(capaSecao(secao), secao.nome)}
             <div class="galeria-secao-content">
                 <h3>${secao.nome}</h3>
                 <div class="galeria-secao-count">${secao.total_fotos} fotos</div>
@@ -521,10 +485,9 @@ function showGaleriaSecao(key, secao) {
                 <h4>${sub.nome}</h4>
                 <div class="image-grid">
                     ${sub.fotos.map(foto => {
-                        const imgSrc = foto.startsWith('http' ) ? foto : secao.pasta + foto;
                         return`
                         <div class="image-item">
-                            <img src="${imgSrc}" alt="${sub.nome}" onerror="this.src='images/galeria/placeholder.jpg'">
+                            ${imagemGaleria(dadosFoto(foto, secao.pasta), sub.nome)}
                             <div class="image-overlay">
                                 <span>Ver imagem</span>
                             </div>
@@ -35,6 +35,38 @@ document.addEventListener('DOMContentLoaded', () => {
     let currentQuestionIndex = 0;
     let score = 0;
 
+    // Os quizzes ficam divididos por sub-tema em data/quiz/ (gerados por data/fragmentos_quiz.py):
+    // cada jogo baixa o manifesto, um fragmento e, no diário, a agenda do mês
+    const PASTA_QUIZ = '../../data/quiz/';
+    let manifestoQuiz = null;
+
+    function carregarManifestoQuiz() {
+        if (!manifestoQuiz) {
+            manifestoQuiz = fetch(PASTA_QUIZ + 'manifesto.json').then(response => response.json());
+        }
+        return manifestoQuiz;
+    }
+
+    function buscarJSON(caminho) {
+        return fetch(PASTA_QUIZ + caminho).then(response => {
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            return response.json();
+        });
+    }
+
+    // Ordem das perguntas de hoje, igual para todos (null se a agenda não cobrir o dia)
+    async function ordemDoDia(arquivoSubtema, totalPerguntas) {
+        const hoje = new Date();
+        const mes = `${hoje.getFullYear()}-${String(hoje.getMonth() + 1).padStart(2, '0')}`;
+        try {
+            const agenda = await buscarJSON(`agenda/${mes}/${arquivoSubtema.split('/').pop()}`);
+            const ordem = agenda.dias[hoje.getDate() - 1];
+            return agenda.perguntas === totalPerguntas && ordem ? ordem : null;
+        } catch (error) {
+            return null;
+        }
+    }
+
     // --- LÓGICA DA TELA DE SELEÇÃO ---
 
     function initQuiz() { // ADICIONADO: Função para organizar o início
@@ -82,14 +114,10 @@ document.addEventListener('DOMContentLoaded', () => {
         subThemeButtonsContainer.innerHTML = '';
         if (selectedTheme === 'santos' || selectedTheme === 'diario') {
             difficultyStepLabel.textContent = '3. Escolha a Dificuldade:';
-            const filePath = selectedTheme === 'santos' ? '../../data/quiz_santos.json' : '../../data/quiz_diario.json';
-            const dataKey = selectedTheme === 'santos' ? 'santos' : 'temas';
-            
             try {
-                const response = await fetch(filePath);
-                const data = await response.json();
+                const manifesto = await carregarManifestoQuiz();
                 
-                data[dataKey].forEach(item => {
+                manifesto.temas[selectedTheme].subtemas.forEach(item => {
                     const subThemeButton = document.createElement('button');
                     subThemeButton.className = 'btn-selection';
                     subThemeButton.dataset.subTheme = item.id;
@@ -122,30 +150,25 @@ document.addEventListener('DOMContentLoaded', () => {
         selectionScreen.style.display = 'none';
         loadingScreen.style.display = 'block';
 
-        const themeFileMap = {
-            'paroquia': '../../data/quiz_paroquia.json',
-            'santos': '../../data/quiz_santos.json',
-            'diario': '../../data/quiz_diario.json'
-        };
-
         try {
-            const response = await fetch(themeFileMap[selectedTheme]);
-            const data = await response.json();
-            
-            if (selectedTheme === 'paroquia') {
-                allQuestions = data.perguntas;
-            } else {
-                const dataKey = selectedTheme === 'santos' ? 'santos' : 'temas';
-                const selectedGroup = data[dataKey].find(item => item.id === selectedSubTheme);
-                allQuestions = selectedGroup.perguntas;
-            }
+            const manifesto = await carregarManifestoQuiz();
+            const tema = manifesto.temas[selectedTheme];
+            const arquivo = tema.subtemas ? tema.subtemas.find(item => item.id === selectedSubTheme).arquivo : tema.arquivo;
+            const data = await buscarJSON(arquivo);
+            allQuestions = data.perguntas;
 
             if (allQuestions.length < selectedDifficulty) {
                 throw new Error(`Não há perguntas suficientes (${allQuestions.length}) para a dificuldade selecionada. Por favor, escolha uma dificuldade menor.`);
             }
 
-            shuffleArray(allQuestions);
-            currentQuestions = allQuestions.slice(0, selectedDifficulty);
+            // No diário, todos recebem as mesmas perguntas no mesmo dia
+            const ordem = selectedTheme === 'diario' ? await ordemDoDia(arquivo, allQuestions.length) : null;
+            if (ordem) {
+                currentQuestions = ordem.slice(0, selectedDifficulty).map(indice => allQuestions[indice]);
+            } else {
+                shuffleArray(allQuestions);
+                currentQuestions = allQuestions.slice(0, selectedDifficulty);
+            }
             
             setTimeout(startGame, 500); // Pequeno delay para a tela de loading ser visível
 
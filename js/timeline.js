@@ -342,9 +342,9 @@ function toggleAutoPlay() {
 document.addEventListener('DOMContentLoaded', function() {
     // Wait for main.js to load the data
     setTimeout(() => {
-        fetch('data/historia.json')
-            .then(response => response.json())
-            .then(data => {
+        carregarPacoteInicio()
+            .then(pacote => {
+                const data = pacote.historia;
                 window.timeline = new Timeline('timeline', data);
                 createTimelineControls();
                 window.timeline.initTouchEvents();